@@ -150,7 +150,9 @@ def _handle_events(payload):
     ).map(_handle_events)
 
 
-def get_compute_log_observable(graphene_info, run_id, step_key, io_type, cursor=None):
+def get_compute_log_observable(
+    graphene_info, run_id, step_key, io_type, cursor=None, tail_lines=None
+):
     from ...schema.logs.compute_logs import from_compute_log_file
 
     check.inst_param(graphene_info, "graphene_info", ResolveInfo)
@@ -158,9 +160,10 @@ def get_compute_log_observable(graphene_info, run_id, step_key, io_type, cursor=
     check.str_param(step_key, "step_key")
     check.inst_param(io_type, "io_type", ComputeIOType)
     check.opt_str_param(cursor, "cursor")
+    check.opt_int_param(tail_lines, "tail_lines")
 
     return graphene_info.context.instance.compute_log_manager.observable(
-        run_id, step_key, io_type, cursor
+        run_id, step_key, io_type, cursor, tail_lines
     ).map(lambda update: from_compute_log_file(graphene_info, update))
 
 
@@ -66,7 +66,6 @@ def get_run_tags(graphene_info):
 @capture_error
 def get_run_group(graphene_info, run_id):
     from ..schema.errors import GrapheneRunGroupNotFoundError
-    from ..schema.pipelines.pipeline import GrapheneRun
     from ..schema.runs import GrapheneRunGroup
 
     instance = graphene_info.context.instance
@@ -75,12 +74,12 @@ def get_run_group(graphene_info, run_id):
     except DagsterRunNotFoundError:
         return GrapheneRunGroupNotFoundError(run_id)
     root_run_id, run_group = result
-    return GrapheneRunGroup(root_run_id=root_run_id, runs=[GrapheneRun(run) for run in run_group])
+    return GrapheneRunGroup(
+        root_run_id=root_run_id, runs=get_graphene_runs(graphene_info, run_group)
+    )
 
 
 def get_runs(graphene_info, filters, cursor=None, limit=None):
-    from ..schema.pipelines.pipeline import GrapheneRun
-
     check.opt_inst_param(filters, "filters", PipelineRunsFilter)
     check.opt_str_param(cursor, "cursor")
     check.opt_int_param(limit, "limit")
@@ -103,6 +102,15 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.get_runs(cursor=cursor, limit=limit)
 
+    return get_graphene_runs(graphene_info, runs)
+
+
+def get_graphene_runs(graphene_info, runs):
+    """Wrap a page of runs, registering them with the request's run batch loader so that each of
+    the per-run fields of the page is loaded with a single storage call."""
+    from ..schema.pipelines.pipeline import GrapheneRun
+
+    graphene_info.context.run_batch_loader.add_run_ids([run.run_id for run in runs])
     return [GrapheneRun(run) for run in runs]
 
 
@@ -111,7 +119,6 @@ def get_runs_count(graphene_info, filters):
 
 
 def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
-    from ..schema.pipelines.pipeline import GrapheneRun
     from ..schema.runs import GrapheneRunGroup
 
     check.opt_inst_param(filters, "filters", PipelineRunsFilter)
@@ -122,9 +129,9 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
 
     for root_run_id in run_groups:
-        run_groups[root_run_id]["runs"] = [
-            GrapheneRun(run) for run in run_groups[root_run_id]["runs"]
-        ]
+        run_groups[root_run_id]["runs"] = get_graphene_runs(
+            graphene_info, run_groups[root_run_id]["runs"]
+        )
 
     return [
         GrapheneRunGroup(root_run_id=root_run_id, runs=run_group["runs"])
@@ -170,7 +177,7 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
 def get_stats(graphene_info, run_id):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+    stats = graphene_info.context.run_batch_loader.get_run_stats(run_id)
     stats.id = "stats-{run_id}"
     return GrapheneRunStatsSnapshot(stats)
 
@@ -178,5 +185,8 @@ def get_stats(graphene_info, run_id):
 def get_step_stats(graphene_info, run_id, step_keys=None):
     from ..schema.logs.events import GrapheneRunStepStats
 
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    if step_keys:
+        step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    else:
+        step_stats = graphene_info.context.run_batch_loader.get_run_step_stats(run_id)
     return [GrapheneRunStepStats(stats) for stats in step_stats]
@@ -28,18 +28,21 @@ def __init__(self, instance, run_id, after_cursor=None):
         self.state = State.NULL
         self.stopping = None
         self.stopped = None
-        self.after_cursor = after_cursor if after_cursor is not None else -1
+        self.after_cursor = int(after_cursor) if after_cursor is not None else -1
+        # the storage id of the last record loaded, so that each chunk is fetched by seeking past
+        # the records already loaded rather than by offset. A subscription that starts from a
+        # cursor resolves it to a storage id with its first fetch
+        self.after_storage_id = -1 if self.after_cursor == -1 else None
 
     def __call__(self, observer):
         self.observer = observer
         check.invariant(self.state is State.NULL, f"unexpected state {self.state}")
         chunk_size = get_chunk_size()
-        events = self.instance.logs_after(self.run_id, self.after_cursor, limit=chunk_size)
+        events = self.load_chunk(chunk_size)
         done_loading = len(events) < chunk_size
 
         if events:
             self.observer.on_next((events, not done_loading))
-            self.after_cursor = len(events) + int(self.after_cursor)
 
         if done_loading:
             self.watch_events()
@@ -48,6 +51,26 @@ def __call__(self, observer):
 
         return self
 
+    def load_chunk(self, chunk_size):
+        if self.after_storage_id is None:
+            # resolve the starting cursor with a query that only reads the ids of the records
+            # before it
+            self.after_storage_id = self.instance.storage_id_for_cursor(
+                self.run_id, self.after_cursor
+            )
+            if self.after_storage_id is None:
+                return []
+
+        records = self.instance.records_after(
+            self.run_id, self.after_storage_id, limit=chunk_size
+        )
+
+        if records:
+            self.after_cursor += len(records)
+            self.after_storage_id = records[-1].storage_id
+
+        return [record.event_log_entry for record in records]
+
     def load_events(self):
         self.state = State.LOADING
 
@@ -75,14 +98,13 @@ def background_event_loading(self, sleep_fn):
         chunk_size = get_chunk_size()
 
         while not self.stopping.is_set():
-            events = self.instance.logs_after(self.run_id, self.after_cursor, limit=chunk_size)
+            events = self.load_chunk(chunk_size)
             if self.observer is None:
                 break
 
             done_loading = len(events) < chunk_size
 
             self.observer.on_next((events, not done_loading))
-            self.after_cursor = len(events) + int(self.after_cursor)
 
             if done_loading:
                 break
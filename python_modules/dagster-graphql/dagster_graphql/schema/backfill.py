@@ -3,6 +3,7 @@
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
 
+from ..implementation.fetch_runs import get_graphene_runs
 from .errors import (
     GrapheneInvalidOutputError,
     GrapheneInvalidStepError,
@@ -113,16 +114,11 @@ def __init__(self, backfill_job):
         )
 
     def resolve_runs(self, graphene_info, **kwargs):
-        from .pipelines.pipeline import GrapheneRun
-
         filters = PipelineRunsFilter.for_backfill(self._backfill_job.backfill_id)
-        return [
-            GrapheneRun(r)
-            for r in graphene_info.context.instance.get_runs(
-                filters=filters,
-                limit=kwargs.get("limit"),
-            )
-        ]
+        return get_graphene_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(filters=filters, limit=kwargs.get("limit")),
+        )
 
     def resolve_numRequested(self, graphene_info):
         filters = PipelineRunsFilter.for_backfill(self._backfill_job.backfill_id)
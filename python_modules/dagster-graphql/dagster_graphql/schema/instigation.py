@@ -19,6 +19,7 @@
 from dagster.seven.compat.pendulum import to_timezone
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+from ..implementation.fetch_runs import get_graphene_runs
 from ..implementation.fetch_schedules import get_schedule_next_tick
 from ..implementation.fetch_sensors import get_sensor_next_tick
 from .errors import GraphenePythonError
@@ -299,19 +300,14 @@ def resolve_typeSpecificData(self, _graphene_info):
         return None
 
     def resolve_runs(self, graphene_info, **kwargs):
-        from .pipelines.pipeline import GrapheneRun
-
         if self._job_state.job_type == JobType.SENSOR:
             filters = PipelineRunsFilter.for_sensor(self._job_state)
         else:
             filters = PipelineRunsFilter.for_schedule(self._job_state)
-        return [
-            GrapheneRun(r)
-            for r in graphene_info.context.instance.get_runs(
-                filters=filters,
-                limit=kwargs.get("limit"),
-            )
-        ]
+        return get_graphene_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(filters=filters, limit=kwargs.get("limit")),
+        )
 
     def resolve_runsCount(self, graphene_info):
         if self._job_state.job_type == JobType.SENSOR:
@@ -22,6 +22,7 @@ class GrapheneSubscription(graphene.ObjectType):
         stepKey=graphene.Argument(graphene.NonNull(graphene.String)),
         ioType=graphene.Argument(graphene.NonNull(GrapheneComputeIOType)),
         cursor=graphene.Argument(graphene.String),
+        tailLines=graphene.Argument(graphene.Int),
     )
 
     locationStateChangeEvents = graphene.Field(
@@ -34,10 +35,12 @@ class Meta:
     def resolve_pipelineRunLogs(self, graphene_info, runId, after=None):
         return get_pipeline_run_observable(graphene_info, runId, after)
 
-    def resolve_computeLogs(self, graphene_info, runId, stepKey, ioType, cursor=None):
+    def resolve_computeLogs(
+        self, graphene_info, runId, stepKey, ioType, cursor=None, tailLines=None
+    ):
         check.str_param(ioType, "ioType")  # need to resolve to enum
         return get_compute_log_observable(
-            graphene_info, runId, stepKey, ComputeIOType(ioType), cursor
+            graphene_info, runId, stepKey, ComputeIOType(ioType), cursor, tailLines
         )
 
     def resolve_locationStateChangeEvents(self, graphene_info):
@@ -4,6 +4,7 @@
 from dagster import file_relative_path, repository
 from dagster.core.code_pointer import CodePointer
 from dagster.core.host_representation import (
+    ExternalRepositoryManifest,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
     external_repository_data_from_def,
 )
@@ -262,7 +263,7 @@ def test_out_of_process_reload_location(self, graphql_context):
                 # note it where the function is *used* that needs to mocked, not
                 # where it is defined.
                 # see https://docs.python.org/3/library/unittest.mock.html#where-to-patch
-                "dagster.core.host_representation.repository_location.sync_get_streaming_external_repositories_data_grpc"
+                "dagster.core.host_representation.repository_location.sync_get_external_repository_manifests_grpc"
             ) as external_repository_mock:
 
                 @repository
@@ -271,7 +272,11 @@ def new_repo():
 
                 new_repo_data = external_repository_data_from_def(new_repo)
 
-                external_repository_mock.return_value = {"new_repo": new_repo_data}
+                external_repository_mock.return_value = {
+                    "new_repo": ExternalRepositoryManifest(
+                        external_repository_data=new_repo_data, external_pipeline_summaries=[]
+                    )
+                }
 
                 cli_command_mock.return_value = ListRepositoriesResponse(
                     repository_symbols=[],
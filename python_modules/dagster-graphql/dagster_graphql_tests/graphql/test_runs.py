@@ -1,6 +1,20 @@
 import copy
-
-from dagster import execute_pipeline, lambda_solid, pipeline, repository
+import tempfile
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+import sqlalchemy as db
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    Output,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    repository,
+    solid,
+)
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
 from dagster.core.execution.api import execute_run
 from dagster.core.storage.pipeline_run import PipelineRunStatus
@@ -8,6 +22,7 @@
 from dagster.core.test_utils import instance_for_test
 from dagster_graphql.test.utils import (
     define_out_of_process_context,
+    define_out_of_process_workspace,
     execute_dagster_graphql,
     infer_pipeline_selector,
 )
@@ -103,6 +118,55 @@
 """
 
 
+RUN_STATS_QUERY = """
+{
+  pipelineRunsOrError {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+        stepStats {
+          stepKey
+          status
+        }
+        assets {
+          key {
+            path
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+RUN_GROUP_STATS_QUERY = """
+{
+  runGroupsOrError {
+    results {
+      rootRunId
+      runs {
+        runId
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+        stepStats {
+          stepKey
+          status
+        }
+      }
+    }
+  }
+}
+"""
+
+
 FILTERED_RUN_QUERY = """
 query PipelineRunsRootQuery($filter: RunsFilter!) {
   pipelineRunsOrError(filter: $filter) {
@@ -413,6 +477,111 @@ def test_runs_over_time():
             }
 
 
+@solid
+def materialize_assets():
+    yield AssetMaterialization(asset_key=AssetKey("asset_one"))
+    yield AssetMaterialization(asset_key=AssetKey(["asset", "two"]))
+    yield Output(None)
+
+
+@pipeline
+def asset_pipeline():
+    materialize_assets()
+
+
+def test_run_stats_batch_loading():
+    with instance_for_test() as instance:
+        repo_1 = get_repo_at_time_1()
+
+        run_ids = [
+            execute_pipeline(repo_1.get_pipeline("evolving_pipeline"), instance=instance).run_id,
+            execute_pipeline(repo_1.get_pipeline("foo_pipeline"), instance=instance).run_id,
+            execute_pipeline(asset_pipeline, instance=instance).run_id,
+        ]
+
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            with mock.patch.object(
+                instance, "get_run_stats_for_runs", wraps=instance.get_run_stats_for_runs
+            ) as get_run_stats_for_runs, mock.patch.object(
+                instance, "get_run_step_stats_for_runs", wraps=instance.get_run_step_stats_for_runs
+            ) as get_run_step_stats_for_runs, mock.patch.object(
+                instance, "asset_keys_for_runs", wraps=instance.asset_keys_for_runs
+            ) as asset_keys_for_runs, mock.patch.object(
+                instance, "get_run_stats", wraps=instance.get_run_stats
+            ) as get_run_stats:
+                result = execute_dagster_graphql(context, RUN_STATS_QUERY)
+
+            # the stats of all the runs of the page are each loaded with a single call
+            assert get_run_stats_for_runs.call_count == 1
+            assert get_run_step_stats_for_runs.call_count == 1
+            assert asset_keys_for_runs.call_count == 1
+            assert get_run_stats.call_count == 0
+
+        runs = {run["runId"]: run for run in result.data["pipelineRunsOrError"]["results"]}
+        assert set(runs.keys()) == set(run_ids)
+        assert runs[run_ids[0]]["stats"]["stepsSucceeded"] == 2
+        assert runs[run_ids[1]]["stats"]["stepsSucceeded"] == 1
+        assert sorted(stats["stepKey"] for stats in runs[run_ids[0]]["stepStats"]) == [
+            "solid_A",
+            "solid_B",
+        ]
+        assert runs[run_ids[0]]["assets"] == []
+        assert runs[run_ids[1]]["assets"] == []
+        assert sorted(asset["key"]["path"] for asset in runs[run_ids[2]]["assets"]) == [
+            ["asset", "two"],
+            ["asset_one"],
+        ]
+
+
+@contextmanager
+def _count_sql_statements():
+    statements = []
+
+    def _before_cursor_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    db.event.listen(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        db.event.remove(db.engine.Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.parametrize("query", [RUN_STATS_QUERY, RUN_GROUP_STATS_QUERY])
+def test_page_sql_statements_do_not_grow_with_runs(query):
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            "event_log_storage": {
+                "module": "dagster.core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            }
+        },
+        temp_dir=temp_dir,
+    ) as instance:
+        repo_1 = get_repo_at_time_1()
+
+        with define_out_of_process_workspace(
+            __file__, "get_repo_at_time_1", instance
+        ) as workspace_process_context:
+            statement_counts = []
+            for _ in range(3):
+                for _ in range(3):
+                    execute_pipeline(repo_1.get_pipeline("evolving_pipeline"), instance=instance)
+
+                # each page is resolved in a fresh request context, as it would be in dagit
+                context = workspace_process_context.create_request_context()
+                with _count_sql_statements() as statements:
+                    result = execute_dagster_graphql(context, query)
+                assert not result.errors
+                statement_counts.append(len(statements))
+
+        # the first page also warms up the storage's caches, e.g. of which secondary indexes have
+        # been migrated. After that, the stats of the runs of a page are loaded with the same
+        # statements however many runs there are
+        assert statement_counts[1] == statement_counts[2]
+
+
 def test_run_groups_over_time():
     with instance_for_test() as instance:
         repo_1 = get_repo_at_time_1()
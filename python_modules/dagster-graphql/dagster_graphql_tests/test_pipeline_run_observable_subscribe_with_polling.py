@@ -2,13 +2,14 @@
 import time
 from collections import namedtuple
 from contextlib import contextmanager
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import SqlEventLogStorage
-from dagster.core.test_utils import instance_for_test
+from dagster.core.test_utils import environ, instance_for_test
 from dagster_graphql.implementation.pipeline_run_storage import PipelineRunObservableSubscribe
 from dagster_tests.core_tests.storage_tests.test_polling_event_watcher import (
     SqlitePollingEventLogStorage,
@@ -114,3 +115,39 @@ def test_using_instance(before_watch_config: NumEventsAndCursor, num_events_afte
                 total_num_events + 1,
             )
         )
+
+
+def test_load_events_in_chunks_by_storage_id():
+    with create_test_instance_and_storage() as (instance, storage):
+        EventStorer(storage).store_n_events(5)
+
+        with environ({"DAGIT_EVENT_LOAD_CHUNK_SIZE": "2"}), mock.patch.object(
+            instance, "logs_after", wraps=instance.logs_after
+        ) as logs_after_mock, mock.patch.object(
+            instance, "records_after", wraps=instance.records_after
+        ) as records_after_mock, mock.patch.object(
+            instance, "storage_id_for_cursor", wraps=instance.storage_id_for_cursor
+        ) as storage_id_for_cursor_mock:
+            observer = Mock()
+            observable_subscribe = PipelineRunObservableSubscribe(instance, RUN_ID, after_cursor=0)
+            observable_subscribe(observer)
+            assert observable_subscribe.stopped.wait(10)
+            observable_subscribe.dispose()
+
+        call_args = observer.on_next.call_args_list
+        assert [[event.message for event in call[0][0][0]] for call in call_args] == [
+            ["2", "3"],
+            ["4", "5"],
+            [],
+        ]
+        assert observable_subscribe.after_cursor == 4
+
+        # the starting cursor is resolved to a storage id once, without loading the records before
+        # it, after which chunks are fetched by seeking past the last storage id loaded
+        assert logs_after_mock.call_count == 0
+        assert [call[0] for call in storage_id_for_cursor_mock.call_args_list] == [(RUN_ID, 0)]
+        assert [call[0] for call in records_after_mock.call_args_list] == [
+            (RUN_ID, 1),
+            (RUN_ID, 3),
+            (RUN_ID, 5),
+        ]
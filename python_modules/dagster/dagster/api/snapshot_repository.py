@@ -1,5 +1,7 @@
+import grpc
 from dagster import check
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.serdes import deserialize_as, deserialize_json_to_dagster_namedtuple, deserialize_value
 
 
 def sync_get_streaming_external_repositories_data_grpc(api_client, repository_location):
@@ -32,3 +34,99 @@ def sync_get_streaming_external_repositories_data_grpc(api_client, repository_lo
 
         repo_datas[repository_name] = external_repository_data
     return repo_datas
+
+
+def sync_get_external_repository_manifests_grpc(api_client, repository_location):
+    """Fetches the ExternalRepositoryManifest of each repository in the location. Returns None if
+    the server does not support fetching manifests.
+    """
+    from dagster.core.host_representation import (
+        ExternalRepositoryManifest,
+        ExternalRepositoryOrigin,
+        RepositoryLocation,
+    )
+
+    check.inst_param(repository_location, "repository_location", RepositoryLocation)
+
+    manifests = {}
+    for repository_name in repository_location.repository_names:
+        try:
+            manifests[repository_name] = deserialize_as(
+                api_client.streaming_external_repository_manifest(
+                    external_repository_origin=ExternalRepositoryOrigin(
+                        repository_location.origin,
+                        repository_name,
+                    )
+                ),
+                ExternalRepositoryManifest,
+            )
+        except grpc.RpcError as e:
+            # servers running older versions of dagster can only return the full repository data
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:  # pylint: disable=no-member
+                return None
+            raise
+
+    return manifests
+
+
+def sync_get_external_pipeline_datas_grpc(
+    api_client,
+    external_repository_origin,
+    external_pipeline_summaries,
+    external_pipeline_data_cache,
+):
+    """Returns the ExternalPipelineData for each of the given ExternalPipelineSummarys, fetching
+    only the ones that are not already in the cache.
+    """
+    from dagster.core.host_representation import ExternalPipelineData, ExternalPipelineSummary
+    from dagster.core.host_representation.repository_location import ExternalPipelineDataCache
+    from dagster.grpc.types import ExternalPipelineDatasArgs
+
+    check.list_param(
+        external_pipeline_summaries, "external_pipeline_summaries", of_type=ExternalPipelineSummary
+    )
+    check.inst_param(
+        external_pipeline_data_cache, "external_pipeline_data_cache", ExternalPipelineDataCache
+    )
+
+    external_pipeline_datas = {
+        summary.external_pipeline_data_id: external_pipeline_data_cache.get(
+            summary.external_pipeline_data_id
+        )
+        for summary in external_pipeline_summaries
+    }
+
+    missing_ids = [
+        external_pipeline_data_id
+        for external_pipeline_data_id, external_pipeline_data in external_pipeline_datas.items()
+        if external_pipeline_data is None
+    ]
+    if missing_ids:
+        fetched_external_pipeline_datas = deserialize_value(
+            api_client.streaming_external_pipeline_datas(
+                ExternalPipelineDatasArgs(
+                    repository_origin=external_repository_origin,
+                    external_pipeline_data_ids=missing_ids,
+                )
+            )
+        )
+        if len(fetched_external_pipeline_datas) != len(missing_ids):
+            raise DagsterInvariantViolationError(
+                "Could not fetch pipeline data from repository {repository_name}: the server no "
+                "longer has the requested versions of its pipelines. Reload the repository "
+                "location to pick up its latest changes.".format(
+                    repository_name=external_repository_origin.repository_name
+                )
+            )
+
+        for external_pipeline_data_id, external_pipeline_data in zip(
+            missing_ids, fetched_external_pipeline_datas
+        ):
+            check.inst(external_pipeline_data, ExternalPipelineData)
+            external_pipeline_data_cache.set(external_pipeline_data_id, external_pipeline_data)
+            external_pipeline_datas[external_pipeline_data_id] = external_pipeline_data
+
+    return [
+        external_pipeline_datas[summary.external_pipeline_data_id]
+        for summary in external_pipeline_summaries
+    ]
@@ -247,6 +247,7 @@ def execute_step_command(input_json):
                 step_keys_to_execute=args.step_keys_to_execute,
                 mode=pipeline_run.mode,
                 known_state=args.known_state,
+                pipeline_snapshot_id=pipeline_run.pipeline_snapshot_id,
             )
 
             buff = []
@@ -320,6 +321,22 @@ def execute_step_command(input_json):
     "waiting to load them when the server is launched. Useful for surfacing errors when the server "
     "is managed directly from Dagit",
 )
+@click.option(
+    "--evaluation-processes",
+    type=click.INT,
+    required=False,
+    default=None,
+    help="If set, evaluate schedules and sensors in a pool of this many processes that have the "
+    "user code loaded, instead of on the GRPC server's threads.",
+)
+@click.option(
+    "--evaluation-timeout",
+    type=click.INT,
+    required=False,
+    default=None,
+    help="Timeout in seconds after which a schedule or sensor evaluation is abandoned and its "
+    "evaluation process terminated. Only applies if --evaluation-processes is set.",
+)
 @python_origin_target_argument
 @click.option(
     "--ipc-output-file",
@@ -350,6 +367,8 @@ def grpc_command(
     heartbeat=False,
     heartbeat_timeout=30,
     lazy_load_user_code=False,
+    evaluation_processes=None,
+    evaluation_timeout=None,
     ipc_output_file=None,
     fixed_server_id=None,
     override_system_timezone=None,
@@ -399,6 +418,8 @@ def grpc_command(
             lazy_load_user_code=lazy_load_user_code,
             ipc_output_file=ipc_output_file,
             fixed_server_id=fixed_server_id,
+            evaluation_processes=evaluation_processes,
+            evaluation_timeout=evaluation_timeout,
         )
 
         server.serve()
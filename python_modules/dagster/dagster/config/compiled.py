@@ -0,0 +1,151 @@
+import copy
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from dagster import check
+from dagster.serdes.utils import hash_str
+from dagster.utils import LRUCache
+
+from .config_type import ConfigType, Enum, Float, get_config_type_generation
+from .iterate_types import iterate_config_types
+from .snap import ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+
+if TYPE_CHECKING:
+    from .evaluate_value_result import EvaluateValueResult
+
+CONFIG_VALUE_MEMO_SIZE = 64
+
+# post_process implementations that only depend on the value they are passed. Config types that
+# override post_process with anything else (e.g. StringSource, which reads the environment) cannot
+# have their processed values memoized.
+_PURE_POST_PROCESS_FNS = {ConfigType.post_process, Float.post_process, Enum.post_process}
+
+
+class CompiledConfigType:
+    """The structures needed to validate config values against a ConfigType and resolve their
+    defaults, computed once per ConfigType rather than on every evaluation.
+
+    Also holds a small memo of evaluation results keyed by a stable hash of the config value, used
+    by callers that opt in to memoization (see process_config). Config values are copied on the way
+    in and out of the memo, so that callers mutating the values they pass in or are handed back
+    never affect each other.
+    """
+
+    def __init__(self, config_type: ConfigType):
+        self._config_type = check.inst_param(config_type, "config_type", ConfigType)
+        self._all_config_types: Dict[str, ConfigType] = {
+            ct.key: ct for ct in iterate_config_types(config_type)
+        }
+        self._config_schema_snapshot = ConfigSchemaSnapshot(
+            {key: _get_config_type_snap(ct) for key, ct in self._all_config_types.items()}
+        )
+        self._has_pure_post_process = all(
+            type(ct).post_process in _PURE_POST_PROCESS_FNS
+            for ct in self._all_config_types.values()
+        )
+        self._memo: LRUCache[Tuple[str, str], "EvaluateValueResult"] = LRUCache(
+            CONFIG_VALUE_MEMO_SIZE
+        )
+
+    @property
+    def config_type(self) -> ConfigType:
+        return self._config_type
+
+    @property
+    def config_type_snap(self) -> ConfigTypeSnap:
+        return self._config_schema_snapshot.get_config_snap(self._config_type.key)
+
+    @property
+    def config_schema_snapshot(self) -> ConfigSchemaSnapshot:
+        return self._config_schema_snapshot
+
+    @property
+    def all_config_types(self) -> Dict[str, ConfigType]:
+        return self._all_config_types
+
+    @property
+    def has_pure_post_process(self) -> bool:
+        """Whether processing a config value against this type depends on nothing but the value,
+        so that processed values can be memoized."""
+        return self._has_pure_post_process
+
+    def get_memoized_result(
+        self, phase: str, value_hash: Optional[str]
+    ) -> Optional["EvaluateValueResult"]:
+        if value_hash is None:
+            return None
+        result = self._memo.get((phase, value_hash))
+        return _copy_result(result) if result is not None else None
+
+    def memoize_result(self, phase: str, value_hash: Optional[str], result: "EvaluateValueResult"):
+        if value_hash is None:
+            return
+        self._memo.set((phase, value_hash), _copy_result(result))
+
+
+def hash_config_value(config_value: Any) -> Optional[str]:
+    """A stable hash of a config value, or None if the value contains anything other than dicts
+    with string keys, lists and scalars, and so cannot be memoized."""
+    try:
+        return hash_str(repr(_canonicalize_config_value(config_value)))
+    except _UnhashableConfigValue:
+        return None
+
+
+def compile_config_type(config_type: ConfigType) -> CompiledConfigType:
+    check.inst_param(config_type, "config_type", ConfigType)
+    generation = get_config_type_generation()
+    cached = getattr(config_type, "_cached_compiled_config_type", None)
+    if cached and cached[0] == generation:
+        return cached[1]
+
+    compiled = CompiledConfigType(config_type)
+    config_type._cached_compiled_config_type = (  # pylint: disable=protected-access
+        generation,
+        compiled,
+    )
+    return compiled
+
+
+def _get_config_type_snap(config_type: ConfigType) -> ConfigTypeSnap:
+    # snaps are shared between the schema snapshots of every type that contains this one
+    generation = get_config_type_generation()
+    cached = getattr(config_type, "_cached_config_type_snap", None)
+    if cached and cached[0] == generation:
+        return cached[1]
+
+    snap = snap_from_config_type(config_type)
+    config_type._cached_config_type_snap = (  # pylint: disable=protected-access
+        generation,
+        snap,
+    )
+    return snap
+
+
+def _copy_result(result: "EvaluateValueResult") -> "EvaluateValueResult":
+    if not result.success:
+        return result._replace(errors=list(result.errors))
+    return result._replace(value=copy.deepcopy(result.value))
+
+
+class _UnhashableConfigValue(Exception):
+    pass
+
+
+def _canonicalize_config_value(config_value):
+    # tag containers by type so that e.g. a tuple, which fails Array validation, never shares a
+    # memo entry with the equivalent list
+    if config_value is None or type(config_value) in (str, int, float, bool):
+        return (type(config_value).__name__, config_value)
+    elif isinstance(config_value, dict):
+        if not all(isinstance(key, str) for key in config_value):
+            raise _UnhashableConfigValue()
+        return (
+            "dict",
+            tuple(
+                (key, _canonicalize_config_value(config_value[key])) for key in sorted(config_value)
+            ),
+        )
+    elif isinstance(config_value, list):
+        return ("list", tuple(_canonicalize_config_value(item) for item in config_value))
+    else:
+        raise _UnhashableConfigValue()
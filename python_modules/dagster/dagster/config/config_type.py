@@ -45,6 +45,17 @@ def is_selector(kind):
         return kind == ConfigTypeKind.SELECTOR
 
 
+# Incremented whenever a config type instance is initialized more than once, which happens when
+# an instance memoized by key (see field_utils._memoize_inst_in_field_cache) is constructed again,
+# possibly with different types inside it. Anything derived from a config type tree and cached on
+# the instance (see compiled.py) is only valid for the generation it was computed in.
+_config_type_generation = 0
+
+
+def get_config_type_generation():
+    return _config_type_generation
+
+
 class ConfigType:
     """
     The class backing DagsterTypes as they are used processing configuration data.
@@ -58,6 +69,9 @@ def __init__(
         description=None,
         type_params=None,
     ):
+        global _config_type_generation  # pylint: disable=global-statement
+        if "key" in self.__dict__:
+            _config_type_generation += 1
 
         self.key = check.str_param(key, "key")
         self.kind = check.inst_param(kind, "kind", ConfigTypeKind)
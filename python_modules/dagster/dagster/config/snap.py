@@ -119,15 +119,31 @@ def non_scalar_type_key(self):
         check.invariant(self.kind == ConfigTypeKind.SCALAR_UNION)
         return self.type_param_keys[1]
 
-    def _get_field(self, name):
-        check.str_param(name, "name")
-        check.invariant(ConfigTypeKind.has_fields(self.kind))
+    @property
+    def field_snaps_by_name(self):
+        # computed once per snap, since validation looks up fields by name for every config value
+        try:
+            return self._cached_field_snaps_by_name
+        except AttributeError:
+            check.invariant(ConfigTypeKind.has_fields(self.kind))
+            self._cached_field_snaps_by_name = {f.name: f for f in self.fields}
+            return self._cached_field_snaps_by_name
 
-        for f in self.fields:
-            if f.name == name:
-                return f
+    @property
+    def defined_field_names(self):
+        """The names of this type's fields, along with any aliases for them."""
+        try:
+            return self._cached_defined_field_names
+        except AttributeError:
+            field_names = set(self.field_snaps_by_name.keys())
+            if self.field_aliases:
+                field_names.update(self.field_aliases.values())
+            self._cached_defined_field_names = frozenset(field_names)
+            return self._cached_defined_field_names
 
-        return None
+    def _get_field(self, name):
+        check.str_param(name, "name")
+        return self.field_snaps_by_name.get(name)
 
     def get_field(self, name):
         field = self._get_field(name)
@@ -152,10 +168,12 @@ def get_child_type_keys(self):
 
     def has_enum_value(self, value):
         check.invariant(self.kind == ConfigTypeKind.ENUM)
-        for enum_value in self.enum_values:
-            if enum_value.value == value:
-                return True
-        return False
+        try:
+            enum_value_set = self._cached_enum_value_set
+        except AttributeError:
+            enum_value_set = frozenset(enum_value.value for enum_value in self.enum_values)
+            self._cached_enum_value_set = enum_value_set
+        return value in enum_value_set
 
 
 @whitelist_for_serdes
@@ -2,10 +2,10 @@
 
 from dagster import check
 
+from .compiled import compile_config_type
 from .config_type import ConfigType
 from .field import Field
-from .iterate_types import config_schema_snapshot_from_config_type, iterate_config_types
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 
 
@@ -106,15 +106,14 @@ def __init__(
 
     @staticmethod
     def from_config_type(config_type, stack, traversal_type):
-        all_config_types = list(iterate_config_types(config_type))
-        config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+        compiled_config_type = compile_config_type(config_type)
         return TraversalContext(
-            config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=snap_from_config_type(config_type),
+            config_schema_snapshot=compiled_config_type.config_schema_snapshot,
+            config_type_snap=compiled_config_type.config_type_snap,
             config_type=config_type,
             stack=stack,
             traversal_type=traversal_type,
-            all_config_types={ct.key: ct for ct in all_config_types},
+            all_config_types=compiled_config_type.all_config_types,
         )
 
     @property
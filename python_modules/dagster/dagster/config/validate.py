@@ -1,6 +1,7 @@
 from dagster import check
 from dagster.utils import ensure_single_item, frozendict
 
+from .compiled import compile_config_type, hash_config_value
 from .config_type import ConfigScalarKind, ConfigTypeKind
 from .errors import (
     create_array_error,
@@ -21,7 +22,6 @@
 )
 from .evaluate_value_result import EvaluateValueResult
 from .field import resolve_to_config_type
-from .iterate_types import config_schema_snapshot_from_config_type
 from .post_process import post_process_config
 from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
@@ -29,6 +29,9 @@
 
 VALID_FLOAT_TYPES = tuple([int, float])
 
+_VALIDATE_PHASE = "VALIDATE"
+_PROCESS_PHASE = "PROCESS"
+
 
 def is_config_scalar_valid(config_type_snap, config_value):
     check.inst_param(config_type_snap, "config_type_snap", ConfigTypeSnap)
@@ -52,12 +55,15 @@ def validate_config(config_schema, config_value):
 
     config_type = resolve_to_config_type(config_schema)
 
-    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+    compiled_config_type = compile_config_type(config_type)
 
-    return validate_config_from_snap(
-        config_schema_snapshot=config_schema_snapshot,
-        config_type_key=config_type.key,
-        config_value=config_value,
+    return _validate_config(
+        ValidationContext(
+            config_schema_snapshot=compiled_config_type.config_schema_snapshot,
+            config_type_snap=compiled_config_type.config_type_snap,
+            stack=EvaluationStack(entries=[]),
+        ),
+        config_value,
     )
 
 
@@ -205,16 +211,13 @@ def _validate_shape_config(context, config_value, check_for_extra_incoming_field
     check.not_none_param(config_value, "config_value")
     check.bool_param(check_for_extra_incoming_fields, "check_for_extra_incoming_fields")
 
-    field_aliases = check.opt_dict_param(
-        context.config_type_snap.field_aliases, "field_aliases", key_type=str, value_type=str
-    )
+    field_aliases = context.config_type_snap.field_aliases or {}
 
     if config_value and not isinstance(config_value, dict):
         return EvaluateValueResult.for_error(create_dict_type_mismatch_error(context, config_value))
 
     field_snaps = context.config_type_snap.fields
-    defined_field_names = {fs.name for fs in field_snaps}
-    defined_field_names = defined_field_names.union(set(field_aliases.values()))
+    defined_field_names = context.config_type_snap.defined_field_names
 
     incoming_field_names = set(config_value.keys())
 
@@ -355,10 +358,53 @@ def validate_enum_config(context, config_value):
     return EvaluateValueResult.for_value(config_value)
 
 
-def process_config(config_type, config_dict) -> EvaluateValueResult:
+def process_config(config_type, config_dict, memoize=False) -> EvaluateValueResult:
+    """Validate a config value against a config type, then resolve its defaults and post-process
+    it.
+
+    If memoize is set, results are memoized on the compiled config type, keyed by a stable hash of
+    the config value, so that repeatedly processing the same value (e.g. the run config of every
+    run in a backfill) skips validation and, where the config type's post-processing only depends
+    on the value, processing too. Callers are handed copies of memoized values, so may mutate them.
+    """
     config_type = resolve_to_config_type(config_type)
-    validate_evr = validate_config(config_type, config_dict)
-    if not validate_evr.success:
+    check.bool_param(memoize, "memoize")
+
+    if not memoize:
+        validate_evr = validate_config(config_type, config_dict)
+        if not validate_evr.success:
+            return validate_evr
+
+        return post_process_config(config_type, validate_evr.value)
+
+    compiled_config_type = compile_config_type(config_type)
+    value_hash = hash_config_value(config_dict)
+
+    processed_evr = compiled_config_type.get_memoized_result(_PROCESS_PHASE, value_hash)
+    if processed_evr:
+        return processed_evr
+
+    validate_evr = compiled_config_type.get_memoized_result(_VALIDATE_PHASE, value_hash)
+    if validate_evr and not validate_evr.success:
         return validate_evr
 
-    return post_process_config(config_type, validate_evr.value)
+    if not validate_evr:
+        validate_evr = validate_config(config_type, config_dict)
+        # only the outcome of validation is kept, since a successfully validated value references
+        # the caller's config value
+        compiled_config_type.memoize_result(
+            _VALIDATE_PHASE,
+            value_hash,
+            validate_evr if not validate_evr.success else EvaluateValueResult.for_value(None),
+        )
+        if not validate_evr.success:
+            return validate_evr
+        config_value = validate_evr.value
+    else:
+        # post-processing the value as given is equivalent to post-processing its validated form
+        config_value = config_dict
+
+    processed_evr = post_process_config(config_type, config_value)
+    if compiled_config_type.has_pure_post_process:
+        compiled_config_type.memoize_result(_PROCESS_PHASE, value_hash, processed_evr)
+    return processed_evr
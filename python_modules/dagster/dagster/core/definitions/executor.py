@@ -3,7 +3,7 @@
 from typing import Any, Dict, Optional
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config.field import Field
 from dagster.config.field_utils import Selector
 from dagster.core.definitions.configurable import (
@@ -199,13 +199,24 @@ def __call__(self, fn):
         return executor_def
 
 
-def _core_in_process_executor_creation(retries_config, marker_to_close):
+def _core_in_process_executor_creation(retries_config, marker_to_close, release_outputs=False):
     from dagster.core.executor.in_process import InProcessExecutor
 
     return InProcessExecutor(
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(retries_config),
         marker_to_close=marker_to_close,
+        release_outputs=release_outputs,
+    )
+
+
+def _get_release_outputs_config():
+    return Field(
+        Bool,
+        is_required=False,
+        default_value=False,
+        description="Whether to release each step output, via its IO manager, once every step "
+        "that consumes it has completed. Released outputs are not available to re-executions.",
     )
 
 
@@ -214,6 +225,7 @@ def _core_in_process_executor_creation(retries_config, marker_to_close):
     config_schema={
         "retries": get_retries_config(),
         "marker_to_close": Field(str, is_required=False),
+        "release_outputs": _get_release_outputs_config(),
     },
 )
 def in_process_executor(init_context):
@@ -227,6 +239,10 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    If ``release_outputs`` is set to ``true``, each step output is released through the
+    ``release_output`` method of its IO manager as soon as every step that consumes it has
+    completed, rather than being kept until the run finishes.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -234,7 +250,9 @@ def in_process_executor(init_context):
     retries_config = init_context.executor_config["retries"]
     marker_to_close = init_context.executor_config.get("marker_to_close")
     return _core_in_process_executor_creation(
-        retries_config=retries_config, marker_to_close=marker_to_close
+        retries_config=retries_config,
+        marker_to_close=marker_to_close,
+        release_outputs=init_context.executor_config["release_outputs"],
     )
 
 
@@ -254,12 +272,26 @@ def execute_in_process_executor(_):
     )
 
 
-def _core_multiprocess_executor_creation(max_concurrent, retries_config):
+def _core_multiprocess_executor_creation(
+    max_concurrent, retries_config, worker_pool=False, release_outputs=False
+):
     from dagster.core.executor.multiprocess import MultiprocessExecutor
 
     return MultiprocessExecutor(
         max_concurrent=max_concurrent,
         retries=RetryMode.from_config(retries_config),
+        worker_pool=worker_pool,
+        release_outputs=release_outputs,
+    )
+
+
+def _get_worker_pool_config():
+    return Field(
+        Bool,
+        is_required=False,
+        default_value=False,
+        description="Whether to execute steps in a pool of long-lived worker processes that are "
+        "reused across steps, rather than in a new process per step.",
     )
 
 
@@ -268,6 +300,8 @@ def _core_multiprocess_executor_creation(max_concurrent, retries_config):
     config_schema={
         "max_concurrent": Field(Int, is_required=False, default_value=0),
         "retries": get_retries_config(),
+        "worker_pool": _get_worker_pool_config(),
+        "release_outputs": _get_release_outputs_config(),
     },
     requirements=multiple_process_executor_requirements(),
 )
@@ -289,6 +323,15 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    The ``worker_pool`` arg is optional. If set to ``true``, steps are executed in up to
+    ``max_concurrent`` long-lived worker processes that are reused from step to step, so that user
+    code is only imported and the pipeline only loaded once per worker rather than once per step.
+    If a worker process crashes, only the step it was executing fails, and the worker is replaced.
+
+    If ``release_outputs`` is set to ``true``, each step output is released through the
+    ``release_output`` method of its IO manager as soon as every step that consumes it has
+    completed. The IO managers are initialized in the parent process in order to do so.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -296,6 +339,8 @@ def multiprocess_executor(init_context):
     return _core_multiprocess_executor_creation(
         max_concurrent=init_context.executor_config["max_concurrent"],
         retries_config=init_context.executor_config["retries"],
+        worker_pool=init_context.executor_config["worker_pool"],
+        release_outputs=init_context.executor_config["release_outputs"],
     )
 
 
@@ -355,10 +400,13 @@ def _get_default_executor_requirements(executor_config):
                 "multiprocess": {
                     "max_concurrent": Field(Int, is_required=False, default_value=0),
                     "retries": get_retries_config(),
+                    "worker_pool": _get_worker_pool_config(),
+                    "release_outputs": _get_release_outputs_config(),
                 },
                 "in_process": {
                     "retries": get_retries_config(),
                     "marker_to_close": Field(str, is_required=False),
+                    "release_outputs": _get_release_outputs_config(),
                 },
             },
         ),
@@ -398,6 +446,12 @@ def multi_or_in_process_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``worker_pool`` to ``true`` executes steps in a pool of long-lived worker processes
+    that are reused from step to step, instead of in a new process per step.
+
+    In either mode, setting ``release_outputs`` to ``true`` releases each step output through the
+    ``release_output`` method of its IO manager once every step that consumes it has completed.
+
     When using the in_process mode, then only retries can be configured.
 
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
@@ -407,13 +461,21 @@ def multi_or_in_process_executor(init_context):
     if "multiprocess" in init_context.executor_config:
         max_concurrent = init_context.executor_config["multiprocess"]["max_concurrent"]
         retries = init_context.executor_config["multiprocess"]["retries"]
+        worker_pool = init_context.executor_config["multiprocess"]["worker_pool"]
+        release_outputs = init_context.executor_config["multiprocess"]["release_outputs"]
         return _core_multiprocess_executor_creation(
-            max_concurrent=max_concurrent, retries_config=retries
+            max_concurrent=max_concurrent,
+            retries_config=retries,
+            worker_pool=worker_pool,
+            release_outputs=release_outputs,
         )
 
     else:
         retries_config = init_context.executor_config["in_process"]["retries"]
         marker_to_close = init_context.executor_config.get("marker_to_close")
+        release_outputs = init_context.executor_config["in_process"]["release_outputs"]
         return _core_in_process_executor_creation(
-            retries_config=retries_config, marker_to_close=marker_to_close
+            retries_config=retries_config,
+            marker_to_close=marker_to_close,
+            release_outputs=release_outputs,
         )
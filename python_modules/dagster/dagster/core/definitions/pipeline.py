@@ -248,6 +248,7 @@ def __init__(
         )
         self._cached_run_config_schemas: Dict[str, "RunConfigSchema"] = {}
         self._cached_external_pipeline = None
+        self._cached_pipeline_index: Optional["PipelineIndex"] = None
 
         self.version_strategy = check.opt_inst_param(
             version_strategy, "version_strategy", VersionStrategy
@@ -457,9 +458,12 @@ def get_pipeline_index(self) -> "PipelineIndex":
         from dagster.core.snap import PipelineSnapshot
         from dagster.core.host_representation import PipelineIndex
 
-        return PipelineIndex(
-            PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
-        )
+        if self._cached_pipeline_index is None:
+            self._cached_pipeline_index = PipelineIndex(
+                PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
+            )
+
+        return self._cached_pipeline_index
 
     def get_config_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         return self.get_pipeline_snapshot().config_schema_snapshot
@@ -729,6 +729,7 @@ def create_execution_plan(
     known_state: KnownExecutionState = None,
     instance: Optional[DagsterInstance] = None,
     tags: Optional[Dict[str, str]] = None,
+    pipeline_snapshot_id: Optional[str] = None,
 ) -> ExecutionPlan:
     pipeline = _check_pipeline(pipeline)
     pipeline_def = pipeline.get_definition()
@@ -738,6 +739,7 @@ def create_execution_plan(
     check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
     check.opt_inst_param(instance, "instance", DagsterInstance)
     tags = check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
+    check.opt_str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
 
     resolved_run_config = ResolvedRunConfig.build(pipeline_def, run_config, mode=mode)
 
@@ -748,6 +750,7 @@ def create_execution_plan(
         known_state=known_state,
         instance=instance,
         tags=tags,
+        pipeline_snapshot_id=pipeline_snapshot_id,
     )
 
 
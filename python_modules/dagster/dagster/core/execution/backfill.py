@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.execution.plan.resume_retry import get_retry_steps_from_parent_run
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.host_representation import (
@@ -124,6 +124,12 @@ def with_error(self, error):
 
 
 def submit_backfill_runs(instance, workspace, repo_location, backfill_job, partition_names=None):
+    """Creates and submits the runs for the given partitions of a backfill.
+
+    The config and tags for every partition are fetched with a single call to the repository
+    location, the runs are written to run storage together, and execution plan snapshots are
+    shared between partitions that would otherwise request identical execution plans.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(repo_location, "repo_location", RepositoryLocation)
@@ -152,21 +158,39 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
     external_pipeline = external_repo.get_full_external_pipeline(
         external_partition_set.pipeline_name
     )
+
+    last_runs_by_partition = (
+        _fetch_last_runs(
+            instance,
+            external_partition_set,
+            [partition_data.name for partition_data in result.partition_data],
+        )
+        if backfill_job.from_failure or backfill_job.reexecution_steps
+        else {}
+    )
+    execution_plan_snapshots = {}
+    runs_kwargs = []
     for partition_data in result.partition_data:
-        pipeline_run = create_backfill_run(
+        run_kwargs = _get_backfill_run_kwargs(
             instance,
             repo_location,
             external_pipeline,
             external_partition_set,
             backfill_job,
             partition_data,
+            last_runs_by_partition.get(partition_data.name),
+            execution_plan_snapshots,
         )
-        if pipeline_run:
-            # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
-            # and the partition has had a successful run since the time the backfill was
-            # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
+        # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
+        # and the partition has had a successful run since the time the backfill was
+        # scheduled
+        if run_kwargs:
+            runs_kwargs.append(run_kwargs)
+        yield None
+
+    for pipeline_run in instance.create_runs(runs_kwargs) if runs_kwargs else []:
+        instance.submit_run(pipeline_run.run_id, workspace)
+        yield pipeline_run.run_id
         yield None
 
 
@@ -180,6 +204,41 @@ def create_backfill_run(
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     check.inst_param(partition_data, "partition_data", ExternalPartitionExecutionParamData)
 
+    last_run = (
+        _fetch_last_runs(instance, external_partition_set, [partition_data.name]).get(
+            partition_data.name
+        )
+        if backfill_job.from_failure or backfill_job.reexecution_steps
+        else None
+    )
+    run_kwargs = _get_backfill_run_kwargs(
+        instance,
+        repo_location,
+        external_pipeline,
+        external_partition_set,
+        backfill_job,
+        partition_data,
+        last_run,
+    )
+    return instance.create_run(**run_kwargs) if run_kwargs else None
+
+
+def _get_backfill_run_kwargs(
+    instance,
+    repo_location,
+    external_pipeline,
+    external_partition_set,
+    backfill_job,
+    partition_data,
+    last_run,
+    execution_plan_snapshots=None,
+):
+    """Returns the keyword arguments to `DagsterInstance.create_run` for the backfill run of the
+    given partition, or None if no run should be created for it.
+
+    If a dict is passed as `execution_plan_snapshots`, it is used to cache execution plan snapshots
+    across calls, so that partitions with identical run config share a single execution plan.
+    """
     tags = merge_dicts(
         external_pipeline.tags,
         partition_data.tags,
@@ -199,7 +258,6 @@ def create_backfill_run(
             solid_selection = external_partition_set.solid_selection
 
     elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         if not last_run or last_run.status != PipelineRunStatus.FAILURE:
             return None
 
@@ -219,7 +277,6 @@ def create_backfill_run(
         step_keys_to_execute, known_state = get_retry_steps_from_parent_run(instance, parent_run_id)
 
     elif backfill_job.reexecution_steps:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
         if parent_run_id and root_run_id:
@@ -239,17 +296,29 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    external_execution_plan = repo_location.get_external_execution_plan(
-        external_pipeline,
-        partition_data.run_config,
-        external_partition_set.mode,
-        step_keys_to_execute=step_keys_to_execute,
-        known_state=known_state,
+    # Execution plans for runs that resume from a parent run depend on the parent run's state, so
+    # only plans without known state are shared
+    execution_plan_key = (
+        _execution_plan_cache_key(partition_data.run_config, step_keys_to_execute)
+        if execution_plan_snapshots is not None and known_state is None
+        else None
     )
+    if execution_plan_key and execution_plan_key in execution_plan_snapshots:
+        execution_plan_snapshot = execution_plan_snapshots[execution_plan_key]
+    else:
+        execution_plan_snapshot = repo_location.get_external_execution_plan(
+            external_pipeline,
+            partition_data.run_config,
+            external_partition_set.mode,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+        ).execution_plan_snapshot
+        if execution_plan_key:
+            execution_plan_snapshots[execution_plan_key] = execution_plan_snapshot
 
-    return instance.create_run(
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
-        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
+        execution_plan_snapshot=execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
         pipeline_name=external_pipeline.name,
         run_id=make_new_run_id(),
@@ -267,20 +336,42 @@ def create_backfill_run(
     )
 
 
-def _fetch_last_run(instance, external_partition_set, partition_name):
+def _execution_plan_cache_key(run_config, step_keys_to_execute):
+    # The execution plan depends on the run config (e.g. the selected executor, or which outputs
+    # are materialized), so only partitions with identical run config can share a plan
+    try:
+        serialized_run_config = seven.json.dumps(run_config)
+    except TypeError:
+        return None
+
+    return (
+        serialized_run_config,
+        tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+    )
+
+
+def _fetch_last_runs(instance, external_partition_set, partition_names):
+    """Fetches the most recent run of each of the given partitions with a single query."""
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
-    check.str_param(partition_name, "partition_name")
+    check.list_param(partition_names, "partition_names", of_type=str)
+
+    if not partition_names:
+        return {}
 
     runs = instance.get_runs(
         PipelineRunsFilter(
             pipeline_name=external_partition_set.pipeline_name,
             tags={
                 PARTITION_SET_TAG: external_partition_set.name,
-                PARTITION_NAME_TAG: partition_name,
+                PARTITION_NAME_TAG: partition_names,
             },
         ),
-        limit=1,
     )
 
-    return runs[0] if runs else None
+    last_runs_by_partition = {}
+    # runs are returned most recent first
+    for run in runs:
+        last_runs_by_partition.setdefault(run.tags.get(PARTITION_NAME_TAG), run)
+
+    return last_runs_by_partition
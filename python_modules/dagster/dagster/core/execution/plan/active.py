@@ -1,5 +1,8 @@
+import heapq
+import itertools
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 from dagster import check
 from dagster.core.errors import (
@@ -16,13 +19,19 @@
 
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
-from .step import ExecutionStep
+from .step import ExecutionStep, IExecutionStep
 
 
 def _default_sort_key(step: ExecutionStep) -> float:
     return int(step.tags.get(PRIORITY_TAG, 0)) * -1
 
 
+def _get_dependency_keys(step: IExecutionStep) -> Set[str]:
+    if isinstance(step, ExecutionStep):
+        return step.get_execution_dependency_keys()
+    return step.get_all_dependency_keys()  # type: ignore[attr-defined]
+
+
 class ActiveExecution:
     """State machine used to track progress through execution of an ExecutionPlan"""
 
@@ -53,7 +62,19 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set()
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # To avoid rescanning every pending step on each _update, each pending step tracks how
+        # many of its upstream steps have yet to succeed or be skipped, and whether any of them
+        # failed or were abandoned. Steps that become ready to be processed as a result are queued
+        # in _ready_to_process, in the order in which they were added to _pending
+        self._step_deps: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._downstream_pending: Dict[str, Set[str]] = defaultdict(set)
+        self._remaining_dep_count: Dict[str, int] = {}
+        self._has_failed_dep: Set[str] = set()
+        self._pending_order: Dict[str, int] = {}
+        self._ready_to_process: Set[str] = set()
+        self._sequence = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -64,8 +85,9 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap,
+        # ordered by sort key and then by the order in which steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -85,6 +107,15 @@ def __init__(
 
         self._interrupted: bool = False
 
+        # Track, for each output produced by a step in the plan, the steps that consume it and
+        # have yet to finish, so that it can be released once they all have. See
+        # get_outputs_to_release
+        self._output_consumers, self._consumed_outputs = self._get_output_consumers()
+        self._outputs_to_release: List[StepOutputHandle] = []
+
+        for step_key, deps in self._step_deps.items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -101,7 +132,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in self._executable]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -142,68 +176,101 @@ def __exit__(self, exc_type, exc_value, traceback):
                     )
                 )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = next(self._sequence)
+
+        remaining_dep_count = 0
+        for dep in deps:
+            if dep in self._failed or dep in self._abandoned:
+                self._has_failed_dep.add(step_key)
+            elif dep not in self._success and dep not in self._skipped:
+                remaining_dep_count += 1
+                self._downstream_pending[dep].add(step_key)
+
+        self._remaining_dep_count[step_key] = remaining_dep_count
+        if remaining_dep_count == 0 or step_key in self._has_failed_dep:
+            self._ready_to_process.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> Set[str]:
+        deps = self._pending.pop(step_key)
+        del self._pending_order[step_key]
+        del self._remaining_dep_count[step_key]
+        self._has_failed_dep.discard(step_key)
+        for dep in deps:
+            downstream = self._downstream_pending.get(dep)
+            if downstream:
+                downstream.discard(step_key)
+        return deps
+
+    def _notify_downstream_pending(self, step_key: str, succeeded_or_skipped: bool) -> None:
+        """Updates the pending steps that depend on a step that has reached a terminal state"""
+        for downstream_key in self._downstream_pending.pop(step_key, set()):
+            if succeeded_or_skipped:
+                self._remaining_dep_count[downstream_key] -= 1
+                if self._remaining_dep_count[downstream_key] == 0:
+                    self._ready_to_process.add(downstream_key)
+            else:
+                self._has_failed_dep.add(downstream_key)
+                self._ready_to_process.add(downstream_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._sequence), step_key),
+        )
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed
         """
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        new_steps_to_abandon = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._step_deps[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
-
-            # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
-
-                # The base case is downstream step won't skip
-                should_skip = False
+        ready_to_process = sorted(
+            self._ready_to_process, key=lambda step_key: self._pending_order[step_key]
+        )
+        self._ready_to_process = set()
 
-                # If there is at least one of the step's inputs, none of whose upstream steps has
-                # yielded an output, we should skip that step.
-                for step_input in step.step_inputs:
-                    missing_source_handles = [
-                        source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
-                        if source_handle.step_key in requirements
-                        and source_handle not in self._step_outputs
-                    ]
-                    if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
-                            should_skip = True
-                            break
-
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        for step_key in ready_to_process:
+            # If any upstream deps failed - this is not executable
+            if step_key in self._has_failed_dep:
+                self._remove_pending(step_key)
+                self._pending_abandon.append(step_key)
+                continue
+
+            # All the upstream steps of the step are complete or skipped
+            requirements = self._remove_pending(step_key)
+            step = self.get_step_by_key(step_key)
+
+            # The base case is downstream step won't skip
+            should_skip = False
+
+            # If there is at least one of the step's inputs, none of whose upstream steps has
+            # yielded an output, we should skip that step.
+            for step_input in step.step_inputs:
+                missing_source_handles = [
+                    source_handle
+                    for source_handle in step_input.get_step_output_handle_dependencies()
+                    if source_handle.step_key in requirements
+                    and source_handle not in self._step_outputs
+                ]
+                if missing_source_handles:
+                    if len(missing_source_handles) == len(
+                        step_input.get_step_output_handle_dependencies()
+                    ):
+                        should_skip = True
+                        break
+
+            if should_skip:
+                self._pending_skip.append(step_key)
+            else:
+                self._push_executable(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -212,7 +279,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self) -> None:
@@ -248,18 +315,13 @@ def get_steps_to_execute(self, limit: int = None) -> List[ExecutionStep]:
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        if limit:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            step = self.get_step_by_key(step_key)
+            self._in_flight.add(step_key)
             self._prep_for_dynamic_outputs(step)
+            steps.append(step)
 
         return steps
 
@@ -267,12 +329,12 @@ def get_steps_to_skip(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._prep_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -281,11 +343,11 @@ def get_steps_to_abandon(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -341,20 +403,26 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._notify_downstream_pending(step_key, succeeded_or_skipped=False)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._notify_downstream_pending(step_key, succeeded_or_skipped=True)
         self._resolve_any_dynamic_outputs(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._notify_downstream_pending(step_key, succeeded_or_skipped=True)
         self._resolve_any_dynamic_outputs(step_key)
+        self._mark_inputs_consumed(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._notify_downstream_pending(step_key, succeeded_or_skipped=False)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -374,11 +442,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._notify_downstream_pending(step_key, succeeded_or_skipped=False)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -439,6 +508,52 @@ def mark_unknown_state(self, step_key: str) -> None:
     def mark_step_produced_output(self, step_output_handle: StepOutputHandle) -> None:
         self._step_outputs.add(step_output_handle)
 
+    def _get_output_consumers(
+        self,
+    ) -> Tuple[Dict[StepOutputHandle, Set[str]], Dict[str, Set[StepOutputHandle]]]:
+        executable_keys = set(self._step_deps.keys())
+
+        # Steps that are not executable yet (e.g. downstream of dynamic outputs) or that are not
+        # being executed can add consumers to the outputs of their upstream steps at any time, so
+        # those outputs are never released
+        untracked_step_keys: Set[str] = set()
+        for step in self._plan.steps:
+            if step.key not in executable_keys:
+                untracked_step_keys.update(_get_dependency_keys(step))
+
+        output_consumers: Dict[StepOutputHandle, Set[str]] = defaultdict(set)
+        consumed_outputs: Dict[str, Set[StepOutputHandle]] = defaultdict(set)
+        for step_key in executable_keys:
+            for step_input in self.get_step_by_key(step_key).step_inputs:
+                for handle in step_input.get_step_output_handle_dependencies():
+                    if handle.step_key in executable_keys and (
+                        handle.step_key not in untracked_step_keys
+                    ):
+                        output_consumers[handle].add(step_key)
+                        consumed_outputs[step_key].add(handle)
+
+        return dict(output_consumers), dict(consumed_outputs)
+
+    def _mark_inputs_consumed(self, step_key: str) -> None:
+        # Only steps that succeed or are skipped count as done consuming their inputs, so that
+        # the inputs of failed steps remain available for retries and re-execution
+        for handle in self._consumed_outputs.pop(step_key, set()):
+            consumers = self._output_consumers[handle]
+            consumers.discard(step_key)
+            if not consumers:
+                del self._output_consumers[handle]
+                if handle in self._step_outputs:
+                    self._outputs_to_release.append(handle)
+
+    def get_outputs_to_release(self) -> List[StepOutputHandle]:
+        """Returns the outputs that are no longer needed by any step in the plan, i.e. outputs for
+        which every consuming step has succeeded or been skipped. Each output is returned once.
+        Outputs without any consumers in the plan are never returned.
+        """
+        outputs_to_release = self._outputs_to_release
+        self._outputs_to_release = []
+        return outputs_to_release
+
     @property
     def is_complete(self) -> bool:
         return (
@@ -21,20 +21,21 @@
     step_failure_event_from_exc_info,
 )
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.release import release_outputs_in_process
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
 def inner_plan_execution_iterator(
-    pipeline_context: PlanExecutionContext, execution_plan: ExecutionPlan
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    release_outputs: bool = False,
 ) -> Iterator[DagsterEvent]:
     check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.bool_param(release_outputs, "release_outputs")
 
     with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
 
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = cast(
@@ -83,6 +84,12 @@ def inner_plan_execution_iterator(
             for hook_event in _trigger_hook(step_context, step_event_list):
                 yield hook_event
 
+            # release outputs that are no longer needed by any step
+            if release_outputs:
+                release_outputs_in_process(
+                    pipeline_context, active_execution.get_outputs_to_release()
+                )
+
 
 def _trigger_hook(
     step_context: StepExecutionContext, step_event_list: List[DagsterEvent]
@@ -1,3 +1,5 @@
+import threading
+import weakref
 from collections import OrderedDict, defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -8,11 +10,12 @@
     NamedTuple,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.definitions import (
     GraphDefinition,
     IPipeline,
@@ -44,6 +47,9 @@
 from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.core.types.dagster_type import DagsterTypeKind
 from dagster.core.utils import toposort
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.serdes.utils import hash_str
+from dagster.utils import LRUCache
 
 from ..context.output import get_output_context
 from ..resolve_versions import resolve_step_output_versions
@@ -874,6 +880,7 @@ def build(
         known_state=None,
         instance=None,
         tags=None,
+        pipeline_snapshot_id=None,
     ) -> "ExecutionPlan":
         """Here we build a new ExecutionPlan from a pipeline definition and the resolved run config.
 
@@ -882,12 +889,27 @@ def build(
 
         Once we've processed the entire pipeline, we invoke _PlanBuilder.build() to construct the
         ExecutionPlan object.
+
+        If the snapshot id of the pipeline is known (e.g. from the run being executed), it is used
+        to share built plans between definitions of the same pipeline.
         """
         check.inst_param(pipeline, "pipeline", IPipeline)
         check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
         check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
         check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         tags = check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
+        check.opt_str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+
+        pipeline_def = pipeline.get_definition()
+        cache_key = _get_execution_plan_cache_key(
+            pipeline_def, resolved_run_config, step_keys_to_execute, known_state, tags
+        )
+        if cache_key is not None:
+            plan_cache, pipeline_key = _get_execution_plan_cache(pipeline_def, pipeline_snapshot_id)
+            cache_key = pipeline_key + cache_key
+            cached_plan = plan_cache.get(cache_key)
+            if cached_plan is not None:
+                return _copy_execution_plan(cached_plan)
 
         plan_builder = _PlanBuilder(
             pipeline,
@@ -899,7 +921,12 @@ def build(
         )
 
         # Finally, we build and return the execution plan
-        return plan_builder.build()
+        plan = plan_builder.build()
+
+        if cache_key is not None:
+            plan_cache.set(cache_key, _copy_execution_plan(plan))
+
+        return plan
 
     @staticmethod
     def rebuild_step_input(step_input_snap):
@@ -1018,6 +1045,91 @@ def rebuild_from_snapshot(pipeline_name, execution_plan_snapshot):
         )
 
 
+# The number of execution plans cached for each pipeline definition, and for pipeline snapshot ids
+EXECUTION_PLAN_CACHE_SIZE = 32
+
+# Dict[PipelineDefinition, LRUCache[Tuple, ExecutionPlan]], so that cached plans are released along
+# with their definitions (e.g. when a repository is reloaded). Plans for a pipeline subset are
+# cached with the pipeline that it is a subset of, since a new subset definition is built for each
+# subset execution.
+_execution_plan_caches: "weakref.WeakKeyDictionary[PipelineDefinition, LRUCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_execution_plan_caches_lock = threading.Lock()
+
+# Plans built for a known pipeline snapshot id, which identifies a pipeline across definitions that
+# are loaded separately (e.g. for each step of a run executed in the same worker process)
+_execution_plans_by_snapshot_id: LRUCache = LRUCache(EXECUTION_PLAN_CACHE_SIZE)
+
+
+def _get_execution_plan_cache(
+    pipeline_def: PipelineDefinition, pipeline_snapshot_id: Optional[str]
+) -> Tuple[LRUCache, Tuple]:
+    """Returns the cache that holds the plans built for a pipeline, along with the key that
+    identifies the pipeline within that cache.
+    """
+    if pipeline_snapshot_id:
+        return _execution_plans_by_snapshot_id, (pipeline_snapshot_id,)
+
+    if pipeline_def.is_subset_pipeline:
+        root_pipeline_def = pipeline_def.parent_pipeline_def
+        pipeline_key: Tuple = (frozenset(pipeline_def.solids_to_execute),)
+    else:
+        root_pipeline_def = pipeline_def
+        pipeline_key = (None,)
+
+    with _execution_plan_caches_lock:
+        if root_pipeline_def not in _execution_plan_caches:
+            _execution_plan_caches[root_pipeline_def] = LRUCache(EXECUTION_PLAN_CACHE_SIZE)
+        return _execution_plan_caches[root_pipeline_def], pipeline_key
+
+
+def _get_execution_plan_cache_key(
+    pipeline_def: PipelineDefinition,
+    resolved_run_config: ResolvedRunConfig,
+    step_keys_to_execute: Optional[List[str]],
+    known_state: Optional[KnownExecutionState],
+    tags: Dict[str, str],
+) -> Optional[Tuple]:
+    """Returns the key that identifies the execution plan built for these arguments within the
+    plans cached for a pipeline, or None if the plan should not be cached.
+    """
+    # memoized plans depend on the outputs stored on the instance, which can change at any time
+    if pipeline_def.is_using_memoization(tags):
+        return None
+
+    try:
+        # a missing run config resolves the same way as an empty one
+        run_config_id = hash_str(
+            seven.json.dumps(resolved_run_config.original_config_dict or {}, sort_keys=True)
+        )
+    except (TypeError, ValueError):
+        # run config passed in process can contain values that are not JSON serializable
+        return None
+
+    return (
+        resolved_run_config.mode,
+        run_config_id,
+        tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+        hash_str(serialize_dagster_namedtuple(known_state)) if known_state else None,
+    )
+
+
+def _copy_execution_plan(plan: ExecutionPlan) -> ExecutionPlan:
+    # ExecutionPlan.resolve updates the plan's step collections in place as dynamic outputs are
+    # resolved, so each caller gets its own copy of them. The steps themselves are immutable.
+    return plan._replace(
+        step_dict=dict(plan.step_dict),
+        executable_map=dict(plan.executable_map),
+        resolvable_map={
+            required_keys: list(step_handles)
+            for required_keys, step_handles in plan.resolvable_map.items()
+        },
+        step_handles_to_execute=list(plan.step_handles_to_execute),
+        step_dict_by_key=dict(plan.step_dict_by_key),
+    )
+
+
 def _update_from_resolved_dynamic_outputs(
     step_dict: Dict[StepHandleUnion, IExecutionStep],
     step_dict_by_key: Dict[str, IExecutionStep],
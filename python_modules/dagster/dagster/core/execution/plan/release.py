@@ -0,0 +1,134 @@
+"""Release step outputs once every step that consumes them has finished.
+
+Outputs are released by calling :py:meth:`IOManager.release_output` on the IO manager that
+stored them. See ``ActiveExecution.get_outputs_to_release`` for how outputs become releasable.
+"""
+import sys
+from typing import Dict, List
+
+from dagster import check
+from dagster.core.definitions.resource import Resources
+from dagster.core.execution.context.output import get_output_context
+from dagster.core.execution.context.system import (
+    PlanExecutionContext,
+    PlanOrchestrationContext,
+    StepExecutionContext,
+)
+from dagster.core.execution.resources_init import (
+    get_transitive_required_resource_keys,
+    resource_initialization_manager,
+)
+from dagster.core.storage.io_manager import IOManager
+from dagster.core.system_config.objects import ResolvedRunConfig
+from dagster.utils import EventGenerationManager
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .outputs import StepOutputHandle
+
+
+def _log_release_failure(log, step_output_handle):
+    error_info = serializable_error_info_from_exc_info(sys.exc_info())
+    log.warning(
+        "Failed to release output {output_name} of step {step_key}, it will be kept in storage:\n"
+        "{error}".format(
+            output_name=step_output_handle.output_name,
+            step_key=step_output_handle.step_key,
+            error=error_info.to_string(),
+        )
+    )
+
+
+def release_outputs_in_process(
+    pipeline_context: PlanExecutionContext, step_output_handles: List[StepOutputHandle]
+) -> None:
+    """Release outputs using the resources already initialized for an in-process execution."""
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+
+    for step_output_handle in step_output_handles:
+        step_context = pipeline_context.for_step(
+            pipeline_context.execution_plan.get_executable_step_by_key(step_output_handle.step_key)
+        )
+        step_context = check.inst(step_context, StepExecutionContext)
+        try:
+            io_manager = step_context.get_io_manager(step_output_handle)
+            io_manager.release_output(step_context.get_output_context(step_output_handle))
+        except Exception:  # pylint: disable=broad-except
+            _log_release_failure(step_context.log, step_output_handle)
+
+
+class OrchestratorOutputReleaser:
+    """Releases outputs on behalf of an executor whose orchestrating process does not otherwise
+    initialize resources, e.g. because steps are executed in other processes.
+
+    The IO managers needed to release outputs (and the resources they depend on) are initialized
+    lazily, at most once per IO manager key, and torn down when the releaser is closed.
+    """
+
+    def __init__(self, plan_context: PlanOrchestrationContext):
+        self._plan_context = check.inst_param(
+            plan_context, "plan_context", PlanOrchestrationContext
+        )
+        self._pipeline_def = plan_context.pipeline.get_definition()
+        self._resolved_run_config = ResolvedRunConfig.build(
+            self._pipeline_def, plan_context.run_config, mode=plan_context.pipeline_run.mode
+        )
+        self._resource_defs = self._pipeline_def.get_mode_definition(
+            self._resolved_run_config.mode
+        ).resource_defs
+        self._resources_by_io_manager_key: Dict[str, Resources] = {}
+        self._resource_managers: List[EventGenerationManager] = []
+
+    def _get_resources(self, io_manager_key: str) -> Resources:
+        if io_manager_key not in self._resources_by_io_manager_key:
+            resource_manager = resource_initialization_manager(
+                resource_defs=self._resource_defs,
+                resource_configs=self._resolved_run_config.resources,
+                log_manager=self._plan_context.log,
+                execution_plan=self._plan_context.execution_plan,
+                pipeline_run=self._plan_context.pipeline_run,
+                resource_keys_to_init=get_transitive_required_resource_keys(
+                    {io_manager_key}, self._resource_defs
+                ),
+                instance=self._plan_context.instance,
+                emit_persistent_events=False,
+                pipeline_def_for_backwards_compat=self._pipeline_def,
+            )
+            list(resource_manager.generate_setup_events())
+            self._resource_managers.append(resource_manager)
+            self._resources_by_io_manager_key[io_manager_key] = resource_manager.get_object().build(
+                {io_manager_key}
+            )
+
+        return self._resources_by_io_manager_key[io_manager_key]
+
+    def release(self, step_output_handles: List[StepOutputHandle]) -> None:
+        check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+
+        execution_plan = self._plan_context.execution_plan
+        for step_output_handle in step_output_handles:
+            try:
+                io_manager_key = execution_plan.get_manager_key(
+                    step_output_handle, self._pipeline_def
+                )
+                resources = self._get_resources(io_manager_key)
+                io_manager = check.inst(getattr(resources, io_manager_key), IOManager)
+                io_manager.release_output(
+                    get_output_context(
+                        execution_plan,
+                        self._pipeline_def,
+                        self._resolved_run_config,
+                        step_output_handle,
+                        self._plan_context.run_id,
+                        log_manager=self._plan_context.log,
+                        step_context=None,
+                        resources=resources,
+                        version=None,
+                    )
+                )
+            except Exception:  # pylint: disable=broad-except
+                _log_release_failure(self._plan_context.log, step_output_handle)
+
+    def close(self) -> None:
+        while self._resource_managers:
+            list(self._resource_managers.pop().generate_teardown_events())
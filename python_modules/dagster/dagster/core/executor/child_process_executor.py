@@ -5,10 +5,12 @@
 import sys
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from multiprocessing import connection
 
 from dagster import check
 from dagster.core.errors import DagsterExecutionInterruptedError
 from dagster.seven import multiprocessing
+from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.interrupts import capture_interrupts
 
@@ -59,24 +61,45 @@ def _execute_command_in_child_process(event_queue, command):
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
-        pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
-        try:
-            for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
-
-        # pylint: disable=broad-except
-        except (
-            Exception,
-            KeyboardInterrupt,
-            DagsterExecutionInterruptedError,
-        ):
-            event_queue.put(
-                ChildProcessSystemErrorEvent(
-                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
+        _execute_command(event_queue, command)
+
+
+def _execute_command(event_queue, command):
+    pid = os.getpid()
+    event_queue.put(ChildProcessStartEvent(pid=pid))
+    try:
+        for step_event in command.execute():
+            event_queue.put(step_event)
+        event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+    # pylint: disable=broad-except
+    except (
+        Exception,
+        KeyboardInterrupt,
+        DagsterExecutionInterruptedError,
+    ):
+        event_queue.put(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
             )
+        )
+
+
+def _execute_commands_in_worker_process(command_queue, event_queue, term_event):
+    """Runs ChildProcessCommands received over the command queue, one at a time, until the
+    worker is told to stop by a None sentinel."""
+
+    with capture_interrupts():
+        if term_event:
+            start_termination_thread(term_event)
+
+        while True:
+            command = command_queue.get()
+            if command is None:
+                break
+
+            check.inst(command, ChildProcessCommand)
+            _execute_command(event_queue, command)
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -86,9 +109,9 @@ def _execute_command_in_child_process(event_queue, command):
 """Sentinel value."""
 
 
-def _poll_for_event(process, event_queue):
+def _poll_for_event(process, event_queue, block=True):
     try:
-        return event_queue.get(block=True, timeout=TICK)
+        return event_queue.get(block=block, timeout=TICK if block else None)
     except queue.Empty:
         if not process.is_alive():
             # There is a possibility that after the last queue.get the
@@ -104,7 +127,30 @@ def _poll_for_event(process, event_queue):
     return None
 
 
-def execute_child_process_command(command):
+def _child_process_wait_handles(process, event_queue):
+    # The reading end of the queue's pipe becomes ready when the child process puts an event, and
+    # the process sentinel becomes ready when the child process exits
+    return [event_queue._reader, process.sentinel]  # pylint: disable=protected-access
+
+
+def wait_for_child_processes(wait_handles, timeout):
+    """Block until any of the given wait handles is ready, or until the timeout elapses.
+
+    Args:
+        wait_handles (List): Wait handles collected from execute_child_process_command or
+            ChildProcessWorker.execute_command.
+        timeout (float): The maximum number of seconds to block for.
+
+    Returns:
+        List: The wait handles that are ready.
+    """
+    check.list_param(wait_handles, "wait_handles")
+    check.numeric_param(timeout, "timeout")
+
+    return connection.wait(wait_handles, timeout=timeout)
+
+
+def execute_child_process_command(command, wait_handles=None):
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
@@ -126,12 +172,18 @@ def execute_child_process_command(command):
 
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
+        wait_handles (Optional[List]): If provided, the handles that become ready when the child
+            process emits an event or exits are appended to this list once the process has
+            started, and the iterator yields None immediately rather than blocking for up to a
+            TICK when no event is available. This allows the caller to multiplex many child
+            processes with a single call to wait_for_child_processes.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
 
     check.inst_param(command, "command", ChildProcessCommand)
+    check.opt_list_param(wait_handles, "wait_handles")
 
     event_queue = multiprocessing.Queue()
     try:
@@ -140,23 +192,143 @@ def execute_child_process_command(command):
         )
         process.start()
 
-        completed_properly = False
+        if wait_handles is not None:
+            wait_handles.extend(_child_process_wait_handles(process, event_queue))
 
-        while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+        yield from _wait_for_command(process, event_queue, block=wait_handles is None)
 
-            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-                break
+        process.join()
+    finally:
+        event_queue.close()
 
-            yield event
 
-            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-                completed_properly = True
+def _wait_for_command(process, event_queue, block):
+    completed_properly = False
 
-        if not completed_properly:
-            # TODO Figure out what to do about stderr/stdout
-            raise ChildProcessCrashException(exit_code=process.exitcode)
+    while not completed_properly:
+        event = _poll_for_event(process, event_queue, block=block)
 
-        process.join()
-    finally:
-        event_queue.close()
+        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+            break
+
+        yield event
+
+        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+            completed_properly = True
+
+    if not completed_properly:
+        # TODO Figure out what to do about stderr/stdout
+        raise ChildProcessCrashException(exit_code=process.exitcode)
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""Seconds to wait for an idle worker to exit cleanly before it is terminated."""
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes a series of ChildProcessCommands.
+
+    Unlike execute_child_process_command, which starts a new process for every command, a worker
+    keeps its interpreter (and anything the commands have imported or cached in it) warm between
+    commands. Commands are executed one at a time.
+
+    Args:
+        term_event (Optional[multiprocessing.Event]): If set, the worker process is interrupted
+            when this event is set. Since events can only be shared with a process when it is
+            started, this is used in place of any per-command termination event.
+    """
+
+    def __init__(self, term_event=None):
+        self._term_event = term_event
+        self._command_queue = multiprocessing.Queue()
+        self._event_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, term_event),
+        )
+        self._process.start()
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def term_event(self):
+        return self._term_event
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def execute_command(self, command, wait_handles=None):
+        """Execute a ChildProcessCommand in this worker.
+
+        Yields the same sequence of objects as execute_child_process_command, and accepts
+        wait_handles in the same way. If the worker dies before the command completes, raises
+        ChildProcessCrashException; the worker cannot be used afterwards.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.opt_list_param(wait_handles, "wait_handles")
+        check.invariant(self.is_alive(), "Cannot execute a command in a dead worker")
+
+        self._command_queue.put(command)
+
+        if wait_handles is not None:
+            wait_handles.extend(_child_process_wait_handles(self._process, self._event_queue))
+
+        yield from _wait_for_command(self._process, self._event_queue, block=wait_handles is None)
+
+    def shutdown(self):
+        if self._process.is_alive():
+            self._command_queue.put(None)
+            self._process.join(WORKER_SHUTDOWN_TIMEOUT)
+
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A bounded set of ChildProcessWorkers, each checked out to at most one key at a time.
+
+    Workers are started lazily. A worker that has died is discarded when it is released, and a
+    replacement is started the next time a worker is needed.
+    """
+
+    def __init__(self, max_workers):
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._idle = []
+        self._in_use = {}
+
+    def acquire(self, key):
+        check.invariant(key not in self._in_use, "Worker already acquired for {}".format(key))
+
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.is_alive():
+                break
+            worker.shutdown()
+        else:
+            check.invariant(
+                len(self._in_use) < self._max_workers,
+                "All {} workers are in use".format(self._max_workers),
+            )
+            worker = ChildProcessWorker(term_event=multiprocessing.Event())
+
+        self._in_use[key] = worker
+        return worker
+
+    def release(self, key):
+        worker = self._in_use.pop(key)
+        if worker.is_alive() and not worker.term_event.is_set():
+            self._idle.append(worker)
+        else:
+            worker.shutdown()
+
+    def shutdown(self):
+        for worker in self._idle + list(self._in_use.values()):
+            worker.shutdown()
+        self._idle = []
+        self._in_use = {}
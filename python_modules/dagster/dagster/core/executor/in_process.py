@@ -1,4 +1,5 @@
 import os
+from functools import partial
 
 from dagster import check
 from dagster.core.events import DagsterEvent, EngineEventData
@@ -14,9 +15,10 @@
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries, marker_to_close):
+    def __init__(self, retries, marker_to_close, release_outputs=False):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self.release_outputs = check.bool_param(release_outputs, "release_outputs")
 
     @property
     def retries(self):
@@ -38,7 +40,9 @@ def execute(self, plan_context, execution_plan):
             yield from iter(
                 ExecuteRunWithPlanIterable(
                     execution_plan=plan_context.execution_plan,
-                    iterator=inner_plan_execution_iterator,
+                    iterator=partial(
+                        inner_plan_execution_iterator, release_outputs=self.release_outputs
+                    ),
                     execution_context_manager=PlanExecutionContextManager(
                         pipeline=plan_context.pipeline,
                         retry_mode=plan_context.retry_mode,
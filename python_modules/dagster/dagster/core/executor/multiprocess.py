@@ -8,6 +8,7 @@
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.release import OrchestratorOutputReleaser
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.base import Executor
 from dagster.core.instance import DagsterInstance
@@ -21,11 +22,20 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    wait_for_child_processes,
 )
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+WAIT_FOR_CHILD_PROCESSES_TIMEOUT = 0.5
+"""The longest the executor blocks waiting on its child processes, so that termination requests
+are still forwarded promptly."""
+
+MAX_EVENTS_PER_CHILD_BATCH = 100
+"""The most events handled from one child process before moving on to the others."""
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -51,17 +61,23 @@ def __init__(
     def execute(self):
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # Commands run in a warm worker are interrupted through the worker's own
+            # termination event
+            if self.term_event:
+                start_termination_thread(self.term_event)
             execution_plan = create_execution_plan(
                 pipeline=pipeline,
                 run_config=self.run_config,
                 mode=self.pipeline_run.mode,
                 step_keys_to_execute=[self.step_key],
                 known_state=self.known_state,
+                pipeline_snapshot_id=self.pipeline_run.pipeline_snapshot_id,
             )
 
             yield instance.report_engine_event(
-                "Executing step {} in subprocess".format(self.step_key),
+                "Executing step {} in {}".format(
+                    self.step_key, "worker process" if self.term_event is None else "subprocess"
+                ),
                 self.pipeline_run,
                 EngineEventData(
                     [
@@ -85,10 +101,12 @@ def execute(self):
 
 
 class MultiprocessExecutor(Executor):
-    def __init__(self, retries, max_concurrent=None):
+    def __init__(self, retries, max_concurrent=None, worker_pool=False, release_outputs=False):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self.worker_pool = check.bool_param(worker_pool, "worker_pool")
+        self.release_outputs = check.bool_param(release_outputs, "release_outputs")
 
     @property
     def retries(self):
@@ -112,14 +130,22 @@ def execute(self, plan_context, execution_plan):
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+        # When enabled, steps are executed in up to `limit` long-lived worker processes that are
+        # reused across steps, instead of a fresh process per step
+        worker_pool = ChildProcessWorkerPool(limit) if self.worker_pool else None
+
+        # When enabled, outputs that are no longer needed by any step are released from this
+        # process as steps complete
+        output_releaser = OrchestratorOutputReleaser(plan_context) if self.release_outputs else None
+
+        with time_execution_scope() as timer_result, execution_plan.start(
+            retry_mode=self.retries
+        ) as active_execution:
+            try:
                 active_iters = {}
                 errors = {}
                 term_events = {}
+                wait_handles = {}
                 stopping = False
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -146,7 +172,11 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiprocessing.Event()
+                            worker = worker_pool.acquire(step.key) if worker_pool else None
+                            term_events[step.key] = (
+                                worker.term_event if worker else multiprocessing.Event()
+                            )
+                            wait_handles[step.key] = []
                             active_iters[step.key] = self.execute_step_out_of_process(
                                 pipeline,
                                 step_context,
@@ -154,16 +184,22 @@ def execute(self, plan_context, execution_plan):
                                 errors,
                                 term_events,
                                 active_execution.get_known_state(),
+                                worker=worker,
+                                wait_handles=wait_handles[step.key],
                             )
 
-                    # process active iterators
+                    # process active iterators, handling every event that is already available
+                    # from each child before moving on to the next
                     empty_iters = []
+                    received_events = False
                     for key, step_iter in active_iters.items():
                         try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
+                            for _ in range(MAX_EVENTS_PER_CHILD_BATCH):
+                                event_or_none = next(step_iter)
+                                if event_or_none is None:
+                                    break
+
+                                received_events = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -198,11 +234,26 @@ def execute(self, plan_context, execution_plan):
                     for key in empty_iters:
                         del active_iters[key]
                         del term_events[key]
+                        del wait_handles[key]
+                        if worker_pool:
+                            worker_pool.release(key)
                         active_execution.verify_complete(plan_context, key)
 
+                    # if nothing happened, block until any child emits an event or exits rather
+                    # than polling each of them in turn
+                    if active_iters and not received_events and not empty_iters:
+                        wait_for_child_processes(
+                            [handle for handles in wait_handles.values() for handle in handles],
+                            timeout=WAIT_FOR_CHILD_PROCESSES_TIMEOUT,
+                        )
+
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
 
+                    # release outputs that are no longer needed by any step
+                    if output_releaser:
+                        output_releaser.release(active_execution.get_outputs_to_release())
+
                 errs = {pid: err for pid, err in errors.items() if err}
 
                 # After termination starts, raise an interrupted exception once all subprocesses
@@ -235,6 +286,11 @@ def execute(self, plan_context, execution_plan):
                         ),
                         subprocess_error_infos=list(errs.values()),
                     )
+            finally:
+                if worker_pool:
+                    worker_pool.shutdown()
+                if output_releaser:
+                    output_releaser.close()
 
         yield DagsterEvent.engine_event(
             plan_context,
@@ -245,14 +301,22 @@ def execute(self, plan_context, execution_plan):
         )
 
     def execute_step_out_of_process(
-        self, pipeline, step_context, step, errors, term_events, known_state
+        self,
+        pipeline,
+        step_context,
+        step,
+        errors,
+        term_events,
+        known_state,
+        worker=None,
+        wait_handles=None,
     ):
         command = MultiprocessExecutorChildProcessCommand(
             run_config=step_context.run_config,
             pipeline_run=step_context.pipeline_run,
             step_key=step.key,
             instance_ref=step_context.instance.get_ref(),
-            term_event=term_events[step.key],
+            term_event=None if worker else term_events[step.key],
             recon_pipeline=pipeline,
             retry_mode=self.retries,
             known_state=known_state,
@@ -260,12 +324,19 @@ def execute_step_out_of_process(
 
         yield DagsterEvent.engine_event(
             step_context,
-            "Launching subprocess for {}".format(step.key),
+            "Launching subprocess for {}".format(step.key)
+            if worker is None
+            else "Sending {} to worker process (pid: {})".format(step.key, worker.pid),
             EngineEventData(marker_start=DELEGATE_MARKER),
             step_handle=step.handle,
         )
 
-        for ret in execute_child_process_command(command):
+        events = (
+            worker.execute_command(command, wait_handles=wait_handles)
+            if worker
+            else execute_child_process_command(command, wait_handles=wait_handles)
+        )
+        for ret in events:
             if ret is None or isinstance(ret, DagsterEvent):
                 yield ret
             elif isinstance(ret, ChildProcessEvent):
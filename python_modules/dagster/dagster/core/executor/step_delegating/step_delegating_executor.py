@@ -1,4 +1,4 @@
-import time
+import threading
 from typing import Dict, List, Optional, cast
 
 import pendulum
@@ -23,6 +23,7 @@ def __init__(
         retries: RetryMode,
         sleep_seconds: Optional[float] = None,
         check_step_health_interval_seconds: Optional[int] = None,
+        event_poll_interval_seconds: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -35,15 +36,53 @@ def __init__(
                 check_step_health_interval_seconds, "check_step_health_interval_seconds", default=20
             ),
         )
+        # The event log storage's watch on the run wakes the executor to read new events. The event
+        # log is also read if the watch has not woken the executor in this long, in case the
+        # storage's watch mechanism misses a write.
+        self._event_poll_interval_seconds = cast(
+            float,
+            check.opt_float_param(
+                event_poll_interval_seconds, "event_poll_interval_seconds", default=5.0
+            ),
+        )
 
     @property
     def retries(self):
         return self._retries
 
-    def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor)
-        self._event_cursor += len(events)
-        return [event.dagster_event for event in events if event.is_dagster_event]
+    def _poll_events(self, instance, run_id) -> List[DagsterEvent]:
+        """Reads the events of the run stored after the last record read. Records are read by
+        storage id, so each event is handled once, however often the event log watch wakes the
+        executor and whether or not the watch saw the event."""
+        records = [
+            record
+            for record in instance.records_after(run_id, self._event_cursor)
+            if record.storage_id > self._event_cursor
+        ]
+        if records:
+            self._event_cursor = records[-1].storage_id
+            self._num_events_read += len(records)
+        return [
+            record.event_log_entry.dagster_event
+            for record in records
+            if record.event_log_entry.is_dagster_event
+        ]
+
+    def _get_new_events(self, instance, run_id, woken: threading.Event) -> List[DagsterEvent]:
+        """Reads the new events of the run if the event log watch woke the executor, or if it has
+        not in a while."""
+        curr_time = pendulum.now("UTC")
+        if (
+            not woken.is_set()
+            and (curr_time - self._last_event_poll_time).total_seconds()
+            < self._event_poll_interval_seconds
+        ):
+            return []
+
+        # cleared before reading, so that a write during the read wakes the executor again
+        woken.clear()
+        self._last_event_poll_time = curr_time
+        return self._poll_events(instance, run_id)
 
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
@@ -76,7 +115,13 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
+        # the storage id of the last record read from the event log, the number of records read,
+        # and when they were last read
         self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._num_events_read = 0  # pylint: disable=attribute-defined-outside-init
+        self._last_event_poll_time = pendulum.now(  # pylint: disable=attribute-defined-outside-init
+            "UTC"
+        )
 
         yield DagsterEvent.engine_event(
             plan_context,
@@ -84,6 +129,35 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
+        # The events already written for the run are read once up front, so that the watch only
+        # wakes the executor for the events written from here on
+        initial_events = self._poll_events(plan_context.instance, plan_context.run_id)
+
+        # The watch is only used to wake the executor, which then reads the new records by storage
+        # id. Events that the watch delivers are not handled directly, since storages number
+        # watched events differently and may skip some.
+        woken = threading.Event()
+
+        def _on_new_event(_event):
+            woken.set()
+
+        plan_context.instance.watch_event_logs(
+            plan_context.run_id, self._num_events_read - 1, _on_new_event
+        )
+        try:
+            yield from self._execute_with_event_watch(
+                plan_context, execution_plan, initial_events, woken
+            )
+        finally:
+            plan_context.instance.end_watch_event_logs(plan_context.run_id, _on_new_event)
+
+    def _execute_with_event_watch(
+        self,
+        plan_context: PlanOrchestrationContext,
+        execution_plan: ExecutionPlan,
+        initial_events: List[DagsterEvent],
+        woken: threading.Event,
+    ):
         with execution_plan.start(retry_mode=self.retries) as active_execution:
             running_steps: Dict[str, ExecutionStep] = {}
 
@@ -94,14 +168,11 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     EngineEventData(),
                 )
 
-                events = self._pop_events(
-                    plan_context.instance,
-                    plan_context.run_id,
-                )
-                for dagster_event in events:
+                for dagster_event in initial_events:
                     yield dagster_event
 
-                possibly_in_flight_steps = active_execution.rebuild_from_events(events)
+                possibly_in_flight_steps = active_execution.rebuild_from_events(initial_events)
+                initial_events = []
                 for step in possibly_in_flight_steps:
 
                     yield DagsterEvent.engine_event(
@@ -134,7 +205,8 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
             last_check_step_health_time = pendulum.now("UTC")
             while not active_execution.is_complete:
-                events = []
+                events = initial_events
+                initial_events = []
 
                 if active_execution.check_for_interrupts():
                     if not plan_context.instance.run_will_resume(plan_context.run_id):
@@ -173,30 +245,29 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     return
 
+                curr_time = pendulum.now("UTC")
                 events.extend(
-                    self._pop_events(
-                        plan_context.instance,
-                        plan_context.run_id,
-                    )
+                    self._get_new_events(plan_context.instance, plan_context.run_id, woken)
                 )
 
-                curr_time = pendulum.now("UTC")
                 if (
-                    curr_time - last_check_step_health_time
-                ).total_seconds() >= self._check_step_health_interval_seconds:
+                    running_steps
+                    and (curr_time - last_check_step_health_time).total_seconds()
+                    >= self._check_step_health_interval_seconds
+                ):
                     last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
-                        events.extend(
-                            self._log_new_events(
-                                self._step_handler.check_step_health(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                ),
-                                plan_context,
-                                running_steps,
-                            )
+                    # check on all of the running steps at once
+                    events.extend(
+                        self._log_new_events(
+                            self._step_handler.check_steps_health(
+                                self._get_step_handler_context(
+                                    plan_context, list(running_steps.values()), active_execution
+                                )
+                            ),
+                            plan_context,
+                            running_steps,
                         )
+                    )
 
                 for step in active_execution.get_steps_to_execute():
                     running_steps[step.key] = step
@@ -229,4 +300,4 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                 for event in active_execution.plan_events_iterator(plan_context):
                     yield event
 
-                time.sleep(self._sleep_seconds)
+                woken.wait(self._sleep_seconds)
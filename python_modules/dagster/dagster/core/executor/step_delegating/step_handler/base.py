@@ -43,6 +43,19 @@ def step_tags(self) -> Dict[str, Dict[str, str]]:
     def instance(self) -> DagsterInstance:
         return self._instance
 
+    def for_step(self, step_key: str) -> "StepHandlerContext":
+        """A context for a single one of the steps of this context."""
+        check.invariant(
+            step_key in self.execute_step_args.step_keys_to_execute,
+            f"Step {step_key} is not in this context",
+        )
+        return StepHandlerContext(
+            instance=self._instance,
+            execute_step_args=self._execute_step_args._replace(step_keys_to_execute=[step_key]),
+            step_tags={step_key: self._step_tags[step_key]},
+            pipeline_run=self._pipeline_run,
+        )
+
 
 class StepHandler(abc.ABC):  # pylint: disable=no-init
     @abc.abstractproperty
@@ -57,6 +70,16 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterE
     def check_step_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         pass
 
+    def check_steps_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
+        """Check on the health of all of the steps in the context at once. Step handlers that can
+        check on many steps with a single request should override this method, so that the cost
+        of health checks does not grow with the number of steps in flight. By default, each step
+        is checked separately with `check_step_health`."""
+        events = []
+        for step_key in step_handler_context.execute_step_args.step_keys_to_execute:
+            events.extend(self.check_step_health(step_handler_context.for_step(step_key)))
+        return events
+
     @abc.abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         pass
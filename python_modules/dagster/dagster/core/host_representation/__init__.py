@@ -25,8 +25,10 @@
     ExternalPartitionTagsData,
     ExternalPipelineData,
     ExternalPipelineSubsetResult,
+    ExternalPipelineSummary,
     ExternalPresetData,
     ExternalRepositoryData,
+    ExternalRepositoryManifest,
     ExternalScheduleData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
@@ -1,3 +1,4 @@
+import threading
 import warnings
 from collections import OrderedDict
 from typing import Optional, Sequence
@@ -17,6 +18,7 @@
     ExternalAssetNode,
     ExternalPartitionSetData,
     ExternalPipelineData,
+    ExternalPipelineSummary,
     ExternalRepositoryData,
     ExternalScheduleData,
     ExternalSensorData,
@@ -33,32 +35,68 @@ class ExternalRepository:
     objects such as these to interact with user-defined artifacts.
     """
 
-    def __init__(self, external_repository_data, repository_handle):
-        self.external_repository_data = check.inst_param(
+    def __init__(
+        self,
+        external_repository_data,
+        repository_handle,
+        external_pipeline_summaries=None,
+        external_pipeline_data_loader=None,
+    ):
+        self._external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
         )
-        self._pipeline_index_map = OrderedDict(
-            (
-                external_pipeline_data.pipeline_snapshot.name,
-                PipelineIndex(
-                    external_pipeline_data.pipeline_snapshot,
-                    external_pipeline_data.parent_pipeline_snapshot,
-                ),
-            )
-            for external_pipeline_data in external_repository_data.external_pipeline_datas
+        self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+
+        # When summaries are passed in, the ExternalPipelineDatas are left out of the
+        # ExternalRepositoryData and loaded on demand with external_pipeline_data_loader, which
+        # takes a list of ExternalPipelineSummarys and returns their ExternalPipelineDatas
+        check.opt_list_param(
+            external_pipeline_summaries,
+            "external_pipeline_summaries",
+            of_type=ExternalPipelineSummary,
         )
-        self._job_index_map = OrderedDict(
-            (
-                external_pipeline_data.pipeline_snapshot.name,
-                PipelineIndex(
-                    external_pipeline_data.pipeline_snapshot,
-                    external_pipeline_data.parent_pipeline_snapshot,
-                ),
+        if external_pipeline_summaries is None:
+            self._external_pipeline_summaries = None
+            self._pipeline_names = OrderedDict.fromkeys(
+                external_pipeline_data.name
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+            )
+            self._job_names = set(
+                external_pipeline_data.name
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+                if external_pipeline_data.is_job
+            )
+            self._external_pipeline_datas = {
+                external_pipeline_data.name: external_pipeline_data
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+            }
+        else:
+            check.invariant(
+                not external_repository_data.external_pipeline_datas,
+                "ExternalPipelineDatas are loaded from the summaries, and should not also be "
+                "included in the ExternalRepositoryData",
+            )
+            self._external_pipeline_summaries = OrderedDict(
+                (summary.name, summary) for summary in external_pipeline_summaries
             )
-            for external_pipeline_data in external_repository_data.external_pipeline_datas
-            if external_pipeline_data.is_job
+            self._pipeline_names = OrderedDict.fromkeys(self._external_pipeline_summaries.keys())
+            self._job_names = set(
+                summary.name for summary in external_pipeline_summaries if summary.is_job
+            )
+            self._external_pipeline_datas = {}
+
+        self._external_pipeline_data_loader = check.opt_callable_param(
+            external_pipeline_data_loader, "external_pipeline_data_loader"
         )
-        self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        check.invariant(
+            external_pipeline_summaries is None or external_pipeline_data_loader is not None,
+            "external_pipeline_data_loader is required when passing external_pipeline_summaries",
+        )
+
+        # INVARIANT: _lock protects _external_pipeline_datas and _pipeline_index_map, so that
+        # each ExternalPipelineData is only loaded and indexed once
+        self._lock = threading.Lock()
+        self._pipeline_index_map = {}
 
         instigation_list = (
             external_repository_data.external_schedule_datas
@@ -72,42 +110,97 @@ def __init__(self, external_repository_data, repository_handle):
             for external_partition_set_data in external_repository_data.external_partition_set_datas
         )
 
+    @property
+    def external_repository_data(self):
+        """The full ExternalRepositoryData of the repository. Loads every pipeline in the
+        repository if they have not been loaded yet."""
+        if self._external_pipeline_summaries is None:
+            return self._external_repository_data
+
+        self._load_external_pipeline_datas(self._pipeline_names)
+        return self._external_repository_data._replace(
+            external_pipeline_datas=[
+                self._external_pipeline_datas[pipeline_name]
+                for pipeline_name in self._pipeline_names
+            ]
+        )
+
+    def _load_external_pipeline_datas(self, pipeline_names):
+        with self._lock:
+            summaries_to_load = [
+                self._external_pipeline_summaries[pipeline_name]
+                for pipeline_name in pipeline_names
+                if pipeline_name not in self._external_pipeline_datas
+            ]
+            if not summaries_to_load:
+                return
+
+            external_pipeline_datas = self._external_pipeline_data_loader(summaries_to_load)
+            for summary, external_pipeline_data in zip(summaries_to_load, external_pipeline_datas):
+                self._external_pipeline_datas[summary.name] = check.inst(
+                    external_pipeline_data, ExternalPipelineData
+                )
+
+    def _get_external_pipeline_data(self, pipeline_name):
+        if pipeline_name not in self._external_pipeline_datas:
+            if pipeline_name not in self._pipeline_names:
+                check.failed("Could not find external pipeline data named " + pipeline_name)
+            self._load_external_pipeline_datas([pipeline_name])
+
+        return self._external_pipeline_datas[pipeline_name]
+
     @property
     def name(self):
-        return self.external_repository_data.name
+        return self._external_repository_data.name
 
     def get_pipeline_index(self, pipeline_name):
+        if pipeline_name not in self._pipeline_index_map:
+            if pipeline_name not in self._pipeline_names:
+                raise KeyError(pipeline_name)
+
+            external_pipeline_data = self._get_external_pipeline_data(pipeline_name)
+            with self._lock:
+                if pipeline_name not in self._pipeline_index_map:
+                    self._pipeline_index_map[pipeline_name] = PipelineIndex(
+                        external_pipeline_data.pipeline_snapshot,
+                        external_pipeline_data.parent_pipeline_snapshot,
+                    )
+
         return self._pipeline_index_map[pipeline_name]
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_names
+
+    def get_pipeline_names(self):
+        return list(self._pipeline_names)
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        self._load_external_pipeline_datas(self._pipeline_names)
+        return [self.get_pipeline_index(pipeline_name) for pipeline_name in self._pipeline_names]
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_names
 
     def get_external_schedule(self, schedule_name):
         return ExternalSchedule(
-            self.external_repository_data.get_external_schedule_data(schedule_name), self._handle
+            self._external_repository_data.get_external_schedule_data(schedule_name), self._handle
         )
 
     def get_external_schedules(self):
         return [
             ExternalSchedule(external_schedule_data, self._handle)
-            for external_schedule_data in self.external_repository_data.external_schedule_datas
+            for external_schedule_data in self._external_repository_data.external_schedule_datas
         ]
 
     def get_external_sensor(self, sensor_name):
         return ExternalSensor(
-            self.external_repository_data.get_external_sensor_data(sensor_name), self._handle
+            self._external_repository_data.get_external_sensor_data(sensor_name), self._handle
         )
 
     def get_external_sensors(self):
         return [
             ExternalSensor(external_sensor_data, self._handle)
-            for external_sensor_data in self.external_repository_data.external_sensor_datas
+            for external_sensor_data in self._external_repository_data.external_sensor_datas
         ]
 
     def has_external_schedule(self, schedule_name):
@@ -121,29 +214,30 @@ def has_external_partition_set(self, partition_set_name):
 
     def get_external_partition_set(self, partition_set_name):
         return ExternalPartitionSet(
-            self.external_repository_data.get_external_partition_set_data(partition_set_name),
+            self._external_repository_data.get_external_partition_set_data(partition_set_name),
             self._handle,
         )
 
     def get_external_partition_sets(self):
         return [
             ExternalPartitionSet(external_partition_set_data, self._handle)
-            for external_partition_set_data in self.external_repository_data.external_partition_set_datas
+            for external_partition_set_data in self._external_repository_data.external_partition_set_datas
         ]
 
     def get_full_external_pipeline(self, pipeline_name):
         check.str_param(pipeline_name, "pipeline_name")
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(pipeline_name),
+            self._get_external_pipeline_data(pipeline_name),
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(pipeline_name),
         )
 
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        self._load_external_pipeline_datas(self._pipeline_names)
+        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_names]
 
     def has_external_job(self, job_name):
-        return job_name in self._job_index_map
+        return job_name in self._job_names
 
     def get_external_job(self, job_name):
         check.str_param(job_name, "job_name")
@@ -152,13 +246,18 @@ def get_external_job(self, job_name):
             check.failed(f"Could not find job data for {job_name}")
 
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(job_name),
+            self._get_external_pipeline_data(job_name),
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(job_name),
         )
 
+    def get_job_names(self):
+        return [pn for pn in self._pipeline_names if pn in self._job_names]
+
     def get_external_jobs(self):
-        return [self.get_external_job(pn) for pn in self._job_index_map]
+        job_names = self.get_job_names()
+        self._load_external_pipeline_datas(job_names)
+        return [self.get_external_job(pn) for pn in job_names]
 
     @property
     def handle(self):
@@ -178,12 +277,12 @@ def get_external_origin_id(self):
         return self.get_external_origin().get_id()
 
     def get_external_asset_nodes(self) -> Sequence[ExternalAssetNode]:
-        return self.external_repository_data.external_asset_graph_data
+        return self._external_repository_data.external_asset_graph_data
 
     def get_external_asset_node(self, asset_key: AssetKey) -> ExternalAssetNode:
         matching = [
             asset_node
-            for asset_node in self.external_repository_data.external_asset_graph_data
+            for asset_node in self._external_repository_data.external_asset_graph_data
             if asset_node.asset_key == asset_key
         ]
         return matching[0] if matching else None
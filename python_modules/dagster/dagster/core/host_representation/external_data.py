@@ -114,6 +114,51 @@ def get_external_sensor_data(self, name):
         check.failed("Could not find sensor data named " + name)
 
 
+@whitelist_for_serdes
+class ExternalPipelineSummary(
+    namedtuple("_ExternalPipelineSummary", "name external_pipeline_data_id is_job tags")
+):
+    """The parts of an ExternalPipelineData that are needed to index a repository, along with the
+    id of the full ExternalPipelineData. The id is the hash of its serialized contents.
+    """
+
+    def __new__(cls, name, external_pipeline_data_id, is_job, tags=None):
+        return super(ExternalPipelineSummary, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            external_pipeline_data_id=check.str_param(
+                external_pipeline_data_id, "external_pipeline_data_id"
+            ),
+            is_job=check.bool_param(is_job, "is_job"),
+            tags=check.opt_dict_param(tags, "tags", key_type=str),
+        )
+
+
+@whitelist_for_serdes
+class ExternalRepositoryManifest(
+    namedtuple(
+        "_ExternalRepositoryManifest", "external_repository_data external_pipeline_summaries"
+    )
+):
+    """An ExternalRepositoryData with its ExternalPipelineDatas left out, along with a summary of
+    each of those ExternalPipelineDatas (in the same order). Clients use the summaries to index the
+    repository, and fetch the full ExternalPipelineDatas by id when they are needed.
+    """
+
+    def __new__(cls, external_repository_data, external_pipeline_summaries):
+        return super(ExternalRepositoryManifest, cls).__new__(
+            cls,
+            external_repository_data=check.inst_param(
+                external_repository_data, "external_repository_data", ExternalRepositoryData
+            ),
+            external_pipeline_summaries=check.list_param(
+                external_pipeline_summaries,
+                "external_pipeline_summaries",
+                of_type=ExternalPipelineSummary,
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalPipelineSubsetResult(
     namedtuple("_ExternalPipelineSubsetResult", "success error external_pipeline_data")
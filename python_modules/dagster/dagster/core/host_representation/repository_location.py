@@ -1,4 +1,5 @@
 import datetime
+import functools
 import sys
 import threading
 from abc import abstractmethod, abstractproperty
@@ -17,7 +18,11 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_external_pipeline_datas_grpc,
+    sync_get_external_repository_manifests_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
@@ -28,7 +33,7 @@
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.state import KnownExecutionState
-from dagster.core.host_representation import ExternalPipelineSubsetResult
+from dagster.core.host_representation import ExternalPipelineData, ExternalPipelineSubsetResult
 from dagster.core.host_representation.external import (
     ExternalExecutionPlan,
     ExternalPipeline,
@@ -37,6 +42,7 @@
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster.core.host_representation.handle import PipelineHandle, RepositoryHandle
 from dagster.core.host_representation.origin import (
+    ExternalRepositoryOrigin,
     GrpcServerRepositoryLocationOrigin,
     InProcessRepositoryLocationOrigin,
     RepositoryLocationOrigin,
@@ -56,7 +62,7 @@
 from dagster.grpc.types import GetCurrentImageResult
 from dagster.serdes import deserialize_as
 from dagster.seven.compat.pendulum import PendulumDateTime
-from dagster.utils import merge_dicts
+from dagster.utils import LRUCache, merge_dicts
 from dagster.utils.hosted_user_process import external_repo_from_def
 
 from .selector import PipelineSelector
@@ -68,6 +74,7 @@
         ExternalPartitionNamesData,
         ExternalPartitionSetExecutionParamData,
         ExternalPartitionTagsData,
+        ExternalPipelineSummary,
         ExternalScheduleExecutionErrorData,
     )
     from dagster.core.definitions.schedule import ScheduleExecutionData
@@ -433,7 +440,28 @@ def get_external_notebook_data(self, notebook_path: str) -> bytes:
         return get_notebook_data(notebook_path)
 
 
+# The number of ExternalPipelineDatas kept by each ExternalPipelineDataCache
+EXTERNAL_PIPELINE_DATA_CACHE_SIZE = 1000
+
+
+class ExternalPipelineDataCache(LRUCache[str, ExternalPipelineData]):
+    """A thread-safe LRU cache of ExternalPipelineDatas, keyed by the hash of their serialized
+    contents (see :py:class:`ExternalPipelineSummary`).
+    """
+
+    def __init__(self, max_size: int = EXTERNAL_PIPELINE_DATA_CACHE_SIZE):
+        super().__init__(max_size)
+
+    def set(self, external_pipeline_data_id: str, external_pipeline_data: ExternalPipelineData):
+        check.inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
+        super().set(external_pipeline_data_id, external_pipeline_data)
+
+
 class GrpcServerRepositoryLocation(RepositoryLocation):
+    # Shared by every location in the process, so that reloading a location (which creates a new
+    # GrpcServerRepositoryLocation) only fetches the pipelines that changed since the last load
+    external_pipeline_data_cache = ExternalPipelineDataCache()
+
     def __init__(
         self,
         origin: RepositoryLocationOrigin,
@@ -515,21 +543,42 @@ def __init__(
 
             self._container_image = self._reload_current_image()
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            # Only the manifest of each repository is loaded up front. The ExternalPipelineDatas
+            # of its pipelines are fetched the first time they are needed.
+            external_repository_manifests = sync_get_external_repository_manifests_grpc(
+                self.client, self
             )
 
-            self.external_repositories = {
-                repo_name: ExternalRepository(
-                    repo_data,
-                    RepositoryHandle(
-                        repository_name=repo_name,
-                        repository_location=self,
-                    ),
+            if external_repository_manifests is not None:
+                self.external_repositories = {
+                    repo_name: ExternalRepository(
+                        manifest.external_repository_data,
+                        RepositoryHandle(
+                            repository_name=repo_name,
+                            repository_location=self,
+                        ),
+                        external_pipeline_summaries=manifest.external_pipeline_summaries,
+                        external_pipeline_data_loader=functools.partial(
+                            self._load_external_pipeline_datas, repo_name
+                        ),
+                    )
+                    for repo_name, manifest in external_repository_manifests.items()
+                }
+            else:
+                self._external_repositories_data = (
+                    sync_get_streaming_external_repositories_data_grpc(self.client, self)
                 )
-                for repo_name, repo_data in self._external_repositories_data.items()
-            }
+
+                self.external_repositories = {
+                    repo_name: ExternalRepository(
+                        repo_data,
+                        RepositoryHandle(
+                            repository_name=repo_name,
+                            repository_location=self,
+                        ),
+                    )
+                    for repo_name, repo_data in self._external_repositories_data.items()
+                }
         except:
             self.cleanup()
             raise
@@ -566,6 +615,16 @@ def host(self) -> str:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
+    def _load_external_pipeline_datas(
+        self, repository_name: str, external_pipeline_summaries: List["ExternalPipelineSummary"]
+    ) -> List[ExternalPipelineData]:
+        return sync_get_external_pipeline_datas_grpc(
+            self.client,
+            ExternalRepositoryOrigin(self.origin, repository_name),
+            external_pipeline_summaries,
+            self.external_pipeline_data_cache,
+        )
+
     def _reload_current_image(self) -> str:
         return deserialize_as(
             self.client.get_current_image(),
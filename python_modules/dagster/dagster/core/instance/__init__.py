@@ -315,6 +315,17 @@ def __init__(
                 "Run monitoring only supports select RunLaunchers",
             )
 
+        self._event_log_write_buffer = None
+        if self.event_log_write_buffer_enabled:
+            from dagster.core.storage.event_log.write_buffer import EventLogWriteBuffer
+
+            write_buffer_settings = self.get_settings("event_log_write_buffer")
+            self._event_log_write_buffer = EventLogWriteBuffer(
+                self._event_storage,
+                max_batch_size=write_buffer_settings.get("max_batch_size"),
+                flush_interval_seconds=write_buffer_settings.get("flush_interval_seconds"),
+            )
+
     # ctors
 
     @staticmethod
@@ -593,6 +604,29 @@ def run_monitoring_max_resume_run_attempts(self) -> int:
     def run_monitoring_poll_interval_seconds(self) -> int:
         return self.run_monitoring_settings.get("poll_interval_seconds", 120)
 
+    # event log write buffer
+
+    @property
+    def event_log_write_buffer_enabled(self) -> bool:
+        event_log_write_buffer_settings = self.get_settings("event_log_write_buffer")
+
+        if not event_log_write_buffer_settings:
+            return False
+
+        return event_log_write_buffer_settings.get("enabled", False)
+
+    # sensors
+
+    @property
+    def sensor_settings(self) -> Dict:
+        return self.get_settings("sensors") or {}
+
+    # schedules
+
+    @property
+    def schedule_settings(self) -> Dict:
+        return self.get_settings("schedules") or {}
+
     # python logs
 
     @property
@@ -618,6 +652,7 @@ def upgrade(self, print_fn=None):
             if print_fn:
                 print_fn("Updating event storage...")
             self._event_storage.upgrade()
+            self._event_storage.reindex_events(print_fn=print_fn)
             self._event_storage.reindex_assets(print_fn=print_fn)
 
             if print_fn:
@@ -637,6 +672,8 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.close()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -674,11 +711,23 @@ def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapsho
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
+        self.flush_event_log_writes()
         return self._event_storage.get_stats_for_run(run_id)
 
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
+        self.flush_event_log_writes()
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_run_stats_for_runs(self, run_ids: List[str]) -> Dict[str, PipelineRunStatsSnapshot]:
+        self.flush_event_log_writes()
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    def get_run_step_stats_for_runs(
+        self, run_ids: List[str]
+    ) -> Dict[str, List["RunStepKeyStatsSnapshot"]]:
+        self.flush_event_log_writes()
+        return self._event_storage.get_step_stats_for_runs(run_ids)
+
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
 
@@ -939,6 +988,20 @@ def create_run(
         )
         return self._run_storage.add_run(pipeline_run)
 
+    def create_runs(self, runs_kwargs: List[Dict[str, Any]]) -> List[PipelineRun]:
+        """Create a batch of runs, writing them to run storage together.
+
+        Args:
+            runs_kwargs (List[Dict[str, Any]]): For each run to create, the keyword arguments that
+                would otherwise be passed to :py:meth:`create_run`.
+        """
+        check.list_param(runs_kwargs, "runs_kwargs", of_type=dict)
+
+        pipeline_runs = [
+            self._construct_run_with_snapshots(**run_kwargs) for run_kwargs in runs_kwargs
+        ]
+        return self._run_storage.add_runs(pipeline_runs)
+
     def register_managed_run(
         self,
         pipeline_name,
@@ -1026,6 +1089,14 @@ def get_runs(
     def get_runs_count(self, filters: PipelineRunsFilter = None) -> int:
         return self._run_storage.get_runs_count(filters)
 
+    def get_queued_runs(self, cursor: str = None, limit: int = None) -> List[PipelineRun]:
+        return self._run_storage.get_queued_runs(cursor=cursor, limit=limit)
+
+    def get_run_counts_by_tag(
+        self, filters: PipelineRunsFilter, tag_keys: List[str]
+    ) -> Dict[Tuple[str, str], int]:
+        return self._run_storage.get_run_counts_by_tag(filters, tag_keys)
+
     def get_run_groups(
         self, filters: PipelineRunsFilter = None, cursor: str = None, limit: int = None
     ) -> Dict[str, Dict[str, Union[Iterable[PipelineRun], int]]]:
@@ -1062,6 +1133,12 @@ def delete_run(self, run_id: str):
 
     # event storage
 
+    def flush_event_log_writes(self):
+        """Write any events buffered by the event log write buffer (if enabled) to the event log
+        storage, so that they are visible to subsequent reads."""
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.flush()
+
     def logs_after(
         self,
         run_id,
@@ -1069,6 +1146,7 @@ def logs_after(
         of_type: "DagsterEventType" = None,
         limit: Optional[int] = None,
     ):
+        self.flush_event_log_writes()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1076,10 +1154,41 @@ def logs_after(
             limit=limit,
         )
 
+    def records_after(
+        self,
+        run_id,
+        after_storage_id: int = -1,
+        of_type: "DagsterEventType" = None,
+        limit: Optional[int] = None,
+    ) -> List["EventLogRecord"]:
+        """Return the event records of a run stored after the record with the given storage id.
+
+        Unlike the zero-based cursor of `logs_after`, the storage id of the last record seen can
+        be used to fetch only the new records of a run without the event log storage scanning
+        past the records that were already fetched.
+        """
+        self.flush_event_log_writes()
+        return self._event_storage.get_records_for_run(
+            run_id,
+            after_storage_id=after_storage_id,
+            of_type=of_type,
+            limit=limit,
+        )
+
+    def storage_id_for_cursor(self, run_id, cursor: int) -> Optional[int]:
+        """Return the storage id of the event at the given zero-based index within a run, or None
+        if the run has no event at that index. Resolves a `logs_after` cursor to a storage id for
+        `records_after`, without reading the events before it.
+        """
+        self.flush_event_log_writes()
+        return self._event_storage.get_storage_id_for_run_cursor(run_id, cursor)
+
     def all_logs(self, run_id, of_type: "DagsterEventType" = None):
+        self.flush_event_log_writes()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     def watch_event_logs(self, run_id, cursor, cb):
+        self.flush_event_log_writes()
         return self._event_storage.watch(run_id, cursor, cb)
 
     def end_watch_event_logs(self, run_id, cb):
@@ -1114,6 +1223,7 @@ def get_event_records(
         Returns:
             List[EventLogRecord]: List of event log records stored in the event log storage.
         """
+        self.flush_event_log_writes()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     def events_for_asset_key(
@@ -1147,6 +1257,7 @@ def events_for_asset_key(
 """
         )
 
+        self.flush_event_log_writes()
         return self._event_storage.get_asset_events(
             asset_key,
             partitions,
@@ -1163,6 +1274,16 @@ def run_ids_for_asset_key(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
         return self._event_storage.get_asset_run_ids(asset_key)
 
+    def asset_keys_for_run(self, run_id: str) -> List[AssetKey]:
+        check.str_param(run_id, "run_id")
+        self.flush_event_log_writes()
+        return self._event_storage.get_asset_keys_for_run(run_id)
+
+    def asset_keys_for_runs(self, run_ids: List[str]) -> Dict[str, List[AssetKey]]:
+        check.list_param(run_ids, "run_ids", of_type=str)
+        self.flush_event_log_writes()
+        return self._event_storage.get_asset_keys_for_runs(run_ids)
+
     def all_asset_tags(self):
         return self._event_storage.all_asset_tags()
 
@@ -1217,7 +1338,10 @@ def get_handlers(self):
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.write(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -121,4 +121,24 @@ def dagster_instance_config_schema():
                 "poll_interval_seconds": Field(int, is_required=False),
             },
         ),
+        "event_log_write_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_batch_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+        ),
+        "sensors": Field(
+            {
+                "use_threads": Field(Bool, is_required=False),
+                "num_workers": Field(int, is_required=False),
+                "max_concurrent_evaluations_per_location": Field(int, is_required=False),
+            },
+        ),
+        "schedules": Field(
+            {
+                "use_threads": Field(Bool, is_required=False),
+                "num_workers": Field(int, is_required=False),
+            },
+        ),
     }
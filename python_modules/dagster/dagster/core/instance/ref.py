@@ -204,7 +204,14 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             defaults["run_launcher"],
         )
 
-        settings_keys = {"telemetry", "python_logs", "run_monitoring"}
+        settings_keys = {
+            "telemetry",
+            "python_logs",
+            "run_monitoring",
+            "event_log_write_buffer",
+            "sensors",
+            "schedules",
+        }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
         return InstanceRef(
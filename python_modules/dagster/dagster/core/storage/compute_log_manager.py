@@ -141,6 +141,24 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
             ComputeLogFileData
         """
 
+    def get_tail_cursor(self, run_id, key, io_type, num_lines):
+        """Get the cursor (byte) at which the last num_lines lines of the compute log data for a
+        given compute step begin.
+
+        Managers that cannot locate lines without reading the whole log file return 0, so that
+        tailing the file streams all of it.
+
+        Args:
+            run_id (str): The id of the pipeline run.
+            key (str): The unique descriptor of the execution step (e.g. `solid_invocation.compute`)
+            io_type (ComputeIOType): Flag indicating the I/O type, either stdout or stderr
+            num_lines (int): The number of lines at the end of the log file to start from
+
+        Returns:
+            Int
+        """
+        return 0
+
     def enabled(self, _pipeline_run, _step_key):
         """Hook for disabling compute log capture.
 
@@ -164,7 +182,7 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         pass
 
-    def observable(self, run_id, key, io_type, cursor=None):
+    def observable(self, run_id, key, io_type, cursor=None, tail_lines=None):
         """Return an Observable which streams back log data from the execution logs for a given
         compute step.
 
@@ -173,6 +191,8 @@ def observable(self, run_id, key, io_type, cursor=None):
             key (str): The unique descriptor of the execution step (e.g. `solid_invocation.compute`)
             io_type (ComputeIOType): Flag indicating the I/O type, either stdout or stderr
             cursor (Optional[Int]): Starting cursor (byte) of log file
+            tail_lines (Optional[Int]): If no cursor is given, start streaming from the last
+                tail_lines lines of the log file rather than from its beginning
 
         Returns:
             Observable
@@ -181,9 +201,12 @@ def observable(self, run_id, key, io_type, cursor=None):
         check.str_param(key, "key")
         check.inst_param(io_type, "io_type", ComputeIOType)
         check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(tail_lines, "tail_lines")
 
         if cursor:
             cursor = int(cursor)
+        elif tail_lines is not None:
+            cursor = self.get_tail_cursor(run_id, key, io_type, tail_lines)
         else:
             cursor = 0
 
@@ -7,6 +7,11 @@
 )
 from .in_memory import InMemoryEventLogStorage
 from .polling_event_watcher import SqlPollingEventWatcher
-from .schema import AssetKeyTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from .schema import (
+    AssetKeyTable,
+    AssetRunsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+)
 from .sql_event_log import SqlEventLogStorage
 from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
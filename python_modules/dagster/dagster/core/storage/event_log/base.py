@@ -130,6 +130,83 @@ def get_logs_for_run(
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
         """
 
+    def get_records_for_run(
+        self,
+        run_id: str,
+        after_storage_id: int = -1,
+        of_type: Optional[DagsterEventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[EventLogRecord]:
+        """Get the event records of a run that were stored after the record with the given storage
+        id, in the order in which they were stored.
+
+        Unlike the zero-based cursor of `get_logs_for_run`, which is an offset into the run's
+        logs, a storage id lets storages seek directly to the new records of a run, so callers
+        that repeatedly fetch the new logs of a run should pass the storage id of the last record
+        they have seen.
+
+        The base implementation uses the zero-based index of each log within its run as its
+        storage id. Storages that assign their own ids to stored events should override it.
+
+        Args:
+            run_id (str): The id of the run for which to fetch records.
+            after_storage_id (Optional[int]): Only records with a storage id greater than this
+                value are returned, i.e., if after_storage_id is -1, all records will be returned.
+                (default: -1)
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the records.
+            limit (Optional[int]): the maximum number of records to fetch.
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(after_storage_id, "after_storage_id")
+        check.invariant(
+            after_storage_id >= -1,
+            "Don't know what to do with negative storage id {after_storage_id}".format(
+                after_storage_id=after_storage_id
+            ),
+        )
+        check.opt_inst_param(of_type, "of_type", DagsterEventType)
+        check.opt_int_param(limit, "limit")
+
+        records = [
+            EventLogRecord(storage_id=after_storage_id + 1 + index, event_log_entry=event)
+            for index, event in enumerate(
+                self.get_logs_for_run(run_id, cursor=after_storage_id)
+            )
+        ]
+        if of_type:
+            records = [
+                record
+                for record in records
+                if record.event_log_entry.is_dagster_event
+                and record.event_log_entry.dagster_event.event_type_value == of_type.value
+            ]
+        if limit:
+            records = records[:limit]
+
+        return records
+
+    def get_storage_id_for_run_cursor(self, run_id: str, cursor: int) -> Optional[int]:
+        """Get the storage id of the log at the given zero-based index within a run, so that a
+        zero-based cursor can be resolved to a storage id to pass to `get_records_for_run`.
+
+        The base implementation uses the zero-based index of each log within its run as its
+        storage id. Storages that assign their own ids to stored events should override it.
+
+        Args:
+            run_id (str): The id of the run.
+            cursor (int): The zero-based index of the log within the run.
+
+        Returns:
+            Optional[int]: The storage id of the log, or None if the run has no log at that index.
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+        check.invariant(
+            cursor >= 0, "Don't know what to do with negative cursor {cursor}".format(cursor=cursor)
+        )
+
+        return cursor if self.get_logs_for_run(run_id, cursor=cursor - 1, limit=1) else None
+
     def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -146,6 +223,18 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_stats_for_runs(self, run_ids: List[str]) -> Dict[str, PipelineRunStatsSnapshot]:
+        """Get a summary of events that have ocurred in each of the given runs, by run id."""
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: List[str]
+    ) -> Dict[str, List[RunStepKeyStatsSnapshot]]:
+        """Get per-step stats for each of the given runs, by run id."""
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_step_stats_for_run(run_id) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -154,6 +243,16 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: List[EventLogEntry]):
+        """Store a batch of events, in order. Storages that are able to write several events in a
+        single round trip should override this method.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -260,6 +359,21 @@ def get_asset_events(
     def get_asset_run_ids(self, asset_key: AssetKey) -> Iterable[str]:
         pass
 
+    def get_asset_keys_for_run(self, run_id: str) -> List[AssetKey]:
+        """Get the keys of the assets materialized in a run, in the order in which they were first
+        materialized."""
+        check.str_param(run_id, "run_id")
+        asset_keys: Dict[AssetKey, None] = {}
+        for event in self.get_logs_for_run(run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION):
+            if event.dagster_event.asset_key:
+                asset_keys[event.dagster_event.asset_key] = None
+        return list(asset_keys)
+
+    def get_asset_keys_for_runs(self, run_ids: List[str]) -> Dict[str, List[AssetKey]]:
+        """Get the keys of the assets materialized in each of the given runs, by run id."""
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_asset_keys_for_run(run_id) for run_id in run_ids}
+
     @abstractmethod
     def wipe_asset(self, asset_key: AssetKey):
         """Remove asset index history from event log for given asset_key"""
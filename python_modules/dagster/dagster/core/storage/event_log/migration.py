@@ -1,5 +1,6 @@
 import sqlalchemy as db
 from dagster import AssetKey, seven
+from dagster.core.errors import DagsterInstanceMigrationRequired
 from dagster.core.events.log import EventLogEntry
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils import utc_datetime_from_timestamp
@@ -7,11 +8,21 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+SECONDARY_INDEX_RUN_STATS = (
+    "run_stats_tables"  # builds the run/step stats tables from the event log
+)
+SECONDARY_INDEX_ASSET_RUNS = (
+    "asset_runs_table"  # builds the run to asset key links from the event log
+)
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    SECONDARY_INDEX_RUN_STATS: lambda: migrate_run_stats_data,
+}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    SECONDARY_INDEX_ASSET_RUNS: lambda: migrate_asset_runs_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
 
 def migrate_event_log_data(instance=None):
@@ -70,6 +81,78 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_asset_runs_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the links between runs and the asset keys they materialized from the
+    data in existing event log records. Takes in event_log_storage, and a print_fn to keep track of
+    progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from .schema import AssetRunsTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying event logs.")
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn("Found {} runs to index".format(len(run_ids)))
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        try:
+            # pylint: disable=protected-access
+            asset_keys = event_log_storage._get_asset_keys_for_run_from_event_log(run_id)
+        except DagsterInstanceMigrationRequired:
+            # e.g. a run-sharded sqlite database that predates the asset key column
+            if print_fn:
+                print_fn(
+                    "Skipping run {}, its event log requires a schema migration".format(run_id)
+                )
+            continue
+
+        with event_log_storage.index_connection() as conn:
+            for asset_key in asset_keys:
+                try:
+                    conn.execute(
+                        AssetRunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                            run_id=run_id, asset_key=asset_key.to_string()
+                        )
+                    )
+                except db.exc.IntegrityError:
+                    # link already present
+                    pass
+
+
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the run and step stats tables from the data in existing event log
+    records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying event logs.")
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn("Found {} runs to index".format(len(run_ids)))
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        try:
+            event_log_storage.rebuild_stats_for_run(run_id)
+        except DagsterInstanceMigrationRequired:
+            # e.g. a run-sharded sqlite database that predates the stats tables
+            if print_fn:
+                print_fn(
+                    "Skipping run {}, its event log requires a schema migration".format(run_id)
+                )
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
     from dagster.serdes import serialize_dagster_namedtuple
@@ -1,5 +1,7 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple
+import weakref
+from typing import Callable, Dict, List, MutableMapping, NamedTuple, Optional
 
 from dagster import check
 from dagster.core.events.log import EventLogEntry
@@ -22,14 +24,28 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry], None]
 
 
+class RunWatchState:
+    """The callbacks watching a given run_id, and how far into the run's event log the watcher
+    has read.
+
+    log_id (int): the storage id of the last EventLogEntry read for the run
+    cursor (int): the zero-based index (within the run) of the last EventLogEntry read for the run
+    """
+
+    def __init__(self):
+        self.log_id: int = -1
+        self.cursor: int = -1
+        self.callbacks: List[CallbackAfterCursor] = []
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids
+    This class' job is to track the callbacks watching each run_id, and to run a single thread
+    (SqlPollingEventWatcherThread) that fetches new events for every watched run_id with one query
+    per poll and fans them out to the callbacks.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_watch_state and the RunWatchStates it contains
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,38 +53,106 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_watch_state
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_watch_state: MutableMapping[str, RunWatchState] = {}
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_watch_state
         return _has_run_id
 
     def watch_run(self, run_id: str, start_cursor: int, callback: Callable[[EventLogEntry], None]):
+        """Observer has started watching this run.
+            Add a callback to execute on new EventLogEntrys st. id >= start_cursor
+
+        Args:
+            run_id (str): the run to watch
+            start_cursor (int): minimum event_id for the callback to execute
+            callback (Callable[[EventLogEntry], None]): callback to update the Dagster UI
+        """
         run_id = check.str_param(run_id, "run_id")
         start_cursor = check.int_param(start_cursor, "start_cursor")
         callback = check.callable_param(callback, "callback")
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(start_cursor, callback)
+            if run_id not in self._run_id_to_watch_state:
+                self._run_id_to_watch_state[run_id] = RunWatchState()
+            self._run_id_to_watch_state[run_id].callbacks.append(
+                CallbackAfterCursor(start_cursor, callback)
+            )
+
+            if not self._watcher_thread:
+                self._watcher_thread = SqlPollingEventWatcherThread(self)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry], None]):
+        """Observer has stopped watching this run;
+            Remove a callback from the list of callbacks to execute on new EventLogEntrys
+
+            Also stop polling for the run_id if no callbacks remain (i.e. no Observers are
+            watching this run_id), and stop the polling thread if no run_ids remain
+
+        Args:
+            run_id (str): the run to stop watching
+            handler (Callable[[EventLogEntry], None]): callback to remove from list of callbacks
+        """
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_watch_state:
+                watch_state = self._run_id_to_watch_state[run_id]
+                watch_state.callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in watch_state.callbacks
+                    if callback_with_cursor.callback != handler
+                ]
+                if not watch_state.callbacks:
+                    del self._run_id_to_watch_state[run_id]
+
+            if not self._run_id_to_watch_state and self._watcher_thread:
+                self._watcher_thread.should_thread_exit.set()
+                self._watcher_thread = None
+
+    def poll(self):
+        """Fetches new EventLogEntrys for every watched run_id with a single query, then fires
+        each callback (taking into account the callback.cursor) on the new EventLogEntrys of the
+        run_id it watches.
+        """
+        with self._dict_lock:
+            watch_states: Dict[str, RunWatchState] = dict(self._run_id_to_watch_state)
+            log_id_by_run_id = {
+                run_id: watch_state.log_id for run_id, watch_state in watch_states.items()
+            }
+
+        if not log_id_by_run_id:
+            return
+
+        events_by_run_id = self._event_log_storage.get_logs_for_runs_after_log_ids(log_id_by_run_id)
+
+        for run_id, events in events_by_run_id.items():
+            watch_state = watch_states[run_id]
+            for log_id, event_record in sorted(events.items(), key=lambda x: x[0]):
+                with self._dict_lock:
+                    if self._run_id_to_watch_state.get(run_id) is not watch_state:
+                        # the run_id was unwatched while the events were being fetched
+                        break
+                    watch_state.log_id = log_id
+                    watch_state.cursor += 1
+                    cursor = watch_state.cursor
+                    callbacks = list(watch_state.callbacks)
+
+                for callback_with_cursor in callbacks:
+                    if callback_with_cursor.start_cursor < cursor:
+                        try:
+                            callback_with_cursor.callback(event_record)
+                        except Exception:  # pylint: disable=broad-except
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
+                            )
 
     def __del__(self):
         self.close()
@@ -77,87 +161,50 @@ def close(self):
         if not self._disposed:
             self._disposed = True
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.start_cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+                watcher_thread = self._watcher_thread
+                self._watcher_thread = None
+                self._run_id_to_watch_state = {}
+            if watcher_thread:
+                watcher_thread.should_thread_exit.set()
+                # the watcher can be garbage collected on its own thread, once the thread drops
+                # the reference it holds while polling
+                if watcher_thread is not threading.current_thread():
+                    watcher_thread.join()
+
+
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls the event log for new Events for all of the run_ids watched by
+    a SqlPollingEventWatcher every POLLING_CADENCE
+
+    Exits when `self.should_thread_exit` is set, or once the watcher is garbage collected: the
+    thread only holds a weak reference to the watcher, so that a watcher that is dropped without
+    being closed does not live (and poll) for as long as the process does.
     """
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+    def __init__(self, event_watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        check.inst_param(event_watcher, "event_watcher", SqlPollingEventWatcher)
+        self._event_watcher_ref = weakref.ref(event_watcher)
         self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, start_cursor: int, callback: Callable[[EventLogEntry], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys st. id >= start_cursor
-
-        Args:
-            start_cursor (int): minimum event_id for the callback to execute
-            callback (Callable[[EventLogEntry], None]): callback to update the Dagster UI
-        """
-        start_cursor = check.int_param(start_cursor, "start_cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(start_cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved
+        Wakes every POLLING_CADENCE & polls the watcher for new EventLogEntrys
         """
-        cursor = -1
         while not self._should_thread_exit.wait(POLLING_CADENCE):
-            events = self._event_log_storage.get_logs_for_run(self._run_id, cursor=cursor)
-            for event_record in events:
-                cursor += 1
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if callback_with_cursor.start_cursor < cursor:
-                            callback_with_cursor.callback(event_record)
+            event_watcher = self._event_watcher_ref()
+            if event_watcher is None:
+                return
+
+            try:
+                event_watcher.poll()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Exception while polling for new events to watch.")
+            finally:
+                # don't keep the watcher alive while waiting for the next poll
+                del event_watcher
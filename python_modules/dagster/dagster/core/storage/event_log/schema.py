@@ -42,6 +42,47 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Summary of the events of each run, maintained as events are stored (guarded by secondary index
+# check)
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.types.TIMESTAMP),
+    db.Column("launch_time", db.types.TIMESTAMP),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+)
+
+# Summary of the events of each step of each run, maintained as events are stored (guarded by
+# secondary index check)
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+    db.Column("attempts", db.Integer),
+)
+
+# Links between runs and the asset keys they materialized, maintained as asset events are stored
+# (guarded by secondary index check)
+AssetRunsTable = db.Table(
+    "asset_runs",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("asset_key", db.Text, nullable=False),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -65,3 +106,17 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_step_stats_run_id_step_key",
+    StepStatsTable.c.run_id,
+    StepStatsTable.c.step_key,
+    unique=True,
+    mysql_length={"step_key": 255},
+)
+db.Index(
+    "idx_asset_runs_run_id_asset_key",
+    AssetRunsTable.c.run_id,
+    AssetRunsTable.c.asset_key,
+    unique=True,
+    mysql_length={"asset_key": 255},
+)
@@ -25,8 +25,168 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    SECONDARY_INDEX_ASSET_RUNS,
+    SECONDARY_INDEX_RUN_STATS,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetRunsTable,
+    RunStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
+
+# Upper bound on the number of rows written by a single multi-row insert statement, which keeps the
+# number of bound parameters below the limits imposed by SQLite
+EVENT_INSERT_BATCH_SIZE = 100
+
+
+def group_events_by_run_id(events):
+    events_by_run_id = defaultdict(list)
+    for event in events:
+        events_by_run_id[event.run_id].append(event)
+    return events_by_run_id
+
+
+def chunk_events_for_insert(events):
+    for i in range(0, len(events), EVENT_INSERT_BATCH_SIZE):
+        yield events[i : i + EVENT_INSERT_BATCH_SIZE]
+
+
+def get_latest_asset_events(events):
+    # The asset key table only tracks the latest materialization for each asset key, and the asset
+    # runs table each run that materialized an asset key, so within a batch only the last
+    # materialization of each asset key in each run needs to be stored
+    latest_asset_events = {}
+    for event in events:
+        if event.is_dagster_event and event.dagster_event.asset_key:
+            key = (event.run_id, event.dagster_event.asset_key.to_string())
+            latest_asset_events.pop(key, None)
+            latest_asset_events[key] = event
+    return list(latest_asset_events.values())
+
+
+# Columns of the run stats table counting events of a given type
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+
+# Columns of the run stats table recording the time of an event of a given type
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.RUN_ENQUEUED: "enqueued_time",
+    DagsterEventType.RUN_STARTING: "launch_time",
+    DagsterEventType.RUN_START: "start_time",
+    DagsterEventType.RUN_SUCCESS: "end_time",
+    DagsterEventType.RUN_FAILURE: "end_time",
+    DagsterEventType.RUN_CANCELED: "end_time",
+}
+
+STEP_STATS_END_STATUSES = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+}
+
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_RESTARTED,
+    *STEP_STATS_END_STATUSES.keys(),
+}
+
+
+def _is_stats_event(event):
+    if not event.is_dagster_event:
+        return False
+
+    event_type = event.dagster_event.event_type
+    return (
+        event_type in RUN_STATS_COUNT_COLUMNS
+        or event_type in RUN_STATS_TIME_COLUMNS
+        or (event_type in STEP_STATS_EVENT_TYPES and event.dagster_event.step_key)
+    )
+
+
+def _get_run_stats_values(event):
+    """Returns the values to update an existing run stats row with, and the values to insert a new
+    run stats row with, to account for the given event."""
+    event_type = event.dagster_event.event_type
+    if event_type in RUN_STATS_COUNT_COLUMNS:
+        column = RunStatsTable.c[RUN_STATS_COUNT_COLUMNS[event_type]]
+        return [(column, column + 1)], {column.name: 1}
+    if event_type in RUN_STATS_TIME_COLUMNS:
+        # Keep the latest timestamp, to match the stats computed from the event log, which take the
+        # latest event of each type and the latest of the run success, failure and canceled events
+        column = RunStatsTable.c[RUN_STATS_TIME_COLUMNS[event_type]]
+        timestamp = datetime.utcfromtimestamp(event.timestamp)
+        latest = db.case([(db.or_(column == None, column < timestamp), timestamp)], else_=column)
+        return [(column, latest)], {column.name: timestamp}
+    return None, None
+
+
+def _get_step_stats_values(event):
+    """Returns the values to update an existing step stats row with, and the values to insert a
+    new step stats row with, to account for the given event."""
+    event_type = event.dagster_event.event_type
+    if not event.dagster_event.step_key or event_type not in STEP_STATS_EVENT_TYPES:
+        return None, None
+
+    timestamp = datetime.utcfromtimestamp(event.timestamp)
+    attempts = StepStatsTable.c.attempts
+    if event_type == DagsterEventType.STEP_START:
+        # Only the first step start counts as an attempt, subsequent attempts are counted by step
+        # restarted events. The attempts column is updated first, since MySQL evaluates the
+        # assignments of an update in order.
+        return (
+            [
+                (
+                    attempts,
+                    db.case(
+                        [(StepStatsTable.c.start_time == None, db.func.coalesce(attempts, 0) + 1)],
+                        else_=attempts,
+                    ),
+                ),
+                (StepStatsTable.c.start_time, timestamp),
+            ],
+            {"attempts": 1, "start_time": timestamp},
+        )
+    if event_type == DagsterEventType.STEP_RESTARTED:
+        return [(attempts, db.func.coalesce(attempts, 0) + 1)], {"attempts": 1}
+
+    status = STEP_STATS_END_STATUSES[event_type].value
+    return (
+        [(StepStatsTable.c.status, status), (StepStatsTable.c.end_time, timestamp)],
+        {"status": status, "end_time": timestamp},
+    )
+
+
+def _upsert_stats_row(conn, table, where_clause, update_values, insert_values):
+    update_statement = (
+        table.update(preserve_parameter_order=True)  # pylint: disable=no-value-for-parameter
+        .where(where_clause)
+        .values(update_values)
+    )
+    if conn.execute(update_statement).rowcount:
+        return
+
+    try:
+        conn.execute(
+            table.insert().values(**insert_values)  # pylint: disable=no-value-for-parameter
+        )
+    except db.exc.IntegrityError:
+        # the row was inserted concurrently
+        conn.execute(update_statement)
+
+
+def _datetime_from_float(timestamp):
+    return datetime.utcfromtimestamp(timestamp) if timestamp is not None else None
 
 
 class SqlEventLogStorage(EventLogStorage):
@@ -68,6 +228,23 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def prepare_insert_events(self, events):
+        """Helper method for preparing a single multi-row event log SQL insertion statement for a
+        batch of events. See `prepare_insert_event`.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        check.invariant(events, "Cannot prepare an insert statement for an empty batch of events")
+
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            [self._get_event_insert_values(event) for event in events]
+        )
+
+    def _get_event_insert_values(self, event):
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -82,8 +259,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -159,6 +335,27 @@ def store_asset(self, event):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
+        self.store_asset_run(event)
+
+    def store_asset_run(self, event):
+        """Link the run of an asset materialization event to its asset key, so that the assets
+        materialized in a run can be fetched without reading the run's events."""
+        check.inst_param(event, "event", EventLogEntry)
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS):
+            return
+
+        with self.index_connection() as conn:
+            try:
+                conn.execute(
+                    AssetRunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=event.run_id,
+                        asset_key=event.dagster_event.asset_key.to_string(),
+                    )
+                )
+            except db.exc.IntegrityError:
+                # the run already materialized the asset key
+                pass
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -168,13 +365,135 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
+        stats_events = self.filter_stats_events([event])
 
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
+            self.update_stats_for_events(conn, stats_events)
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             self.store_asset(event)
 
+    def store_events(self, events):
+        """Store a batch of events, using a single multi-row insert statement for each run (and
+        chunk of at most ``EVENT_INSERT_BATCH_SIZE`` events) in the batch.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        stats_events = self.filter_stats_events(events)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                for chunk in chunk_events_for_insert(run_events):
+                    conn.execute(self.prepare_insert_events(chunk))
+                self.update_stats_for_events(
+                    conn, [event for event in stats_events if event.run_id == run_id]
+                )
+
+        for event in get_latest_asset_events(events):
+            self.store_asset(event)
+
+    def filter_stats_events(self, events):
+        """Returns the events that need to be accounted for in the run and step stats tables, if
+        those tables are in use. Since this may need to check for the secondary index, it should be
+        called before opening the connection that the stats tables are updated with.
+        """
+        stats_events = [event for event in events if _is_stats_event(event)]
+        if not stats_events or not self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            return []
+        return stats_events
+
+    def update_stats_for_events(self, conn, events):
+        """Incrementally updates the run and step stats tables to account for the given events,
+        which have just been stored. See ``filter_stats_events``.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for event in events:
+            update_values, insert_values = _get_run_stats_values(event)
+            if update_values:
+                _upsert_stats_row(
+                    conn,
+                    RunStatsTable,
+                    RunStatsTable.c.run_id == event.run_id,
+                    update_values,
+                    dict(run_id=event.run_id, **insert_values),
+                )
+
+            update_values, insert_values = _get_step_stats_values(event)
+            if update_values:
+                step_key = event.dagster_event.step_key
+                _upsert_stats_row(
+                    conn,
+                    StepStatsTable,
+                    db.and_(
+                        StepStatsTable.c.run_id == event.run_id,
+                        StepStatsTable.c.step_key == step_key,
+                    ),
+                    update_values,
+                    dict(run_id=event.run_id, step_key=step_key, **insert_values),
+                )
+
+    def rebuild_stats_for_run(self, run_id):
+        """Recomputes the run and step stats of a run from its events, replacing any existing rows
+        in the run and step stats tables.
+        """
+        check.str_param(run_id, "run_id")
+
+        run_stats = self._get_stats_for_run_from_event_log(run_id)
+        step_stats_by_step_key = self._get_step_stats_by_step_key_from_event_log(run_id)
+
+        with self.run_connection(run_id) as conn:
+            with conn.begin():
+                conn.execute(
+                    RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        RunStatsTable.c.run_id == run_id
+                    )
+                )
+                conn.execute(
+                    StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        StepStatsTable.c.run_id == run_id
+                    )
+                )
+                conn.execute(
+                    RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        steps_succeeded=run_stats.steps_succeeded,
+                        steps_failed=run_stats.steps_failed,
+                        materializations=run_stats.materializations,
+                        expectations=run_stats.expectations,
+                        enqueued_time=_datetime_from_float(run_stats.enqueued_time),
+                        launch_time=_datetime_from_float(run_stats.launch_time),
+                        start_time=_datetime_from_float(run_stats.start_time),
+                        end_time=_datetime_from_float(run_stats.end_time),
+                    )
+                )
+                step_stats_rows = [
+                    dict(
+                        run_id=run_id,
+                        step_key=step_key,
+                        status=value["status"].value if value.get("status") else None,
+                        start_time=_datetime_from_float(value.get("start_time")),
+                        end_time=_datetime_from_float(value.get("end_time")),
+                        attempts=value.get("attempts"),
+                    )
+                    for step_key, value in step_stats_by_step_key.items()
+                ]
+                for chunk in chunk_events_for_insert(step_stats_rows):
+                    conn.execute(
+                        StepStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                            chunk
+                        )
+                    )
+
+    def get_all_run_ids(self):
+        """Returns the ids of all of the runs with events in the event log."""
+        query = db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+        with self.run_connection(run_id=None) as conn:
+            return [run_id for (run_id,) in conn.execute(query).fetchall() if run_id]
+
     def get_logs_for_run_by_log_id(
         self,
         run_id,
@@ -223,6 +542,153 @@ def get_logs_for_run_by_log_id(
 
         return events
 
+    def get_records_for_run(
+        self,
+        run_id,
+        after_storage_id=-1,
+        of_type=None,
+        limit=None,
+    ):
+        check.str_param(run_id, "run_id")
+        check.int_param(after_storage_id, "after_storage_id")
+        check.opt_inst_param(of_type, "of_type", DagsterEventType)
+        check.opt_int_param(limit, "limit")
+
+        # seek past the records already seen using the primary key, rather than making the
+        # database scan and discard them as it would for an offset
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.id > after_storage_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if of_type:
+            query = query.where(SqlEventLogStorageTable.c.dagster_event_type == of_type.value)
+
+        if limit:
+            query = query.limit(limit)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        try:
+            for record_id, json_str in results:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=check.inst_param(
+                            deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                        ),
+                    )
+                )
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return records
+
+    def get_storage_id_for_run_cursor(self, run_id, cursor):
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+        check.invariant(
+            cursor >= 0, "Don't know what to do with negative cursor {cursor}".format(cursor=cursor)
+        )
+
+        # only the id column is read for the records skipped by the offset
+        query = (
+            db.select([SqlEventLogStorageTable.c.id])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .offset(cursor)
+            .limit(1)
+        )
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        return row[0] if row else None
+
+    def _get_records_for_watch(self, run_id, cursor, after_storage_id):
+        """Get the new records of a watched run. Watches start from a zero-based cursor, which is
+        resolved to a storage id by the first fetch that returns records, after which each fetch
+        seeks directly to the new records of the run.
+
+        Returns:
+            Tuple[List[EventLogRecord], int, Optional[int]]: The new records, and the updated
+                cursor and storage id.
+        """
+        if after_storage_id is None:
+            after_storage_id = (
+                self.get_storage_id_for_run_cursor(run_id, cursor) if cursor >= 0 else -1
+            )
+            if after_storage_id is None:
+                return [], cursor, None
+
+        records = self.get_records_for_run(run_id, after_storage_id)
+
+        if not records:
+            return records, cursor, after_storage_id
+
+        return records, cursor + len(records), records[-1].storage_id
+
+    def get_logs_for_runs_after_log_ids(self, log_id_by_run_id):
+        """Get the logs for several runs using a single query. For each run, only the logs stored
+        after the given log id (i.e. the id of the last record already seen for that run) are
+        returned.
+
+        Args:
+            log_id_by_run_id (Dict[str, int]): The log id after which to fetch logs, for each run.
+                Use -1 to fetch all of the logs of a run.
+
+        Returns:
+            Dict[str, Dict[int, EventLogEntry]]: For each run with new logs, the new logs keyed by
+                log id.
+        """
+        check.dict_param(log_id_by_run_id, "log_id_by_run_id", key_type=str, value_type=int)
+        if not log_id_by_run_id:
+            return {}
+
+        query = self._get_logs_after_log_ids_query(log_id_by_run_id)
+        with self.run_connection(run_id=None) as conn:
+            results = conn.execute(query).fetchall()
+
+        return self._get_logs_by_run_id_from_rows(results)
+
+    def _get_logs_after_log_ids_query(self, log_id_by_run_id):
+        return (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > log_id,
+                        )
+                        for run_id, log_id in log_id_by_run_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+    def _get_logs_by_run_id_from_rows(self, rows):
+        events_by_run_id = defaultdict(dict)
+        for record_id, run_id, json_str in rows:
+            try:
+                events_by_run_id[run_id][record_id] = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return dict(events_by_run_id)
+
     def get_logs_for_run(
         self,
         run_id,
@@ -253,6 +719,85 @@ def get_logs_for_run(
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            return self._get_stats_for_run_from_stats_table(run_id)
+
+        return self._get_stats_for_run_from_event_log(run_id)
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        if not run_ids or not self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            return super().get_stats_for_runs(run_ids)
+
+        query = db.select(
+            [
+                RunStatsTable.c.run_id,
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id.in_(run_ids))
+
+        with self.index_connection() as conn:
+            rows_by_run_id = {row.run_id: row for row in conn.execute(query).fetchall()}
+
+        return {
+            run_id: self._get_stats_snapshot_from_row(run_id, rows_by_run_id.get(run_id))
+            for run_id in run_ids
+        }
+
+    def _get_stats_for_run_from_stats_table(self, run_id):
+        query = db.select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        return self._get_stats_snapshot_from_row(run_id, row)
+
+    def _get_stats_snapshot_from_row(self, run_id, row):
+        if not row:
+            return PipelineRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=0,
+                steps_failed=0,
+                materializations=0,
+                expectations=0,
+                enqueued_time=None,
+                launch_time=None,
+                start_time=None,
+                end_time=None,
+            )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=row.steps_succeeded,
+            steps_failed=row.steps_failed,
+            materializations=row.materializations,
+            expectations=row.expectations,
+            enqueued_time=datetime_as_float(row.enqueued_time) if row.enqueued_time else None,
+            launch_time=datetime_as_float(row.launch_time) if row.launch_time else None,
+            start_time=datetime_as_float(row.start_time) if row.start_time else None,
+            end_time=datetime_as_float(row.end_time) if row.end_time else None,
+        )
+
+    def _get_stats_for_run_from_event_log(self, run_id):
         query = (
             db.select(
                 [
@@ -280,13 +825,16 @@ def get_stats_for_run(self, run_id):
             enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
             launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
             start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(
-                    DagsterEventType.PIPELINE_FAILURE.value,
-                    times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
-                ),
-            )
+            end_times = [
+                times[event_type.value]
+                for event_type in [
+                    DagsterEventType.PIPELINE_SUCCESS,
+                    DagsterEventType.PIPELINE_FAILURE,
+                    DagsterEventType.PIPELINE_CANCELED,
+                ]
+                if times.get(event_type.value)
+            ]
+            end_time = max(end_times) if end_times else None
 
             return PipelineRunStatsSnapshot(
                 run_id=run_id,
@@ -306,14 +854,149 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        STEP_STATS_EVENT_TYPES = [
-            DagsterEventType.STEP_START.value,
-            DagsterEventType.STEP_SUCCESS.value,
-            DagsterEventType.STEP_SKIPPED.value,
-            DagsterEventType.STEP_FAILURE.value,
-            DagsterEventType.STEP_RESTARTED.value,
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            by_step_key = self._get_step_stats_by_step_key_from_stats_table(run_id, step_keys)
+        else:
+            by_step_key = self._get_step_stats_by_step_key_from_event_log(run_id, step_keys)
+
+        raw_event_query = self._get_step_stats_events_query(
+            [SqlEventLogStorageTable.c.event], step_keys
+        ).where(SqlEventLogStorageTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        return self._build_step_stats(run_id, by_step_key, [json_str for (json_str,) in results])
+
+    def get_step_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        if not run_ids or not self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            return super().get_step_stats_for_runs(run_ids)
+
+        query = (
+            db.select(
+                [
+                    StepStatsTable.c.run_id,
+                    StepStatsTable.c.step_key,
+                    StepStatsTable.c.status,
+                    StepStatsTable.c.start_time,
+                    StepStatsTable.c.end_time,
+                    StepStatsTable.c.attempts,
+                ]
+            )
+            .where(StepStatsTable.c.run_id.in_(run_ids))
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        raw_event_query = self._get_step_stats_events_query(
+            [SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event]
+        ).where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+            event_rows = conn.execute(raw_event_query).fetchall()
+
+        by_step_key_by_run_id = defaultdict(dict)
+        for row in rows:
+            by_step_key_by_run_id[row.run_id][row.step_key] = self._get_step_stats_from_row(row)
+
+        json_strs_by_run_id = defaultdict(list)
+        for row in event_rows:
+            json_strs_by_run_id[row.run_id].append(row.event)
+
+        return {
+            run_id: self._build_step_stats(
+                run_id, by_step_key_by_run_id[run_id], json_strs_by_run_id[run_id]
+            )
+            for run_id in run_ids
+        }
+
+    def _get_step_stats_events_query(self, columns, step_keys=None):
+        # the materialization and expectation events reported in the step stats
+        query = (
+            db.select(columns)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        if step_keys:
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+
+        return query
+
+    def _build_step_stats(self, run_id, by_step_key, event_json_strs):
+        materializations = defaultdict(list)
+        expectation_results = defaultdict(list)
+
+        try:
+            for json_str in event_json_strs:
+                event = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                )
+                if event.dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materializations[event.step_key].append(
+                        event.dagster_event.event_specific_data.materialization
+                    )
+                elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                    expectation_results[event.step_key].append(
+                        event.dagster_event.event_specific_data.expectation_result
+                    )
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return [
+            RunStepKeyStatsSnapshot(
+                run_id=run_id,
+                step_key=step_key,
+                status=value.get("status"),
+                start_time=value.get("start_time"),
+                end_time=value.get("end_time"),
+                materializations=materializations.get(step_key),
+                expectation_results=expectation_results.get(step_key),
+                attempts=value.get("attempts"),
+            )
+            for step_key, value in by_step_key.items()
         ]
 
+    def _get_step_stats_by_step_key_from_stats_table(self, run_id, step_keys=None):
+        query = (
+            db.select(
+                [
+                    StepStatsTable.c.step_key,
+                    StepStatsTable.c.status,
+                    StepStatsTable.c.start_time,
+                    StepStatsTable.c.end_time,
+                    StepStatsTable.c.attempts,
+                ]
+            )
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        return {row.step_key: self._get_step_stats_from_row(row) for row in results}
+
+    def _get_step_stats_from_row(self, row):
+        return {
+            "status": StepEventStatus(row.status) if row.status else None,
+            "start_time": datetime_as_float(row.start_time) if row.start_time else None,
+            "end_time": datetime_as_float(row.end_time) if row.end_time else None,
+            "attempts": row.attempts,
+        }
+
+    def _get_step_stats_by_step_key_from_event_log(self, run_id, step_keys=None):
         by_step_query = (
             db.select(
                 [
@@ -325,7 +1008,11 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             )
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
+                )
+            )
         )
 
         if step_keys:
@@ -371,60 +1058,7 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
                 )
                 by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
 
-        materializations = defaultdict(list)
-        expectation_results = defaultdict(list)
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                    ]
-                )
-            )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
-        )
-
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
-
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
-
-        try:
-            for (json_str,) in results:
-                event = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
-                )
-                if event.dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-                    materializations[event.step_key].append(
-                        event.dagster_event.event_specific_data.materialization
-                    )
-                elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-                    expectation_results[event.step_key].append(
-                        event.dagster_event.event_specific_data.expectation_result
-                    )
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
-
-        return [
-            RunStepKeyStatsSnapshot(
-                run_id=run_id,
-                step_key=step_key,
-                status=value.get("status"),
-                start_time=value.get("start_time"),
-                end_time=value.get("end_time"),
-                materializations=materializations.get(step_key),
-                expectation_results=expectation_results.get(step_key),
-                attempts=value.get("attempts"),
-            )
-            for step_key, value in by_step_key.items()
-        ]
+        return by_step_key
 
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
@@ -458,15 +1092,34 @@ def wipe(self):
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(AssetRunsTable.delete())  # pylint: disable=no-value-for-parameter
 
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
+        self.delete_asset_runs(run_id)
+
+    def delete_asset_runs(self, run_id):
+        """Remove the links between a run and the asset keys it materialized. Must not be called
+        while a connection is open, since checking the secondary index may need one."""
+        check.str_param(run_id, "run_id")
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS):
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(
+                AssetRunsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    AssetRunsTable.c.run_id == run_id
+                )
+            )
+
     def delete_events_for_run(self, conn, run_id):
         check.str_param(run_id, "run_id")
 
@@ -487,6 +1140,16 @@ def delete_events_for_run(self, conn, run_id):
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        conn.execute(
+            RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunStatsTable.c.run_id == run_id
+            )
+        )
+        conn.execute(
+            StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                StepStatsTable.c.run_id == run_id
+            )
+        )
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -969,6 +1632,52 @@ def get_asset_run_ids(self, asset_key):
 
         return [run_id for (run_id, _timestamp) in results]
 
+    def get_asset_keys_for_run(self, run_id):
+        check.str_param(run_id, "run_id")
+        return self.get_asset_keys_for_runs([run_id])[run_id]
+
+    def get_asset_keys_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        if not run_ids:
+            return {}
+
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS):
+            return {
+                run_id: self._get_asset_keys_for_run_from_event_log(run_id) for run_id in run_ids
+            }
+
+        query = (
+            db.select([AssetRunsTable.c.run_id, AssetRunsTable.c.asset_key])
+            .where(AssetRunsTable.c.run_id.in_(run_ids))
+            .order_by(AssetRunsTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        asset_keys_by_run_id = {run_id: [] for run_id in run_ids}
+        for run_id, asset_key in results:
+            asset_keys_by_run_id[run_id].append(AssetKey.from_db_string(asset_key))
+        return asset_keys_by_run_id
+
+    def _get_asset_keys_for_run_from_event_log(self, run_id):
+        # reads the indexed asset key column rather than the event bodies
+        query = (
+            db.select([SqlEventLogStorageTable.c.asset_key])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.asset_key != None)
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+            .order_by(db.func.min(SqlEventLogStorageTable.c.id).asc())
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        # legacy and current asset key strings may both refer to the same asset key
+        asset_keys = {AssetKey.from_db_string(asset_key): None for (asset_key,) in results}
+        return list(asset_keys)
+
     def _asset_materialization_from_json_column(self, json_str):
         if not json_str:
             return None
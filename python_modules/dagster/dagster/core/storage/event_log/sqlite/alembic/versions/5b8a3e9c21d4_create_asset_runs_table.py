@@ -0,0 +1,22 @@
+"""create asset runs table
+
+Revision ID: 5b8a3e9c21d4
+Revises: a1f7c92d4e5b
+Create Date: 2021-09-24 10:12:48.630127
+
+"""
+from dagster.core.storage.migration.utils import create_asset_runs_table
+
+# revision identifiers, used by Alembic.
+revision = "5b8a3e9c21d4"
+down_revision = "a1f7c92d4e5b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_runs_table()
+
+
+def downgrade():
+    pass
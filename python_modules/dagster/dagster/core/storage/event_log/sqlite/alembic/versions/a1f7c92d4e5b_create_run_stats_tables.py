@@ -0,0 +1,22 @@
+"""create run stats tables
+
+Revision ID: a1f7c92d4e5b
+Revises: 05844c702676
+Create Date: 2021-09-20 14:03:11.218345
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_tables
+
+# revision identifiers, used by Alembic.
+revision = "a1f7c92d4e5b"
+down_revision = "05844c702676"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_tables()
+
+
+def downgrade():
+    pass
@@ -141,7 +141,7 @@ def watch(self, run_id, start_cursor, callback):
             )
 
         cursor = start_cursor if start_cursor is not None else -1
-        self._watchers[run_id][callback] = cursor
+        self._watchers[run_id][callback] = (cursor, None)
 
     def on_modified(self):
         keys = [
@@ -150,15 +150,16 @@ def on_modified(self):
             for callback, _ in callback_dict.items()
         ]
         for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
+            cursor, storage_id = self._watchers[run_id][callback]
 
             # fetch events
-            events = self.get_logs_for_run(run_id, cursor)
+            records, cursor, storage_id = self._get_records_for_watch(run_id, cursor, storage_id)
 
             # update cursor
-            self._watchers[run_id][callback] = cursor + len(events)
+            self._watchers[run_id][callback] = (cursor, storage_id)
 
-            for event in events:
+            for record in records:
+                event = record.event_log_entry
                 status = None
                 try:
                     status = callback(event)
@@ -37,7 +37,13 @@
 from watchdog.observers import Observer
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    chunk_events_for_insert,
+    get_latest_asset_events,
+    group_events_by_run_id,
+)
 
 INDEX_SHARD_NAME = "index"
 
@@ -81,6 +87,7 @@ def __init__(self, base_dir, inst_data=None):
         # Used to ensure that each run ID attempts to initialize its DB the first time it connects,
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
@@ -123,6 +130,18 @@ def config_type(cls):
     def from_config_value(inst_data, config_value):
         return SqliteEventLogStorage(inst_data=inst_data, **config_value)
 
+    def has_secondary_index(self, name):
+        if name not in self._secondary_index_cache:
+            self._secondary_index_cache[name] = super(
+                SqliteEventLogStorage, self
+            ).has_secondary_index(name)
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
     def get_all_run_ids(self):
         all_filenames = glob.glob(os.path.join(self._base_dir, "*.db"))
         return [
@@ -166,6 +185,9 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table step_stats already exists" in err_msg
+                    or "table asset_runs already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -226,9 +248,11 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
+        stats_events = self.filter_stats_events([event])
 
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
+            self.update_stats_for_events(conn, stats_events)
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             # mirror the event in the cross-run index database
@@ -237,6 +261,53 @@ def store_event(self, event):
 
             self.store_asset(event)
 
+    def store_events(self, events):
+        """
+        Overridden method to replicate asset events in a central assets.db sqlite shard, enabling
+        cross-run asset queries.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        stats_events = self.filter_stats_events(events)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                for chunk in chunk_events_for_insert(run_events):
+                    conn.execute(self.prepare_insert_events(chunk))
+                self.update_stats_for_events(
+                    conn, [event for event in stats_events if event.run_id == run_id]
+                )
+
+        if asset_events:
+            # mirror the events in the cross-run index database
+            with self.index_connection() as conn:
+                for chunk in chunk_events_for_insert(asset_events):
+                    conn.execute(self.prepare_insert_events(chunk))
+
+            for event in get_latest_asset_events(asset_events):
+                self.store_asset(event)
+
+    def get_stats_for_runs(self, run_ids):
+        """
+        Overridden method to query each of the run-sharded databases in turn, since there is no
+        single database containing the stats of every run.
+        """
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(self, run_ids):
+        """
+        Overridden method to query each of the run-sharded databases in turn, since there is no
+        single database containing the step stats of every run.
+        """
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_step_stats_for_run(run_id) for run_id in run_ids}
+
     def get_event_records(
         self,
         event_records_filter: Optional[EventRecordsFilter] = None,
@@ -347,6 +418,8 @@ def delete_events(self, run_id):
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        self.delete_asset_runs(run_id)
+
     def wipe(self):
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
@@ -357,6 +430,7 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -408,12 +482,16 @@ def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
         self._cursor = start_cursor if start_cursor is not None else -1
+        self._storage_id = None
         super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
 
     def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
+        # pylint: disable=protected-access
+        records, self._cursor, self._storage_id = self._event_log_storage._get_records_for_watch(
+            self._run_id, self._cursor, self._storage_id
+        )
+        for record in records:
+            event = record.event_log_entry
             status = None
             try:
                 status = self._cb(event)
@@ -0,0 +1,120 @@
+import logging
+import threading
+from typing import List, Optional
+
+from dagster import check
+from dagster.core.events import PIPELINE_EVENTS, DagsterEventType
+from dagster.core.events.log import EventLogEntry
+
+from .base import EventLogStorage
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Events marking a transition in the lifecycle of a run or a step. Other processes (e.g. the
+# executor orchestrating a step, or the daemon monitoring a run) make decisions based on these
+# events, so they are never left sitting in a buffer.
+LIFECYCLE_EVENT_TYPES = PIPELINE_EVENTS | {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+def is_lifecycle_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.dagster_event.event_type in LIFECYCLE_EVENT_TYPES
+
+
+class EventLogWriteBuffer:
+    """Buffers events on their way to an event log storage, so that they can be written in batches
+    using :py:meth:`EventLogStorage.store_events`.
+
+    Buffered events are written once ``max_batch_size`` events have accumulated, and otherwise by a
+    background thread every ``flush_interval_seconds``. Lifecycle events are written synchronously,
+    together with every event buffered before them, so that all events up to and including a
+    lifecycle event are durable by the time ``write`` returns. Events are always written in the
+    order in which they were buffered.
+
+    Args:
+        event_log_storage (EventLogStorage): The storage to write events to.
+        max_batch_size (Optional[int]): The number of buffered events that triggers a write.
+        flush_interval_seconds (Optional[float]): The maximum time between writes of buffered
+            events.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._max_batch_size = check.opt_int_param(
+            max_batch_size, "max_batch_size", DEFAULT_MAX_BATCH_SIZE
+        )
+        check.invariant(self._max_batch_size > 0, "max_batch_size must be positive")
+        self._flush_interval_seconds = check.opt_numeric_param(
+            flush_interval_seconds, "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+        )
+        check.invariant(self._flush_interval_seconds > 0, "flush_interval_seconds must be positive")
+
+        # Held while writing, so that batches are written in order
+        self._lock = threading.Lock()
+        self._buffer: List[EventLogEntry] = []
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def write(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+
+        with self._lock:
+            check.invariant(
+                not self._shutdown_event.is_set(), "Cannot write to a closed EventLogWriteBuffer"
+            )
+            self._buffer.append(event)
+            if len(self._buffer) >= self._max_batch_size or is_lifecycle_event(event):
+                self._flush()
+                return
+
+            if not self._flush_thread:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_periodically,
+                    name="event-log-write-buffer",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+
+    def flush(self):
+        """Write all buffered events to the event log storage."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+
+        # Events in a batch that fails to be written are dropped, as they would have been had they
+        # been written one at a time
+        batch = self._buffer
+        self._buffer = []
+        self._event_log_storage.store_events(batch)
+
+    def _flush_periodically(self):
+        while not self._shutdown_event.wait(self._flush_interval_seconds):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Exception while writing buffered events to the event log.")
+
+    def close(self):
+        """Stop the background thread and write any remaining buffered events."""
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+        self.flush()
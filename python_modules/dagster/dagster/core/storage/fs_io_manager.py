@@ -1,7 +1,11 @@
+import mmap
 import os
 import pickle
+import shutil
+import sys
 
 from dagster import check
+from dagster.builtins import Bool
 from dagster.config import Field
 from dagster.config.source import StringSource
 from dagster.core.definitions.event_metadata import EventMetadataEntry
@@ -14,7 +18,20 @@
 from dagster.utils.backcompat import experimental
 
 
-@io_manager(config_schema={"base_dir": Field(StringSource, is_required=False)})
+@io_manager(
+    config_schema={
+        "base_dir": Field(StringSource, is_required=False),
+        "out_of_band_buffers": Field(
+            Bool,
+            is_required=False,
+            default_value=False,
+            description="Pickle outputs with protocol 5 and write the buffers of objects that "
+            "support out-of-band pickling (e.g. NumPy arrays and pandas DataFrames) to separate "
+            "files, which are memory-mapped rather than read when the output is loaded. Requires "
+            "Python 3.8 or later.",
+        ),
+    }
+)
 def fs_io_manager(init_context):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
 
@@ -72,12 +89,32 @@ def op_b(df):
         def job():
             op_b(op_a())
 
+    3. Store large array outputs so that they are memory-mapped, rather than copied into memory,
+    when they are loaded by downstream ops.
+
+    .. code-block:: python
+
+        @job(
+            resource_defs={
+                "io_manager": fs_io_manager.configured({"out_of_band_buffers": True})
+            }
+        )
+        def job():
+            op_b(op_a())
+
     """
     base_dir = init_context.resource_config.get(
         "base_dir", init_context.instance.storage_directory()
     )
 
-    return PickledObjectFilesystemIOManager(base_dir=base_dir)
+    return PickledObjectFilesystemIOManager(
+        base_dir=base_dir,
+        out_of_band_buffers=init_context.resource_config["out_of_band_buffers"],
+    )
+
+
+# Suffix of the directory, next to an output's pickle file, that holds its out-of-band buffers
+OUT_OF_BAND_BUFFERS_SUFFIX = ".buffers"
 
 
 class PickledObjectFilesystemIOManager(MemoizableIOManager):
@@ -86,10 +123,21 @@ class PickledObjectFilesystemIOManager(MemoizableIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        out_of_band_buffers (Optional[bool]): whether to pickle outputs with protocol 5, writing
+            the buffers of objects that support out-of-band pickling to separate files that are
+            memory-mapped when the output is loaded. Buffers are mapped copy-on-write, so loaded
+            objects can be modified without changing the stored output. Requires Python 3.8 or
+            later. Defaults to False.
     """
 
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, out_of_band_buffers=False):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.out_of_band_buffers = check.bool_param(out_of_band_buffers, "out_of_band_buffers")
+        check.invariant(
+            not self.out_of_band_buffers or sys.version_info >= (3, 8),
+            "out_of_band_buffers requires pickle protocol 5, which is only available in Python "
+            "3.8 or later.",
+        )
         self.write_mode = "wb"
         self.read_mode = "rb"
 
@@ -99,6 +147,9 @@ def _get_path(self, context):
 
         return os.path.join(self.base_dir, *keys)
 
+    def _get_buffers_path(self, filepath):
+        return filepath + OUT_OF_BAND_BUFFERS_SUFFIX
+
     def has_output(self, context):
         filepath = self._get_path(context)
 
@@ -118,8 +169,52 @@ def handle_output(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        # The output is pickled to temporary files next to the destination before anything stored
+        # at this path is removed, so that a value that fails to pickle leaves the previous output
+        # in place
+        buffers_path = self._get_buffers_path(filepath)
+        temp_path = filepath + ".tmp"
+        temp_buffers_path = buffers_path + ".tmp"
+        try:
+            buffers = self._write_pickle(temp_path, obj)
+            if buffers:
+                self._write_buffers(temp_buffers_path, buffers)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            shutil.rmtree(temp_buffers_path, ignore_errors=True)
+            raise
+
+        # A previous output at this path that was stored with out-of-band buffers is removed,
+        # pickle first, so that its pickle is never loaded alongside missing or replaced buffers
+        if os.path.exists(buffers_path):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            shutil.rmtree(buffers_path)
+
+        # The pickle is moved into place once its buffers are, so that has_output and load_input
+        # only ever see complete outputs
+        if buffers:
+            os.rename(temp_buffers_path, buffers_path)
+        os.replace(temp_path, filepath)
+
+    def _write_pickle(self, path, obj):
+        buffers = []
+        with open(path, self.write_mode) as write_obj:
+            if self.out_of_band_buffers:
+                pickle.dump(obj, write_obj, protocol=5, buffer_callback=buffers.append)
+            else:
+                pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        return buffers
+
+    def _write_buffers(self, buffers_path, buffers):
+        # left behind by a write that was interrupted
+        if os.path.exists(buffers_path):
+            shutil.rmtree(buffers_path)
+        mkdir_p(buffers_path)
+        for index, buffer in enumerate(buffers):
+            with open(os.path.join(buffers_path, str(index)), self.write_mode) as write_obj:
+                write_obj.write(_buffer_contents(buffer))
 
     def load_input(self, context):
         """Unpickle the file and Load it to a data object."""
@@ -128,9 +223,55 @@ def load_input(self, context):
         filepath = self._get_path(context.upstream_output)
         context.log.debug(f"Loading file from: {filepath}")
 
+        # Outputs are loaded according to how they were stored rather than the current setting,
+        # so that they can be read by an IO manager configured differently from the one that
+        # wrote them
+        buffers_path = self._get_buffers_path(filepath)
+        if os.path.isdir(buffers_path):
+            buffers = [
+                _map_buffer_file(os.path.join(buffers_path, name))
+                for name in sorted(os.listdir(buffers_path), key=int)
+            ]
+            with open(filepath, self.read_mode) as read_obj:
+                return pickle.load(read_obj, buffers=buffers)
+
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def release_output(self, context):
+        """Remove the file the output was pickled to."""
+        check.inst_param(context, "context", OutputContext)
+
+        filepath = self._get_path(context)
+        if os.path.exists(filepath):
+            context.log.debug(f"Removing file at: {filepath}")
+            os.remove(filepath)
+
+        buffers_path = self._get_buffers_path(filepath)
+        if os.path.exists(buffers_path):
+            shutil.rmtree(buffers_path)
+
+
+def _buffer_contents(buffer):
+    try:
+        return buffer.raw()
+    except BufferError:
+        # raw() requires a contiguous buffer; this makes a contiguous copy
+        return memoryview(buffer).tobytes()
+
+
+def _map_buffer_file(path):
+    with open(path, "rb") as read_obj:
+        if os.fstat(read_obj.fileno()).st_size == 0:
+            # empty files cannot be memory-mapped
+            return bytearray()
+
+        # The mapping stays valid after the file is closed, and is released once the objects
+        # that were unpickled from it are garbage collected. ACCESS_COPY maps the file
+        # copy-on-write, so that loaded objects are writable but changes to them are never
+        # written back to the file.
+        return mmap.mmap(read_obj.fileno(), 0, access=mmap.ACCESS_COPY)
+
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
     """Built-in filesystem IO managerthat stores and retrieves values using pickling and
@@ -121,6 +121,17 @@ def handle_output(self, context, obj):
             obj (Any): The object, returned by the op, to be stored.
         """
 
+    def release_output(self, _context) -> None:
+        """User-defined method that frees the storage used by an output once it is no longer
+        needed, i.e. once every step that consumes it has completed.
+
+        This is only invoked when the executor is configured with ``release_outputs``. Released
+        outputs are no longer available to re-executions of the run.
+
+        Args:
+            context (OutputContext): The context of the step output that is no longer needed.
+        """
+
     def get_output_asset_key(self, _context) -> Optional[AssetKey]:
         """User-defined method that associates outputs handled by this IOManager with a particular
         AssetKey.
@@ -1,15 +1,19 @@
 import hashlib
 import os
+import stat
+import struct
 import sys
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 
-from dagster import Field, Float, StringSource, check
+from dagster import Bool, Field, Float, StringSource, check
 from dagster.core.execution.compute_logs import mirror_stream_to_file
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.utils import ensure_dir, touch_file
+from dagster.utils import LRUCache, ensure_dir, touch_file
 from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 from .compute_log_manager import (
@@ -24,19 +28,34 @@
 
 IO_TYPE_EXTENSION = {ComputeIOType.STDOUT: "out", ComputeIOType.STDERR: "err"}
 
+LINE_INDEX_EXTENSION_SUFFIX = "idx"
+
 MAX_FILENAME_LENGTH = 255
 
+# number of recent reads kept so that subscriptions tailing the same file from the same cursor
+# share a single read of each new chunk. Only reads of up to READ_CACHE_MAX_ENTRY_BYTES are kept,
+# so that the cache holds at most 8 MB
+READ_CACHE_SIZE = 8
+READ_CACHE_MAX_ENTRY_BYTES = 1048576  # 1 MB
+
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     """Stores copies of stdout & stderr for each compute step locally on disk."""
 
-    def __init__(self, base_dir, polling_timeout=None, inst_data=None):
+    def __init__(
+        self, base_dir, polling_timeout=None, use_filesystem_notifications=None, inst_data=None
+    ):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._use_filesystem_notifications = check.opt_bool_param(
+            use_filesystem_notifications, "use_filesystem_notifications", False
+        )
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._read_cache = LRUCache(READ_CACHE_SIZE)
+        self._line_index_lock = threading.Lock()
 
     @contextmanager
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -58,11 +77,22 @@ def inst_data(self):
     def polling_timeout(self):
         return self._polling_timeout
 
+    @property
+    def use_filesystem_notifications(self):
+        return self._use_filesystem_notifications
+
     @classmethod
     def config_type(cls):
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "use_filesystem_notifications": Field(
+                Bool,
+                is_required=False,
+                description="Watch compute log files for subscriptions using the operating "
+                "system's filesystem notifications (e.g. inotify) instead of polling them. Not "
+                "supported by some network and container filesystems.",
+            ),
         }
 
     @staticmethod
@@ -85,12 +115,29 @@ def _get_local_path(self, run_id, key, extension):
             filename = "{}.{}".format(hashlib.md5(key.encode("utf-8")).hexdigest(), extension)
         return os.path.join(self._run_directory(run_id), filename)
 
+    def get_line_index_path(self, run_id, key, io_type):
+        check.inst_param(io_type, "io_type", ComputeIOType)
+        return self._get_local_path(
+            run_id, key, "{}.{}".format(IO_TYPE_EXTENSION[io_type], LINE_INDEX_EXTENSION_SUFFIX)
+        )
+
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
-        if not os.path.exists(path) or not os.path.isfile(path):
+        try:
+            stats = os.stat(path)
+        except OSError:
+            stats = None
+
+        if not stats or not stat.S_ISREG(stats.st_mode):
             return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
 
+        # many subscriptions may be tailing the same file, and are all notified when it changes
+        read_cache_key = (path, cursor, max_bytes, stats.st_size, stats.st_mtime_ns)
+        cached = self._read_cache.get(read_cache_key)
+        if cached:
+            return cached
+
         # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
         with open(path, "rb") as f:
             f.seek(cursor, os.SEEK_SET)
@@ -100,13 +147,80 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
 
         # local download path
         download_url = self.download_url(run_id, key, io_type)
-        return ComputeLogFileData(
+        file_data = ComputeLogFileData(
             path=path,
             data=data.decode("utf-8"),
             cursor=cursor,
             size=stats.st_size,
             download_url=download_url,
         )
+        if len(data) <= READ_CACHE_MAX_ENTRY_BYTES:
+            self._read_cache.set(read_cache_key, file_data)
+        return file_data
+
+    def get_tail_cursor(self, run_id, key, io_type, num_lines):
+        # located using the line index kept next to the log file, without scanning the file
+        check.inst_param(io_type, "io_type", ComputeIOType)
+        check.int_param(num_lines, "num_lines")
+        check.param_invariant(num_lines >= 0, "num_lines")
+
+        if not os.path.isfile(self.get_local_path(run_id, key, io_type)):
+            return 0
+
+        line_index = self._update_line_index(run_id, key, io_type)
+        return line_index.get_line_start_offset(max(line_index.line_count - num_lines, 0))
+
+    def read_logs_file_lines(self, run_id, key, io_type, start_line=0, end_line=None):
+        """Get the compute log data for a range of lines of a compute step's log file, without
+        scanning the file, using the line index kept next to it.
+
+        Args:
+            run_id (str): The id of the pipeline run.
+            key (str): The unique descriptor of the execution step (e.g. `solid_invocation.compute`)
+            io_type (ComputeIOType): Flag indicating the I/O type, either stdout or stderr
+            start_line (Optional[int]): The first line to read. As with python slices, negative
+                values count back from the end of the file, so -10 reads the last 10 lines.
+            end_line (Optional[int]): The line to stop reading at (exclusive). Defaults to the end
+                of the file.
+
+        Returns:
+            ComputeLogFileData: The data for the lines read, whose cursor is the byte offset of the
+                end of the last line read, and so can be used to continue streaming the file.
+        """
+        check.inst_param(io_type, "io_type", ComputeIOType)
+        check.int_param(start_line, "start_line")
+        check.opt_int_param(end_line, "end_line")
+
+        path = self.get_local_path(run_id, key, io_type)
+        if not os.path.isfile(path):
+            return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
+
+        line_index = self._update_line_index(run_id, key, io_type)
+        start_line, end_line, _ = slice(start_line, end_line).indices(line_index.line_count)
+        start_offset = line_index.get_line_start_offset(start_line)
+        end_offset = line_index.get_line_start_offset(max(start_line, end_line))
+
+        with open(path, "rb") as f:
+            f.seek(start_offset, os.SEEK_SET)
+            data = f.read(end_offset - start_offset)
+            stats = os.fstat(f.fileno())
+
+        return ComputeLogFileData(
+            path=path,
+            data=data.decode("utf-8"),
+            cursor=end_offset,
+            size=stats.st_size,
+            download_url=self.download_url(run_id, key, io_type),
+        )
+
+    def _update_line_index(self, run_id, key, io_type):
+        with self._line_index_lock:
+            line_index = ComputeLogLineIndex(
+                self.get_local_path(run_id, key, io_type),
+                self.get_line_index_path(run_id, key, io_type),
+            )
+            line_index.update()
+            return line_index
 
     def is_watch_completed(self, run_id, key):
         return os.path.exists(self.complete_artifact_path(run_id, key))
@@ -187,7 +301,11 @@ def watch(self, run_id, step_key):
         )
 
         if not self._observer:
-            self._observer = PollingObserver(self._manager.polling_timeout)
+            self._observer = (
+                Observer()
+                if self._manager.use_filesystem_notifications
+                else PollingObserver(self._manager.polling_timeout)
+            )
             self._observer.start()
 
         ensure_dir(directory)
@@ -234,3 +352,131 @@ def on_created(self, event):
     def on_modified(self, event):
         if event.src_path in self.update_paths:
             self.manager.notify_subscriptions(self.run_id, self.key)
+
+
+class ComputeLogLineIndex:
+    """Index of the lines of a compute log file, stored in a file next to it (e.g.
+    `my_step.compute.out.idx`) as a header identifying the indexed log file, followed by the
+    little-endian uint64 byte offset at which each complete line ends.
+
+    The index is brought up to date incrementally, by scanning only the bytes appended to the log
+    file since the last update, so locating any line (or the last N lines) of a large log file
+    needs neither a scan of the file nor of the index. The header holds the inode of the log file
+    and a digest of its first block: if either changed, or the log file is shorter than the index
+    says or no longer ends a line where the index says, it has been replaced or rewritten and the
+    index is rebuilt.
+    """
+
+    _OFFSET = struct.Struct("<Q")
+    # inode of the log file, number of bytes at the start of the log file that were digested, and
+    # the digest of those bytes
+    _HEADER = struct.Struct("<QQ16s")
+    _HEAD_SIZE = 4096
+    _SCAN_CHUNK_SIZE = 1048576  # 1 MB
+
+    def __init__(self, log_path, index_path):
+        self._log_path = check.str_param(log_path, "log_path")
+        self._index_path = check.str_param(index_path, "index_path")
+        self._num_indexed_lines = 0
+        self._indexed_bytes = 0
+        self._log_size = 0
+
+    @property
+    def line_count(self):
+        """The number of lines in the log file, including a trailing incomplete line."""
+        has_partial_line = self._log_size > self._indexed_bytes
+        return self._num_indexed_lines + (1 if has_partial_line else 0)
+
+    def get_line_start_offset(self, line_number):
+        """The byte offset at which the given (zero-based) line starts. Passing line_count returns
+        the size of the file."""
+        check.int_param(line_number, "line_number")
+        if line_number > self._num_indexed_lines:
+            return self._log_size
+        if line_number == self._num_indexed_lines:
+            return self._indexed_bytes
+        return self._get_line_end_offset(line_number - 1)
+
+    def _get_line_end_offset(self, line_number):
+        if line_number < 0:
+            return 0
+        with open(self._index_path, "rb") as index_file:
+            index_file.seek(self._HEADER.size + line_number * self._OFFSET.size, os.SEEK_SET)
+            return self._OFFSET.unpack(index_file.read(self._OFFSET.size))[0]
+
+    def _read_log_bytes(self, offset, length):
+        with open(self._log_path, "rb") as log_file:
+            log_file.seek(offset, os.SEEK_SET)
+            return log_file.read(length)
+
+    def _get_header(self, inode, head_length):
+        head_digest = hashlib.md5(self._read_log_bytes(0, head_length)).digest()
+        return self._HEADER.pack(inode, head_length, head_digest)
+
+    def _is_index_current(self, inode, index_header):
+        _, head_length, _ = self._HEADER.unpack(index_header)
+        if head_length > self._log_size or self._indexed_bytes > self._log_size:
+            return False
+
+        if self._get_header(inode, head_length) != index_header:
+            return False
+
+        # the last indexed line still ends where the index says it does
+        return not self._indexed_bytes or (
+            self._read_log_bytes(self._indexed_bytes - 1, 1) == b"\n"
+        )
+
+    def update(self):
+        log_stat = os.stat(self._log_path)
+        self._log_size = log_stat.st_size
+
+        index_header = None
+        self._num_indexed_lines = 0
+        if os.path.exists(self._index_path):
+            index_size = os.path.getsize(self._index_path)
+            offsets_size = index_size - self._HEADER.size
+            # otherwise the index was left partially written
+            if offsets_size >= 0 and not offsets_size % self._OFFSET.size:
+                with open(self._index_path, "rb") as index_file:
+                    index_header = index_file.read(self._HEADER.size)
+                self._num_indexed_lines = offsets_size // self._OFFSET.size
+        self._indexed_bytes = self._get_line_end_offset(self._num_indexed_lines - 1)
+
+        if index_header is None or not self._is_index_current(log_stat.st_ino, index_header):
+            # the log file was replaced or rewritten, or the index was corrupt, so start over
+            self._num_indexed_lines = 0
+            self._indexed_bytes = 0
+            index_header = self._get_header(log_stat.st_ino, 0)
+            with open(self._index_path, "wb") as index_file:
+                index_file.write(index_header)
+
+        _, head_length, _ = self._HEADER.unpack(index_header)
+        if head_length < min(self._HEAD_SIZE, self._log_size):
+            # digest more of the start of the log file, now that more of it has been written
+            with open(self._index_path, "r+b") as index_file:
+                index_file.write(
+                    self._get_header(log_stat.st_ino, min(self._HEAD_SIZE, self._log_size))
+                )
+
+        if self._indexed_bytes == self._log_size:
+            return
+
+        new_offsets = []
+        with open(self._log_path, "rb") as log_file:
+            log_file.seek(self._indexed_bytes, os.SEEK_SET)
+            position = self._indexed_bytes
+            while position < self._log_size:
+                chunk = log_file.read(min(self._SCAN_CHUNK_SIZE, self._log_size - position))
+                if not chunk:
+                    break
+                newline = chunk.find(b"\n")
+                while newline != -1:
+                    new_offsets.append(position + newline + 1)
+                    newline = chunk.find(b"\n", newline + 1)
+                position += len(chunk)
+
+        if new_offsets:
+            with open(self._index_path, "ab") as index_file:
+                index_file.write(b"".join(self._OFFSET.pack(offset) for offset in new_offsets))
+            self._num_indexed_lines += len(new_offsets)
+            self._indexed_bytes = new_offsets[-1]
@@ -204,3 +204,81 @@ def create_event_log_event_idx():
         ["dagster_event_type", "id"],
         mysql_length={"dagster_event_type": 64},
     )
+
+
+def create_run_stats_tables():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_time", db.types.TIMESTAMP),
+            db.Column("launch_time", db.types.TIMESTAMP),
+            db.Column("start_time", db.types.TIMESTAMP),
+            db.Column("end_time", db.types.TIMESTAMP),
+        )
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column("start_time", db.types.TIMESTAMP),
+            db.Column("end_time", db.types.TIMESTAMP),
+            db.Column("attempts", db.Integer),
+        )
+
+        op.create_index(
+            "idx_step_stats_run_id_step_key",
+            "step_stats",
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"step_key": 255},
+        )
+
+
+def add_run_priority_column():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "priority"):
+        op.add_column("runs", db.Column("priority", db.Integer, server_default=db.text("0")))
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("runs")]
+    if "idx_run_priority" not in indices:
+        op.create_index(
+            "idx_run_priority",
+            "runs",
+            ["status", db.text("priority DESC"), db.text("id ASC")],
+            unique=False,
+        )
+
+
+def create_asset_runs_table():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_runs"):
+        op.create_table(
+            "asset_runs",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("asset_key", db.Text, nullable=False),
+        )
+
+        op.create_index(
+            "idx_asset_runs_run_id_asset_key",
+            "asset_runs",
+            ["run_id", "asset_key"],
+            unique=True,
+            mysql_length={"asset_key": 255},
+        )
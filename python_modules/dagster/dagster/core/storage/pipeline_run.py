@@ -375,12 +375,28 @@ def tags_for_partition_set(partition_set, partition):
         return {PARTITION_NAME_TAG: partition.name, PARTITION_SET_TAG: partition_set.name}
 
 
+def _check_tags_filter(tags):
+    tags = check.opt_dict_param(tags, "tags", key_type=str)
+    for key, value in tags.items():
+        if isinstance(value, list):
+            check.list_param(value, f"tags[{key}]", of_type=str)
+        else:
+            check.str_param(value, f"tags[{key}]")
+    return tags
+
+
 @whitelist_for_serdes
 class PipelineRunsFilter(
     namedtuple(
         "_PipelineRunsFilter", "run_ids pipeline_name statuses tags snapshot_id updated_after mode"
     )
 ):
+    """Filters runs by the given fields. Runs must match every field that is set.
+
+    A run matches the ``tags`` filter if it has every given tag key, with the given value. If a list
+    of values is given for a tag key instead, the run's value for the key must be one of them.
+    """
+
     def __new__(
         cls,
         run_ids=None,
@@ -396,7 +412,7 @@ def __new__(
             run_ids=check.opt_list_param(run_ids, "run_ids", of_type=str),
             pipeline_name=check.opt_str_param(pipeline_name, "pipeline_name"),
             statuses=check.opt_list_param(statuses, "statuses", of_type=PipelineRunStatus),
-            tags=check.opt_dict_param(tags, "tags", key_type=str, value_type=str),
+            tags=_check_tags_filter(tags),
             snapshot_id=check.opt_str_param(snapshot_id, "snapshot_id"),
             updated_after=check.opt_inst_param(updated_after, "updated_after", datetime),
             mode=check.opt_str_param(mode, "mode"),
@@ -5,7 +5,13 @@
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster.core.instance import MayHaveInstanceWeakref
 from dagster.core.snap import ExecutionPlanSnapshot, PipelineSnapshot
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunsFilter, RunRecord
+from dagster.core.storage.pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunsFilter,
+    RunRecord,
+)
+from dagster.core.storage.tags import get_run_priority
 from dagster.daemon.types import DaemonHeartbeat
 
 
@@ -32,6 +38,18 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        """Add a batch of runs to storage. Storages that are able to write several runs in a single
+        round trip should override this method.
+
+        If a run already exists with the same ID, raise DagsterRunAlreadyExists
+        If a run's snapshot ID does not exist raise DagsterSnapshotDoesNotExist
+
+        Args:
+            pipeline_runs (List[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -71,6 +89,65 @@ def get_runs_count(self, filters: PipelineRunsFilter = None) -> int:
             int: The number of runs that match the given filters.
         """
 
+    def get_queued_runs(self, cursor: str = None, limit: int = None) -> List[PipelineRun]:
+        """Return the queued runs present in the storage, in the order in which they should be
+        dequeued: by descending priority, and in the order in which they were queued within a
+        priority.
+
+        Args:
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRun]
+        """
+        statuses = [PipelineRunStatus.QUEUED]
+        if cursor:
+            # the cursor run may have been dequeued since it was fetched, but still determines
+            # where the range of runs starts
+            cursor_run = self.get_run_by_id(cursor)
+            if not cursor_run:
+                return []
+            if cursor_run.status != PipelineRunStatus.QUEUED:
+                statuses.append(cursor_run.status)
+
+        runs = [
+            run
+            for run in self.get_runs(filters=PipelineRunsFilter(statuses=statuses))
+            if run.status == PipelineRunStatus.QUEUED or run.run_id == cursor
+        ]
+
+        # Reversed for fifo ordering. sorted is stable, so fifo is maintained within a priority
+        runs = sorted(runs[::-1], key=lambda run: get_run_priority(run.tags), reverse=True)
+
+        if cursor:
+            run_ids = [run.run_id for run in runs]
+            runs = runs[run_ids.index(cursor) + 1 :] if cursor in run_ids else []
+
+        return runs[:limit] if limit else runs
+
+    def get_run_counts_by_tag(
+        self, filters: PipelineRunsFilter, tag_keys: List[str]
+    ) -> Dict[Tuple[str, str], int]:
+        """Return the number of runs that match the given filters, for each value of each of the
+        given tag keys.
+
+        Args:
+            filters (PipelineRunsFilter) -- The
+                :py:class:`~dagster.core.storage.pipeline_run.PipelineRunFilter` by which to filter
+                runs
+            tag_keys (List[str]): The tag keys to count runs for.
+
+        Returns:
+            Dict[Tuple[str, str], int]: The number of matching runs for each (key, value) tag pair.
+        """
+        counts: Dict[Tuple[str, str], int] = {}
+        for run in self.get_runs(filters=filters):
+            for key, value in run.tags.items():
+                if key in tag_keys:
+                    counts[(key, value)] = counts.get((key, value), 0) + 1
+        return counts
+
     @abstractmethod
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun]]]:
         """Get the run group to which a given run belongs.
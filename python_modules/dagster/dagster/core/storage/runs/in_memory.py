@@ -105,7 +105,10 @@ def run_filter(run):
                 return False
 
             if filters.tags and not all(
-                run.tags.get(key) == value for key, value in filters.tags.items()
+                run.tags.get(key) in value
+                if isinstance(value, list)
+                else run.tags.get(key) == value
+                for key, value in filters.tags.items()
             ):
                 return False
 
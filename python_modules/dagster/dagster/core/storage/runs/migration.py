@@ -2,12 +2,14 @@
 
 from tqdm import tqdm
 
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
+from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, PRIORITY_TAG, get_run_priority
 
 RUN_PARTITIONS = "run_partitions"
+RUN_PRIORITY = "run_priority"
 
 RUN_DATA_MIGRATIONS = {
     RUN_PARTITIONS: lambda: migrate_run_partition,
+    RUN_PRIORITY: lambda: migrate_run_priority,
 }
 
 RUN_CHUNK_SIZE = 100
@@ -51,3 +53,25 @@ def migrate_run_partition(storage, print_fn=None):
             continue
 
         storage.add_run_tags(run.run_id, run.tags)
+
+
+def migrate_run_priority(storage, print_fn=None):
+    """
+    Utility method to build the run priority column from the priority tags of existing runs.
+    Takes in run_storage, and a print_fn to keep track of progress.
+    """
+    from .schema import RunsTable
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    for run in chunked_run_iterator(storage, print_fn):
+        if PRIORITY_TAG not in run.tags:
+            continue
+
+        with storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(RunsTable.c.run_id == run.run_id)
+                .values(priority=get_run_priority(run.tags))
+            )
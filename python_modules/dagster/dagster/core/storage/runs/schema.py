@@ -22,6 +22,7 @@
     db.Column("run_body", db.Text),
     db.Column("partition", db.Text),
     db.Column("partition_set", db.Text),
+    db.Column("priority", db.Integer, server_default=db.text("0")),
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
     db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
@@ -79,3 +80,7 @@
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
 db.Index("idx_bulk_actions_status", BulkActionsTable.c.status, mysql_length=32)
 db.Index("idx_run_status", RunsTable.c.status, mysql_length=32)
+# matches the order in which queued runs are dequeued
+db.Index(
+    "idx_run_priority", RunsTable.c.status, RunsTable.c.priority.desc(), RunsTable.c.id.asc()
+)
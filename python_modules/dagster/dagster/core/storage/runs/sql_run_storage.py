@@ -4,7 +4,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
@@ -23,7 +23,13 @@
     create_execution_plan_snapshot_id,
     create_pipeline_snapshot_id,
 )
-from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    PRIORITY_TAG,
+    ROOT_RUN_ID_TAG,
+    get_run_priority,
+)
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.serdes import (
     deserialize_as,
@@ -31,11 +37,11 @@
     serialize_dagster_namedtuple,
 )
 from dagster.seven import JSONDecodeError
-from dagster.utils import merge_dicts, utc_datetime_from_timestamp
+from dagster.utils import LRUCache, merge_dicts, utc_datetime_from_timestamp
 
-from ..pipeline_run import PipelineRun, PipelineRunsFilter, RunRecord
+from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter, RunRecord
 from .base import RunStorage
-from .migration import RUN_DATA_MIGRATIONS, RUN_PARTITIONS
+from .migration import RUN_DATA_MIGRATIONS, RUN_PARTITIONS, RUN_PRIORITY
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
@@ -51,6 +57,17 @@ class SnapshotType(Enum):
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
+# The number of deserialized snapshots that each SqlRunStorage keeps in memory
+SNAPSHOT_CACHE_SIZE = 32
+
+# The number of ids of snapshots known to be present that each SqlRunStorage keeps in memory
+PRESENT_SNAPSHOT_IDS_CACHE_SIZE = 1024
+
+# Snapshots are compressed with the fastest zlib level. Snapshot bodies are mostly repeated JSON
+# keys, so higher levels barely shrink them, and every level is read by the same zlib.decompress.
+SNAPSHOT_COMPRESSION_LEVEL = 1
+
+
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     """Base class for SQL based run storages"""
 
@@ -58,6 +75,12 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
 
+    def connect_for_transaction(self):
+        """Context manager yielding a sqlalchemy.engine.Connection that transactions can be begun
+        on. Storages whose connections autocommit, which ignores transactions, should override this
+        to yield a connection that does not autocommit."""
+        return self.connect()
+
     @abstractmethod
     def upgrade(self):
         """This method should perform any schema or data migrations necessary to bring an
@@ -80,9 +103,7 @@ def fetchone(self, query):
 
         return row
 
-    def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
-        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
-
+    def _check_snapshot_exists(self, pipeline_run: PipelineRun):
         if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
             pipeline_run.pipeline_snapshot_id
         ):
@@ -92,11 +113,15 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
                 )
             )
 
+    def _run_row_values(self, pipeline_run: PipelineRun, include_priority: bool) -> Dict[str, Any]:
         has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
         partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
         partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
+        priority_values = (
+            dict(priority=get_run_priority(pipeline_run.tags)) if include_priority else {}
+        )
 
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=pipeline_run.run_id,
             pipeline_name=pipeline_run.pipeline_name,
             status=pipeline_run.status.value,
@@ -104,6 +129,16 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             snapshot_id=pipeline_run.pipeline_snapshot_id,
             partition=partition,
             partition_set=partition_set,
+            **priority_values,
+        )
+
+    def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+
+        self._check_snapshot_exists(pipeline_run)
+
+        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._run_row_values(pipeline_run, self.has_built_index(RUN_PRIORITY))
         )
         with self.connect() as conn:
             try:
@@ -122,6 +157,45 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
 
         return pipeline_run
 
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        check.list_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+
+        if not pipeline_runs:
+            return []
+
+        for snapshot_id in {pipeline_run.pipeline_snapshot_id for pipeline_run in pipeline_runs}:
+            if snapshot_id and not self.has_pipeline_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(ss_id=snapshot_id)
+                )
+
+        include_priority = self.has_built_index(RUN_PRIORITY)
+        tag_rows = [
+            dict(run_id=pipeline_run.run_id, key=k, value=v)
+            for pipeline_run in pipeline_runs
+            for k, v in (pipeline_run.tags or {}).items()
+        ]
+
+        with self.connect_for_transaction() as conn:
+            with conn.begin():
+                try:
+                    conn.execute(
+                        RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            self._run_row_values(pipeline_run, include_priority)
+                            for pipeline_run in pipeline_runs
+                        ],
+                    )
+                except db.exc.IntegrityError as exc:
+                    raise DagsterRunAlreadyExists from exc
+
+                if tag_rows:
+                    conn.execute(
+                        RunTagsTable.insert(), tag_rows  # pylint: disable=no-value-for-parameter
+                    )
+
+        return pipeline_runs
+
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -197,7 +271,12 @@ def _add_filters_to_query(self, query, filters: PipelineRunsFilter):
             query = query.where(
                 db.or_(
                     *(
-                        db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
+                        db.and_(
+                            RunTagsTable.c.key == key,
+                            RunTagsTable.c.value.in_(value)
+                            if isinstance(value, list)
+                            else RunTagsTable.c.value == value,
+                        )
                         for key, value in filters.tags.items()
                     )
                 )
@@ -271,6 +350,62 @@ def get_runs_count(self, filters: PipelineRunsFilter = None) -> int:
         count = rows[0][0]
         return count
 
+    def get_queued_runs(self, cursor: str = None, limit: int = None) -> List[PipelineRun]:
+        check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+
+        if not self.has_built_index(RUN_PRIORITY):
+            # order by the priority tags
+            return super().get_queued_runs(cursor=cursor, limit=limit)
+
+        query = db.select([RunsTable.c.run_body]).where(
+            RunsTable.c.status == PipelineRunStatus.QUEUED.value
+        )
+
+        if cursor:
+            cursor_row = self.fetchone(
+                db.select([RunsTable.c.priority, RunsTable.c.id]).where(
+                    RunsTable.c.run_id == cursor
+                )
+            )
+            if not cursor_row:
+                return []
+
+            cursor_priority, cursor_id = cursor_row
+            query = query.where(
+                db.or_(
+                    RunsTable.c.priority < cursor_priority,
+                    db.and_(RunsTable.c.priority == cursor_priority, RunsTable.c.id > cursor_id),
+                )
+            )
+
+        query = query.order_by(RunsTable.c.priority.desc(), RunsTable.c.id.asc())
+        if limit:
+            query = query.limit(limit)
+
+        rows = self.fetchall(query)
+        return self._rows_to_runs(rows)
+
+    def get_run_counts_by_tag(
+        self, filters: PipelineRunsFilter, tag_keys: List[str]
+    ) -> Dict[Tuple[str, str], int]:
+        check.inst_param(filters, "filters", PipelineRunsFilter)
+        check.list_param(tag_keys, "tag_keys", of_type=str)
+
+        if not tag_keys:
+            return {}
+
+        run_ids_query = self._runs_query(filters=filters, columns=["run_id"])
+        query = (
+            db.select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count().label("count")])
+            .where(RunTagsTable.c.key.in_(tag_keys))
+            .where(RunTagsTable.c.run_id.in_(run_ids_query))
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+
+        rows = self.fetchall(query)
+        return {(row[0], row[1]): row[2] for row in rows}
+
     def get_run_by_id(self, run_id: str) -> Optional[PipelineRun]:
         """Get a run by its id.
 
@@ -345,6 +480,11 @@ def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         all_tags = merge_dicts(current_tags, new_tags)
         partition = all_tags.get(PARTITION_NAME_TAG)
         partition_set = all_tags.get(PARTITION_SET_TAG)
+        priority_values = (
+            dict(priority=get_run_priority(all_tags))
+            if PRIORITY_TAG in new_tags and self.has_built_index(RUN_PRIORITY)
+            else {}
+        )
 
         with self.connect() as conn:
             conn.execute(
@@ -357,6 +497,7 @@ def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
+                    **priority_values,
                 )
             )
 
@@ -576,9 +717,40 @@ def delete_run(self, run_id: str):
         with self.connect() as conn:
             conn.execute(query)
 
+    @property
+    def _snapshot_cache(self) -> LRUCache:
+        # Snapshots are keyed by the hash of their contents, so a deserialized snapshot never goes
+        # stale. Created lazily since subclasses are not required to call super().__init__().
+        snapshot_cache = self.__dict__.get("_snapshot_lru_cache")
+        if snapshot_cache is None:
+            snapshot_cache = self.__dict__.setdefault(
+                "_snapshot_lru_cache", LRUCache(SNAPSHOT_CACHE_SIZE)
+            )
+        return snapshot_cache
+
+    @property
+    def _present_snapshot_ids(self) -> LRUCache:
+        # The ids of snapshots that this process wrote, or found in the database. Unlike snapshot
+        # bodies, presence can go stale if another process wipes the storage, so the cache is only
+        # trusted to answer that a snapshot is present: misses always go to the database, and
+        # writes never consult it.
+        present_snapshot_ids = self.__dict__.get("_present_snapshot_ids_lru_cache")
+        if present_snapshot_ids is None:
+            present_snapshot_ids = self.__dict__.setdefault(
+                "_present_snapshot_ids_lru_cache", LRUCache(PRESENT_SNAPSHOT_IDS_CACHE_SIZE)
+            )
+        return present_snapshot_ids
+
     def has_pipeline_snapshot(self, pipeline_snapshot_id: str) -> bool:
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
-        return self._has_snapshot_id(pipeline_snapshot_id)
+        if pipeline_snapshot_id in self._present_snapshot_ids:
+            return True
+
+        if not self._has_snapshot_id(pipeline_snapshot_id):
+            return False
+
+        self._present_snapshot_ids.set(pipeline_snapshot_id, True)
+        return True
 
     def add_pipeline_snapshot(self, pipeline_snapshot: PipelineSnapshot) -> str:
         check.inst_param(pipeline_snapshot, "pipeline_snapshot", PipelineSnapshot)
@@ -619,13 +791,22 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                     snapshot_id=snapshot_id,
                     snapshot_body=zlib.compress(
-                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
+                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8"),
+                        SNAPSHOT_COMPRESSION_LEVEL,
                     ),
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
-            return snapshot_id
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are content hashes, so a snapshot with this id that was added
+                # concurrently (e.g. by another sensor thread creating a run) is identical
+                pass
+
+        self._present_snapshot_ids.set(snapshot_id, True)
+        self._snapshot_cache.set(snapshot_id, snapshot_obj)
+        return snapshot_id
 
     def _has_snapshot_id(self, snapshot_id: str) -> bool:
         query = db.select([SnapshotsTable.c.snapshot_id]).where(
@@ -637,13 +818,21 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str):
+        snapshot = self._snapshot_cache.get(snapshot_id)
+        if snapshot is not None:
+            return snapshot
+
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+        snapshot = defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+        if snapshot is not None:
+            self._present_snapshot_ids.set(snapshot_id, True)
+            self._snapshot_cache.set(snapshot_id, snapshot)
+        return snapshot
 
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
@@ -755,6 +944,9 @@ def wipe(self):
             conn.execute(SnapshotsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        self._present_snapshot_ids.clear()
+        self._snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self):
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -0,0 +1,22 @@
+"""add run priority column
+
+Revision ID: dc94a0a5efd3
+Revises: 7f2b1a4ca7a5
+Create Date: 2021-09-22 11:27:40.531289
+
+"""
+from dagster.core.storage.migration.utils import add_run_priority_column
+
+# revision identifiers, used by Alembic.
+revision = "dc94a0a5efd3"
+down_revision = "7f2b1a4ca7a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_priority_column()
+
+
+def downgrade():
+    pass
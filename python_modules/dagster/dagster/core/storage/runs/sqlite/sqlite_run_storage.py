@@ -49,6 +49,7 @@ def __init__(self, conn_string, inst_data=None):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._index_migration_cache = {}
 
         super().__init__()
 
@@ -117,6 +118,18 @@ def upgrade(self):
         self._check_for_version_066_migration_and_perform()
         self._alembic_upgrade()
 
+    def has_built_index(self, migration_name):
+        if migration_name not in self._index_migration_cache:
+            self._index_migration_cache[migration_name] = super(
+                SqliteRunStorage, self
+            ).has_built_index(migration_name)
+        return self._index_migration_cache[migration_name]
+
+    def mark_index_built(self, migration_name):
+        super(SqliteRunStorage, self).mark_index_built(migration_name)
+        if migration_name in self._index_migration_cache:
+            del self._index_migration_cache[migration_name]
+
     # In version 0.6.6, we changed the layout of the of the sqllite dbs on disk
     # to move from the root of DAGSTER_HOME/runs.db to DAGSTER_HOME/history/runs.bd
     # This function checks for that condition and does the move
@@ -42,6 +42,16 @@
 USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG]
 
 
+def get_run_priority(tags):
+    """The priority of a run with the given tags, for dequeuing. Malformed priorities are treated
+    as the default priority of 0."""
+    priority_tag_value = tags.get(PRIORITY_TAG, "0") if tags else "0"
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
 class TagType(Enum):
     # Custom tag provided by a user
     USER_PROVIDED = "USER_PROVIDED"
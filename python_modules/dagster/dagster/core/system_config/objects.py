@@ -147,7 +147,9 @@ def build(
                 run_config
             )
 
-        config_evr = process_config(run_config_schema.run_config_schema_type, run_config)
+        config_evr = process_config(
+            run_config_schema.run_config_schema_type, run_config, memoize=True
+        )
         if not config_evr.success:
             raise DagsterInvalidConfigError(
                 f"Error in config for {pipeline_def.target_type}".format(pipeline_def.name),
@@ -0,0 +1,59 @@
+from typing import Callable, Dict, List, TypeVar
+
+from dagster import check
+from dagster.core.definitions.events import AssetKey
+from dagster.core.execution.stats import RunStepKeyStatsSnapshot
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
+
+T = TypeVar("T")
+
+
+class RunBatchLoader:
+    """
+    Request-scoped loader for data that is stored per run, such as run stats, step stats and the
+    keys of the assets materialized in each run.
+
+    Resolvers that fetch a list of runs register the run ids with `add_run_ids`. The first time a
+    field is loaded for one of the registered runs, it is loaded for all of the registered runs
+    with a single storage call, so that resolving the field for every run of a page does not cost a
+    storage call per run. Loading a field for a run that was not registered falls through to the
+    single run storage call, and is not cached, so that long lived request contexts (e.g. those of
+    subscriptions) do not serve stale data for runs that are not part of a page.
+    """
+
+    def __init__(self, instance: DagsterInstance):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._run_ids: Dict[str, None] = {}  # ordered set of the registered run ids
+        self._stats: Dict[str, PipelineRunStatsSnapshot] = {}
+        self._step_stats: Dict[str, List[RunStepKeyStatsSnapshot]] = {}
+        self._asset_keys: Dict[str, List[AssetKey]] = {}
+
+    def add_run_ids(self, run_ids: List[str]):
+        for run_id in check.list_param(run_ids, "run_ids", of_type=str):
+            self._run_ids[run_id] = None
+
+    def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
+        check.str_param(run_id, "run_id")
+        if run_id not in self._run_ids:
+            return self._instance.get_run_stats(run_id)
+        return self._load(self._stats, self._instance.get_run_stats_for_runs, run_id)
+
+    def get_run_step_stats(self, run_id: str) -> List[RunStepKeyStatsSnapshot]:
+        check.str_param(run_id, "run_id")
+        if run_id not in self._run_ids:
+            return self._instance.get_run_step_stats(run_id)
+        return self._load(self._step_stats, self._instance.get_run_step_stats_for_runs, run_id)
+
+    def get_run_asset_keys(self, run_id: str) -> List[AssetKey]:
+        check.str_param(run_id, "run_id")
+        if run_id not in self._run_ids:
+            return self._instance.asset_keys_for_run(run_id)
+        return self._load(self._asset_keys, self._instance.asset_keys_for_runs, run_id)
+
+    def _load(
+        self, cache: Dict[str, T], load_fn: Callable[[List[str]], Dict[str, T]], run_id: str
+    ) -> T:
+        if run_id not in cache:
+            cache.update(load_fn([key for key in self._run_ids if key not in cache]))
+        return cache[run_id]
@@ -32,6 +32,7 @@
 from dagster.grpc.server_watcher import create_grpc_watch_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+from .batch_loader import RunBatchLoader
 from .load_target import WorkspaceLoadTarget
 from .permissions import get_user_permissions
 from .workspace import IWorkspace, WorkspaceLocationEntry, WorkspaceLocationLoadStatus
@@ -263,11 +264,16 @@ def __init__(
         self._workspace_snapshot = workspace_snapshot
         self._process_context = process_context
         self._version = version
+        self._run_batch_loader = RunBatchLoader(instance)
 
     @property
     def instance(self) -> DagsterInstance:
         return self._instance
 
+    @property
+    def run_batch_loader(self) -> RunBatchLoader:
+        return self._run_batch_loader
+
     def get_workspace_snapshot(self) -> Dict[str, WorkspaceLocationEntry]:
         return self._workspace_snapshot
 
@@ -10,9 +10,10 @@
     submit_backfill_runs,
 )
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunsFilter
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import PARTITION_NAME_TAG
 from dagster.core.workspace import IWorkspace
+from dagster.utils import merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 # out of abundance of caution, sleep at checkpoints in case we are pinning CPU by submitting lots
@@ -81,11 +82,17 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
                 if backfill_job.status != BulkActionStatus.REQUESTED:
                     break
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
+                chunk, unsubmitted_runs, checkpoint, has_more = _get_partitions_chunk(
                     instance, logger, backfill_job, CHECKPOINT_COUNT
                 )
                 _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
 
+                # the runs of a chunk are all created before any of them are submitted, so submit
+                # any runs that were created by an interrupted iteration but never submitted
+                for run in unsubmitted_runs:
+                    instance.submit_run(run.run_id, workspace)
+                    yield
+
                 if chunk:
 
                     for _run_id in submit_backfill_runs(
@@ -126,11 +133,6 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
         index = partition_names.index(backfill_job.last_submitted_partition_name)
         partition_names = partition_names[index + 1 :]
 
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        PipelineRunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
     initial_checkpoint = (
         partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
     )
@@ -139,14 +141,34 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
     partitions_chunk = partition_names[:chunk_size]
     next_checkpoint = partitions_chunk[-1]
 
+    # for idempotence, fetch the runs with the current backfill id for the partitions in the chunk
+    backfill_runs = instance.get_runs(
+        PipelineRunsFilter(
+            tags=merge_dicts(
+                PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
+                {PARTITION_NAME_TAG: partitions_chunk},
+            )
+        )
+    )
+    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
+    # runs are fetched newest first, but should be submitted in the order they were created
+    unsubmitted_runs = [
+        run for run in reversed(backfill_runs) if run.status == PipelineRunStatus.NOT_STARTED
+    ]
+
     to_skip = set(partitions_chunk).intersection(completed_partitions)
     if to_skip:
         logger.info(
             f"Found {len(to_skip)} existing runs for backfill {backfill_job.backfill_id}, skipping"
         )
+    if unsubmitted_runs:
+        logger.info(
+            f"Found {len(unsubmitted_runs)} existing runs for backfill {backfill_job.backfill_id} "
+            "that were not submitted, submitting"
+        )
     to_submit = [
         partition_name
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+    return to_submit, unsubmitted_runs, next_checkpoint, has_more
@@ -2,31 +2,42 @@
 import sys
 import time
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, Tuple
 
 from dagster import DagsterEvent, DagsterEventType, check
 from dagster.core.events.log import EventLogEntry
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import (
     IN_PROGRESS_RUN_STATUSES,
-    PipelineRun,
     PipelineRunStatus,
     PipelineRunsFilter,
 )
-from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.daemon import DagsterDaemon
 from dagster.utils.error import serializable_error_info_from_exc_info
 
+# The number of queued runs fetched from the run storage at a time, in priority order
+QUEUED_RUNS_PAGE_SIZE = 100
+
+# The number of queued runs checked against the tag concurrency limits in each iteration, per run
+# that can be launched, so that runs blocked at the front of a long queue don't make every
+# iteration walk the whole queue
+MAX_QUEUED_RUNS_CHECKED_PER_LAUNCH = 10
+
 
 class _TagConcurrencyLimitsCounter:
     """
     Helper object that keeps track of when the tag concurrency limits are met
     """
 
-    def __init__(self, tag_concurrency_limits, in_progress_runs):
+    def __init__(self, tag_concurrency_limits, in_progress_run_counts_by_tag):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
+        check.dict_param(
+            in_progress_run_counts_by_tag,
+            "in_progress_run_counts_by_tag",
+            key_type=tuple,
+            value_type=int,
+        )
 
         self._key_limits: Dict[str, int] = {}
         self._key_value_limits: Dict[(str, str), int] = {}
@@ -48,9 +59,9 @@ def __init__(self, tag_concurrency_limits, in_progress_runs):
         self._key_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
         self._unique_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
 
-        # initialize counters based on current in progress runs
-        for run in in_progress_runs:
-            self.update_counters_with_launched_run(run)
+        # initialize counters based on the tags of the current in progress runs
+        for (key, value), count in in_progress_run_counts_by_tag.items():
+            self._update_counters_with_tag(key, value, count)
 
     def is_run_blocked(self, run):
         """
@@ -80,15 +91,18 @@ def update_counters_with_launched_run(self, run):
         Add a new in progress run to the counters
         """
         for key, value in run.tags.items():
-            if key in self._key_limits:
-                self._key_counts[key] += 1
+            self._update_counters_with_tag(key, value, 1)
 
-            tag_tuple = (key, value)
-            if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
+    def _update_counters_with_tag(self, key, value, count):
+        if key in self._key_limits:
+            self._key_counts[key] += count
+
+        tag_tuple = (key, value)
+        if tag_tuple in self._key_value_limits:
+            self._key_value_counts[tag_tuple] += count
 
-            if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+        if key in self._unique_value_limits:
+            self._unique_value_counts[tag_tuple] += count
 
 
 class QueuedRunCoordinatorDaemon(DagsterDaemon):
@@ -108,38 +122,37 @@ def run_iteration(self, instance, workspace):
         max_concurrent_runs = instance.run_coordinator.max_concurrent_runs
         tag_concurrency_limits = instance.run_coordinator.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
-        max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+        in_progress_runs_filter = PipelineRunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        num_in_progress_runs = instance.get_runs_count(filters=in_progress_runs_filter)
+        max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
 
         # Possibly under 0 if runs were launched without queuing
         if max_runs_to_launch <= 0:
             self._logger.info(
                 "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                    len(in_progress_runs), max_concurrent_runs
+                    num_in_progress_runs, max_concurrent_runs
                 )
             )
             return
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.info("Poll returned no queued runs.")
-        else:
-            self._logger.info("Retrieved {} queued runs, checking limits.".format(len(queued_runs)))
-
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-
-        # launch until blocked by limit rules
-        num_dequeued_runs = 0
+        # count the in progress runs by the tags that are limited, rather than fetching the runs
+        tag_keys = sorted({tag_limit["key"] for tag_limit in tag_concurrency_limits or []})
         tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
+            tag_concurrency_limits,
+            instance.get_run_counts_by_tag(in_progress_runs_filter, tag_keys) if tag_keys else {},
         )
 
-        for run in sorted_runs:
+        # launch in priority order until blocked by limit rules
+        num_dequeued_runs = 0
+        num_checked_runs = 0
+        max_runs_to_check = max_runs_to_launch * MAX_QUEUED_RUNS_CHECKED_PER_LAUNCH
+
+        for run in self._iterate_queued_runs(instance, max_runs_to_check):
             if num_dequeued_runs >= max_runs_to_launch:
                 break
 
+            num_checked_runs += 1
+
             if tag_concurrency_limits_counter.is_run_blocked(run):
                 continue
 
@@ -168,30 +181,38 @@ def run_iteration(self, instance, workspace):
 
             yield error_info
 
-        self._logger.info("Launched {} runs.".format(num_dequeued_runs))
-
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = PipelineRunsFilter(statuses=[PipelineRunStatus.QUEUED])
-
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        if not num_checked_runs:
+            self._logger.info("Poll returned no queued runs.")
+        else:
+            self._logger.info("Checked limits for {} queued runs.".format(num_checked_runs))
 
-    def _get_in_progress_runs(self, instance):
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=PipelineRunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        if num_checked_runs >= max_runs_to_check and num_dequeued_runs < max_runs_to_launch:
+            self._logger.info(
+                "Stopped checking queued runs after the first {} in priority order, the runs "
+                "behind them will be checked once runs ahead of them are launched.".format(
+                    max_runs_to_check
+                )
+            )
 
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        self._logger.info("Launched {} runs.".format(num_dequeued_runs))
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _iterate_queued_runs(self, instance, max_runs_to_check):
+        """Yields up to max_runs_to_check queued runs in the order in which they should be
+        dequeued, fetching them from the run storage a page at a time, so that only as many runs
+        are fetched as are needed to fill the available slots."""
+        cursor = None
+        num_fetched_runs = 0
+        while num_fetched_runs < max_runs_to_check:
+            limit = min(QUEUED_RUNS_PAGE_SIZE, max_runs_to_check - num_fetched_runs)
+            runs = instance.get_queued_runs(cursor=cursor, limit=limit)
+            num_fetched_runs += len(runs)
+            for run in runs:
+                yield run
+
+            if len(runs) < limit:
+                return
+
+            cursor = runs[-1].run_id
 
     def _dequeue_run(self, instance, run, workspace):
         # double check that the run is still queued before dequeing
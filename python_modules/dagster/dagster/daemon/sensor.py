@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 import time
@@ -14,6 +15,7 @@
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import RUN_KEY_TAG, check_tags
 from dagster.core.workspace import IWorkspace
+from dagster.daemon.threaded_submission import execute_evaluations_in_threads
 from dagster.utils import merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -181,71 +183,154 @@ def execute_sensor_iteration(
         yield
         return
 
+    if instance.sensor_settings.get("use_threads"):
+        yield from _execute_sensor_jobs_in_threads(
+            instance, logger, workspace, sensor_jobs, debug_crash_flags
+        )
+        return
+
     for job_state in sensor_jobs:
         sensor_debug_crash_flags = (
             debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None
         )
-        error_info = None
-        try:
-            origin = job_state.origin.external_repository_origin.repository_location_origin
-            repo_location = workspace.get_location(origin)
-
-            repo_name = job_state.origin.external_repository_origin.repository_name
-
-            if not repo_location.has_repository(repo_name):
-                raise DagsterSensorDaemonError(
-                    f"Could not find repository {repo_name} in location {repo_location.name} to "
-                    + f"run sensor {job_state.job_name}. If this repository no longer exists, you can "
-                    + "turn off the sensor in the Dagit UI.",
-                )
+        yield from _process_sensor_job(
+            instance, logger, workspace, job_state, sensor_debug_crash_flags
+        )
 
-            external_repo = repo_location.get_repository(repo_name)
-            if not external_repo.has_external_sensor(job_state.job_name):
-                raise DagsterSensorDaemonError(
-                    f"Could not find sensor {job_state.job_name} in repository {repo_name}. If this "
-                    "sensor no longer exists, you can turn it off in the Dagit UI.",
-                )
 
-            now = pendulum.now("UTC")
-            if _is_under_min_interval(job_state, now):
-                continue
-
-            tick = instance.create_job_tick(
-                JobTickData(
-                    job_origin_id=job_state.job_origin_id,
-                    job_name=job_state.job_name,
-                    job_type=JobType.SENSOR,
-                    status=JobTickStatus.STARTED,
-                    timestamp=now.timestamp(),
-                )
-            )
-
-            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+def _execute_sensor_jobs_in_threads(instance, logger, workspace, sensor_jobs, debug_crash_flags):
+    """
+    Evaluates sensors concurrently on a pool of threads, so that one slow sensor does not delay the
+    evaluation of every other sensor. At most `max_concurrent_evaluations_per_location` sensors
+    are evaluated at once against any single repository location.
+
+    Each sensor is evaluated at most once per iteration, and the iteration only completes once
+    every evaluation has finished, so ticks (and cursors) for any given sensor are still processed
+    one at a time and in order. Since the workspace is not thread-safe, the worker threads only
+    evaluate sensors and create runs: repository locations are resolved and runs are submitted on
+    the calling thread.
+    """
+    evaluations = []
+    for job_state in sensor_jobs:
+        try:
+            repo_location, external_repo = _get_sensor_repository(workspace, job_state)
+        except Exception:  # pylint: disable=broad-except
+            yield _log_sensor_error(logger, job_state)
+            continue
 
-            external_sensor = external_repo.get_external_sensor(job_state.job_name)
-            with SensorLaunchContext(
-                external_sensor, job_state, tick, instance, logger
-            ) as tick_context:
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                yield from _evaluate_sensor(
-                    tick_context,
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None
+        )
+        evaluations.append(
+            (
+                repo_location.name,
+                functools.partial(
+                    _process_sensor_job,
                     instance,
+                    logger,
                     workspace,
-                    repo_location,
-                    external_repo,
-                    external_sensor,
                     job_state,
                     sensor_debug_crash_flags,
-                )
-        except Exception:  # pylint: disable=broad-except
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
-                    sensor_name=job_state.job_name,
-                    error_info=error_info.to_string(),
-                )
+                    sensor_repository=(repo_location, external_repo),
+                ),
             )
-        yield error_info
+        )
+
+    yield from execute_evaluations_in_threads(
+        evaluations,
+        submit_run_fn=lambda run_id: instance.submit_run(run_id, workspace),
+        num_workers=instance.sensor_settings.get("num_workers"),
+        thread_name_prefix="sensor_daemon_worker",
+        max_concurrent_per_group=instance.sensor_settings.get(
+            "max_concurrent_evaluations_per_location"
+        ),
+    )
+
+
+def _get_sensor_repository(workspace, job_state):
+    origin = job_state.origin.external_repository_origin.repository_location_origin
+    repo_location = workspace.get_location(origin)
+
+    repo_name = job_state.origin.external_repository_origin.repository_name
+
+    if not repo_location.has_repository(repo_name):
+        raise DagsterSensorDaemonError(
+            f"Could not find repository {repo_name} in location {repo_location.name} to "
+            + f"run sensor {job_state.job_name}. If this repository no longer exists, you can "
+            + "turn off the sensor in the Dagit UI.",
+        )
+
+    external_repo = repo_location.get_repository(repo_name)
+    if not external_repo.has_external_sensor(job_state.job_name):
+        raise DagsterSensorDaemonError(
+            f"Could not find sensor {job_state.job_name} in repository {repo_name}. If this "
+            "sensor no longer exists, you can turn it off in the Dagit UI.",
+        )
+
+    return repo_location, external_repo
+
+
+def _log_sensor_error(logger, job_state):
+    error_info = serializable_error_info_from_exc_info(sys.exc_info())
+    logger.error(
+        "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
+            sensor_name=job_state.job_name,
+            error_info=error_info.to_string(),
+        )
+    )
+    return error_info
+
+
+def _process_sensor_job(
+    instance,
+    logger,
+    workspace,
+    job_state,
+    sensor_debug_crash_flags,
+    sensor_repository=None,
+    submit_run_fn=None,
+):
+    error_info = None
+    try:
+        repo_location, external_repo = (
+            sensor_repository if sensor_repository else _get_sensor_repository(workspace, job_state)
+        )
+
+        now = pendulum.now("UTC")
+        if _is_under_min_interval(job_state, now):
+            return
+
+        tick = instance.create_job_tick(
+            JobTickData(
+                job_origin_id=job_state.job_origin_id,
+                job_name=job_state.job_name,
+                job_type=JobType.SENSOR,
+                status=JobTickStatus.STARTED,
+                timestamp=now.timestamp(),
+            )
+        )
+
+        _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        external_sensor = external_repo.get_external_sensor(job_state.job_name)
+        with SensorLaunchContext(
+            external_sensor, job_state, tick, instance, logger
+        ) as tick_context:
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            yield from _evaluate_sensor(
+                tick_context,
+                instance,
+                workspace,
+                repo_location,
+                external_repo,
+                external_sensor,
+                job_state,
+                sensor_debug_crash_flags,
+                submit_run_fn,
+            )
+    except Exception:  # pylint: disable=broad-except
+        error_info = _log_sensor_error(logger, job_state)
+    yield error_info
 
 
 def _evaluate_sensor(
@@ -257,6 +342,7 @@ def _evaluate_sensor(
     external_sensor,
     job_state,
     sensor_debug_crash_flags=None,
+    submit_run_fn=None,
 ):
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
     sensor_runtime_data = repo_location.get_external_sensor_execution_data(
@@ -359,7 +445,10 @@ def _evaluate_sensor(
             context.logger.info(
                 "Launching run for {sensor_name}".format(sensor_name=external_sensor.name)
             )
-            instance.submit_run(run.run_id, workspace)
+            if submit_run_fn:
+                submit_run_fn(run.run_id)
+            else:
+                instance.submit_run(run.run_id, workspace)
             context.logger.info(
                 "Completed launch of run {run_id} for {sensor_name}".format(
                     run_id=run.run_id, sensor_name=external_sensor.name
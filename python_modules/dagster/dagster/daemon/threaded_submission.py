@@ -0,0 +1,160 @@
+import queue
+import threading
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from dagster import check
+from dagster.core.errors import DagsterError
+
+# How often the daemon heartbeats while waiting on evaluations in threads
+THREADED_EVALUATION_POLL_INTERVAL = 1
+
+
+class DagsterDaemonShutdownError(DagsterError):
+    """Error raised in an evaluation thread that submits a run after the daemon stopped handling
+    run submissions"""
+
+
+class _RunSubmission(namedtuple("_RunSubmission", "run_id future")):
+    """Request from an evaluation thread for the daemon thread to submit a run"""
+
+
+class _DaemonQueue:
+    """
+    Receives run submissions from the evaluation threads, as well as the futures of the
+    evaluations as they finish. Once closed, pending and future run submissions fail instead of
+    waiting on a daemon thread that is no longer handling them.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit_run(self, run_id):
+        submitted = Future()
+        with self._lock:
+            if self._closed:
+                raise DagsterDaemonShutdownError(
+                    f"Could not submit run {run_id} since the daemon is shutting down."
+                )
+            self._queue.put(_RunSubmission(run_id, submitted))
+        return submitted.result()
+
+    def put_finished(self, future):
+        self._queue.put(future)
+
+    def get(self, timeout):
+        return self._queue.get(timeout=timeout)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if isinstance(item, _RunSubmission):
+                item.future.set_exception(
+                    DagsterDaemonShutdownError(
+                        f"Could not submit run {item.run_id} since the daemon is shutting down."
+                    )
+                )
+
+
+def execute_evaluations_in_threads(
+    evaluations,
+    submit_run_fn,
+    num_workers,
+    thread_name_prefix,
+    max_concurrent_per_group=None,
+):
+    """
+    Runs daemon evaluations (e.g. sensor or schedule ticks) concurrently on a pool of threads.
+    Since the workspace is not thread-safe, runs that the evaluations create are submitted on the
+    calling thread, using `submit_run_fn`.
+
+    Args:
+        evaluations (List[Tuple[str, Callable]]): The group (e.g. repository location name) of
+            each evaluation, along with a function that takes the function to submit runs with (as
+            `submit_run_fn`) and returns a generator of error infos (or None) for the evaluation.
+        submit_run_fn (Callable[[str], None]): Submits the run with the given id.
+        num_workers (Optional[int]): The number of threads to evaluate on.
+        thread_name_prefix (str): The prefix of the names of the evaluation threads.
+        max_concurrent_per_group (Optional[int]): The maximum number of evaluations of any one
+            group that are in flight at once.
+
+    Yields the error infos of each evaluation as it finishes, as well as None while waiting so that
+    the daemon can heartbeat. If the generator is closed before all evaluations finish, evaluations
+    that have not started are cancelled and run submissions from evaluations that have fail with a
+    DagsterDaemonShutdownError, so that closing does not block on submissions that never happen.
+    """
+    check.list_param(evaluations, "evaluations", of_type=tuple)
+    check.callable_param(submit_run_fn, "submit_run_fn")
+    check.opt_int_param(num_workers, "num_workers")
+    check.str_param(thread_name_prefix, "thread_name_prefix")
+    check.opt_int_param(max_concurrent_per_group, "max_concurrent_per_group")
+
+    pending_by_group = defaultdict(deque)
+    for group, evaluation_fn in evaluations:
+        pending_by_group[group].append(evaluation_fn)
+
+    daemon_queue = _DaemonQueue()
+    in_flight_groups = {}
+    in_flight_counts = defaultdict(int)
+
+    with ThreadPoolExecutor(
+        max_workers=num_workers, thread_name_prefix=thread_name_prefix
+    ) as executor:
+        try:
+            while pending_by_group or in_flight_groups:
+                for group in list(pending_by_group.keys()):
+                    pending = pending_by_group[group]
+                    while pending and (
+                        not max_concurrent_per_group
+                        or in_flight_counts[group] < max_concurrent_per_group
+                    ):
+                        evaluation_fn = pending.popleft()
+                        future = executor.submit(
+                            _collect_errors, evaluation_fn(submit_run_fn=daemon_queue.submit_run)
+                        )
+                        in_flight_groups[future] = group
+                        in_flight_counts[group] += 1
+                        future.add_done_callback(daemon_queue.put_finished)
+
+                    if not pending:
+                        del pending_by_group[group]
+
+                try:
+                    item = daemon_queue.get(timeout=THREADED_EVALUATION_POLL_INTERVAL)
+                except queue.Empty:
+                    # let the daemon heartbeat while evaluations are still in flight
+                    yield
+                    continue
+
+                if isinstance(item, _RunSubmission):
+                    try:
+                        submit_run_fn(item.run_id)
+                    except Exception as e:  # pylint: disable=broad-except
+                        item.future.set_exception(e)
+                    else:
+                        item.future.set_result(None)
+                    yield
+                    continue
+
+                in_flight_counts[in_flight_groups.pop(item)] -= 1
+                yield from item.result()
+        finally:
+            # Runs if the daemon stops consuming this generator before every evaluation finished:
+            # the executor waits on its threads on exit, so none of them may be left waiting on a
+            # run submission
+            for future in in_flight_groups:
+                future.cancel()
+            daemon_queue.close()
+
+
+def _collect_errors(generator):
+    return [error_info for error_info in generator if error_info]
@@ -26,7 +26,7 @@
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\tapi.proto\x12\x03\x61pi"\x07\n\x05\x45mpty"\x1b\n\x0bPingRequest\x12\x0c\n\x04\x65\x63ho\x18\x01 \x01(\t"\x19\n\tPingReply\x12\x0c\n\x04\x65\x63ho\x18\x01 \x01(\t"=\n\x14StreamingPingRequest\x12\x17\n\x0fsequence_length\x18\x01 \x01(\x05\x12\x0c\n\x04\x65\x63ho\x18\x02 \x01(\t";\n\x12StreamingPingEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12\x0c\n\x04\x65\x63ho\x18\x02 \x01(\t"%\n\x10GetServerIdReply\x12\x11\n\tserver_id\x18\x01 \x01(\t"O\n\x1c\x45xecutionPlanSnapshotRequest\x12/\n\'serialized_execution_plan_snapshot_args\x18\x01 \x01(\t"H\n\x1a\x45xecutionPlanSnapshotReply\x12*\n"serialized_execution_plan_snapshot\x18\x01 \x01(\t"H\n\x1d\x45xternalPartitionNamesRequest\x12\'\n\x1fserialized_partition_names_args\x18\x01 \x01(\t"p\n\x1b\x45xternalPartitionNamesReply\x12Q\nIserialized_external_partition_names_or_external_partition_execution_error\x18\x01 \x01(\t"4\n\x1b\x45xternalNotebookDataRequest\x12\x15\n\rnotebook_path\x18\x01 \x01(\t",\n\x19\x45xternalNotebookDataReply\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c"C\n\x1e\x45xternalPartitionConfigRequest\x12!\n\x19serialized_partition_args\x18\x01 \x01(\t"r\n\x1c\x45xternalPartitionConfigReply\x12R\nJserialized_external_partition_config_or_external_partition_execution_error\x18\x01 \x01(\t"A\n\x1c\x45xternalPartitionTagsRequest\x12!\n\x19serialized_partition_args\x18\x01 \x01(\t"n\n\x1a\x45xternalPartitionTagsReply\x12P\nHserialized_external_partition_tags_or_external_partition_execution_error\x18\x01 \x01(\t"c\n*ExternalPartitionSetExecutionParamsRequest\x12\x35\n-serialized_partition_set_execution_param_args\x18\x01 \x01(\t"\x19\n\x17ListRepositoriesRequest"O\n\x15ListRepositoriesReply\x12\x36\n.serialized_list_repositories_response_or_error\x18\x01 \x01(\t"Y\n%ExternalPipelineSubsetSnapshotRequest\x12\x30\n(serialized_pipeline_subset_snapshot_args\x18\x01 \x01(\t"Y\n#ExternalPipelineSubsetSnapshotReply\x12\x32\n*serialized_external_pipeline_subset_result\x18\x01 \x01(\t"H\n\x19\x45xternalRepositoryRequest\x12+\n#serialized_repository_python_origin\x18\x01 \x01(\t"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01 \x01(\t"i\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"W\n ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01 \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01 \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12\x18\n\x10serialized_chunk\x18\x02 \x01(\t"@\n\x13ShutdownServerReply\x12)\n!serialized_shutdown_server_result\x18\x01 \x01(\t"E\n\x16\x43\x61ncelExecutionRequest\x12+\n#serialized_cancel_execution_request\x18\x01 \x01(\t"B\n\x14\x43\x61ncelExecutionReply\x12*\n"serialized_cancel_execution_result\x18\x01 \x01(\t"L\n\x19\x43\x61nCancelExecutionRequest\x12/\n\'serialized_can_cancel_execution_request\x18\x01 \x01(\t"I\n\x17\x43\x61nCancelExecutionReply\x12.\n&serialized_can_cancel_execution_result\x18\x01 \x01(\t"6\n\x0fStartRunRequest\x12#\n\x1bserialized_execute_run_args\x18\x01 \x01(\t"4\n\rStartRunReply\x12#\n\x1bserialized_start_run_result\x18\x01 \x01(\t"8\n\x14GetCurrentImageReply\x12 \n\x18serialized_current_image\x18\x01 \x01(\t2\xd8\r\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12 .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x62\x06proto3',
+    serialized_pb=b'\n\tapi.proto\x12\x03\x61pi"\x07\n\x05\x45mpty"\x1b\n\x0bPingRequest\x12\x0c\n\x04\x65\x63ho\x18\x01 \x01(\t"\x19\n\tPingReply\x12\x0c\n\x04\x65\x63ho\x18\x01 \x01(\t"=\n\x14StreamingPingRequest\x12\x17\n\x0fsequence_length\x18\x01 \x01(\x05\x12\x0c\n\x04\x65\x63ho\x18\x02 \x01(\t";\n\x12StreamingPingEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12\x0c\n\x04\x65\x63ho\x18\x02 \x01(\t"%\n\x10GetServerIdReply\x12\x11\n\tserver_id\x18\x01 \x01(\t"O\n\x1c\x45xecutionPlanSnapshotRequest\x12/\n\'serialized_execution_plan_snapshot_args\x18\x01 \x01(\t"H\n\x1a\x45xecutionPlanSnapshotReply\x12*\n"serialized_execution_plan_snapshot\x18\x01 \x01(\t"H\n\x1d\x45xternalPartitionNamesRequest\x12\'\n\x1fserialized_partition_names_args\x18\x01 \x01(\t"p\n\x1b\x45xternalPartitionNamesReply\x12Q\nIserialized_external_partition_names_or_external_partition_execution_error\x18\x01 \x01(\t"4\n\x1b\x45xternalNotebookDataRequest\x12\x15\n\rnotebook_path\x18\x01 \x01(\t",\n\x19\x45xternalNotebookDataReply\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c"C\n\x1e\x45xternalPartitionConfigRequest\x12!\n\x19serialized_partition_args\x18\x01 \x01(\t"r\n\x1c\x45xternalPartitionConfigReply\x12R\nJserialized_external_partition_config_or_external_partition_execution_error\x18\x01 \x01(\t"A\n\x1c\x45xternalPartitionTagsRequest\x12!\n\x19serialized_partition_args\x18\x01 \x01(\t"n\n\x1a\x45xternalPartitionTagsReply\x12P\nHserialized_external_partition_tags_or_external_partition_execution_error\x18\x01 \x01(\t"c\n*ExternalPartitionSetExecutionParamsRequest\x12\x35\n-serialized_partition_set_execution_param_args\x18\x01 \x01(\t"\x19\n\x17ListRepositoriesRequest"O\n\x15ListRepositoriesReply\x12\x36\n.serialized_list_repositories_response_or_error\x18\x01 \x01(\t"Y\n%ExternalPipelineSubsetSnapshotRequest\x12\x30\n(serialized_pipeline_subset_snapshot_args\x18\x01 \x01(\t"Y\n#ExternalPipelineSubsetSnapshotReply\x12\x32\n*serialized_external_pipeline_subset_result\x18\x01 \x01(\t"H\n\x19\x45xternalRepositoryRequest\x12+\n#serialized_repository_python_origin\x18\x01 \x01(\t"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01 \x01(\t"i\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"O\n\x1c\x45xternalPipelineDatasRequest\x12/\n\'serialized_external_pipeline_datas_args\x18\x01 \x01(\t"W\n ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01 \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01 \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01 \x01(\x05\x12\x18\n\x10serialized_chunk\x18\x02 \x01(\t"@\n\x13ShutdownServerReply\x12)\n!serialized_shutdown_server_result\x18\x01 \x01(\t"E\n\x16\x43\x61ncelExecutionRequest\x12+\n#serialized_cancel_execution_request\x18\x01 \x01(\t"B\n\x14\x43\x61ncelExecutionReply\x12*\n"serialized_cancel_execution_result\x18\x01 \x01(\t"L\n\x19\x43\x61nCancelExecutionRequest\x12/\n\'serialized_can_cancel_execution_request\x18\x01 \x01(\t"I\n\x17\x43\x61nCancelExecutionReply\x12.\n&serialized_can_cancel_execution_result\x18\x01 \x01(\t"6\n\x0fStartRunRequest\x12#\n\x1bserialized_execute_run_args\x18\x01 \x01(\t"4\n\rStartRunReply\x12#\n\x1bserialized_start_run_result\x18\x01 \x01(\t"8\n\x14GetCurrentImageReply\x12 \n\x18serialized_current_image\x18\x01 \x01(\t2\xa0\x0f\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12 .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12\x63\n#StreamingExternalRepositoryManifest\x12\x1e.api.ExternalRepositoryRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x61\n\x1eStreamingExternalPipelineDatas\x12!.api.ExternalPipelineDatasRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x62\x06proto3',
 )
 
 
@@ -1031,6 +1031,47 @@
 )
 
 
+_EXTERNALPIPELINEDATASREQUEST = _descriptor.Descriptor(
+    name="ExternalPipelineDatasRequest",
+    full_name="api.ExternalPipelineDatasRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="serialized_external_pipeline_datas_args",
+            full_name="api.ExternalPipelineDatasRequest.serialized_external_pipeline_datas_args",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1697,
+    serialized_end=1776,
+)
+
+
 _EXTERNALSCHEDULEEXECUTIONREQUEST = _descriptor.Descriptor(
     name="ExternalScheduleExecutionRequest",
     full_name="api.ExternalScheduleExecutionRequest",
@@ -1067,8 +1108,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1697,
-    serialized_end=1784,
+    serialized_start=1778,
+    serialized_end=1865,
 )
 
 
@@ -1108,8 +1149,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1786,
-    serialized_end=1869,
+    serialized_start=1867,
+    serialized_end=1950,
 )
 
 
@@ -1168,8 +1209,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1871,
-    serialized_end=1943,
+    serialized_start=1952,
+    serialized_end=2024,
 )
 
 
@@ -1209,8 +1250,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1945,
-    serialized_end=2009,
+    serialized_start=2026,
+    serialized_end=2090,
 )
 
 
@@ -1250,8 +1291,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2011,
-    serialized_end=2080,
+    serialized_start=2092,
+    serialized_end=2161,
 )
 
 
@@ -1291,8 +1332,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2082,
-    serialized_end=2148,
+    serialized_start=2163,
+    serialized_end=2229,
 )
 
 
@@ -1332,8 +1373,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2150,
-    serialized_end=2226,
+    serialized_start=2231,
+    serialized_end=2307,
 )
 
 
@@ -1373,8 +1414,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2228,
-    serialized_end=2301,
+    serialized_start=2309,
+    serialized_end=2382,
 )
 
 
@@ -1414,8 +1455,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2303,
-    serialized_end=2357,
+    serialized_start=2384,
+    serialized_end=2438,
 )
 
 
@@ -1455,8 +1496,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2359,
-    serialized_end=2411,
+    serialized_start=2440,
+    serialized_end=2492,
 )
 
 
@@ -1496,8 +1537,8 @@
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2413,
-    serialized_end=2469,
+    serialized_start=2494,
+    serialized_end=2550,
 )
 
 DESCRIPTOR.message_types_by_name["Empty"] = _EMPTY
@@ -1532,6 +1573,7 @@
 DESCRIPTOR.message_types_by_name[
     "StreamingExternalRepositoryEvent"
 ] = _STREAMINGEXTERNALREPOSITORYEVENT
+DESCRIPTOR.message_types_by_name["ExternalPipelineDatasRequest"] = _EXTERNALPIPELINEDATASREQUEST
 DESCRIPTOR.message_types_by_name[
     "ExternalScheduleExecutionRequest"
 ] = _EXTERNALSCHEDULEEXECUTIONREQUEST
@@ -1811,6 +1853,17 @@
 )
 _sym_db.RegisterMessage(StreamingExternalRepositoryEvent)
 
+ExternalPipelineDatasRequest = _reflection.GeneratedProtocolMessageType(
+    "ExternalPipelineDatasRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _EXTERNALPIPELINEDATASREQUEST,
+        "__module__": "api_pb2"
+        # @@protoc_insertion_point(class_scope:api.ExternalPipelineDatasRequest)
+    },
+)
+_sym_db.RegisterMessage(ExternalPipelineDatasRequest)
+
 ExternalScheduleExecutionRequest = _reflection.GeneratedProtocolMessageType(
     "ExternalScheduleExecutionRequest",
     (_message.Message,),
@@ -1940,8 +1993,8 @@
     index=0,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_start=2472,
-    serialized_end=4224,
+    serialized_start=2553,
+    serialized_end=4505,
     methods=[
         _descriptor.MethodDescriptor(
             name="Ping",
@@ -2083,10 +2136,30 @@
             serialized_options=None,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.MethodDescriptor(
+            name="StreamingExternalRepositoryManifest",
+            full_name="api.DagsterApi.StreamingExternalRepositoryManifest",
+            index=14,
+            containing_service=None,
+            input_type=_EXTERNALREPOSITORYREQUEST,
+            output_type=_STREAMINGCHUNKEVENT,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="StreamingExternalPipelineDatas",
+            full_name="api.DagsterApi.StreamingExternalPipelineDatas",
+            index=15,
+            containing_service=None,
+            input_type=_EXTERNALPIPELINEDATASREQUEST,
+            output_type=_STREAMINGCHUNKEVENT,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
         _descriptor.MethodDescriptor(
             name="ExternalScheduleExecution",
             full_name="api.DagsterApi.ExternalScheduleExecution",
-            index=14,
+            index=16,
             containing_service=None,
             input_type=_EXTERNALSCHEDULEEXECUTIONREQUEST,
             output_type=_STREAMINGCHUNKEVENT,
@@ -2096,7 +2169,7 @@
         _descriptor.MethodDescriptor(
             name="ExternalSensorExecution",
             full_name="api.DagsterApi.ExternalSensorExecution",
-            index=15,
+            index=17,
             containing_service=None,
             input_type=_EXTERNALSENSOREXECUTIONREQUEST,
             output_type=_STREAMINGCHUNKEVENT,
@@ -2106,7 +2179,7 @@
         _descriptor.MethodDescriptor(
             name="ShutdownServer",
             full_name="api.DagsterApi.ShutdownServer",
-            index=16,
+            index=18,
             containing_service=None,
             input_type=_EMPTY,
             output_type=_SHUTDOWNSERVERREPLY,
@@ -2116,7 +2189,7 @@
         _descriptor.MethodDescriptor(
             name="CancelExecution",
             full_name="api.DagsterApi.CancelExecution",
-            index=17,
+            index=19,
             containing_service=None,
             input_type=_CANCELEXECUTIONREQUEST,
             output_type=_CANCELEXECUTIONREPLY,
@@ -2126,7 +2199,7 @@
         _descriptor.MethodDescriptor(
             name="CanCancelExecution",
             full_name="api.DagsterApi.CanCancelExecution",
-            index=18,
+            index=20,
             containing_service=None,
             input_type=_CANCANCELEXECUTIONREQUEST,
             output_type=_CANCANCELEXECUTIONREPLY,
@@ -2136,7 +2209,7 @@
         _descriptor.MethodDescriptor(
             name="StartRun",
             full_name="api.DagsterApi.StartRun",
-            index=19,
+            index=21,
             containing_service=None,
             input_type=_STARTRUNREQUEST,
             output_type=_STARTRUNREPLY,
@@ -2146,7 +2219,7 @@
         _descriptor.MethodDescriptor(
             name="GetCurrentImage",
             full_name="api.DagsterApi.GetCurrentImage",
-            index=20,
+            index=22,
             containing_service=None,
             input_type=_EMPTY,
             output_type=_GETCURRENTIMAGEREPLY,
@@ -92,6 +92,16 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositoryManifest = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryManifest",
+            request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
+        self.StreamingExternalPipelineDatas = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalPipelineDatas",
+            request_serializer=api__pb2.ExternalPipelineDatasRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -216,6 +226,18 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositoryManifest(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def StreamingExternalPipelineDatas(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -331,6 +353,16 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositoryManifest": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryManifest,
+            request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
+        "StreamingExternalPipelineDatas": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalPipelineDatas,
+            request_deserializer=api__pb2.ExternalPipelineDatasRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -781,6 +813,64 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositoryManifest(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryManifest",
+            api__pb2.ExternalRepositoryRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def StreamingExternalPipelineDatas(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalPipelineDatas",
+            api__pb2.ExternalPipelineDatasRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
@@ -22,6 +22,7 @@
     CancelExecutionRequest,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalPipelineDatasArgs,
     ExternalScheduleExecutionArgs,
     PartitionArgs,
     PartitionNamesArgs,
@@ -264,6 +265,44 @@ def streaming_external_repository(self, external_repository_origin):
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_manifest(self, external_repository_origin):
+        check.inst_param(
+            external_repository_origin,
+            "external_repository_origin",
+            ExternalRepositoryOrigin,
+        )
+
+        chunks = list(
+            self._streaming_query(
+                "StreamingExternalRepositoryManifest",
+                api_pb2.ExternalRepositoryRequest,
+                serialized_repository_python_origin=serialize_dagster_namedtuple(
+                    external_repository_origin
+                ),
+            )
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
+    def streaming_external_pipeline_datas(self, external_pipeline_datas_args):
+        check.inst_param(
+            external_pipeline_datas_args,
+            "external_pipeline_datas_args",
+            ExternalPipelineDatasArgs,
+        )
+
+        chunks = list(
+            self._streaming_query(
+                "StreamingExternalPipelineDatas",
+                api_pb2.ExternalPipelineDatasRequest,
+                serialized_external_pipeline_datas_args=serialize_dagster_namedtuple(
+                    external_pipeline_datas_args
+                ),
+            )
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
@@ -17,7 +17,13 @@
     ReconstructableRepository,
     repository_def_from_target_def,
 )
-from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.host_representation.external_data import (
+    ExternalPipelineSummary,
+    ExternalRepositoryManifest,
+    ExternalScheduleExecutionErrorData,
+    ExternalSensorExecutionErrorData,
+    external_repository_data_from_def,
+)
 from dagster.core.host_representation.origin import ExternalPipelineOrigin, ExternalRepositoryOrigin
 from dagster.core.instance import DagsterInstance
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
@@ -27,6 +33,7 @@
     whitelist_for_serdes,
 )
 from dagster.serdes.ipc import IPCErrorMessage, ipc_write_stream, open_ipc_subprocess
+from dagster.serdes.utils import hash_str
 from dagster.seven import multiprocessing
 from dagster.utils import find_free_port, safe_tempfile_path_unmanaged
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -55,6 +62,7 @@
     CancelExecutionResult,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalPipelineDatasArgs,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
     ListRepositoriesResponse,
@@ -125,6 +133,159 @@ def load_loadable_repository_symbols(loadable_target_origin):
         return []
 
 
+def _initialize_evaluation_process(loadable_target_origin):
+    # Load the user code before the first evaluation is sent to this process, so that evaluations
+    # don't pay for importing it
+    repository_symbols_and_code_pointers = RepositorySymbolsAndCodePointers(loadable_target_origin)
+    repository_symbols_and_code_pointers.load()
+    for code_pointer in repository_symbols_and_code_pointers.code_pointers_by_repo_name.values():
+        ReconstructableRepository(code_pointer, os.getenv("DAGSTER_CURRENT_IMAGE")).get_definition()
+
+
+def _evaluate_schedule_in_process(recon_repo, args):
+    return serialize_dagster_namedtuple(
+        get_external_schedule_execution(
+            recon_repo,
+            args.instance_ref,
+            args.schedule_name,
+            args.scheduled_execution_timestamp,
+            args.scheduled_execution_timezone,
+        )
+    )
+
+
+def _evaluate_sensor_in_process(recon_repo, args):
+    return serialize_dagster_namedtuple(
+        get_external_sensor_execution(
+            recon_repo,
+            args.instance_ref,
+            args.sensor_name,
+            args.last_completion_time,
+            args.last_run_key,
+            args.cursor,
+        )
+    )
+
+
+def _evaluation_process_main(conn, loadable_target_origin):
+    _initialize_evaluation_process(loadable_target_origin)
+
+    while True:
+        try:
+            evaluation = conn.recv()
+        except EOFError:
+            # the server closed its end of the pipe
+            return
+
+        evaluation_fn, recon_repo, args = evaluation
+        try:
+            result = (True, evaluation_fn(recon_repo, args))
+        except Exception:  # pylint: disable=broad-except
+            result = (False, serializable_error_info_from_exc_info(sys.exc_info()))
+        conn.send(result)
+
+
+class EvaluationProcessDiedError(Exception):
+    pass
+
+
+class EvaluationTimeoutError(Exception):
+    pass
+
+
+class _EvaluationProcess(namedtuple("_EvaluationProcess", "process conn")):
+    pass
+
+
+class EvaluationProcessPool:
+    """A fixed number of processes that have the user code loaded, each of which runs one schedule
+    or sensor evaluation at a time.
+
+    Unlike in a ProcessPoolExecutor, a process whose evaluation times out or dies is replaced on
+    its own, without failing the evaluations that are running in the other processes.
+    """
+
+    def __init__(self, num_processes, loadable_target_origin):
+        self._num_processes = check.int_param(num_processes, "num_processes")
+        self._loadable_target_origin = check.opt_inst_param(
+            loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
+        )
+        self._idle_processes = queue.Queue()
+        self._processes = set()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        with self._lock:
+            for _ in range(self._num_processes):
+                self._idle_processes.put(self._start_process())
+
+    # Assumes the lock is being held
+    def _start_process(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_evaluation_process_main,
+            args=(child_conn, self._loadable_target_origin),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        evaluation_process = _EvaluationProcess(process, parent_conn)
+        self._processes.add(evaluation_process)
+        return evaluation_process
+
+    def _replace_process(self, evaluation_process):
+        evaluation_process.process.terminate()
+        evaluation_process.process.join()
+        evaluation_process.conn.close()
+
+        with self._lock:
+            self._processes.discard(evaluation_process)
+            if self._shutdown:
+                self._idle_processes.put(None)
+            else:
+                self._idle_processes.put(self._start_process())
+
+    def evaluate(self, evaluation_fn, recon_repo, args, timeout=None):
+        """Runs evaluation_fn(recon_repo, args) in the next idle process and returns its result.
+
+        Raises EvaluationTimeoutError if the evaluation takes longer than timeout seconds, and
+        EvaluationProcessDiedError if its process exits before returning a result. Either way, the
+        process is terminated and replaced.
+        """
+        evaluation_process = self._idle_processes.get()
+        check.invariant(evaluation_process is not None, "The evaluation pool has been shut down")
+
+        try:
+            evaluation_process.conn.send((evaluation_fn, recon_repo, args))
+            if not evaluation_process.conn.poll(timeout):
+                self._replace_process(evaluation_process)
+                raise EvaluationTimeoutError()
+            success, result = evaluation_process.conn.recv()
+        except (EOFError, OSError) as e:
+            self._replace_process(evaluation_process)
+            raise EvaluationProcessDiedError() from e
+        except BaseException:
+            # e.g. the arguments could not be pickled, which leaves the process waiting for its
+            # next evaluation
+            self._idle_processes.put(evaluation_process)
+            raise
+
+        self._idle_processes.put(evaluation_process)
+        return success, result
+
+    def shutdown(self):
+        with self._lock:
+            self._shutdown = True
+            processes = list(self._processes)
+            self._processes.clear()
+
+        for evaluation_process in processes:
+            evaluation_process.process.terminate()
+            evaluation_process.conn.close()
+            # unblocks any evaluation waiting for an idle process
+            self._idle_processes.put(None)
+
+
 def build_code_pointers_by_repo_name(loadable_target_origin, loadable_repository_symbols):
     repository_code_pointer_dict = {}
     for loadable_repository_symbol in loadable_repository_symbols:
@@ -166,12 +327,26 @@ def __init__(
         heartbeat_timeout=30,
         lazy_load_user_code=False,
         fixed_server_id=None,
+        evaluation_processes=None,
+        evaluation_timeout=None,
     ):
         super(DagsterApiServer, self).__init__()
 
         check.bool_param(heartbeat, "heartbeat")
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
+        self._evaluation_processes = check.opt_int_param(
+            evaluation_processes, "evaluation_processes"
+        )
+        check.invariant(
+            self._evaluation_processes is None or self._evaluation_processes > 0,
+            "evaluation_processes must be greater than 0",
+        )
+        self._evaluation_timeout = check.opt_int_param(evaluation_timeout, "evaluation_timeout")
+        check.invariant(
+            self._evaluation_timeout is None or self._evaluation_timeout > 0,
+            "evaluation_timeout must be greater than 0",
+        )
 
         self._server_termination_event = check.inst_param(
             server_termination_event, "server_termination_event", ThreadingEventType
@@ -198,6 +373,12 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # The serialized ExternalPipelineDatas of the most recent manifest of each repository,
+        # keyed by id, so that clients can fetch them without the repository being loaded again.
+        # Dict[str, Dict[str, str]]
+        self._serialized_external_pipeline_datas = {}
+        self._serialized_external_pipeline_datas_lock = threading.Lock()
+
         self._repository_symbols_and_code_pointers = RepositorySymbolsAndCodePointers(
             loadable_target_origin
         )
@@ -208,6 +389,16 @@ def __init__(
                 raise
             self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
 
+        # If set, schedule and sensor evaluations are sent to a pool of processes that have the user
+        # code loaded, rather than run on the server's threads, so that CPU-bound evaluations can
+        # run in parallel and don't starve other calls of the GIL
+        self._evaluation_pool = None
+        self._evaluation_pool_lock = threading.Lock()
+        if self._evaluation_processes and not self._serializable_load_error:
+            self._evaluation_pool = EvaluationProcessPool(
+                self._evaluation_processes, self._loadable_target_origin
+            )
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread = threading.Thread(
@@ -231,6 +422,48 @@ def cleanup(self):
         if self.__heartbeat_thread:
             self.__heartbeat_thread.join()
         self.__cleanup_thread.join()
+        with self._evaluation_pool_lock:
+            if self._evaluation_pool:
+                self._evaluation_pool.shutdown()
+                self._evaluation_pool = None
+
+    def _evaluate(self, evaluation_fn, recon_repo, args, error_data_cls, description):
+        if not self._evaluation_processes:
+            return evaluation_fn(recon_repo, args)
+
+        with self._evaluation_pool_lock:
+            if not self._evaluation_pool:
+                self._evaluation_pool = EvaluationProcessPool(
+                    self._evaluation_processes, self._loadable_target_origin
+                )
+            evaluation_pool = self._evaluation_pool
+
+        try:
+            success, result = evaluation_pool.evaluate(
+                evaluation_fn, recon_repo, args, timeout=self._evaluation_timeout
+            )
+        except EvaluationTimeoutError:
+            # The evaluation can't be interrupted, so its process is terminated rather than left
+            # occupying a slot in the pool until the evaluation function returns
+            error_info = SerializableErrorInfo(
+                message=f"Evaluation of {description} timed out after "
+                f"{self._evaluation_timeout} seconds.",
+                stack=[],
+                cls_name=None,
+            )
+        except EvaluationProcessDiedError:
+            # e.g. the process was killed or segfaulted
+            error_info = SerializableErrorInfo(
+                message=f"The process evaluating {description} exited unexpectedly.",
+                stack=[],
+                cls_name=None,
+            )
+        else:
+            if success:
+                return result
+            error_info = result
+
+        return serialize_dagster_namedtuple(error_data_cls(error_info))
 
     def _heartbeat_thread(self, heartbeat_timeout):
         while True:
@@ -496,6 +729,89 @@ def StreamingExternalRepository(self, request, _context):
                 ],
             )
 
+    def _get_serialized_external_repository_manifest(self, repository_origin):
+        """Returns the serialized ExternalRepositoryManifest of a repository, and saves its
+        serialized ExternalPipelineDatas to be fetched later.
+        """
+        recon_repo = self._recon_repository_from_origin(repository_origin)
+        external_repository_data = external_repository_data_from_def(recon_repo.get_definition())
+
+        serialized_external_pipeline_datas = {}
+        external_pipeline_summaries = []
+        for external_pipeline_data in external_repository_data.external_pipeline_datas:
+            serialized_external_pipeline_data = serialize_dagster_namedtuple(external_pipeline_data)
+            external_pipeline_data_id = hash_str(serialized_external_pipeline_data)
+            serialized_external_pipeline_datas[
+                external_pipeline_data_id
+            ] = serialized_external_pipeline_data
+            external_pipeline_summaries.append(
+                ExternalPipelineSummary(
+                    name=external_pipeline_data.name,
+                    external_pipeline_data_id=external_pipeline_data_id,
+                    is_job=external_pipeline_data.is_job,
+                    tags=external_pipeline_data.pipeline_snapshot.tags,
+                )
+            )
+
+        with self._serialized_external_pipeline_datas_lock:
+            self._serialized_external_pipeline_datas[
+                repository_origin.repository_name
+            ] = serialized_external_pipeline_datas
+
+        return serialize_dagster_namedtuple(
+            ExternalRepositoryManifest(
+                external_repository_data=external_repository_data._replace(
+                    external_pipeline_datas=[]
+                ),
+                external_pipeline_summaries=external_pipeline_summaries,
+            )
+        )
+
+    def StreamingExternalRepositoryManifest(self, request, _context):
+        repository_origin = deserialize_json_to_dagster_namedtuple(
+            request.serialized_repository_python_origin
+        )
+        check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+
+        serialized_manifest = self._get_serialized_external_repository_manifest(repository_origin)
+        yield from self._split_serialized_data_into_chunk_events(serialized_manifest)
+
+    def StreamingExternalPipelineDatas(self, request, _context):
+        args = deserialize_json_to_dagster_namedtuple(
+            request.serialized_external_pipeline_datas_args
+        )
+        check.inst_param(args, "args", ExternalPipelineDatasArgs)
+
+        repository_name = args.repository_origin.repository_name
+        with self._serialized_external_pipeline_datas_lock:
+            serialized_external_pipeline_datas = self._serialized_external_pipeline_datas.get(
+                repository_name, {}
+            )
+
+        if any(
+            external_pipeline_data_id not in serialized_external_pipeline_datas
+            for external_pipeline_data_id in args.external_pipeline_data_ids
+        ):
+            # The repository was loaded by a different client or has changed since the manifest
+            # was fetched, so load it again
+            self._get_serialized_external_repository_manifest(args.repository_origin)
+            with self._serialized_external_pipeline_datas_lock:
+                serialized_external_pipeline_datas = self._serialized_external_pipeline_datas[
+                    repository_name
+                ]
+
+        # The ExternalPipelineDatas are already serialized, so they are joined in to a serialized
+        # list rather than being deserialized and serialized again. Ids that are not in the
+        # manifest are left out, and detected by the client.
+        serialized_data = "[{}]".format(
+            ",".join(
+                serialized_external_pipeline_datas[external_pipeline_data_id]
+                for external_pipeline_data_id in args.external_pipeline_data_ids
+                if external_pipeline_data_id in serialized_external_pipeline_datas
+            )
+        )
+        yield from self._split_serialized_data_into_chunk_events(serialized_data)
+
     def _split_serialized_data_into_chunk_events(self, serialized_data):
         num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
         for i in range(num_chunks):
@@ -522,14 +838,12 @@ def ExternalScheduleExecution(self, request, _context):
         )
 
         recon_repo = self._recon_repository_from_origin(args.repository_origin)
-        serialized_schedule_data = serialize_dagster_namedtuple(
-            get_external_schedule_execution(
-                recon_repo,
-                args.instance_ref,
-                args.schedule_name,
-                args.scheduled_execution_timestamp,
-                args.scheduled_execution_timezone,
-            )
+        serialized_schedule_data = self._evaluate(
+            _evaluate_schedule_in_process,
+            recon_repo,
+            args,
+            ExternalScheduleExecutionErrorData,
+            f"schedule {args.schedule_name}",
         )
 
         yield from self._split_serialized_data_into_chunk_events(serialized_schedule_data)
@@ -542,15 +856,12 @@ def ExternalSensorExecution(self, request, _context):
         check.inst_param(args, "args", SensorExecutionArgs)
 
         recon_repo = self._recon_repository_from_origin(args.repository_origin)
-        serialized_sensor_data = serialize_dagster_namedtuple(
-            get_external_sensor_execution(
-                recon_repo,
-                args.instance_ref,
-                args.sensor_name,
-                args.last_completion_time,
-                args.last_run_key,
-                args.cursor,
-            )
+        serialized_sensor_data = self._evaluate(
+            _evaluate_sensor_in_process,
+            recon_repo,
+            args,
+            ExternalSensorExecutionErrorData,
+            f"sensor {args.sensor_name}",
         )
 
         yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
@@ -778,6 +1089,8 @@ def __init__(
         lazy_load_user_code=False,
         ipc_output_file=None,
         fixed_server_id=None,
+        evaluation_processes=None,
+        evaluation_timeout=None,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -822,6 +1135,8 @@ def __init__(
                 heartbeat_timeout=heartbeat_timeout,
                 lazy_load_user_code=lazy_load_user_code,
                 fixed_server_id=fixed_server_id,
+                evaluation_processes=evaluation_processes,
+                evaluation_timeout=evaluation_timeout,
             )
         except Exception:
             if self._ipc_output_file:
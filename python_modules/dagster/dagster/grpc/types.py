@@ -253,6 +253,22 @@ def __new__(cls, pipeline_origin, solid_selection):
         )
 
 
+@whitelist_for_serdes
+class ExternalPipelineDatasArgs(
+    namedtuple("_ExternalPipelineDatasArgs", "repository_origin external_pipeline_data_ids")
+):
+    def __new__(cls, repository_origin, external_pipeline_data_ids):
+        return super(ExternalPipelineDatasArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            external_pipeline_data_ids=check.list_param(
+                external_pipeline_data_ids, "external_pipeline_data_ids", of_type=str
+            ),
+        )
+
+
 @whitelist_for_serdes
 class NotebookPathArgs(namedtuple("_NotebookPathArgs", "repository_location_origin notebook_path")):
     def __new__(cls, repository_location_origin, notebook_path):
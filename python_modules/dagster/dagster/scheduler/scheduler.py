@@ -1,7 +1,9 @@
 import datetime
+import functools
 import os
 import sys
 import time
+from collections import defaultdict
 
 import pendulum
 from dagster import check
@@ -80,27 +82,117 @@ def launch_scheduled_runs(
     schedule_names = ", ".join([schedule.job_name for schedule in schedules])
     logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
+    if instance.schedule_settings.get("use_threads"):
+        yield from _launch_scheduled_runs_in_threads(
+            instance,
+            workspace,
+            logger,
+            schedules,
+            end_datetime_utc,
+            max_catchup_runs,
+            debug_crash_flags,
+        )
+        return
+
+    for schedule_state in schedules:
+        yield from _process_schedule_state(
+            instance,
+            logger,
+            schedule_state,
+            workspace,
+            end_datetime_utc,
+            max_catchup_runs,
+            (debug_crash_flags.get(schedule_state.job_name) if debug_crash_flags else None),
+        )
+
+
+def _launch_scheduled_runs_in_threads(
+    instance, workspace, logger, schedules, end_datetime_utc, max_catchup_runs, debug_crash_flags
+):
+    """
+    Evaluates schedules concurrently on a pool of threads, so that catching up on many schedules
+    (e.g. after the daemon was down) is not bound by the latency of each schedule in turn.
+
+    All of the ticks for a given schedule are still processed in order on a single thread. Since
+    the workspace is not thread-safe, the worker threads only evaluate schedules and create runs:
+    repository locations are resolved and runs are submitted on the calling thread.
+    """
+    # circular dep
+    from dagster.daemon.threaded_submission import execute_evaluations_in_threads
+
+    evaluations = []
     for schedule_state in schedules:
-        error_info = None
         try:
-            origin = schedule_state.origin.external_repository_origin.repository_location_origin
-            repo_location = workspace.get_location(origin)
-            yield from launch_scheduled_runs_for_schedule(
-                instance,
-                logger,
-                schedule_state,
-                workspace,
-                repo_location,
-                end_datetime_utc,
-                max_catchup_runs,
-                (debug_crash_flags.get(schedule_state.job_name) if debug_crash_flags else None),
-            )
+            repo_location = _get_repo_location(workspace, schedule_state)
         except Exception:  # pylint: disable=broad-except
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                f"Scheduler caught an error for schedule {schedule_state.job_name} : {error_info.to_string()}"
+            yield _log_schedule_error(logger, schedule_state)
+            continue
+
+        evaluations.append(
+            (
+                repo_location.name,
+                functools.partial(
+                    _process_schedule_state,
+                    instance,
+                    logger,
+                    schedule_state,
+                    workspace,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    (debug_crash_flags.get(schedule_state.job_name) if debug_crash_flags else None),
+                    repo_location=repo_location,
+                ),
             )
-        yield error_info
+        )
+
+    yield from execute_evaluations_in_threads(
+        evaluations,
+        submit_run_fn=lambda run_id: instance.submit_run(run_id, workspace),
+        num_workers=instance.schedule_settings.get("num_workers"),
+        thread_name_prefix="schedule_daemon_worker",
+    )
+
+
+def _get_repo_location(workspace, schedule_state):
+    origin = schedule_state.origin.external_repository_origin.repository_location_origin
+    return workspace.get_location(origin)
+
+
+def _log_schedule_error(logger, schedule_state):
+    error_info = serializable_error_info_from_exc_info(sys.exc_info())
+    logger.error(
+        f"Scheduler caught an error for schedule {schedule_state.job_name} : {error_info.to_string()}"
+    )
+    return error_info
+
+
+def _process_schedule_state(
+    instance,
+    logger,
+    schedule_state,
+    workspace,
+    end_datetime_utc,
+    max_catchup_runs,
+    debug_crash_flags,
+    repo_location=None,
+    submit_run_fn=None,
+):
+    error_info = None
+    try:
+        yield from launch_scheduled_runs_for_schedule(
+            instance,
+            logger,
+            schedule_state,
+            workspace,
+            repo_location if repo_location else _get_repo_location(workspace, schedule_state),
+            end_datetime_utc,
+            max_catchup_runs,
+            debug_crash_flags,
+            submit_run_fn,
+        )
+    except Exception:  # pylint: disable=broad-except
+        error_info = _log_schedule_error(logger, schedule_state)
+    yield error_info
 
 
 def launch_scheduled_runs_for_schedule(
@@ -112,6 +204,7 @@ def launch_scheduled_runs_for_schedule(
     end_datetime_utc,
     max_catchup_runs,
     debug_crash_flags=None,
+    submit_run_fn=None,
 ):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(schedule_state, "schedule_state", JobState)
@@ -181,6 +274,10 @@ def launch_scheduled_runs_for_schedule(
         times = ", ".join([time.strftime(_SCHEDULER_DATETIME_FORMAT) for time in tick_times])
         logger.info(f"Evaluating schedule `{schedule_name}` at the following times: {times}")
 
+    existing_runs_by_execution_time = _get_existing_runs_by_execution_time(
+        instance, external_schedule, tick_times
+    )
+
     for schedule_time in tick_times:
         schedule_timestamp = schedule_time.timestamp()
         if latest_tick and latest_tick.timestamp == schedule_timestamp:
@@ -211,8 +308,10 @@ def launch_scheduled_runs_for_schedule(
                 external_repo,
                 external_schedule,
                 schedule_time,
+                existing_runs_by_execution_time[_scheduled_execution_time_tag_value(schedule_time)],
                 tick_context,
                 debug_crash_flags,
+                submit_run_fn,
             )
 
 
@@ -237,8 +336,10 @@ def _schedule_runs_at_time(
     external_repo,
     external_schedule,
     schedule_time,
+    existing_runs,
     tick_context,
     debug_crash_flags,
+    submit_run_fn=None,
 ):
     schedule_name = external_schedule.name
 
@@ -270,42 +371,61 @@ def _schedule_runs_at_time(
         tick_context.update_state(JobTickStatus.SKIPPED)
         return
 
+    # Find or plan out a run for each run request, then create all of the new runs together
+    planned_runs = []
+    runs_kwargs = []
     for run_request in schedule_execution_data.run_requests:
-        run = _get_existing_run_for_request(instance, external_schedule, schedule_time, run_request)
+        run = _get_existing_run_for_request(existing_runs, run_request)
         if run:
-            if run.status != PipelineRunStatus.NOT_STARTED:
-                # A run already exists and was launched for this time period,
-                # but the scheduler must have crashed before the tick could be put
-                # into a SUCCESS state
+            planned_runs.append((run_request, run, []))
+            continue
 
-                logger.info(
-                    f"Run {run.run_id} already completed for this execution of {external_schedule.name}"
-                )
-                tick_context.add_run(run_id=run.run_id, run_key=run_request.run_key)
-                yield
-                continue
-            else:
-                logger.info(
-                    f"Run {run.run_id} already created for this execution of {external_schedule.name}"
+        run_kwargs, execution_plan_errors = _get_scheduler_run_kwargs(
+            schedule_time,
+            repo_location,
+            external_schedule,
+            external_pipeline,
+            run_request,
+        )
+        planned_runs.append((run_request, None, execution_plan_errors))
+        runs_kwargs.append(run_kwargs)
+        yield
+
+    created_runs = iter(instance.create_runs(runs_kwargs) if runs_kwargs else [])
+
+    for run_request, run, execution_plan_errors in planned_runs:
+        if not run:
+            run = next(created_runs)
+            if execution_plan_errors:
+                _report_execution_plan_errors(
+                    instance, logger, external_schedule, run, execution_plan_errors
                 )
+            for error in execution_plan_errors:
+                yield error
+        elif run.status != PipelineRunStatus.NOT_STARTED:
+            # A run already exists and was launched for this time period,
+            # but the scheduler must have crashed before the tick could be put
+            # into a SUCCESS state
+
+            logger.info(
+                f"Run {run.run_id} already completed for this execution of {external_schedule.name}"
+            )
+            tick_context.add_run(run_id=run.run_id, run_key=run_request.run_key)
+            yield
+            continue
         else:
-            run, errors = _create_scheduler_run(
-                instance,
-                logger,
-                schedule_time,
-                repo_location,
-                external_schedule,
-                external_pipeline,
-                run_request,
+            logger.info(
+                f"Run {run.run_id} already created for this execution of {external_schedule.name}"
             )
-            for error in errors:
-                yield error
 
         _check_for_debug_crash(debug_crash_flags, "RUN_CREATED")
 
         if run.status != PipelineRunStatus.FAILURE:
             try:
-                instance.submit_run(run.run_id, workspace)
+                if submit_run_fn:
+                    submit_run_fn(run.run_id)
+                else:
+                    instance.submit_run(run.run_id, workspace)
                 logger.info(f"Completed scheduled launch of run {run.run_id} for {schedule_name}")
             except Exception:  # pylint: disable=broad-except
                 error_info = serializable_error_info_from_exc_info(sys.exc_info())
@@ -323,25 +443,38 @@ def _schedule_runs_at_time(
     tick_context.update_state(JobTickStatus.SUCCESS)
 
 
-def _get_existing_run_for_request(instance, external_schedule, schedule_time, run_request):
-    tags = merge_dicts(
-        PipelineRun.tags_for_schedule(external_schedule),
-        {
-            SCHEDULED_EXECUTION_TIME_TAG: to_timezone(schedule_time, "UTC").isoformat(),
-        },
+def _scheduled_execution_time_tag_value(schedule_time):
+    return to_timezone(schedule_time, "UTC").isoformat()
+
+
+def _get_existing_runs_by_execution_time(instance, external_schedule, schedule_times):
+    """Fetches the runs previously created by the schedule for any of the given execution times
+    with a single query, keyed by the scheduled execution time tag value."""
+    runs_filter = PipelineRunsFilter(
+        tags=merge_dicts(
+            PipelineRun.tags_for_schedule(external_schedule),
+            {
+                SCHEDULED_EXECUTION_TIME_TAG: [
+                    _scheduled_execution_time_tag_value(schedule_time)
+                    for schedule_time in schedule_times
+                ],
+            },
+        )
     )
-    if run_request.run_key:
-        tags[RUN_KEY_TAG] = run_request.run_key
-    runs_filter = PipelineRunsFilter(tags=tags)
-    existing_runs = instance.get_runs(runs_filter)
-    if not len(existing_runs):
-        return None
-    return existing_runs[0]
+    existing_runs_by_execution_time = defaultdict(list)
+    for run in instance.get_runs(runs_filter):
+        existing_runs_by_execution_time[run.tags[SCHEDULED_EXECUTION_TIME_TAG]].append(run)
+    return existing_runs_by_execution_time
 
 
-def _create_scheduler_run(
-    instance,
-    logger,
+def _get_existing_run_for_request(existing_runs, run_request):
+    for run in existing_runs:
+        if not run_request.run_key or run.tags.get(RUN_KEY_TAG) == run_request.run_key:
+            return run
+    return None
+
+
+def _get_scheduler_run_kwargs(
     schedule_time,
     repo_location,
     external_schedule,
@@ -370,13 +503,13 @@ def _create_scheduler_run(
     check_tags(pipeline_tags, "pipeline_tags")
     tags = merge_dicts(pipeline_tags, schedule_tags)
 
-    tags[SCHEDULED_EXECUTION_TIME_TAG] = to_timezone(schedule_time, "UTC").isoformat()
+    tags[SCHEDULED_EXECUTION_TIME_TAG] = _scheduled_execution_time_tag_value(schedule_time)
     if run_request.run_key:
         tags[RUN_KEY_TAG] = run_request.run_key
 
     # If the run was scheduled correctly but there was an error creating its
     # run config, enter it into the run DB with a FAILURE status
-    possibly_invalid_pipeline_run = instance.create_run(
+    run_kwargs = dict(
         pipeline_name=external_schedule.pipeline_name,
         run_id=None,
         run_config=run_config,
@@ -398,15 +531,18 @@ def _create_scheduler_run(
         external_pipeline_origin=external_pipeline.get_external_origin(),
         pipeline_code_origin=external_pipeline.get_python_origin(),
     )
+    return (run_kwargs, execution_plan_errors)
 
-    if len(execution_plan_errors) > 0:
-        for error in execution_plan_errors:
-            instance.report_engine_event(
-                error.message,
-                possibly_invalid_pipeline_run,
-                EngineEventData.engine_error(error),
-            )
-        instance.report_run_failed(possibly_invalid_pipeline_run)
-        error_string = "\n".join([error.to_string() for error in execution_plan_errors])
-        logger.error(f"Failed to fetch execution plan for {external_schedule.name}: {error_string}")
-    return (possibly_invalid_pipeline_run, execution_plan_errors)
+
+def _report_execution_plan_errors(
+    instance, logger, external_schedule, possibly_invalid_pipeline_run, execution_plan_errors
+):
+    for error in execution_plan_errors:
+        instance.report_engine_event(
+            error.message,
+            possibly_invalid_pipeline_run,
+            EngineEventData.engine_error(error),
+        )
+    instance.report_run_failed(possibly_invalid_pipeline_run)
+    error_string = "\n".join([error.to_string() for error in execution_plan_errors])
+    logger.error(f"Failed to fetch execution plan for {external_schedule.name}: {error_string}")
@@ -19,6 +19,7 @@
 from inspect import Parameter, isclass, signature
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -45,10 +46,17 @@
 ]
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
 
+# Packers and unpackers are compiled for each whitelisted namedtuple when it is registered, so that
+# the work of inspecting its serializer and fields is not repeated for every value
+TuplePacker = Callable[[Any, "WhitelistMap"], Dict[str, Any]]
+TupleUnpacker = Callable[[Dict[str, Any], "WhitelistMap"], Any]
+
 
 class WhitelistMap(NamedTuple):
     tuples: Dict[str, TupleEntry]
     enums: Dict[str, EnumEntry]
+    tuple_packers: Dict[Type, TuplePacker]
+    tuple_unpackers: Dict[str, TupleUnpacker]
 
     def register_tuple(
         self,
@@ -65,7 +73,19 @@ def register_tuple(
             serializer: The class to use when serializing and deserializing
             args_for_class: the inspect.signature paramaters for __new__
         """
-        self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        serializer = serializer or DefaultNamedTupleSerializer
+        if name in self.tuples:
+            # packers are looked up by class, so drop the packer of the class being replaced
+            prev_nt, _, _ = self.tuples[name]
+            if prev_nt is not None and prev_nt.__name__ == name:
+                self.tuple_packers.pop(prev_nt, None)
+
+        self.tuples[name] = (nt, serializer, args_for_class)
+        # values are serialized using the name of their class, so classes registered under another
+        # name (i.e. fallbacks for classes that no longer exist) are only used for deserialization
+        if nt is not None and nt.__name__ == name:
+            self.tuple_packers[nt] = _compile_tuple_packer(name, nt, serializer)
+        self.tuple_unpackers[name] = _compile_tuple_unpacker(nt, serializer, args_for_class)
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -88,7 +108,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={})
+        return WhitelistMap(tuples={}, enums={}, tuple_packers={}, tuple_unpackers={})
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -246,6 +266,77 @@ def value_to_storage_dict(
         return base_dict
 
 
+def _compile_tuple_packer(
+    name: str, klass: Type, serializer: Type[NamedTupleSerializer]
+) -> TuplePacker:
+    if not _overrides(serializer, "value_to_storage_dict"):
+        serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+        fields = klass._fields
+        skip_when_empty_fields = serializer.skip_when_empty()
+
+        def _pack_tuple(value, whitelist_map):
+            base_dict = {}
+            for key, inner_value in zip(fields, value):
+                if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                base_dict[key] = _pack_value(inner_value, whitelist_map)
+
+            base_dict["__class__"] = name
+            return base_dict
+
+        return _pack_tuple
+
+    def _pack_tuple_with_serializer(value, whitelist_map):
+        return serializer.value_to_storage_dict(value, whitelist_map, "")
+
+    return _pack_tuple_with_serializer
+
+
+def _compile_tuple_unpacker(
+    klass: Optional[Type],
+    serializer: Type[NamedTupleSerializer],
+    args_for_class: Mapping[str, Parameter],
+) -> TupleUnpacker:
+    if klass is None:
+        # Target class being set to none, to gracefully load previously serialized objects
+        return lambda _storage_dict, _whitelist_map: None
+
+    if not _overrides(serializer, "value_from_storage_dict"):
+        serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+        value_from_unpacked = serializer.value_from_unpacked
+
+        def _unpack_tuple(storage_dict, whitelist_map):
+            # "__class__" is never an argument to __new__, so it is filtered out here
+            return value_from_unpacked(
+                {
+                    key: _unpack_value(value, whitelist_map)
+                    for key, value in storage_dict.items()
+                    if key in args_for_class
+                },
+                klass,
+            )
+
+        return _unpack_tuple
+
+    def _unpack_tuple_with_serializer(storage_dict, whitelist_map):
+        return serializer.value_from_storage_dict(
+            _without_class_key(storage_dict), klass, args_for_class, whitelist_map, ""
+        )
+
+    return _unpack_tuple_with_serializer
+
+
+def _overrides(serializer: Type[NamedTupleSerializer], method_name: str) -> bool:
+    return (
+        getattr(serializer, method_name).__func__
+        is not getattr(DefaultNamedTupleSerializer, method_name).__func__
+    )
+
+
+def _without_class_key(storage_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in storage_dict.items() if key != "__class__"}
+
+
 ###################################################################################################
 # Serialize
 ###################################################################################################
@@ -280,9 +371,56 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        pass
+
+    # Walk the value again, this time keeping track of the path to the value that could not be
+    # serialized, so that it can be reported in the error
+    return _pack_value_with_path(val, whitelist_map, descent_path)
+
+
+# Values of these types are left as is, so they are checked for before anything else
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _PRIMITIVE_TYPES:
+        return val
+    packer = whitelist_map.tuple_packers.get(val_type)
+    if packer:
+        return packer(val, whitelist_map)
+    if isinstance(val, list):
+        return [_pack_value(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        if not whitelist_map.has_tuple_entry(val_type.__name__):
+            raise SerializationError(f"Can only serialize whitelisted namedtuples, received {val}.")
+        _, serializer, _ = whitelist_map.get_tuple_entry(val_type.__name__)
+        return serializer.value_to_storage_dict(val, whitelist_map, "")
+    if isinstance(val, Enum):
+        if not whitelist_map.has_enum_entry(val_type.__name__):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {val_type.__name__}."
+            )
+        return {"__enum__": str(val)}
+    if isinstance(val, set):
+        return {"__set__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]}
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]
+        }
+    if isinstance(val, dict):
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _pack_value_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_value_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -293,6 +431,18 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
             )
         val = cast(NamedTuple, val)
         _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+        if not _overrides(serializer, "value_to_storage_dict"):
+            serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+            skip_when_empty_fields = serializer.skip_when_empty()
+            base_dict = {}
+            for key, inner_value in val._asdict().items():
+                if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                base_dict[key] = _pack_value_with_path(
+                    inner_value, whitelist_map, f"{descent_path}.{key}"
+                )
+            base_dict["__class__"] = klass_name
+            return base_dict
         return serializer.value_to_storage_dict(val, whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -305,7 +455,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_value_with_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -313,13 +463,13 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_value_with_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_value_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -381,13 +531,55 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map)
+    except DeserializationError:
+        pass
+
+    # Walk the value again, this time keeping track of the path to the value that could not be
+    # deserialized, so that it can be reported in the error
+    return _unpack_value_with_path(val, whitelist_map, descent_path)
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_unpack_value(item, whitelist_map) for item in val]
+    if isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name:
+            unpacker = whitelist_map.tuple_unpackers.get(klass_name)
+            if unpacker is None:
+                raise DeserializationError(
+                    f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+                )
+            return unpacker(val, whitelist_map)
+        if val.get("__enum__"):
+            name, member = val["__enum__"].split(".")
+            if not whitelist_map.has_enum_entry(name):
+                raise DeserializationError(
+                    f"Attempted to deserialize enum {name} which was not in the whitelist."
+                )
+            enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+            return enum_serializer.value_from_storage_str(member, enum_class)
+        if val.get("__set__") is not None:
+            return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
+        if val.get("__frozenset__") is not None:
+            return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
+        return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _unpack_value_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_value_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = val.pop("__class__")
+        klass_name = val["__class__"]
         if not whitelist_map.has_tuple_entry(klass_name):
             raise DeserializationError(
                 f'Attempted to deserialize class "{klass_name}" which is not in the whitelist. '
@@ -401,8 +593,19 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         if klass is None:
             return None
 
+        if not _overrides(serializer, "value_from_storage_dict"):
+            serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+            return serializer.value_from_unpacked(
+                {
+                    key: _unpack_value_with_path(value, whitelist_map, f"{descent_path}.{key}")
+                    for key, value in val.items()
+                    if key in args_for_class
+                },
+                klass,
+            )
+
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            _without_class_key(val), klass, args_for_class, whitelist_map, descent_path
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
@@ -416,15 +619,20 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [_unpack_value_with_path(item, whitelist_map, set_path) for item in val["__set__"]]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_value_with_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_value_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -4,8 +4,18 @@
 
 
 def create_snapshot_id(snapshot: tuple) -> str:
-    json_rep = serialize_dagster_namedtuple(snapshot)
-    return hash_str(json_rep)
+    # Snapshots are immutable, so the id is cached on the snapshot object (if it allows attributes
+    # to be set) instead of serializing and hashing the whole snapshot again on every call
+    snapshot_id = getattr(snapshot, "_cached_snapshot_id", None)
+    if snapshot_id is None:
+        json_rep = serialize_dagster_namedtuple(snapshot)
+        snapshot_id = hash_str(json_rep)
+        try:
+            snapshot._cached_snapshot_id = snapshot_id  # type: ignore
+        except AttributeError:
+            pass
+
+    return snapshot_id
 
 
 def hash_str(in_str: str) -> str:
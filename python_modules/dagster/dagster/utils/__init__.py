@@ -11,7 +11,7 @@
 import sys
 import tempfile
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from datetime import timezone
 from enum import Enum
 from typing import (
@@ -216,6 +216,46 @@ def __hash__(self):
         return hash(tuple(self))
 
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe mapping that holds at most max_size entries, evicting the least recently
+    used entry when it is full."""
+
+    def __init__(self, max_size: int):
+        self._max_size = check.int_param(max_size, "max_size")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 def make_readonly_value(value):
     if isinstance(value, list):
         return frozenlist(list(map(make_readonly_value, value)))
@@ -1,12 +1,22 @@
 import sys
 from contextlib import contextmanager
 
+import mock
 from dagster import lambda_solid, pipeline, repository
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_external_pipeline_datas_grpc,
+    sync_get_external_repository_manifests_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.core.host_representation import (
     ExternalRepositoryData,
+    ExternalRepositoryOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
+from dagster.core.host_representation.repository_location import (
+    ExternalPipelineDataCache,
+    GrpcServerRepositoryLocation,
+)
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 
 from .utils import get_bar_repo_repository_location
@@ -26,6 +36,91 @@ def test_streaming_external_repositories_api_grpc():
         assert external_repository_data.name == "bar_repo"
 
 
+def test_external_pipeline_datas_api_grpc_with_cache():
+    with get_bar_repo_repository_location() as repository_location:
+        full_external_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location
+        )["bar_repo"]
+        external_pipeline_summaries = sync_get_external_repository_manifests_grpc(
+            repository_location.client, repository_location
+        )["bar_repo"].external_pipeline_summaries
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location.origin, "bar_repo"
+        )
+
+        cache = ExternalPipelineDataCache()
+        with mock.patch.object(
+            repository_location.client,
+            "streaming_external_pipeline_datas",
+            wraps=repository_location.client.streaming_external_pipeline_datas,
+        ) as fetch_mock:
+            external_pipeline_datas = sync_get_external_pipeline_datas_grpc(
+                repository_location.client,
+                external_repository_origin,
+                external_pipeline_summaries,
+                cache,
+            )
+
+            assert external_pipeline_datas == full_external_repository_data.external_pipeline_datas
+            assert fetch_mock.call_count == 1
+            assert len(cache) == len(full_external_repository_data.external_pipeline_datas)
+
+            # every pipeline is already in the cache, so none are fetched again
+            external_pipeline_datas = sync_get_external_pipeline_datas_grpc(
+                repository_location.client,
+                external_repository_origin,
+                external_pipeline_summaries,
+                cache,
+            )
+
+            assert external_pipeline_datas == full_external_repository_data.external_pipeline_datas
+            assert fetch_mock.call_count == 1
+
+
+def test_grpc_server_repository_location_loads_pipelines_lazily():
+    with get_bar_repo_repository_location() as repository_location:
+        full_external_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location
+        )["bar_repo"]
+
+        with mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "external_pipeline_data_cache",
+            ExternalPipelineDataCache(),
+        ), mock.patch.object(
+            repository_location.client,
+            "streaming_external_pipeline_datas",
+            wraps=repository_location.client.streaming_external_pipeline_datas,
+        ) as fetch_mock:
+            external_repo = repository_location.get_repository("bar_repo")
+
+            # names, schedules, sensors and partition sets come from the manifest
+            assert external_repo.has_external_pipeline("foo")
+            assert not external_repo.has_external_pipeline("does_not_exist")
+            assert external_repo.get_pipeline_names() == [
+                external_pipeline_data.name
+                for external_pipeline_data in full_external_repository_data.external_pipeline_datas
+            ]
+            assert len(external_repo.get_external_schedules()) == len(
+                full_external_repository_data.external_schedule_datas
+            )
+            assert external_repo.has_external_sensor("sensor_foo")
+            assert fetch_mock.call_count == 0
+
+            assert external_repo.get_full_external_pipeline("foo").name == "foo"
+            assert fetch_mock.call_count == 1
+
+            # each pipeline is only fetched once
+            external_repo.get_full_external_pipeline("foo")
+            assert fetch_mock.call_count == 1
+
+            assert len(external_repo.get_all_external_pipelines()) == 3
+            assert fetch_mock.call_count == 2
+
+            assert external_repo.external_repository_data == full_external_repository_data
+            assert fetch_mock.call_count == 2
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -3,9 +3,11 @@
 import tempfile
 from difflib import SequenceMatcher
 
+import mock
 from click.testing import CliRunner
 from dagster.cli.pipeline import pipeline_execute_command
 from dagster.core.definitions.reconstructable import get_ephemeral_repository_name
+from dagster.core.host_representation import ExternalRepository
 from dagster.core.telemetry import (
     UPDATE_REPO_STATS,
     get_dir_from_dagster_home,
@@ -153,12 +155,20 @@ def test_log_workspace_stats(caplog):
         with load_workspace_process_context_from_yaml_paths(
             instance, [file_relative_path(__file__, "./multi_env_telemetry_workspace.yaml")]
         ) as context:
-            log_workspace_stats(instance, context)
+            # the pipelines in each repository are counted from its manifest, without fetching
+            # their data
+            with mock.patch.object(
+                ExternalRepository,
+                "get_all_external_pipelines",
+                side_effect=Exception("Fetched every pipeline to count them"),
+            ):
+                log_workspace_stats(instance, context)
 
             for record in caplog.records:
                 message = json.loads(record.getMessage())
                 assert message.get("action") == UPDATE_REPO_STATS
                 assert set(message.keys()) == EXPECTED_KEYS
+                assert int(message.get("num_pipelines_in_repo")) > 0
 
             assert len(caplog.records) == 2
 
@@ -11,6 +11,7 @@
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -22,12 +23,14 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
@@ -61,6 +64,7 @@
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -72,12 +76,14 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
@@ -111,6 +117,7 @@
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
@@ -122,12 +129,14 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'release_outputs': True,
                 'retries': {
                     'disabled': {
                     },
                     'enabled': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
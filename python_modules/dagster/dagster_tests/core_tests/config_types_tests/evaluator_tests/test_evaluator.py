@@ -1,9 +1,14 @@
+from unittest import mock
+
 from dagster import Any, Bool, Field, Int, Noneable, Selector, Shape, String, StringSource
+from dagster.config import validate
+from dagster.config.compiled import compile_config_type, hash_config_value
 from dagster.config.errors import DagsterEvaluationErrorReason
 from dagster.config.evaluate_value_result import EvaluateValueResult
 from dagster.config.field import resolve_to_config_type
 from dagster.config.stack import EvaluationStackListItemEntry, EvaluationStackPathEntry
 from dagster.config.validate import process_config
+from dagster.core.test_utils import environ
 
 
 def eval_config_value_from_dagster_type(dagster_type, value):
@@ -538,3 +543,98 @@ def test_post_process_error():
     error = error_result.errors[0]
     assert error.reason == DagsterEvaluationErrorReason.FAILED_POST_PROCESSING
     assert len(error.stack.entries) == 1
+
+
+def test_compiled_config_type_is_cached():
+    config_type = resolve_to_config_type(Shape({"foo": Field(Int, default_value=1)}))
+    compiled = compile_config_type(config_type)
+    assert compile_config_type(config_type) is compiled
+    assert compiled.config_type_snap.key == config_type.key
+    assert set(compiled.all_config_types.keys()) == {config_type.key, "Int"}
+
+    with mock.patch("dagster.config.compiled.snap_from_config_type") as snap_mock:
+        assert process_config(config_type, {}).value == {"foo": 1}
+        assert process_config(config_type, {"foo": 2}).value == {"foo": 2}
+        assert not process_config(config_type, {"bar": 2}).success
+        assert snap_mock.call_count == 0
+
+
+def test_memoized_process_config():
+    config_type = resolve_to_config_type(
+        Shape(
+            {
+                "foo": Field(Int, default_value=1),
+                "bar": Field([String], is_required=False),
+                "baz": Field(Any, is_required=False),
+            }
+        )
+    )
+
+    with mock.patch(
+        "dagster.config.validate.validate_config", wraps=validate.validate_config
+    ) as validate_mock, mock.patch(
+        "dagster.config.validate.post_process_config", wraps=validate.post_process_config
+    ) as post_process_mock:
+        result = process_config(config_type, {"bar": ["a"]}, memoize=True)
+        assert result.success
+        assert result.value == {"foo": 1, "bar": ["a"]}
+        assert validate_mock.call_count == 1
+        assert post_process_mock.call_count == 1
+
+        memoized_result = process_config(config_type, {"bar": ["a"]}, memoize=True)
+        assert memoized_result == result
+        assert validate_mock.call_count == 1
+        assert post_process_mock.call_count == 1
+
+        # callers are handed copies, so mutating one does not affect the memo or other callers
+        any_value = {"baz": ["a"]}
+        any_result = process_config(config_type, {"baz": any_value}, memoize=True)
+        memoized_any_result = process_config(config_type, {"baz": any_value}, memoize=True)
+        assert memoized_any_result.value["baz"] is not any_result.value["baz"]
+        memoized_any_result.value["baz"]["baz"].append("b")
+        any_result.value["baz"]["baz"].append("c")
+        any_value["baz"].append("d")
+        assert process_config(config_type, {"baz": {"baz": ["a"]}}, memoize=True).value == {
+            "foo": 1,
+            "baz": {"baz": ["a"]},
+        }
+        assert post_process_mock.call_count == 2
+
+        # a tuple is not a valid Array value, so must not share a memo entry with the list
+        assert not process_config(config_type, {"bar": ("a",)}, memoize=True).success
+
+        error_result = process_config(config_type, {"foo": "a"}, memoize=True)
+        assert not error_result.success
+        assert process_config(config_type, {"foo": "a"}, memoize=True) == error_result
+
+        assert process_config(config_type, {"bar": ["a"]}) is not result
+
+    # values that cannot be hashed stably are processed without memoization
+    assert hash_config_value({"bar": ["a"]}) == hash_config_value({"bar": ["a"]})
+    assert hash_config_value({"bar": ["a"]}) != hash_config_value({"bar": ("a",)})
+    assert hash_config_value({"foo": 1}) != hash_config_value({"foo": True})
+    assert hash_config_value({1: "a"}) is None
+    assert hash_config_value({"foo": object()}) is None
+
+
+def test_memoized_process_config_with_impure_post_process():
+    config_type = resolve_to_config_type(Shape({"foo": StringSource}))
+    assert not compile_config_type(config_type).has_pure_post_process
+
+    with mock.patch(
+        "dagster.config.validate.validate_config", wraps=validate.validate_config
+    ) as validate_mock:
+        with environ({"DAGSTER_TEST_MEMO_ENV_VAR": "bar"}):
+            result = process_config(
+                config_type, {"foo": {"env": "DAGSTER_TEST_MEMO_ENV_VAR"}}, memoize=True
+            )
+            assert result.value == {"foo": "bar"}
+        assert validate_mock.call_count == 1
+
+        # validation is memoized, but the environment is read again for every run config
+        with environ({"DAGSTER_TEST_MEMO_ENV_VAR": "baz"}):
+            result = process_config(
+                config_type, {"foo": {"env": "DAGSTER_TEST_MEMO_ENV_VAR"}}, memoize=True
+            )
+            assert result.value == {"foo": "baz"}
+        assert validate_mock.call_count == 1
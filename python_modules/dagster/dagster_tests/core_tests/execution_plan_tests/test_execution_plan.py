@@ -1,6 +1,10 @@
+from unittest import mock
+
 import pytest
 from dagster import (
     DagsterInstance,
+    DynamicOutput,
+    DynamicOutputDefinition,
     Int,
     Output,
     OutputDefinition,
@@ -18,8 +22,10 @@
     DagsterUnknownStepStateError,
 )
 from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.outputs import StepOutputHandle
-from dagster.core.execution.plan.plan import should_skip_step
+from dagster.core.execution.plan.plan import _PlanBuilder, should_skip_step
 from dagster.core.execution.retries import RetryMode
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.utils import make_new_run_id
@@ -121,6 +127,62 @@ def test_active_execution_plan():
         assert active_execution.is_complete
 
 
+def test_active_execution_outputs_to_release():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=(RetryMode.DISABLED)) as active_execution:
+        [step_1] = active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle(step_1.key, "result"))
+        active_execution.mark_success(step_1.key)
+        assert active_execution.get_outputs_to_release() == []
+
+        step_2, step_3 = active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle(step_2.key, "result"))
+        active_execution.mark_success(step_2.key)
+
+        # mult_three still needs the output of return_two
+        assert active_execution.get_outputs_to_release() == []
+
+        active_execution.mark_step_produced_output(StepOutputHandle(step_3.key, "result"))
+        active_execution.mark_success(step_3.key)
+        assert active_execution.get_outputs_to_release() == [
+            StepOutputHandle("return_two", "result")
+        ]
+        assert active_execution.get_outputs_to_release() == []
+
+        [step_4] = active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle(step_4.key, "result"))
+        active_execution.mark_success(step_4.key)
+        assert set(active_execution.get_outputs_to_release()) == {
+            StepOutputHandle("add_three", "result"),
+            StepOutputHandle("mult_three", "result"),
+        }
+
+        # the output of adder has no consumers, so it is never released
+        assert active_execution.get_outputs_to_release() == []
+        assert active_execution.is_complete
+
+
+def test_active_execution_failed_consumer_keeps_outputs():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=(RetryMode.DISABLED)) as active_execution:
+        [step_1] = active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle(step_1.key, "result"))
+        active_execution.mark_success(step_1.key)
+
+        step_2, step_3 = active_execution.get_steps_to_execute()
+        active_execution.mark_success(step_2.key)
+        active_execution.mark_failed(step_3.key)
+
+        # the failed step may be re-executed, so its input is kept
+        assert active_execution.get_outputs_to_release() == []
+
+        active_execution.get_steps_to_abandon()
+        active_execution.mark_abandoned("adder")
+        assert active_execution.get_outputs_to_release() == []
+
+
 def test_failing_execution_plan():
     pipeline_def = define_diamond_pipeline()
     plan = create_execution_plan(pipeline_def)
@@ -341,6 +403,170 @@ def priorities():
         _ = [active_execution.mark_skipped(step.key) for step in steps]
 
 
+def define_pairs_pipeline(num_pairs):
+    @lambda_solid
+    def start():
+        return 1
+
+    @solid
+    def finish(_, num):
+        return num
+
+    @pipeline
+    def pairs():
+        for i in range(num_pairs):
+            finish.alias("finish_{}".format(i))(start.alias("start_{}".format(i))())
+
+    return pairs
+
+
+def _calls_per_completion_event(plan):
+    sorted_step_keys = []
+
+    def sort_key_fn(step):
+        sorted_step_keys.append(step.key)
+        return 0
+
+    calls_per_event = set()
+    with mock.patch.object(
+        ActiveExecution,
+        "get_step_by_key",
+        autospec=True,
+        side_effect=ActiveExecution.get_step_by_key,
+    ) as get_step_mock:
+        with plan.start(RetryMode.DISABLED, sort_key_fn) as active_execution:
+            start_steps = active_execution.get_steps_to_execute()
+
+            # every completed start step makes exactly one of the pending finish steps executable
+            for step in start_steps:
+                finish_key = step.key.replace("start", "finish")
+                get_step_mock.reset_mock()
+                sorted_step_keys.clear()
+
+                active_execution.mark_success(step.key)
+                active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+                steps = active_execution.get_steps_to_execute()
+
+                assert [step.key for step in steps] == [finish_key]
+                # only the step that became executable is sorted
+                assert sorted_step_keys == [finish_key]
+                calls_per_event.add(get_step_mock.call_count)
+
+            for step in start_steps:
+                active_execution.mark_success(step.key.replace("start", "finish"))
+
+            assert active_execution.is_complete
+
+    return calls_per_event
+
+
+def test_active_execution_per_event_cost():
+    small_calls = _calls_per_completion_event(create_execution_plan(define_pairs_pipeline(5)))
+    large_calls = _calls_per_completion_event(create_execution_plan(define_pairs_pipeline(50)))
+
+    # handling a completion event only touches the downstream steps of the completed step, so
+    # the work per event does not grow with the number of pending steps in the plan
+    assert len(small_calls) == 1
+    assert small_calls == large_calls
+
+
+def test_execution_plan_cache():
+    diamond_pipeline = define_diamond_pipeline()
+
+    with mock.patch.object(
+        _PlanBuilder, "build", autospec=True, side_effect=_PlanBuilder.build
+    ) as build_mock:
+        plan = create_execution_plan(diamond_pipeline)
+        assert build_mock.call_count == 1
+
+        cached_plan = create_execution_plan(diamond_pipeline)
+        assert build_mock.call_count == 1
+        assert cached_plan.step_keys_to_execute == plan.step_keys_to_execute
+        assert cached_plan.step_dict == plan.step_dict
+        assert cached_plan.step_dict is not plan.step_dict
+
+        create_execution_plan(diamond_pipeline, step_keys_to_execute=["adder"])
+        assert build_mock.call_count == 2
+
+        create_execution_plan(
+            diamond_pipeline, run_config={"execution": {"in_process": {"config": {}}}}
+        )
+        assert build_mock.call_count == 3
+
+        # plans for another definition of the same pipeline are not shared
+        create_execution_plan(define_diamond_pipeline())
+        assert build_mock.call_count == 4
+
+
+def test_execution_plan_cache_run_config_and_snapshot_id():
+    diamond_pipeline = define_diamond_pipeline()
+
+    with mock.patch.object(
+        _PlanBuilder, "build", autospec=True, side_effect=_PlanBuilder.build
+    ) as build_mock:
+        create_execution_plan(diamond_pipeline)
+        assert build_mock.call_count == 1
+
+        # a missing run config resolves the same way as an empty one
+        create_execution_plan(diamond_pipeline, run_config={})
+        assert build_mock.call_count == 1
+
+        # plans built for a pipeline snapshot id are shared between definitions of the pipeline
+        snapshot_id = diamond_pipeline.get_pipeline_snapshot_id()
+        create_execution_plan(diamond_pipeline, pipeline_snapshot_id=snapshot_id)
+        assert build_mock.call_count == 2
+
+        create_execution_plan(define_diamond_pipeline(), pipeline_snapshot_id=snapshot_id)
+        assert build_mock.call_count == 2
+
+
+def test_execution_plan_cache_subset():
+    diamond_pipeline = define_diamond_pipeline()
+
+    with mock.patch.object(
+        _PlanBuilder, "build", autospec=True, side_effect=_PlanBuilder.build
+    ) as build_mock:
+        result = execute_pipeline(diamond_pipeline, solid_selection=["return_two", "add_three"])
+        assert result.success
+        call_count = build_mock.call_count
+        assert call_count > 0
+
+        # a new subset definition is built for each run, which shares the plans of the first
+        result = execute_pipeline(diamond_pipeline, solid_selection=["add_three", "return_two"])
+        assert result.success
+        assert build_mock.call_count == call_count
+
+        execute_pipeline(diamond_pipeline, solid_selection=["return_two"])
+        assert build_mock.call_count > call_count
+
+
+def test_execution_plan_cache_dynamic():
+    @solid(output_defs=[DynamicOutputDefinition()])
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @solid
+    def echo(x):
+        return x
+
+    @pipeline
+    def dynamic_pipeline():
+        emit().map(echo)
+
+    plan = create_execution_plan(dynamic_pipeline)
+    assert plan.resolvable_map
+
+    plan.resolve({"emit": {"result": ["0", "1"]}})
+    assert not plan.resolvable_map
+    assert plan.has_step(StepHandle.parse_from_key("echo[0]"))
+
+    # resolving a plan does not change the plans that are later returned from the cache
+    cached_plan = create_execution_plan(dynamic_pipeline)
+    assert cached_plan.resolvable_map
+    assert not cached_plan.has_step(StepHandle.parse_from_key("echo[0]"))
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_pipeline()
@@ -207,38 +207,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
-            }
-          ],
-          "given_name": null,
-          "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
-          "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -321,6 +289,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "in_process",
+              "type_key": "Shape.2816befeac0e1ad5e93135a364006af653fbb62d"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}}",
+              "description": null,
+              "is_required": false,
+              "name": "multiprocess",
+              "type_key": "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -531,53 +531,96 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.37500e12d7c32132e4858674bc8ac380cffd3547": {
+        "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.39a128a91d6cf239d531995e58f88744fa7bf613"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.2816befeac0e1ad5e93135a364006af653fbb62d": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
+              "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
               "description": null,
               "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-            },
+              "name": "config",
+              "type_key": "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.2816befeac0e1ad5e93135a364006af653fbb62d",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.39a128a91d6cf239d531995e58f88744fa7bf613": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "0",
               "description": null,
               "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+              "name": "max_concurrent",
+              "type_key": "Int"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": null,
+              "default_value_as_json_str": "false",
+              "description": "Whether to release each step output, via its IO manager, once every step that consumes it has completed. Released outputs are not available to re-executions.",
               "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+              "name": "release_outputs",
+              "type_key": "Bool"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": "Whether to execute steps in a pool of long-lived worker processes that are reused across steps, rather than in a new process per step.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Bool"
             }
           ],
           "given_name": null,
-          "key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547",
+          "key": "Shape.39a128a91d6cf239d531995e58f88744fa7bf613",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -653,7 +696,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
+        "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -663,58 +706,56 @@
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Any"
+              "name": "execution",
+              "type_key": "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "outputs",
-              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Any"
+              "name": "resources",
+              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
             }
           ],
           "given_name": null,
-          "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+          "key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
@@ -722,53 +763,44 @@
               "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "marker_to_close",
-              "type_key": "String"
+              "name": "config",
+              "type_key": "Any"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "outputs",
+              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
             }
           ],
           "given_name": null,
-          "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+          "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+        "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "0",
-              "description": null,
-              "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "config",
+              "type_key": "Any"
             }
           ],
           "given_name": null,
-          "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+          "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -801,23 +833,41 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "marker_to_close",
+              "type_key": "String"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "false",
+              "description": "Whether to release each step output, via its IO manager, once every step that consumes it has completed. Released outputs are not available to re-executions.",
+              "is_required": false,
+              "name": "release_outputs",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             }
           ],
           "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "key": "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -860,29 +910,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "String": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -1042,7 +1069,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547"
+        "root_config_key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1080,7 +1107,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547"
+        "root_config_key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc"
       }
     ],
     "name": "a_pipeline",
@@ -1335,38 +1362,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1449,6 +1444,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_process",
+                  "type_key": "Shape.2816befeac0e1ad5e93135a364006af653fbb62d"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "multiprocess",
+                  "type_key": "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1659,53 +1686,96 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.37500e12d7c32132e4858674bc8ac380cffd3547": {
+            "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.39a128a91d6cf239d531995e58f88744fa7bf613"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.26704f805c3f60d016dd989e98fcbabbe1fb83a0",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.2816befeac0e1ad5e93135a364006af653fbb62d": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
+                  "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
                   "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-                },
+                  "name": "config",
+                  "type_key": "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.2816befeac0e1ad5e93135a364006af653fbb62d",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.39a128a91d6cf239d531995e58f88744fa7bf613": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "0",
                   "description": null,
                   "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                  "name": "max_concurrent",
+                  "type_key": "Int"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": null,
+                  "default_value_as_json_str": "false",
+                  "description": "Whether to release each step output, via its IO manager, once every step that consumes it has completed. Released outputs are not available to re-executions.",
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                  "name": "release_outputs",
+                  "type_key": "Bool"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": "Whether to execute steps in a pool of long-lived worker processes that are reused across steps, rather than in a new process per step.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Bool"
                 }
               ],
               "given_name": null,
-              "key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547",
+              "key": "Shape.39a128a91d6cf239d531995e58f88744fa7bf613",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1781,7 +1851,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
+            "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1791,58 +1861,56 @@
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Any"
+                  "name": "execution",
+                  "type_key": "Selector.cd7e35fd7be55f04280be36a8ef4f0c2107eaa97"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "outputs",
-                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Any"
+                  "name": "resources",
+                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+              "key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+            "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
@@ -1850,53 +1918,44 @@
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "marker_to_close",
-                  "type_key": "String"
+                  "name": "config",
+                  "type_key": "Any"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "outputs",
+                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+              "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+            "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": null,
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "config",
+                  "type_key": "Any"
                 }
               ],
               "given_name": null,
-              "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+              "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1929,23 +1988,41 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "marker_to_close",
+                  "type_key": "String"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "false",
+                  "description": "Whether to release each step output, via its IO manager, once every step that consumes it has completed. Released outputs are not available to re-executions.",
+                  "is_required": false,
+                  "name": "release_outputs",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.b3cbfbdef3f0ab33a44bfc5d4c53eed1db550912",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1988,29 +2065,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "String": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -2170,7 +2224,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547"
+            "root_config_key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2208,7 +2262,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.37500e12d7c32132e4858674bc8ac380cffd3547"
+            "root_config_key": "Shape.545d9233c3cea08950d6de228dc00887c5b7afbc"
           }
         ],
         "name": "a_pipeline",
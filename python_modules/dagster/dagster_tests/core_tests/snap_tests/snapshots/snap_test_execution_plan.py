@@ -12,7 +12,7 @@
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "initial_known_state": null,
-  "pipeline_snapshot_id": "588501f8b7b5a1a7dd65fc0aa091bab26670e5c2",
+  "pipeline_snapshot_id": "e58915b7a4238149750533990ce9ddbc2bda79ad",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -137,7 +137,7 @@
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "initial_known_state": null,
-  "pipeline_snapshot_id": "2290b3c558988d5ac3b68b109c7a6da33a237696",
+  "pipeline_snapshot_id": "c91b051092591cb297e3e3b8e2a06bdb58e35590",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -192,7 +192,7 @@
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "initial_known_state": null,
-  "pipeline_snapshot_id": "bb5c233d49c4c6832472f7eea29ba6ec92b78463",
+  "pipeline_snapshot_id": "653f742898277b1491016c7c9086b10b7b891659",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -261,7 +261,7 @@
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "initial_known_state": null,
-  "pipeline_snapshot_id": "3aad6c74f16d0c802e9fc139412d5f9e1766f54a",
+  "pipeline_snapshot_id": "a973b2334038c7d1ba0f1c40e859e5df474f0650",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -1,4 +1,5 @@
 import itertools
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -476,3 +477,23 @@ def noop_pipeline():
     _map_has_stable_hashes(
         recevied_config_type, pipeline_snapshot.config_schema_snapshot.all_config_snaps_by_key
     )
+
+
+def test_pipeline_snapshot_id_memoized():
+    noop_pipeline = get_noop_pipeline()
+
+    # the snapshot and its id are only computed once per definition
+    assert noop_pipeline.get_pipeline_snapshot() is noop_pipeline.get_pipeline_snapshot()
+
+    pipeline_snapshot = PipelineSnapshot.from_pipeline_def(noop_pipeline)
+    with mock.patch(
+        "dagster.serdes.utils.serialize_dagster_namedtuple", wraps=serialize_dagster_namedtuple
+    ) as serialize_mock:
+        snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+        assert create_pipeline_snapshot_id(pipeline_snapshot) == snapshot_id
+        assert serialize_mock.call_count == 1
+
+    # the cached id does not change the snapshot's serialized form or equality
+    assert serialize_rt(pipeline_snapshot) == pipeline_snapshot
+    assert create_pipeline_snapshot_id(serialize_rt(pipeline_snapshot)) == snapshot_id
+    assert snapshot_id == noop_pipeline.get_pipeline_snapshot_id()
@@ -1,7 +1,156 @@
+import os
+import tempfile
+
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import (
+    READ_CACHE_MAX_ENTRY_BYTES,
+    ComputeLogLineIndex,
+    LocalComputeLogManager,
+)
 from dagster.core.test_utils import instance_for_test
+from dagster.utils import ensure_dir, touch_file
+
+INDEX_HEADER_SIZE = ComputeLogLineIndex._HEADER.size  # pylint: disable=protected-access
 
 
 def test_compute_log_manager_instance():
     with instance_for_test() as instance:
         assert instance.compute_log_manager
         assert instance.compute_log_manager._instance  # pylint: disable=protected-access
+
+
+def test_get_tail_cursor():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id = "fake_run_id"
+        step_key = "spew"
+        stdout_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+
+        assert manager.get_tail_cursor(run_id, step_key, ComputeIOType.STDOUT, 5) == 0
+
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "w") as f:
+            f.write("".join("line {}\n".format(i) for i in range(10)))
+
+        def _read_tail(num_lines):
+            cursor = manager.get_tail_cursor(run_id, step_key, ComputeIOType.STDOUT, num_lines)
+            return manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT, cursor).data
+
+        assert _read_tail(3) == "line 7\nline 8\nline 9\n"
+        assert _read_tail(20) == "".join("line {}\n".format(i) for i in range(10))
+        assert _read_tail(0) == ""
+
+        index_path = manager.get_line_index_path(run_id, step_key, ComputeIOType.STDOUT)
+        assert os.path.getsize(index_path) == INDEX_HEADER_SIZE + 10 * 8
+
+        # only the appended bytes are indexed, including a trailing incomplete line
+        with open(stdout_path, "a") as f:
+            f.write("line 10\nline 11")
+
+        assert _read_tail(2) == "line 10\nline 11"
+        assert os.path.getsize(index_path) == INDEX_HEADER_SIZE + 11 * 8
+
+        # a rewritten log file is reindexed
+        with open(stdout_path, "w") as f:
+            f.write("new line\n")
+
+        assert _read_tail(5) == "new line\n"
+        assert os.path.getsize(index_path) == INDEX_HEADER_SIZE + 8
+
+        # as is a log file rewritten with different content that is longer than the indexed bytes
+        with open(stdout_path, "w") as f:
+            f.write("".join("other line {}\n".format(i) for i in range(10)))
+
+        assert _read_tail(2) == "other line 8\nother line 9\n"
+        assert os.path.getsize(index_path) == INDEX_HEADER_SIZE + 10 * 8
+
+        # as is a log file that was replaced by a new file
+        os.remove(stdout_path)
+        with open(stdout_path, "w") as f:
+            f.write("".join("other line {}\n".format(i) for i in range(5)))
+            f.write("replaced\n")
+
+        assert _read_tail(1) == "replaced\n"
+        assert os.path.getsize(index_path) == INDEX_HEADER_SIZE + 6 * 8
+
+
+def test_read_logs_file_lines():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id = "fake_run_id"
+        step_key = "spew"
+        stdout_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+
+        assert manager.read_logs_file_lines(run_id, step_key, ComputeIOType.STDOUT).data is None
+
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "w") as f:
+            f.write("".join("line {}\n".format(i) for i in range(10)))
+
+        all_lines = manager.read_logs_file_lines(run_id, step_key, ComputeIOType.STDOUT)
+        assert all_lines.data.splitlines() == ["line {}".format(i) for i in range(10)]
+        assert all_lines.cursor == all_lines.size == os.path.getsize(stdout_path)
+
+        last_lines = manager.read_logs_file_lines(run_id, step_key, ComputeIOType.STDOUT, -3)
+        assert last_lines.data == "line 7\nline 8\nline 9\n"
+        assert last_lines.cursor == all_lines.size
+
+        some_lines = manager.read_logs_file_lines(run_id, step_key, ComputeIOType.STDOUT, 2, 4)
+        assert some_lines.data == "line 2\nline 3\n"
+        assert some_lines.cursor == len("".join("line {}\n".format(i) for i in range(4)))
+
+        assert not manager.read_logs_file_lines(run_id, step_key, ComputeIOType.STDOUT, 20).data
+
+
+def test_tail_observable():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id = "fake_run_id"
+        step_key = "spew"
+        stdout_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "w") as f:
+            f.write("".join("line {}\n".format(i) for i in range(10)))
+        touch_file(manager.complete_artifact_path(run_id, step_key))
+
+        messages = []
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT, tail_lines=2).subscribe(
+            messages.append
+        )
+        assert [message.data for message in messages] == ["line 8\nline 9\n"]
+
+        # a cursor takes precedence over the number of lines to tail
+        messages = []
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT, "63", tail_lines=2).subscribe(
+            messages.append
+        )
+        assert [message.data for message in messages] == ["line 9\n"]
+
+
+def test_read_logs_file_shares_reads():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir)
+        run_id = "fake_run_id"
+        step_key = "spew"
+        stdout_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "w") as f:
+            f.write("hello\n")
+
+        first_read = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT) is first_read
+
+        with open(stdout_path, "a") as f:
+            f.write("world\n")
+
+        second_read = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert second_read.data == "hello\nworld\n"
+        assert manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT, 6).data == "world\n"
+
+        # large reads are not kept, so that the cache stays small
+        with open(stdout_path, "a") as f:
+            f.write("x" * READ_CACHE_MAX_ENTRY_BYTES)
+
+        large_read = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT) is not large_read
+        assert manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT) == large_read
@@ -5,6 +5,7 @@
 
 import pytest
 import sqlalchemy
+from dagster import AssetKey, AssetMaterialization, Output, solid
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
@@ -16,7 +17,7 @@
 from dagster.core.storage.sql import create_engine
 from dagster.seven import multiprocessing
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, _synthesize_events
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -78,6 +79,30 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data(self, storage):
         with pytest.raises(DagsterEventLogInvalidForRun):
             storage.get_logs_for_run("bar")
 
+    def test_delete_events_with_cold_secondary_index_cache(self, storage):
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=AssetKey("asset_one"))
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        events, result = _synthesize_events(_solids)
+        for event in events:
+            storage.store_event(event)
+
+        # a fresh storage over the same directory has not yet looked up which secondary indexes
+        # have been built, so deleting has to do so without holding a connection open
+        tmpdir_path = storage._base_dir  # pylint: disable=protected-access
+        cold_storage = SqliteEventLogStorage(tmpdir_path)
+        try:
+            cold_storage.delete_events(result.run_id)
+            assert cold_storage.get_logs_for_run(result.run_id) == []
+            assert cold_storage.all_asset_keys() == []
+        finally:
+            cold_storage.dispose()
+
     def cmd(self, exceptions, tmpdir_path):
         storage = SqliteEventLogStorage(tmpdir_path)
         try:
@@ -0,0 +1,147 @@
+import time
+
+import mock
+import pytest
+from dagster import check, execute_pipeline, pipeline, solid
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.event_log.write_buffer import EventLogWriteBuffer
+from dagster.core.test_utils import instance_for_test
+
+RUN_ID = "foo"
+
+
+def create_engine_event(message):
+    return EventLogEntry(
+        None,
+        message,
+        "debug",
+        "",
+        RUN_ID,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def create_step_start_event(message):
+    return EventLogEntry(
+        None,
+        message,
+        "debug",
+        "",
+        RUN_ID,
+        time.time(),
+        dagster_event=DagsterEvent(DagsterEventType.STEP_START.value, "nonce"),
+    )
+
+
+def _messages(storage):
+    return [event.message for event in storage.get_logs_for_run(RUN_ID)]
+
+
+def test_write_buffer_flushes_full_batches():
+    storage = InMemoryEventLogStorage()
+    write_buffer = EventLogWriteBuffer(storage, max_batch_size=3, flush_interval_seconds=60)
+
+    write_buffer.write(create_engine_event("0"))
+    write_buffer.write(create_engine_event("1"))
+    assert _messages(storage) == []
+
+    write_buffer.write(create_engine_event("2"))
+    assert _messages(storage) == ["0", "1", "2"]
+
+    write_buffer.close()
+
+
+def test_write_buffer_flushes_lifecycle_events():
+    storage = InMemoryEventLogStorage()
+    write_buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    write_buffer.write(create_engine_event("0"))
+    assert _messages(storage) == []
+
+    write_buffer.write(create_step_start_event("1"))
+    assert _messages(storage) == ["0", "1"]
+
+    write_buffer.close()
+
+
+def test_write_buffer_flushes_periodically():
+    storage = InMemoryEventLogStorage()
+    write_buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=0.1)
+
+    write_buffer.write(create_engine_event("0"))
+
+    start_time = time.time()
+    while not _messages(storage):
+        assert time.time() - start_time < 5, "Timed out waiting for buffered event to be written"
+        time.sleep(0.05)
+
+    assert _messages(storage) == ["0"]
+
+    write_buffer.close()
+
+
+def test_write_buffer_close():
+    storage = InMemoryEventLogStorage()
+    write_buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    write_buffer.write(create_engine_event("0"))
+    write_buffer.close()
+    assert _messages(storage) == ["0"]
+
+    with pytest.raises(check.CheckError):
+        write_buffer.write(create_engine_event("1"))
+
+
+@solid
+def log_many(context):
+    for i in range(20):
+        context.log.info(str(i))
+
+
+@pipeline
+def log_many_pipeline():
+    log_many()
+
+
+def test_instance_event_log_write_buffer():
+    with instance_for_test(
+        overrides={
+            "event_log_write_buffer": {
+                "enabled": True,
+                "max_batch_size": 10,
+                "flush_interval_seconds": 60.0,
+            }
+        }
+    ) as instance:
+        assert instance.event_log_write_buffer_enabled
+
+        with mock.patch.object(
+            instance.event_log_storage,
+            "store_events",
+            wraps=instance.event_log_storage.store_events,
+        ) as store_events_mock:
+            result = execute_pipeline(log_many_pipeline, instance=instance)
+            assert result.success
+
+            written_events = [
+                event
+                for call in store_events_mock.call_args_list
+                for event in call[0][0]  # first positional arg is the batch of events
+            ]
+
+        # all events were written, in batches, by the time the run finished
+        assert store_events_mock.call_count < len(written_events)
+        assert instance.all_logs(result.run_id) == written_events
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+
+
+def test_instance_event_log_write_buffer_disabled():
+    with instance_for_test() as instance:
+        assert not instance.event_log_write_buffer_enabled
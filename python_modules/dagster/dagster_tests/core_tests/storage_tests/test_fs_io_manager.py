@@ -1,12 +1,25 @@
+import mmap
 import os
 import pickle
+import sys
 import tempfile
 
-from dagster import ModeDefinition, execute_pipeline, graph, op, pipeline, solid
+import pytest
+from dagster import (
+    ModeDefinition,
+    build_input_context,
+    build_output_context,
+    execute_pipeline,
+    graph,
+    op,
+    pipeline,
+    solid,
+)
 from dagster.core.definitions.version_strategy import VersionStrategy
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.fs_io_manager import fs_io_manager
+from dagster.core.storage import fs_io_manager as fs_io_manager_module
+from dagster.core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
 from dagster.core.test_utils import instance_for_test
 
 
@@ -52,6 +65,57 @@ def test_fs_io_manager():
             assert pickle.load(read_obj) == 1
 
 
+def test_fs_io_manager_release_outputs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path})
+        pipeline_def = define_pipeline(io_manager)
+
+        result = execute_pipeline(
+            pipeline_def,
+            run_config={"execution": {"in_process": {"config": {"release_outputs": True}}}},
+        )
+        assert result.success
+
+        # solid_a's output was removed once solid_b consumed it, solid_b's output has no consumers
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id, "solid_a", "result"))
+        assert os.path.isfile(os.path.join(tmpdir_path, result.run_id, "solid_b", "result"))
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("Unpicklable")
+
+
+@pytest.mark.parametrize(
+    "out_of_band_buffers",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 8), reason="Requires pickle protocol 5"
+            ),
+        ),
+    ],
+)
+def test_fs_io_manager_failed_write_keeps_previous_output(out_of_band_buffers):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, out_of_band_buffers=out_of_band_buffers
+        )
+        output_context = build_output_context(step_key="a", name="result", run_id="run")
+        input_context = build_input_context(upstream_output=output_context)
+        io_manager.handle_output(output_context, ZeroCopyByteArray(b"abc"))
+        stored = sorted(os.listdir(os.path.join(tmpdir_path, "run", "a")))
+        assert stored == (["result", "result.buffers"] if out_of_band_buffers else ["result"])
+
+        with pytest.raises(pickle.PicklingError):
+            io_manager.handle_output(output_context, [ZeroCopyByteArray(b"def"), Unpicklable()])
+
+        assert io_manager.load_input(input_context) == ZeroCopyByteArray(b"abc")
+        assert sorted(os.listdir(os.path.join(tmpdir_path, "run", "a"))) == stored
+
+
 def test_fs_io_manager_base_dir():
     with tempfile.TemporaryDirectory() as tmpdir_path:
         instance = DagsterInstance.ephemeral(tempdir=tmpdir_path)
@@ -100,3 +164,132 @@ def get_solid_version(self, solid_def):
             result = my_job.execute_in_process(instance=instance)
             assert result.success
             assert len(recorder) == 1
+
+
+class ZeroCopyByteArray(bytearray):
+    # supports out-of-band pickling in the same way as NumPy arrays
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),), None
+        return type(self)._reconstruct, (bytearray(self),)
+
+    @classmethod
+    def _reconstruct(cls, obj):
+        with memoryview(obj) as m:
+            obj = m.obj
+            if type(obj) is cls:  # pylint: disable=unidiomatic-typecheck
+                return obj
+            return cls(obj)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Requires pickle protocol 5")
+def test_fs_io_manager_out_of_band_buffers():
+    loaded = []
+
+    @solid
+    def solid_a(_context):
+        return {"data": pickle.PickleBuffer(ZeroCopyByteArray(b"abc" * 1000)), "empty": b""}
+
+    @solid
+    def solid_b(_context, value):
+        data = value["data"]
+        loaded.append(type(data.obj) if isinstance(data, memoryview) else type(data))
+        assert bytes(data) == b"abc" * 1000
+        return 1
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    "io_manager": fs_io_manager.configured({"out_of_band_buffers": True})
+                }
+            )
+        ]
+    )
+    def buffers_pipeline():
+        solid_b(solid_a())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(buffers_pipeline, instance=instance)
+        assert result.success
+
+        filepath_a = os.path.join(instance.storage_directory(), result.run_id, "solid_a", "result")
+        assert os.path.isfile(filepath_a)
+        assert os.listdir(filepath_a + ".buffers") == ["0"]
+        with open(os.path.join(filepath_a + ".buffers", "0"), "rb") as read_obj:
+            assert read_obj.read() == b"abc" * 1000
+
+        # the buffer was memory-mapped rather than read into memory
+        assert loaded == [mmap.mmap]
+
+        # outputs without buffers are stored as a single pickle file
+        filepath_b = os.path.join(instance.storage_directory(), result.run_id, "solid_b", "result")
+        assert not os.path.exists(filepath_b + ".buffers")
+        with open(filepath_b, "rb") as read_obj:
+            assert pickle.load(read_obj) == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Requires pickle protocol 5")
+def test_fs_io_manager_out_of_band_buffers_not_copied(monkeypatch):
+    written = []
+    buffer_contents = fs_io_manager_module._buffer_contents  # pylint: disable=protected-access
+
+    def _buffer_contents(buffer):
+        contents = buffer_contents(buffer)
+        written.append(contents)
+        return contents
+
+    monkeypatch.setattr(fs_io_manager_module, "_buffer_contents", _buffer_contents)
+
+    payload = bytearray(b"abc" * 1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, out_of_band_buffers=True
+        )
+        output_context = build_output_context(step_key="a", name="result", run_id="run")
+        input_context = build_input_context(upstream_output=output_context)
+        io_manager.handle_output(output_context, {"data": pickle.PickleBuffer(payload)})
+
+        # the buffer is written straight from the memory of the output, and not into the pickle
+        assert len(written) == 1
+        assert written[0].obj is payload
+        filepath = os.path.join(tmpdir_path, "run", "a", "result")
+        assert os.path.getsize(filepath) < 1024
+        assert os.path.getsize(os.path.join(filepath + ".buffers", "0")) == len(payload)
+
+        # and is loaded as the memory-mapped file, rather than read into a copy
+        value = io_manager.load_input(input_context)
+        assert isinstance(value["data"], mmap.mmap)
+        assert value["data"][:] == payload
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Requires pickle protocol 5")
+def test_fs_io_manager_out_of_band_buffers_copy_on_write():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, out_of_band_buffers=True
+        )
+        output_context = build_output_context(step_key="a", name="result", run_id="run")
+        input_context = build_input_context(upstream_output=output_context)
+        io_manager.handle_output(output_context, pickle.PickleBuffer(bytearray(b"abc")))
+
+        value = io_manager.load_input(input_context)
+        assert value[:] == b"abc"
+        value[0] = ord("x")
+
+        # changes to loaded values are not written back to the stored output
+        assert io_manager.load_input(input_context)[:] == b"abc"
+
+        # overwriting an output with one stored without buffers removes the old buffers
+        PickledObjectFilesystemIOManager(base_dir=tmpdir_path).handle_output(output_context, b"def")
+        assert not os.path.exists(os.path.join(tmpdir_path, "run", "a", "result.buffers"))
+        assert io_manager.load_input(input_context) == b"def"
+
+        # outputs are loaded according to how they were stored
+        io_manager.handle_output(output_context, ZeroCopyByteArray(b"ghi"))
+        assert PickledObjectFilesystemIOManager(base_dir=tmpdir_path).load_input(
+            input_context
+        ) == ZeroCopyByteArray(b"ghi")
+
+        io_manager.release_output(output_context)
+        assert not os.listdir(os.path.join(tmpdir_path, "run", "a"))
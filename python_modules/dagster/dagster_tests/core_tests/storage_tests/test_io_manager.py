@@ -423,6 +423,36 @@ def my_pipeline():
     assert execute_pipeline(my_pipeline).success
 
 
+def test_mem_io_manager_release_outputs():
+    @solid
+    def solid_a(_context):
+        return 1
+
+    @solid
+    def solid_b(_context, a):
+        return a + 1
+
+    io_manager_instance = InMemoryIOManager()
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    "io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager_instance)
+                }
+            )
+        ]
+    )
+    def my_pipeline():
+        solid_b(solid_a())
+
+    result = execute_pipeline(
+        my_pipeline, run_config={"execution": {"in_process": {"config": {"release_outputs": True}}}}
+    )
+    assert result.success
+    assert list(io_manager_instance.values.values()) == [2]
+
+
 @io_manager
 def my_io_manager(_):
     pass
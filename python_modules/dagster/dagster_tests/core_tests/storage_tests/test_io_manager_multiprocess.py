@@ -1,3 +1,4 @@
+import os
 import tempfile
 
 from dagster import (
@@ -38,3 +39,19 @@ def test_io_manager_with_multi_process_executor():
                 instance=instance,
             )
             assert result.success
+
+
+def test_io_manager_with_multi_process_executor_release_outputs():
+    with instance_for_test() as instance:
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            result = execute_pipeline(
+                reconstructable(my_pipeline),
+                run_config={
+                    "execution": {"multiprocess": {"config": {"release_outputs": True}}},
+                    "resources": {"io_manager": {"config": {"base_dir": tmpdir_path}}},
+                },
+                instance=instance,
+            )
+            assert result.success
+            assert not os.path.exists(os.path.join(tmpdir_path, result.run_id, "solid_a", "result"))
+            assert os.path.isfile(os.path.join(tmpdir_path, result.run_id, "solid_b", "result"))
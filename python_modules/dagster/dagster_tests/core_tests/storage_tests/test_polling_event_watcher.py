@@ -1,8 +1,12 @@
+import gc
 import tempfile
+import threading
 import time
+import weakref
 from contextlib import contextmanager
 from typing import Callable
 
+import mock
 from dagster import check
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
@@ -37,6 +41,16 @@ def end_watch(self, run_id: str, handler: Callable[[EventLogEntry], None]):
         check.callable_param(handler, "handler")
         self._watcher.unwatch_run(run_id, handler)
 
+    def get_logs_for_runs_after_log_ids(self, log_id_by_run_id):
+        # there is no single database containing the logs of every run, so query each shard in turn
+        results = []
+        for run_id, log_id in log_id_by_run_id.items():
+            query = self._get_logs_after_log_ids_query({run_id: log_id})
+            with self.run_connection(run_id) as conn:
+                results.extend(conn.execute(query).fetchall())
+
+        return self._get_logs_by_run_id_from_rows(results)
+
     def __del__(self):
         self.dispose()
 
@@ -121,3 +135,87 @@ def test_using_logstorage():
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_watch_multiple_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = ["foo", "bar", "baz"]
+        watched = {run_id: [] for run_id in run_ids}
+
+        storage.store_event(create_event(1, run_id="foo"))
+        for run_id in run_ids:
+            storage.watch(run_id, 0 if run_id == "foo" else -1, watched[run_id].append)
+
+        # a single thread polls for every watched run
+        watcher_threads = [
+            thread for thread in threading.enumerate() if thread.name == "sql-event-watch"
+        ]
+        assert len(watcher_threads) == 1
+
+        for i, run_id in enumerate(run_ids):
+            storage.store_event(create_event(i + 2, run_id=run_id))
+
+        attempts = 10
+        while any(len(watched[run_id]) < 1 for run_id in run_ids) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched["foo"]] == [2]
+        assert [int(evt.message) for evt in watched["bar"]] == [3]
+        assert [int(evt.message) for evt in watched["baz"]] == [4]
+
+        for run_id in run_ids:
+            storage.end_watch(run_id, watched[run_id].append)
+            assert not storage._watcher.has_run_id(run_id)  # pylint: disable=protected-access
+
+        # the thread exits once no runs are being watched
+        watcher_threads[0].join(timeout=5)
+        assert not watcher_threads[0].is_alive()
+
+
+def test_poll_uses_single_query():
+    with create_sqlite_run_event_logstorage() as storage:
+        # keep the background thread from polling, so that polling is driven by the test
+        with mock.patch(
+            "dagster.core.storage.event_log.polling_event_watcher.POLLING_CADENCE", 60
+        ), mock.patch.object(
+            storage,
+            "get_logs_for_runs_after_log_ids",
+            wraps=storage.get_logs_for_runs_after_log_ids,
+        ) as get_logs_mock:
+            watcher = SqlPollingEventWatcher(storage)
+            watched = []
+            for i in range(20):
+                run_id = "run_{}".format(i)
+                storage.store_event(create_event(i, run_id=run_id))
+                watcher.watch_run(run_id, -1, watched.append)
+
+            watcher.poll()
+            assert get_logs_mock.call_count == 1
+            assert sorted(int(evt.message) for evt in watched) == list(range(20))
+
+            watcher.poll()
+            assert get_logs_mock.call_count == 2
+            assert len(watched) == 20
+
+            watcher.close()
+
+
+def test_dropped_watcher_thread_exits():
+    with create_sqlite_run_event_logstorage() as storage:
+        watcher = SqlPollingEventWatcher(storage)
+        watcher.watch_run(RUN_ID, -1, lambda _event: None)
+        watcher_thread = watcher._watcher_thread  # pylint: disable=protected-access
+        watcher_ref = weakref.ref(watcher)
+
+        # the thread does not keep a watcher that was never closed alive
+        del watcher
+        attempts = 10
+        while watcher_ref() is not None and attempts > 0:
+            gc.collect()
+            time.sleep(0.1)
+            attempts -= 1
+        assert watcher_ref() is None
+
+        watcher_thread.join(timeout=5)
+        assert not watcher_thread.is_alive()
@@ -1,3 +1,4 @@
+import math
 import re
 import time
 from collections import Counter
@@ -41,7 +42,10 @@
 )
 from dagster.core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    SECONDARY_INDEX_ASSET_RUNS,
+    SECONDARY_INDEX_RUN_STATS,
     migrate_asset_key_data,
+    migrate_asset_runs_data,
 )
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import instance_for_test
@@ -312,6 +316,114 @@ def test_event_log_storage_store_with_multiple_runs(self, storage):
             for run_id in runs:
                 assert len(storage.get_logs_for_run(run_id)) == 0
 
+    def test_event_log_storage_store_events_batch(self, storage):
+        runs = ["foo", "bar"]
+        events = [
+            create_test_event_log_record(str(i), run_id=runs[i % len(runs)]) for i in range(250)
+        ]
+        storage.store_events(events)
+
+        for i, run_id in enumerate(runs):
+            run_logs = storage.get_logs_for_run(run_id)
+            assert [log.message for log in run_logs] == [str(j) for j in range(i, 250, len(runs))]
+
+        storage.store_events([])
+        for run_id in runs:
+            assert len(storage.get_logs_for_run(run_id)) == 125
+
+    def test_event_log_storage_store_events_batch_assets(self, storage):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @solid
+        def materialize_twice(_):
+            yield AssetMaterialization(asset_key=asset_key, tags={"attempt": "one"})
+            yield AssetMaterialization(asset_key=asset_key, tags={"attempt": "two"})
+            yield Output(1)
+
+        def _solids():
+            materialize_twice()
+
+        with instance_for_test() as instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(instance)
+
+            events, result = _synthesize_events(_solids, instance=instance)
+            storage.store_events(events)
+
+            assert len(storage.get_logs_for_run(result.run_id)) == len(events)
+            assert asset_key in set(storage.all_asset_keys())
+            assert len(storage.get_asset_events(asset_key)) == 2
+            records = storage.get_event_records(EventRecordsFilter(asset_key=asset_key))
+            assert len(records) == 2
+            assert storage.get_asset_tags(asset_key) == {"attempt": "two"}
+
+    def test_get_logs_for_runs_after_log_ids(self, storage):
+        if not isinstance(storage, SqlEventLogStorage) or isinstance(
+            storage, SqliteEventLogStorage
+        ):
+            # run-sharded sqlite storages watch runs with watchdog rather than by polling
+            pytest.skip("storage does not support fetching logs for several runs at once")
+
+        for i in range(4):
+            storage.store_event(create_test_event_log_record(str(i), run_id="foo"))
+            storage.store_event(create_test_event_log_record(str(i), run_id="bar"))
+
+        logs_by_run_id = storage.get_logs_for_runs_after_log_ids({"foo": -1, "bar": -1})
+        assert set(logs_by_run_id.keys()) == {"foo", "bar"}
+        for run_id in ["foo", "bar"]:
+            assert logs_by_run_id[run_id] == storage.get_logs_for_run_by_log_id(run_id)
+
+        foo_log_ids = sorted(logs_by_run_id["foo"].keys())
+        bar_log_ids = sorted(logs_by_run_id["bar"].keys())
+        logs_by_run_id = storage.get_logs_for_runs_after_log_ids(
+            {"foo": foo_log_ids[1], "bar": bar_log_ids[-1], "baz": -1}
+        )
+        assert set(logs_by_run_id.keys()) == {"foo"}
+        assert [event.message for _, event in sorted(logs_by_run_id["foo"].items())] == ["2", "3"]
+
+        assert storage.get_logs_for_runs_after_log_ids({}) == {}
+
+    def test_get_records_for_run(self, storage):
+        for i in range(4):
+            storage.store_event(create_test_event_log_record(str(i), run_id="foo"))
+            storage.store_event(create_test_event_log_record(str(i), run_id="bar"))
+
+        records = storage.get_records_for_run("foo")
+        assert [record.event_log_entry.message for record in records] == ["0", "1", "2", "3"]
+        assert [record.event_log_entry for record in records] == storage.get_logs_for_run("foo")
+        storage_ids = [record.storage_id for record in records]
+        assert storage_ids == sorted(storage_ids)
+
+        records = storage.get_records_for_run("foo", after_storage_id=storage_ids[1])
+        assert [record.event_log_entry.message for record in records] == ["2", "3"]
+        assert [record.storage_id for record in records] == storage_ids[2:]
+
+        records = storage.get_records_for_run("foo", after_storage_id=storage_ids[0], limit=2)
+        assert [record.event_log_entry.message for record in records] == ["1", "2"]
+
+        assert storage.get_records_for_run("foo", after_storage_id=storage_ids[-1]) == []
+        assert storage.get_records_for_run("baz") == []
+        assert (
+            storage.get_records_for_run("foo", of_type=DagsterEventType.PIPELINE_SUCCESS) == []
+        )
+
+    def test_get_storage_id_for_run_cursor(self, storage):
+        for i in range(4):
+            storage.store_event(create_test_event_log_record(str(i), run_id="foo"))
+            storage.store_event(create_test_event_log_record(str(i), run_id="bar"))
+
+        storage_ids = [record.storage_id for record in storage.get_records_for_run("foo")]
+        assert [
+            storage.get_storage_id_for_run_cursor("foo", cursor) for cursor in range(4)
+        ] == storage_ids
+        assert storage.get_storage_id_for_run_cursor("foo", 4) is None
+        assert storage.get_storage_id_for_run_cursor("baz", 0) is None
+
+        records = storage.get_records_for_run(
+            "foo", after_storage_id=storage.get_storage_id_for_run_cursor("foo", 1)
+        )
+        assert [record.event_log_entry.message for record in records] == ["2", "3"]
+
     def test_event_log_storage_watch(self, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -997,6 +1109,66 @@ def _two():
         assert asset_key_one in set(asset_keys)
         assert asset_key_two in set(asset_keys)
 
+    def test_get_asset_keys_for_run(self, storage):
+        asset_key_one = AssetKey(["one"])
+        asset_key_two = AssetKey(["two"])
+
+        @solid
+        def materialize_one(_, _input):
+            yield AssetMaterialization(asset_key=asset_key_one)
+            yield AssetMaterialization(asset_key=asset_key_one)
+            yield Output(1)
+
+        @solid
+        def materialize_two(_):
+            yield AssetMaterialization(asset_key=asset_key_two)
+            yield Output(1)
+
+        def _one():
+            # chained so that asset two is always materialized first
+            materialize_one(materialize_two())
+
+        def _two():
+            materialize_two()
+
+        events_one, result_one = _synthesize_events(_one)
+        storage.store_events(events_one)
+        events_two, result_two = _synthesize_events(_two)
+        for event in events_two:
+            storage.store_event(event)
+
+        # asset keys are listed once, in the order in which they were first materialized
+        run_ids = [result_one.run_id, result_two.run_id, "not_a_run"]
+        assert storage.get_asset_keys_for_run(result_one.run_id) == [asset_key_two, asset_key_one]
+        assert storage.get_asset_keys_for_runs(run_ids) == {
+            result_one.run_id: [asset_key_two, asset_key_one],
+            result_two.run_id: [asset_key_two],
+            "not_a_run": [],
+        }
+
+        if not isinstance(storage, SqlEventLogStorage):
+            return
+
+        # the links in the asset runs table match the asset keys of the runs' events
+        assert storage.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS)
+        for run_id in run_ids:
+            assert storage.get_asset_keys_for_run(
+                run_id
+            ) == storage._get_asset_keys_for_run_from_event_log(  # pylint: disable=protected-access
+                run_id
+            )
+
+        # rebuilding the links from the event log leaves them unchanged
+        migrate_asset_runs_data(storage)
+        assert storage.get_asset_keys_for_runs(run_ids)[result_one.run_id] == [
+            asset_key_two,
+            asset_key_one,
+        ]
+
+        storage.delete_events(result_one.run_id)
+        assert storage.get_asset_keys_for_run(result_one.run_id) == []
+        assert storage.get_asset_keys_for_run(result_two.run_id) == [asset_key_two]
+
     def test_run_step_stats(self, storage):
         @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
         def should_fail(context, _input):
@@ -1040,6 +1212,132 @@ def _one():
         assert step_stats[0].end_time > step_stats[0].start_time
         assert step_stats[0].attempts == 4
 
+    def test_get_stats_for_runs(self, storage):
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_fail(context, _input):
+            raise Exception("booo")
+
+        def _one():
+            should_fail(should_succeed())
+
+        def _two():
+            should_succeed()
+
+        run_ids = []
+        for solids_fn in [_one, _two]:
+            events, result = _synthesize_events(solids_fn, check_success=False)
+            storage.store_events(events)
+            run_ids.append(result.run_id)
+
+        # the stats of each run match the stats loaded for the run on its own
+        run_ids.append("not_a_run")
+        stats_by_run_id = storage.get_stats_for_runs(run_ids)
+        assert list(stats_by_run_id.keys()) == run_ids
+        for run_id in run_ids:
+            assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+        assert stats_by_run_id[run_ids[0]].steps_failed == 1
+        assert stats_by_run_id[run_ids[1]].steps_failed == 0
+
+        step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids)
+        assert list(step_stats_by_run_id.keys()) == run_ids
+        for run_id in run_ids:
+            assert step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(run_id)
+        assert len(step_stats_by_run_id[run_ids[0]]) == 2
+        assert step_stats_by_run_id["not_a_run"] == []
+
+        assert storage.get_stats_for_runs([]) == {}
+        assert storage.get_step_stats_for_runs([]) == {}
+
+    def test_run_stats_tables(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS)
+
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_retry(context, _input):
+            raise RetryRequested(max_retries=2)
+
+        def _one():
+            should_retry(should_succeed())
+
+        events, result = _synthesize_events(_one, check_success=False)
+        storage.store_events(events[:5])
+        for event in events[5:]:
+            storage.store_event(event)
+
+        def _step_stats(step_stats):
+            return sorted(
+                [
+                    (stats.step_key, stats.status, stats.start_time, stats.end_time, stats.attempts)
+                    for stats in step_stats
+                ]
+            )
+
+        # the stats maintained in the stats tables match the stats computed from the event log
+        run_stats = storage.get_stats_for_run(result.run_id)
+        assert run_stats.steps_succeeded == 1
+        assert run_stats.steps_failed == 1
+        assert (
+            run_stats
+            == storage._get_stats_for_run_from_event_log(  # pylint: disable=protected-access
+                result.run_id
+            )
+        )
+
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        step_stats_from_event_log = [
+            (step_key, value["status"], value["start_time"], value["end_time"], value["attempts"])
+            for step_key, value in storage._get_step_stats_by_step_key_from_event_log(  # pylint: disable=protected-access
+                result.run_id
+            ).items()
+        ]
+        assert _step_stats(step_stats) == sorted(step_stats_from_event_log)
+        assert [
+            stats.attempts
+            for stats in storage.get_step_stats_for_run(result.run_id, step_keys=["should_retry"])
+        ] == [3]
+
+        # rebuilding the stats from the event log leaves them unchanged
+        storage.rebuild_stats_for_run(result.run_id)
+        assert storage.get_stats_for_run(result.run_id) == run_stats
+        assert _step_stats(storage.get_step_stats_for_run(result.run_id)) == _step_stats(step_stats)
+
+        storage.delete_events(result.run_id)
+        assert storage.get_stats_for_run(result.run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(result.run_id) == []
+
+    def test_run_stats_tables_end_time(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        # run end events that are stored out of order keep the latest end time
+        end_time = time.time()
+        for event_type, timestamp in [
+            (DagsterEventType.PIPELINE_SUCCESS, end_time),
+            (DagsterEventType.PIPELINE_FAILURE, end_time - 10),
+        ]:
+            storage.store_event(
+                EventLogEntry(
+                    None,
+                    "message",
+                    "debug",
+                    "",
+                    DEFAULT_RUN_ID,
+                    timestamp,
+                    dagster_event=DagsterEvent(event_type.value, "nonce"),
+                )
+            )
+
+        run_stats = storage.get_stats_for_run(DEFAULT_RUN_ID)
+        assert math.isclose(run_stats.end_time, end_time)
+        assert (
+            run_stats
+            == storage._get_stats_for_run_from_event_log(  # pylint: disable=protected-access
+                DEFAULT_RUN_ID
+            )
+        )
+
     def test_get_event_records(self, storage):
         if isinstance(storage, SqliteEventLogStorage):
             # test sqlite in test_get_event_records_sqlite
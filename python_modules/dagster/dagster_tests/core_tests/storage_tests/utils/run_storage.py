@@ -1,6 +1,8 @@
 import sys
+import zlib
 from datetime import datetime
 
+import mock
 import pendulum
 import pytest
 from dagster.core.definitions import PipelineDefinition
@@ -18,13 +20,14 @@
 from dagster.core.snap import create_pipeline_snapshot_id
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.runs.migration import RUN_DATA_MIGRATIONS
+from dagster.core.storage.runs.schema import SnapshotsTable
 from dagster.core.storage.runs.sql_run_storage import SqlRunStorage
-from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import PARENT_RUN_ID_TAG, PRIORITY_TAG, ROOT_RUN_ID_TAG
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.core.utils import make_new_run_id
 from dagster.daemon.daemon import SensorDaemon
 from dagster.daemon.types import DaemonHeartbeat
-from dagster.serdes import serialize_pp
+from dagster.serdes import serialize_dagster_namedtuple, serialize_pp
 
 
 class TestRunStorage:
@@ -67,6 +70,10 @@ def fake_repo_target():
             "fake_repo_name",
         )
 
+    @classmethod
+    def fake_pipeline_origin(cls):
+        return cls.fake_repo_target().get_pipeline_origin("some_pipeline")
+
     @classmethod
     def fake_partition_set_origin(cls, partition_set_name):
         return cls.fake_repo_target().get_partition_set_origin(partition_set_name)
@@ -81,6 +88,7 @@ def build_run(
         parent_run_id=None,
         root_run_id=None,
         pipeline_snapshot_id=None,
+        external_pipeline_origin=None,
     ):
         return PipelineRun(
             pipeline_name=pipeline_name,
@@ -92,6 +100,7 @@ def build_run(
             root_run_id=root_run_id,
             parent_run_id=parent_run_id,
             pipeline_snapshot_id=pipeline_snapshot_id,
+            external_pipeline_origin=external_pipeline_origin,
         )
 
     def test_basic_storage(self, storage):
@@ -453,6 +462,75 @@ def test_fetch_by_tags(self, storage):
         some_runs = storage.get_runs(PipelineRunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_fetch_by_tag_values(self, storage):
+        assert storage
+        one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "hello", "mytag2": "world"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "goodbye", "mytag2": "world"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "hi", "mytag2": "world"},
+            )
+        )
+
+        some_runs = storage.get_runs(PipelineRunsFilter(tags={"mytag": ["hello", "goodbye"]}))
+        assert [run.run_id for run in some_runs] == [two, one]
+
+        some_runs = storage.get_runs(
+            PipelineRunsFilter(tags={"mytag": ["hello", "hi", "nope"], "mytag2": "world"})
+        )
+        assert [run.run_id for run in some_runs] == [three, one]
+
+        assert storage.get_runs(PipelineRunsFilter(tags={"mytag": ["nope"]})) == []
+
+    def test_add_runs(self, storage):
+        assert storage
+        one, two = [make_new_run_id(), make_new_run_id()]
+        storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=one, pipeline_name="some_pipeline", tags={"mytag": "hello"}
+                ),
+                TestRunStorage.build_run(run_id=two, pipeline_name="some_pipeline"),
+            ]
+        )
+
+        assert {run.run_id for run in storage.get_runs()} == {one, two}
+        assert [
+            run.run_id for run in storage.get_runs(PipelineRunsFilter(tags={"mytag": "hello"}))
+        ] == [one]
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs([TestRunStorage.build_run(run_id=one, pipeline_name="some_pipeline")])
+
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        # SQL storages add a batch of runs in a single transaction
+        three = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(run_id=three, pipeline_name="some_pipeline"),
+                    TestRunStorage.build_run(run_id=one, pipeline_name="some_pipeline"),
+                ]
+            )
+        assert not storage.has_run(three)
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -658,6 +736,87 @@ def test_fetch_by_status_cursored(self, storage):
         assert len(cursor_four_limit_one) == 1
         assert cursor_four_limit_one[0].run_id == two
 
+    def test_fetch_queued_runs(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(5)]
+        priorities = ["0", "1", None, "1", "-1"]
+        for run_id, priority in zip(run_ids, priorities):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=PipelineRunStatus.QUEUED,
+                    tags={PRIORITY_TAG: priority} if priority else None,
+                    external_pipeline_origin=TestRunStorage.fake_pipeline_origin(),
+                )
+            )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                status=PipelineRunStatus.STARTED,
+                tags={PRIORITY_TAG: "2"},
+            )
+        )
+
+        # by descending priority, then in fifo order
+        expected_run_ids = [run_ids[1], run_ids[3], run_ids[0], run_ids[2], run_ids[4]]
+        assert [run.run_id for run in storage.get_queued_runs()] == expected_run_ids
+        assert [run.run_id for run in storage.get_queued_runs(limit=2)] == expected_run_ids[:2]
+        assert [
+            run.run_id for run in storage.get_queued_runs(cursor=expected_run_ids[1], limit=2)
+        ] == expected_run_ids[2:4]
+
+        # the cursor run no longer needs to be queued
+        storage.handle_run_event(
+            expected_run_ids[1],
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_STARTING.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        assert [
+            run.run_id for run in storage.get_queued_runs(cursor=expected_run_ids[1])
+        ] == expected_run_ids[2:]
+
+        # changing the priority tag of a run changes its place in the queue
+        storage.add_run_tags(run_ids[4], {PRIORITY_TAG: "5"})
+        assert [run.run_id for run in storage.get_queued_runs()] == [
+            run_ids[4],
+            run_ids[1],
+            run_ids[0],
+            run_ids[2],
+        ]
+
+    def test_fetch_run_counts_by_tag(self, storage):
+        assert storage
+        for status, tags in [
+            (PipelineRunStatus.STARTED, {"foo": "a", "bar": "x"}),
+            (PipelineRunStatus.STARTED, {"foo": "a"}),
+            (PipelineRunStatus.STARTING, {"foo": "b", "baz": "y"}),
+            (PipelineRunStatus.QUEUED, {"foo": "a"}),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    pipeline_name="some_pipeline",
+                    status=status,
+                    tags=tags,
+                    external_pipeline_origin=TestRunStorage.fake_pipeline_origin(),
+                )
+            )
+
+        assert storage.get_run_counts_by_tag(
+            PipelineRunsFilter(statuses=[PipelineRunStatus.STARTED, PipelineRunStatus.STARTING]),
+            ["foo", "bar"],
+        ) == {("foo", "a"): 2, ("foo", "b"): 1, ("bar", "x"): 1}
+        assert storage.get_run_counts_by_tag(PipelineRunsFilter(), ["foo"]) == {
+            ("foo", "a"): 3,
+            ("foo", "b"): 1,
+        }
+        assert storage.get_run_counts_by_tag(PipelineRunsFilter(), []) == {}
+
     def test_delete(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete runs")
@@ -719,6 +878,8 @@ def test_add_get_snapshot(self, storage):
         pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
         pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
 
+        assert storage.add_pipeline_snapshot(pipeline_snapshot) == pipeline_snapshot_id
+        # adding a snapshot that is already stored, as concurrent run creation may, is a no-op
         assert storage.add_pipeline_snapshot(pipeline_snapshot) == pipeline_snapshot_id
         fetched_pipeline_snapshot = storage.get_pipeline_snapshot(pipeline_snapshot_id)
         assert fetched_pipeline_snapshot
@@ -731,6 +892,80 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
 
+    def test_snapshot_cache(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = storage.add_pipeline_snapshot(pipeline_snapshot)
+
+        # snapshots that were just added are read back without going to the database
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is pipeline_snapshot
+
+        storage._snapshot_cache.clear()  # pylint: disable=protected-access
+        fetched_pipeline_snapshot = storage.get_pipeline_snapshot(pipeline_snapshot_id)
+        assert fetched_pipeline_snapshot == pipeline_snapshot
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is fetched_pipeline_snapshot
+
+    def test_snapshot_presence_cache(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+
+        # a snapshot that is missing is looked up again, since another process may add it
+        assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
+        with storage.connect() as conn:
+            conn.execute(
+                SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    snapshot_id=pipeline_snapshot_id,
+                    snapshot_body=zlib.compress(
+                        serialize_dagster_namedtuple(pipeline_snapshot).encode("utf-8")
+                    ),
+                    snapshot_type="PIPELINE",
+                )
+            )
+
+        with mock.patch.object(
+            storage,
+            "_has_snapshot_id",
+            wraps=storage._has_snapshot_id,  # pylint: disable=protected-access
+        ) as has_snapshot_id_mock:
+            assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
+            assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
+            # once found in the database, the snapshot is known to be present
+            assert has_snapshot_id_mock.call_count == 1
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
+
+    def test_read_snapshot_with_default_compression(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+
+        # rows written by earlier versions used the default zlib compression level
+        with storage.connect() as conn:
+            conn.execute(
+                SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    snapshot_id=pipeline_snapshot_id,
+                    snapshot_body=zlib.compress(
+                        serialize_dagster_namedtuple(pipeline_snapshot).encode("utf-8")
+                    ),
+                    snapshot_type="PIPELINE",
+                )
+            )
+
+        assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) == pipeline_snapshot
+
     def test_single_write_read_with_snapshot(self, storage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
@@ -172,11 +172,16 @@ def test_compute_log_manager_subscriptions():
 @pytest.mark.skipif(
     should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
 )
-def test_compute_log_manager_subscription_updates():
+@pytest.mark.parametrize("use_filesystem_notifications", [False, True])
+def test_compute_log_manager_subscription_updates(use_filesystem_notifications):
     from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
 
     with tempfile.TemporaryDirectory() as temp_dir:
-        compute_log_manager = LocalComputeLogManager(temp_dir, polling_timeout=0.5)
+        compute_log_manager = LocalComputeLogManager(
+            temp_dir,
+            polling_timeout=0.5,
+            use_filesystem_notifications=use_filesystem_notifications,
+        )
         run_id = "fake_run_id"
         step_key = "spew"
         stdout_path = compute_log_manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
@@ -6,6 +6,7 @@
 from collections import defaultdict
 from contextlib import contextmanager
 
+import mock
 import pendulum
 import pytest
 from dagster import (
@@ -25,6 +26,7 @@
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster.core.host_representation import (
     ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocation,
     InProcessRepositoryLocationOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
@@ -322,6 +324,107 @@ def test_simple_backfill(external_repo_context):
         assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+class _DaemonInterrupted(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_backfill_submits_runs_created_by_interrupted_iteration(external_repo_context):
+    with instance_for_context(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        # the daemon goes down after creating every run of the chunk, but only submitting one
+        submit_run = instance.submit_run
+        submitted_run_ids = []
+
+        def _submit_run_then_go_down(run_id, run_workspace):
+            if submitted_run_ids:
+                raise _DaemonInterrupted()
+            submitted_run_ids.append(run_id)
+            return submit_run(run_id, run_workspace)
+
+        with mock.patch.object(instance, "submit_run", side_effect=_submit_run_then_go_down):
+            with pytest.raises(_DaemonInterrupted):
+                list(
+                    execute_backfill_iteration(
+                        instance, workspace, get_default_daemon_logger("BackfillDaemon")
+                    )
+                )
+
+        assert instance.get_runs_count() == 3
+        assert instance.get_backfill("simple").status == BulkActionStatus.REQUESTED
+        not_started_filter = PipelineRunsFilter(statuses=[PipelineRunStatus.NOT_STARTED])
+        assert len(instance.get_runs(not_started_filter)) == 2
+
+        list(
+            execute_backfill_iteration(
+                instance, workspace, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        assert instance.get_runs_count() == 3
+        assert not instance.get_runs(not_started_filter)
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_backfill_shares_execution_plans(external_repo_context):
+    with instance_for_context(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        with mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "get_external_execution_plan",
+            autospec=True,
+            side_effect=GrpcServerRepositoryLocation.get_external_execution_plan,
+        ) as get_external_execution_plan_mock:
+            list(
+                execute_backfill_iteration(
+                    instance, workspace, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+
+        # every partition has the same run config, so the execution plan is only fetched once
+        assert get_external_execution_plan_mock.call_count == 1
+
+        runs = instance.get_runs()
+        assert len(runs) == 3
+        assert len({run.execution_plan_snapshot_id for run in runs}) == 1
+        assert {run.tags[PARTITION_NAME_TAG] for run in runs} == {"one", "two", "three"}
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_failure_backfill(external_repo_context):
     output_file = _failure_flag_file()
@@ -1,6 +1,7 @@
 # pylint: disable=redefined-outer-name
 
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
 from dagster.core.host_representation.repository_location import GrpcServerRepositoryLocation
@@ -11,6 +12,7 @@
     create_test_daemon_workspace,
     instance_for_test,
 )
+from dagster.daemon.run_coordinator import queued_run_coordinator_daemon
 from dagster.daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster_tests.api_tests.utils import get_foo_pipeline_handle
 
@@ -204,6 +206,77 @@ def test_tag_limits(workspace, daemon):
         assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "large-1"]
 
 
+def test_tag_limits_across_pages(workspace, daemon, monkeypatch):
+    monkeypatch.setattr(queued_run_coordinator_daemon, "QUEUED_RUNS_PAGE_SIZE", 2)
+
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        create_run(
+            instance,
+            run_id="tiny-in-progress",
+            status=PipelineRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(5):
+            create_run(
+                instance,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny", PRIORITY_TAG: "1"},
+            )
+        create_run(
+            instance,
+            run_id="large-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "large"},
+        )
+
+        list(daemon.run_iteration(instance, workspace))
+
+        # the blocked runs fill several pages, but the run after them is still launched
+        assert get_run_ids(instance.run_launcher.queue()) == ["large-1"]
+
+
+def test_queued_runs_checked_per_iteration(workspace, daemon, monkeypatch):
+    monkeypatch.setattr(queued_run_coordinator_daemon, "QUEUED_RUNS_PAGE_SIZE", 2)
+    monkeypatch.setattr(queued_run_coordinator_daemon, "MAX_QUEUED_RUNS_CHECKED_PER_LAUNCH", 2)
+
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=3,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        create_run(
+            instance,
+            run_id="tiny-in-progress",
+            status=PipelineRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(5):
+            create_run(
+                instance,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny", PRIORITY_TAG: "1"},
+            )
+        create_run(
+            instance,
+            run_id="large-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "large"},
+        )
+
+        with mock.patch.object(
+            instance, "get_queued_runs", wraps=instance.get_queued_runs
+        ) as get_queued_runs_mock:
+            list(daemon.run_iteration(instance, workspace))
+
+        # with two runs to launch, only the first four queued runs are checked, which are blocked
+        assert instance.run_launcher.queue() == []
+        assert [call[1]["limit"] for call in get_queued_runs_mock.call_args_list] == [2, 2]
+
+
 def test_tag_limits_just_key(workspace, daemon):
     with instance_for_queued_run_coordinator(
         max_concurrent_runs=10,
@@ -33,6 +33,7 @@
 from dagster.core.host_representation import (
     ExternalJobOrigin,
     ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocation,
     InProcessRepositoryLocationOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
@@ -1042,12 +1043,23 @@ def test_large_sensor(external_repo_context):
 
 
 @pytest.mark.parametrize("external_repo_context", repos())
-def test_cursor_sensor(external_repo_context):
+@pytest.mark.parametrize(
+    "sensor_settings",
+    [
+        None,
+        {"use_threads": True, "num_workers": 4},
+        {"use_threads": True, "num_workers": 4, "max_concurrent_evaluations_per_location": 1},
+    ],
+)
+def test_cursor_sensor(external_repo_context, sensor_settings):
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
         "US/Central",
     )
-    with instance_with_sensors(external_repo_context) as (
+    with instance_with_sensors(
+        external_repo_context,
+        overrides={"sensors": sensor_settings} if sensor_settings else None,
+    ) as (
         instance,
         workspace,
         external_repo,
@@ -1104,6 +1116,91 @@ def test_cursor_sensor(external_repo_context):
             assert run_ticks[0].cursor == "2"
 
 
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_threaded_sensors_max_concurrent_evaluations(external_repo_context, monkeypatch):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(
+        external_repo_context,
+        overrides={
+            "sensors": {
+                "use_threads": True,
+                "num_workers": 4,
+                "max_concurrent_evaluations_per_location": 2,
+            }
+        },
+    ) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+        # each evaluation waits for a second one, so the evaluations can only complete if two of
+        # them run at the same time
+        barrier = threading.Barrier(2, timeout=30)
+        original_get_sensor_data = GrpcServerRepositoryLocation.get_external_sensor_execution_data
+
+        def _get_sensor_data(self, *args, **kwargs):
+            with lock:
+                in_flight.append(threading.current_thread())
+                max_in_flight.append(len(in_flight))
+            try:
+                barrier.wait()
+                return original_get_sensor_data(self, *args, **kwargs)
+            finally:
+                with lock:
+                    in_flight.remove(threading.current_thread())
+
+        monkeypatch.setattr(
+            GrpcServerRepositoryLocation, "get_external_sensor_execution_data", _get_sensor_data
+        )
+
+        submit_threads = []
+        original_submit_run = instance.submit_run
+
+        def _submit_run(run_id, run_workspace):
+            submit_threads.append(threading.current_thread())
+            return original_submit_run(run_id, run_workspace)
+
+        monkeypatch.setattr(instance, "submit_run", _submit_run)
+
+        with pendulum.test(freeze_datetime):
+            sensors = [
+                external_repo.get_external_sensor(name)
+                for name in [
+                    "always_on_sensor",
+                    "run_key_sensor",
+                    "skip_cursor_sensor",
+                    "run_cursor_sensor",
+                ]
+            ]
+            for external_sensor in sensors:
+                instance.start_sensor(external_sensor)
+
+            evaluate_sensors(instance, workspace)
+
+            assert max(max_in_flight) == 2
+            for external_sensor in sensors:
+                ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+                assert len(ticks) == 1
+                validate_tick(
+                    ticks[0],
+                    external_sensor,
+                    freeze_datetime,
+                    JobTickStatus.SKIPPED
+                    if external_sensor.name == "skip_cursor_sensor"
+                    else JobTickStatus.SUCCESS,
+                )
+
+            # runs are created by the evaluation threads, but submitted on the daemon thread
+            assert instance.get_runs_count() == 3
+            assert submit_threads == [threading.main_thread()] * 3
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_asset_sensor(external_repo_context):
     freeze_datetime = to_timezone(
@@ -0,0 +1,69 @@
+import threading
+
+from dagster.daemon.threaded_submission import (
+    DagsterDaemonShutdownError,
+    execute_evaluations_in_threads,
+)
+
+
+def test_submits_runs_on_calling_thread():
+    submitted = []
+
+    def _submit_run(run_id):
+        submitted.append((run_id, threading.current_thread()))
+
+    def _evaluate(run_id, submit_run_fn):
+        submit_run_fn(run_id)
+        yield
+        yield "error_" + run_id
+
+    errors = [
+        error
+        for error in execute_evaluations_in_threads(
+            [
+                ("location", lambda submit_run_fn: _evaluate("foo", submit_run_fn)),
+                ("location", lambda submit_run_fn: _evaluate("bar", submit_run_fn)),
+            ],
+            submit_run_fn=_submit_run,
+            num_workers=2,
+            thread_name_prefix="test_worker",
+            max_concurrent_per_group=1,
+        )
+        if error
+    ]
+
+    assert sorted(errors) == ["error_bar", "error_foo"]
+    assert sorted(run_id for run_id, _ in submitted) == ["bar", "foo"]
+    assert all(thread == threading.current_thread() for _, thread in submitted)
+
+
+def test_close_mid_iteration_fails_pending_submissions():
+    submitted = []
+    submission_errors = []
+
+    def _evaluate(submit_run_fn):
+        submit_run_fn("first")
+        try:
+            submit_run_fn("second")
+        except DagsterDaemonShutdownError as e:
+            submission_errors.append(e)
+        yield
+
+    generator = execute_evaluations_in_threads(
+        [("location", _evaluate)],
+        submit_run_fn=submitted.append,
+        num_workers=1,
+        thread_name_prefix="test_worker",
+    )
+
+    # the first submission is handled, then the daemon stops consuming the generator
+    next(generator)
+    assert submitted == ["first"]
+
+    closer = threading.Thread(target=generator.close)
+    closer.start()
+    closer.join(timeout=30)
+
+    assert not closer.is_alive()
+    assert submitted == ["first"]
+    assert len(submission_errors) == 1
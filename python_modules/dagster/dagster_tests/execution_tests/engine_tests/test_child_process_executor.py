@@ -9,7 +9,10 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    wait_for_child_processes,
 )
 from dagster.utils import segfault
 
@@ -98,6 +101,90 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_child_process_wait_handles():
+    wait_handles = []
+    events = []
+    for event in execute_child_process_command(
+        DoubleAStringChildProcessCommand("aa"), wait_handles=wait_handles
+    ):
+        if event is None:
+            assert wait_handles
+            assert wait_for_child_processes(wait_handles, timeout=5)
+        else:
+            events.append(event)
+
+    assert isinstance(events[0], ChildProcessStartEvent)
+    assert events[1] == "aaaa"
+    assert isinstance(events[2], ChildProcessDoneEvent)
+
+
+def test_child_process_wait_handles_crashy_process():
+    wait_handles = []
+    with pytest.raises(ChildProcessCrashException) as exc:
+        for event in execute_child_process_command(CrashyCommand(), wait_handles=wait_handles):
+            if event is None:
+                wait_for_child_processes(wait_handles, timeout=5)
+    assert exc.value.exit_code == 1
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
+
+
+def test_worker_executes_commands_in_same_process():
+    worker = ChildProcessWorker()
+    try:
+        first = list(
+            filter(lambda x: x, worker.execute_command(DoubleAStringChildProcessCommand("a")))
+        )
+        second = list(
+            filter(lambda x: x, worker.execute_command(DoubleAStringChildProcessCommand("b")))
+        )
+
+        assert first[1] == "aa"
+        assert second[1] == "bb"
+        assert first[0].pid == second[0].pid == worker.pid
+        assert worker.pid != os.getpid()
+    finally:
+        worker.shutdown()
+
+    assert not worker.is_alive()
+
+
+def test_worker_survives_uncaught_exception():
+    worker = ChildProcessWorker()
+    try:
+        results = list(
+            filter(
+                lambda x: x and isinstance(x, ChildProcessSystemErrorEvent),
+                worker.execute_command(ThrowAnErrorCommand()),
+            )
+        )
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        assert "aaaa" in list(worker.execute_command(DoubleAStringChildProcessCommand("aa")))
+    finally:
+        worker.shutdown()
+
+
+def test_worker_pool_replaces_crashed_worker():
+    pool = ChildProcessWorkerPool(max_workers=1)
+    try:
+        worker = pool.acquire("crashy")
+        crashed_pid = worker.pid
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(worker.execute_command(CrashyCommand()))
+        assert exc.value.exit_code == 1
+        pool.release("crashy")
+
+        worker = pool.acquire("double")
+        assert worker.pid != crashed_pid
+        assert "aaaa" in list(worker.execute_command(DoubleAStringChildProcessCommand("aa")))
+        pool.release("double")
+
+        assert pool.acquire("again").pid == worker.pid
+        pool.release("again")
+    finally:
+        pool.shutdown()
@@ -20,6 +20,7 @@
     solid,
 )
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
+from dagster.core.events import DagsterEventType
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.test_utils import default_mode_def_for_test, instance_for_test
@@ -59,6 +60,29 @@ def test_diamond_multi_execution():
         # assert len(set(pids_by_solid.values())) == len(pipeline.solids)
 
 
+def test_diamond_multi_execution_worker_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {"config": {"max_concurrent": 2, "worker_pool": True}}
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        worker_pids = {
+            event.pid
+            for event in result.step_event_list
+            if event.event_type == DagsterEventType.STEP_START
+        }
+        # four steps were executed across at most two warm workers
+        assert len(worker_pids) <= 2
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -422,6 +446,23 @@ def test_crash_multiprocessing():
         # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_multiprocessing_worker_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": True}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @solid
 def segfault_solid(context):
@@ -1,14 +1,19 @@
 import subprocess
+import threading
+import time
 from typing import List
 
+import pendulum
 from dagster import executor, pipeline, reconstructable, solid
 from dagster.config.field_utils import Permissive
 from dagster.core.definitions.executor import multiple_process_executor_requirements
 from dagster.core.definitions.mode import ModeDefinition
-from dagster.core.events import DagsterEvent
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.api import execute_pipeline
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.step_delegating import StepDelegatingExecutor, StepHandler
+from dagster.core.storage.event_log.base import EventLogRecord
 from dagster.core.storage.fs_io_manager import fs_io_manager
 from dagster.core.test_utils import instance_for_test
 from dagster.serdes import serialize_dagster_namedtuple
@@ -21,6 +26,7 @@ class TestStepHandler(StepHandler):
     launch_step_count = 0  # type: ignore
     saw_baz_solid = False
     check_step_health_count = 0  # type: ignore
+    check_steps_health_count = 0  # type: ignore
     terminate_step_count = 0  # type: ignore
 
     @property
@@ -50,6 +56,10 @@ def check_step_health(self, step_handler_context) -> List[DagsterEvent]:
         TestStepHandler.check_step_health_count += 1
         return []
 
+    def check_steps_health(self, step_handler_context) -> List[DagsterEvent]:
+        TestStepHandler.check_steps_health_count += 1
+        return super().check_steps_health(step_handler_context)
+
     def terminate_step(self, step_handler_context):
         TestStepHandler.terminate_step_count += 1
         raise NotImplementedError()
@@ -59,6 +69,7 @@ def reset(cls):
         cls.processes = []
         cls.launch_step_count = 0
         cls.check_step_health_count = 0
+        cls.check_steps_health_count = 0
         cls.terminate_step_count = 0
 
     @classmethod
@@ -148,6 +159,7 @@ def test_execute_intervals():
     assert TestStepHandler.terminate_step_count == 0
     # pipeline should complete before 60s
     assert TestStepHandler.check_step_health_count == 0
+    assert TestStepHandler.check_steps_health_count == 0
 
     TestStepHandler.reset()
     with instance_for_test() as instance:
@@ -169,3 +181,80 @@ def test_execute_intervals():
     assert TestStepHandler.terminate_step_count == 0
     # every step should get checked at least once
     assert TestStepHandler.check_step_health_count >= 3
+    # the running steps are checked together
+    assert TestStepHandler.check_steps_health_count < TestStepHandler.check_step_health_count
+
+
+def _engine_event_entry(message):
+    return EventLogEntry(
+        None,
+        message,
+        "debug",
+        "",
+        "foo",
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "foo_pipeline",
+            message=message,
+            event_specific_data=EngineEventData(),
+        ),
+    )
+
+
+class _WatchedRecordsInstance:
+    """Stores records and calls the watch callback for each record stored, except for the records
+    whose storage ids are in skip_watch_storage_ids."""
+
+    def __init__(self, skip_watch_storage_ids):
+        self.records = []
+        self.callback = None
+        self._skip_watch_storage_ids = skip_watch_storage_ids
+
+    def records_after(self, _run_id, after_storage_id):
+        return [record for record in self.records if record.storage_id > after_storage_id]
+
+    def store(self, record):
+        self.records.append(record)
+        if self.callback and record.storage_id not in self._skip_watch_storage_ids:
+            self.callback(record.event_log_entry)
+
+
+def test_events_missed_by_watch_handled_once():
+    # pylint: disable=protected-access
+    instance = _WatchedRecordsInstance(skip_watch_storage_ids={100})
+    woken = threading.Event()
+    instance.callback = lambda _event: woken.set()
+
+    step_delegating_executor = StepDelegatingExecutor(
+        TestStepHandler(), retries=RetryMode.DISABLED, event_poll_interval_seconds=60.0
+    )
+    step_delegating_executor._event_cursor = -1
+    step_delegating_executor._num_events_read = 0
+    step_delegating_executor._last_event_poll_time = pendulum.now("UTC")
+
+    handled = []
+    for i in range(12):
+        instance.store(
+            EventLogRecord(storage_id=(i + 1) * 10, event_log_entry=_engine_event_entry(str(i)))
+        )
+        handled.extend(
+            event.message
+            for event in step_delegating_executor._get_new_events(instance, "foo", woken)
+        )
+
+    # the event that the watch missed is read along with the next one that it saw
+    assert handled == [str(i) for i in range(12)]
+    assert step_delegating_executor._num_events_read == 12
+
+    # without a wake up, the event log is not read until the poll interval passes
+    assert not woken.is_set()
+    instance.records.append(
+        EventLogRecord(storage_id=130, event_log_entry=_engine_event_entry("12"))
+    )
+    assert step_delegating_executor._get_new_events(instance, "foo", woken) == []
+
+    step_delegating_executor._last_event_poll_time = pendulum.now("UTC").subtract(seconds=60)
+    assert [
+        event.message for event in step_delegating_executor._get_new_events(instance, "foo", woken)
+    ] == ["12"]
@@ -22,7 +22,11 @@
 from dagster.core.events import DagsterEvent
 from dagster.core.events.log import EventLogEntry
 from dagster.core.instance import DagsterInstance, InstanceRef
-from dagster.core.storage.event_log.migration import migrate_event_log_data
+from dagster.core.storage.event_log.migration import (
+    SECONDARY_INDEX_ASSET_RUNS,
+    SECONDARY_INDEX_RUN_STATS,
+    migrate_event_log_data,
+)
 from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster.serdes.serdes import (
     WhitelistMap,
@@ -512,6 +516,60 @@ def asset_pipeline():
             assert not storage.has_asset_key(AssetKey(["a"]))
 
 
+def _sorted_step_stats(instance, run_id):
+    return sorted(instance.get_run_step_stats(run_id), key=lambda stats: stats.step_key)
+
+
+def test_0_12_x_run_stats_tables():
+    src_dir = file_relative_path(__file__, "snapshot_0_12_0_pre_asset_index_cols/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        assert "run_stats" not in get_sqlite3_tables(db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            storage = instance._event_storage
+            assert not storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS)
+
+            run_ids = [run.run_id for run in instance.get_runs()]
+            assert run_ids
+            old_run_stats = [instance.get_run_stats(run_id) for run_id in run_ids]
+            old_step_stats = [_sorted_step_stats(instance, run_id) for run_id in run_ids]
+
+            instance.upgrade()
+
+            assert "run_stats" in get_sqlite3_tables(db_path)
+            assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS)
+
+            # the stats backfilled into the stats tables match the stats from the event log
+            assert [instance.get_run_stats(run_id) for run_id in run_ids] == old_run_stats
+            assert [_sorted_step_stats(instance, run_id) for run_id in run_ids] == old_step_stats
+
+
+def test_0_12_x_asset_runs_table():
+    src_dir = file_relative_path(__file__, "snapshot_0_12_0_pre_asset_index_cols/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        assert "asset_runs" not in get_sqlite3_tables(db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            storage = instance._event_storage
+            assert not storage.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS)
+
+            run_ids = [run.run_id for run in instance.get_runs()]
+            old_asset_keys = [storage.get_asset_keys_for_run(run_id) for run_id in run_ids]
+            assert any(old_asset_keys)
+
+            instance.upgrade()
+
+            assert "asset_runs" in get_sqlite3_tables(db_path)
+            assert storage.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS)
+
+            # the links backfilled into the asset runs table match the asset keys in the event log
+            assert [storage.get_asset_keys_for_run(run_id) for run_id in run_ids] == old_asset_keys
+
+
 def test_solid_handle_node_handle():
     # serialize in current code
     test_handle = NodeHandle("test", None)
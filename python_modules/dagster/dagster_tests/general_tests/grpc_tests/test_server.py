@@ -1,8 +1,23 @@
+import sys
 import threading
 import time
 
 import grpc
+from dagster import file_relative_path
+from dagster.core.definitions.schedule import ScheduleExecutionData
+from dagster.core.host_representation.external_data import ExternalSensorExecutionErrorData
+from dagster.core.host_representation.origin import (
+    ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocationOrigin,
+)
+from dagster.core.test_utils import instance_for_test
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.__generated__ import api_pb2
 from dagster.grpc.client import ephemeral_grpc_api_client
+from dagster.grpc.server import DagsterApiServer
+from dagster.grpc.types import ExternalScheduleExecutionArgs, SensorExecutionArgs
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.utils import find_free_port
 
 
 def _stream_events_target(results, api_client):
@@ -39,3 +54,109 @@ def test_streaming_terminate():
 
         api_client._server_process.wait()  # pylint: disable=protected-access
         assert api_client._server_process.poll() == 0  # pylint: disable=protected-access
+
+
+def _evaluate_in_server(server, method_name, request):
+    chunks = list(getattr(server, method_name)(request, None))
+    return deserialize_json_to_dagster_namedtuple(
+        "".join([chunk.serialized_chunk for chunk in chunks])
+    )
+
+
+def test_evaluation_processes():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        python_file=file_relative_path(__file__, "grpc_repo.py"),
+    )
+    server_termination_event = threading.Event()
+    server = DagsterApiServer(
+        server_termination_event=server_termination_event,
+        loadable_target_origin=loadable_target_origin,
+        evaluation_processes=2,
+        evaluation_timeout=2,
+    )
+    try:
+        with instance_for_test() as instance:
+            repo_origin = ExternalRepositoryOrigin(
+                repository_location_origin=GrpcServerRepositoryLocationOrigin(
+                    port=find_free_port(), host="localhost"
+                ),
+                repository_name="bar_repo",
+            )
+
+            schedule_request = api_pb2.ExternalScheduleExecutionRequest(
+                serialized_external_schedule_execution_args=serialize_dagster_namedtuple(
+                    ExternalScheduleExecutionArgs(
+                        repository_origin=repo_origin,
+                        instance_ref=instance.get_ref(),
+                        schedule_name="foo_schedule",
+                    )
+                )
+            )
+            schedule_data = _evaluate_in_server(
+                server, "ExternalScheduleExecution", schedule_request
+            )
+            assert isinstance(schedule_data, ScheduleExecutionData)
+            assert len(schedule_data.run_requests) == 1
+
+            evaluation_pool = server._evaluation_pool  # pylint: disable=protected-access
+            processes = set(evaluation_pool._processes)  # pylint: disable=protected-access
+            assert len(processes) == 2
+
+            # slow_sensor sleeps for longer than the evaluation timeout
+            sensor_request = api_pb2.ExternalSensorExecutionRequest(
+                serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
+                    SensorExecutionArgs(
+                        repository_origin=repo_origin,
+                        instance_ref=instance.get_ref(),
+                        sensor_name="slow_sensor",
+                        last_completion_time=None,
+                        last_run_key=None,
+                        cursor=None,
+                    )
+                )
+            )
+            sensor_results = []
+            sensor_thread = threading.Thread(
+                target=lambda: sensor_results.append(
+                    _evaluate_in_server(server, "ExternalSensorExecution", sensor_request)
+                )
+            )
+            sensor_thread.start()
+
+            # other evaluations keep running in the other process while slow_sensor is evaluated,
+            # and are not affected when its evaluation times out
+            start_time = time.time()
+            while sensor_thread.is_alive():
+                schedule_data = _evaluate_in_server(
+                    server, "ExternalScheduleExecution", schedule_request
+                )
+                assert isinstance(schedule_data, ScheduleExecutionData)
+                assert time.time() - start_time < 30
+            sensor_thread.join()
+
+            sensor_data = sensor_results[0]
+            assert isinstance(sensor_data, ExternalSensorExecutionErrorData)
+            assert "Evaluation of sensor slow_sensor timed out after 2 seconds" in (
+                sensor_data.error.message
+            )
+
+            # only the process that evaluated slow_sensor was terminated and replaced, so that the
+            # timed out evaluation does not keep occupying it
+            assert server._evaluation_pool is evaluation_pool  # pylint: disable=protected-access
+            remaining_processes = set(
+                evaluation_pool._processes  # pylint: disable=protected-access
+            )
+            assert len(remaining_processes) == 2
+            (replaced_process,) = processes - remaining_processes
+            assert not replaced_process.process.is_alive()
+            for evaluation_process in processes & remaining_processes:
+                assert evaluation_process.process.is_alive()
+
+            schedule_data = _evaluate_in_server(
+                server, "ExternalScheduleExecution", schedule_request
+            )
+            assert isinstance(schedule_data, ScheduleExecutionData)
+    finally:
+        server_termination_event.set()
+        server.cleanup()
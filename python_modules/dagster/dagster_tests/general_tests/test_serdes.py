@@ -3,20 +3,26 @@
 from collections import namedtuple
 from enum import Enum
 from typing import NamedTuple, Set
+from unittest import mock
 
 import pytest
 from dagster.check import ParameterCheckError, inst_param, set_param
+from dagster.serdes import serdes
 from dagster.serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster.serdes.serdes import (
+    _WHITELIST_MAP,
     DefaultEnumSerializer,
     DefaultNamedTupleSerializer,
     WhitelistMap,
     _deserialize_json,
+    _pack_value_with_path,
     _serialize_dagster_namedtuple,
+    _unpack_value_with_path,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
     pack_inner_value,
+    register_serdes_tuple_fallbacks,
     serialize_value,
     unpack_inner_value,
 )
@@ -555,3 +561,99 @@ class NumHolder(NamedTuple):
     ser_x = _serialize_dagster_namedtuple(x, test_map)
     roundtrip_x = _deserialize_json(ser_x, test_map)
     assert x.num == roundtrip_x.num
+
+
+def test_descent_path_through_custom_serializer():
+    test_map = WhitelistMap.create()
+
+    class Foo(NamedTuple):
+        bar: int
+
+    class PassthroughSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return super().value_to_storage_dict(value, whitelist_map, descent_path)
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=PassthroughSerializer)
+    class Fizz(NamedTuple):
+        buzz: list
+
+    with pytest.raises(
+        SerializationError, match=re.escape("Descent path: <root:dict>.a[0].buzz[1]")
+    ):
+        _serialize_dagster_namedtuple({"a": [Fizz([1, Foo(1)])]}, whitelist_map=test_map)
+
+
+def test_unpack_does_not_mutate_packed_value():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Fizz(NamedTuple):
+        buzz: int
+
+    packed = pack_inner_value([Fizz(1)], whitelist_map=test_map, descent_path="")
+    assert unpack_inner_value(packed, whitelist_map=test_map, descent_path="") == [Fizz(1)]
+    assert unpack_inner_value(packed, whitelist_map=test_map, descent_path="") == [Fizz(1)]
+
+
+def test_fallback_does_not_change_serialized_class_name():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class NewThing(NamedTuple):
+        name: str
+
+    register_serdes_tuple_fallbacks({"OldThing": NewThing}, whitelist_map=test_map)
+
+    serialized = _serialize_dagster_namedtuple(NewThing("a"), whitelist_map=test_map)
+    assert '"__class__": "NewThing"' in serialized
+    assert _deserialize_json(
+        serialized.replace("NewThing", "OldThing"), whitelist_map=test_map
+    ) == NewThing("a")
+
+
+def test_compiled_packers_roundtrip_snapshots():
+    from dagster.core.host_representation import external_repository_data_from_def
+    from dagster_tests.api_tests.api_tests_repo import bar_repo
+
+    external_repository_data = external_repository_data_from_def(bar_repo)
+    pipeline_snapshot = bar_repo.get_pipeline("foo").get_pipeline_snapshot()
+
+    for snapshot in [external_repository_data, pipeline_snapshot]:
+        packed = pack_inner_value(snapshot, whitelist_map=_WHITELIST_MAP, descent_path="")
+
+        # the compiled packers and unpackers produce the same values as walking the value while
+        # keeping track of the descent path
+        assert packed == _pack_value_with_path(snapshot, _WHITELIST_MAP, "")
+        unpacked = unpack_inner_value(packed, _WHITELIST_MAP, "")
+        assert unpacked == _unpack_value_with_path(packed, _WHITELIST_MAP, "")
+        assert unpacked == snapshot
+
+        serialized = serialize_value(snapshot)
+        assert deserialize_value(serialized) == snapshot
+        assert serialize_value(deserialize_value(serialized)) == serialized
+
+
+def test_compiled_packers_do_not_track_descent_paths():
+    from dagster.core.host_representation import external_repository_data_from_def
+    from dagster_tests.api_tests.api_tests_repo import bar_repo
+
+    external_repository_data = external_repository_data_from_def(bar_repo)
+    pipeline_snapshot = bar_repo.get_pipeline("foo").get_pipeline_snapshot()
+
+    with mock.patch.object(
+        serdes, "_pack_value_with_path", autospec=True, side_effect=_pack_value_with_path
+    ) as pack_with_path, mock.patch.object(
+        serdes, "_unpack_value_with_path", autospec=True, side_effect=_unpack_value_with_path
+    ) as unpack_with_path:
+        for snapshot in [external_repository_data, pipeline_snapshot]:
+            assert deserialize_value(serialize_value(snapshot)) == snapshot
+
+        # descent paths are only built for values that fail to serialize or deserialize
+        assert pack_with_path.call_count == 0
+        assert unpack_with_path.call_count == 0
+
+        not_whitelisted = namedtuple("NotWhitelisted", "foo")
+        with pytest.raises(SerializationError, match=re.escape("Descent path: <root:list>[1]")):
+            serialize_value([external_repository_data, not_whitelisted(1)])
+        assert pack_with_path.call_count > 0
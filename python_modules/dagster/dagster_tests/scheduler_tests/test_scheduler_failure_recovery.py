@@ -3,7 +3,7 @@
 from dagster.core.instance import DagsterInstance
 from dagster.core.scheduler.job import JobTickStatus
 from dagster.core.storage.pipeline_run import PipelineRunStatus
-from dagster.core.storage.tags import PARTITION_NAME_TAG, SCHEDULED_EXECUTION_TIME_TAG
+from dagster.core.storage.tags import PARTITION_NAME_TAG, RUN_KEY_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster.core.test_utils import (
     cleanup_test_instance,
     create_test_daemon_workspace,
@@ -21,6 +21,7 @@
     validate_run_started,
     validate_tick,
     wait_for_all_runs_to_start,
+    wait_for_run_to_start,
 )
 
 
@@ -361,9 +362,12 @@ def test_failure_recovery_between_multi_runs(external_repo_context, crash_locati
 
             assert scheduler_process.exitcode != 0
 
-            wait_for_all_runs_to_start(instance)
-            assert instance.get_runs_count() == 1
-            validate_run_started(instance.get_runs()[0], initial_datetime)
+            # the runs for the tick are created together, but only the first one was launched
+            assert instance.get_runs_count() == 2
+            runs_by_key = {run.tags[RUN_KEY_TAG]: run for run in instance.get_runs()}
+            assert runs_by_key["B"].status == PipelineRunStatus.NOT_STARTED
+            wait_for_run_to_start(instance, runs_by_key["A"].run_id)
+            validate_run_started(instance.get_run_by_id(runs_by_key["A"].run_id), initial_datetime)
 
             ticks = instance.get_job_ticks(external_schedule.get_external_origin_id())
             assert len(ticks) == 1
@@ -378,7 +382,9 @@ def test_failure_recovery_between_multi_runs(external_repo_context, crash_locati
             scheduler_process.join(timeout=60)
             assert scheduler_process.exitcode == 0
             assert instance.get_runs_count() == 2
-            validate_run_started(instance.get_runs()[0], initial_datetime)
+            wait_for_all_runs_to_start(instance)
+            for run in instance.get_runs():
+                validate_run_started(run, initial_datetime)
             ticks = instance.get_job_ticks(external_schedule.get_external_origin_id())
             assert len(ticks) == 1
             validate_tick(
@@ -3,6 +3,7 @@
 import random
 import string
 import sys
+import threading
 import time
 from contextlib import contextmanager
 
@@ -31,6 +32,7 @@
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster.core.scheduler.job import JobState, JobStatus, JobTickStatus, JobType, ScheduleJobData
+from dagster.core.scheduler.scheduler import DEFAULT_MAX_CATCHUP_RUNS
 from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import PARTITION_NAME_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster.core.test_utils import (
@@ -463,6 +465,14 @@ def wait_for_all_runs_to_start(instance, timeout=10):
             break
 
 
+def wait_for_run_to_start(instance, run_id, timeout=10):
+    start_time = time.time()
+    while instance.get_run_by_id(run_id).status == PipelineRunStatus.NOT_STARTED:
+        if time.time() - start_time > timeout:
+            raise Exception("Timed out waiting for run to start")
+        time.sleep(0.5)
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_simple_schedule(external_repo_context, capfd):
     freeze_datetime = to_timezone(
@@ -1277,6 +1287,73 @@ def test_multiple_schedules_on_different_time_ranges(external_repo_context, capf
             )
 
 
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_multiple_schedules_in_threads(external_repo_context, monkeypatch):
+    with instance_with_schedules(
+        external_repo_context, overrides={"schedules": {"use_threads": True, "num_workers": 4}}
+    ) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        submit_threads = []
+        original_submit_run = instance.submit_run
+
+        def _submit_run(run_id, run_workspace):
+            submit_threads.append(threading.current_thread())
+            return original_submit_run(run_id, run_workspace)
+
+        monkeypatch.setattr(instance, "submit_run", _submit_run)
+
+        external_schedule = external_repo.get_external_schedule("simple_schedule")
+        external_hourly_schedule = external_repo.get_external_schedule("simple_hourly_schedule")
+        initial_datetime = to_timezone(
+            create_pendulum_time(
+                year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"
+            ),
+            "US/Central",
+        )
+        with pendulum.test(initial_datetime):
+            instance.start_schedule_and_update_storage_state(external_schedule)
+            instance.start_schedule_and_update_storage_state(external_hourly_schedule)
+
+        initial_datetime = initial_datetime.add(seconds=2)
+        with pendulum.test(initial_datetime):
+            list(launch_scheduled_runs(instance, workspace, logger(), pendulum.now("UTC")))
+
+            assert instance.get_runs_count() == 2
+            ticks = instance.get_job_ticks(external_schedule.get_external_origin_id())
+            assert len(ticks) == 1
+            assert ticks[0].status == JobTickStatus.SUCCESS
+
+            hourly_ticks = instance.get_job_ticks(external_hourly_schedule.get_external_origin_id())
+            assert len(hourly_ticks) == 1
+            assert hourly_ticks[0].status == JobTickStatus.SUCCESS
+
+        # catch up on both schedules
+        initial_datetime = initial_datetime.add(days=2)
+        with pendulum.test(initial_datetime):
+            list(launch_scheduled_runs(instance, workspace, logger(), pendulum.now("UTC")))
+
+            ticks = instance.get_job_ticks(external_schedule.get_external_origin_id())
+            assert len(ticks) == 3
+            assert len([tick for tick in ticks if tick.status == JobTickStatus.SUCCESS]) == 3
+
+            hourly_ticks = instance.get_job_ticks(external_hourly_schedule.get_external_origin_id())
+            assert len(hourly_ticks) == 1 + DEFAULT_MAX_CATCHUP_RUNS
+            assert all(tick.status == JobTickStatus.SUCCESS for tick in hourly_ticks)
+
+            assert instance.get_runs_count() == len(ticks) + len(hourly_ticks)
+
+            # ticks for each schedule were processed in order
+            for schedule_ticks in [ticks, hourly_ticks]:
+                timestamps = [tick.timestamp for tick in schedule_ticks]
+                assert timestamps == sorted(timestamps, reverse=True)
+
+            # runs are created by the evaluation threads, but submitted on the daemon thread
+            assert submit_threads == [threading.main_thread()] * instance.get_runs_count()
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_launch_failure(external_repo_context, capfd):
     with instance_with_schedules(
@@ -1,5 +1,7 @@
 import sys
+import threading
 import time
+from collections import Counter, defaultdict
 
 from celery.exceptions import TaskRevokedError
 from dagster import check
@@ -8,7 +10,7 @@
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.tags import PRIORITY_TAG
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .defaults import task_default_priority, task_default_queue
@@ -20,9 +22,109 @@
 )
 
 TICK_SECONDS = 1
+# Interval at which the result of every submitted task is checked, to find tasks that ended
+# without their steps reporting that they finished (e.g. because the worker was lost)
+RESULT_SWEEP_SECONDS = 10
 DELEGATE_MARKER = "celery_queue_wait"
 
 
+class StepEventStream:
+    """Reads the events that celery workers write to the run's event log while they execute their
+    steps, so that they are reported as they happen rather than when the steps' tasks complete.
+
+    The event log is watched for writes, so that it is only read when there are new events, and
+    is read from the storage id of the last record seen. The events of a step are held until the
+    result of its task is collected, when they are matched against the events returned by the
+    task so that none is reported twice.
+    """
+
+    def __init__(self, instance, run_id):
+        self._instance = instance
+        self._run_id = check.str_param(run_id, "run_id")
+        self._storage_id = -1
+        self._new_events = threading.Event()
+        self._new_events.set()
+        self._events_by_step_key = defaultdict(list)
+        self._ignored = Counter()
+
+    def _on_new_event(self, _event):
+        self._new_events.set()
+
+    def watch(self):
+        self._instance.watch_event_logs(self._run_id, -1, self._on_new_event)
+
+    def end_watch(self):
+        self._instance.end_watch_event_logs(self._run_id, self._on_new_event)
+
+    def wait(self, timeout):
+        """Wait until new events are written to the run's event log, or the timeout elapses."""
+        self._new_events.wait(timeout)
+
+    def ignore(self, event):
+        """Don't report an event that was logged for a step by the orchestrator itself."""
+        self._ignored[serialize_dagster_namedtuple(event)] += 1
+
+    def read(self, step_keys, force=False):
+        """Return the new events of the given steps. The event log is only read if it was
+        written to since the last read, unless force is set."""
+        if not force and not self._new_events.is_set():
+            return []
+
+        # cleared before reading, so that events written during the read are read next time
+        self._new_events.clear()
+        records = self._instance.records_after(self._run_id, self._storage_id)
+        if records:
+            self._storage_id = records[-1].storage_id
+
+        events = []
+        for record in records:
+            event = record.event_log_entry.dagster_event
+            if not event:
+                continue
+
+            # engine events reported by workers are only associated with their step by the log
+            step_key = record.event_log_entry.step_key or event.step_key
+            if step_key not in step_keys:
+                continue
+
+            serialized_event = serialize_dagster_namedtuple(event)
+            if self._ignored[serialized_event]:
+                self._ignored[serialized_event] -= 1
+                continue
+
+            self._events_by_step_key[step_key].append((serialized_event, event))
+            events.append(event)
+
+        return events
+
+    def is_step_finished(self, step_key):
+        """Whether the events read so far show that the step's task has finished running it."""
+        return any(
+            event.is_step_success
+            or event.is_step_failure
+            or event.is_step_skipped
+            or event.is_step_up_for_retry
+            for _, event in self._events_by_step_key.get(step_key, [])
+        )
+
+    def pop_step_events(self, step_key, serialized_task_events):
+        """Returns the events that were read for a step, followed by those of the events returned
+        by the step's task that were not read from the event log."""
+        events = self._events_by_step_key.pop(step_key, [])
+        unread = Counter(serialized_event for serialized_event, _ in events)
+
+        unread_task_events = []
+        for serialized_task_event in serialized_task_events:
+            event = deserialize_json_to_dagster_namedtuple(serialized_task_event)
+            serialized_event = serialize_dagster_namedtuple(event)
+            if unread[serialized_event]:
+                unread[serialized_event] -= 1
+            else:
+                unread_task_events.append(event)
+
+        return [event for _, event in events], unread_task_events
+
+
 def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_fn):
 
     check.inst_param(pipeline_context, "pipeline_context", PlanOrchestrationContext)
@@ -52,29 +154,56 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
     step_errors = {}
 
-    with execution_plan.start(
-        retry_mode=pipeline_context.executor.retries,
-        sort_key_fn=priority_for_step,
-    ) as active_execution:
+    step_event_stream = StepEventStream(pipeline_context.instance, pipeline_context.run_id)
+    step_event_stream.watch()
+    try:
+        with execution_plan.start(
+            retry_mode=pipeline_context.executor.retries,
+            sort_key_fn=priority_for_step,
+        ) as active_execution:
 
-        stopping = False
+            stopping = False
+            last_sweep_time = time.time()
 
-        while (not active_execution.is_complete and not stopping) or step_results:
-            if active_execution.check_for_interrupts():
-                yield DagsterEvent.engine_event(
-                    pipeline_context,
-                    "Celery executor: received termination signal - revoking active tasks from workers",
-                    EngineEventData.interrupted(list(step_results.keys())),
-                )
-                stopping = True
-                active_execution.mark_interrupted()
-                for result in step_results.values():
-                    result.revoke()
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
+            while (not active_execution.is_complete and not stopping) or step_results:
+                if active_execution.check_for_interrupts():
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        "Celery executor: received termination signal - revoking active tasks from workers",
+                        EngineEventData.interrupted(list(step_results.keys())),
+                    )
+                    stopping = True
+                    active_execution.mark_interrupted()
+                    for result in step_results.values():
+                        result.revoke()
+
+                # report the events of the running steps as the workers write them
+                curr_time = time.time()
+                sweep = stopping or curr_time - last_sweep_time >= RESULT_SWEEP_SECONDS
+                if sweep:
+                    last_sweep_time = curr_time
+                for event in step_event_stream.read(step_results.keys(), force=sweep):
+                    yield event
+
+                # Only the tasks whose steps have finished are checked for results, rather than
+                # every task, except on a periodic sweep that finds tasks that ended without their
+                # steps reporting that they finished
+                ready_step_keys = [
+                    step_key
+                    for step_key in sorted(step_results.keys(), key=priority_for_key)
+                    if (sweep or step_event_stream.is_step_finished(step_key))
+                    and step_results[step_key].ready()
+                ]
+
+                if ready_step_keys:
+                    # read any events that were written just before the tasks completed, so that
+                    # they are matched with the events returned by the tasks
+                    for event in step_event_stream.read(step_results.keys(), force=True):
+                        yield event
+
+                results_to_pop = []
+                for step_key in ready_step_keys:
+                    result = step_results[step_key]
                     try:
                         step_events = result.get()
                     except TaskRevokedError:
@@ -94,80 +223,94 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                         step_errors[step_key] = serializable_error_info_from_exc_info(
                             sys.exc_info()
                         )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
+
+                    read_events, unread_events = step_event_stream.pop_step_events(
+                        step_key, step_events
+                    )
+                    for event in unread_events:
                         yield event
+
+                    for event in read_events + unread_events:
                         active_execution.handle_event(event)
 
                     results_to_pop.append(step_key)
 
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+                for step_key in results_to_pop:
+                    if step_key in step_results:
+                        del step_results[step_key]
+                        active_execution.verify_complete(pipeline_context, step_key)
 
-            # process skips from failures or uncovered inputs
-            for event in active_execution.plan_events_iterator(pipeline_context):
-                yield event
+                # process skips from failures or uncovered inputs
+                for event in active_execution.plan_events_iterator(pipeline_context):
+                    yield event
 
-            # don't add any new steps if we are stopping
-            if stopping or step_errors:
-                continue
+                # don't add any new steps if we are stopping
+                if stopping or step_errors:
+                    step_event_stream.wait(TICK_SECONDS)
+                    continue
 
-            # This is a slight refinement. If we have n workers idle and schedule m > n steps for
-            # execution, the first n steps will be picked up by the idle workers in the order in
-            # which they are scheduled (and the following m-n steps will be executed in priority
-            # order, provided that it takes longer to execute a step than to schedule it). The test
-            # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
-                try:
-                    queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
-                            step_key=step.key, queue=queue
-                        ),
-                        EngineEventData(marker_start=DELEGATE_MARKER),
-                        step_handle=step.handle,
-                    )
+                # This is a slight refinement. If we have n workers idle and schedule m > n steps
+                # for execution, the first n steps will be picked up by the idle workers in the
+                # order in which they are scheduled (and the following m-n steps will be executed in
+                # priority order, provided that it takes longer to execute a step than to schedule
+                # it). The test case has m >> n to exhibit this behavior in the absence of this sort
+                # step.
+                for step in active_execution.get_steps_to_execute():
+                    try:
+                        queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
+                        submit_event = DagsterEvent.engine_event(
+                            pipeline_context,
+                            'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
+                                step_key=step.key, queue=queue
+                            ),
+                            EngineEventData(marker_start=DELEGATE_MARKER),
+                            step_handle=step.handle,
+                        )
+                        # this event is written to the event log before the step's task is
+                        # submitted, and should not be reported again when the log is read
+                        step_event_stream.ignore(submit_event)
+                        yield submit_event
 
-                    # Get the Celery priority for this step
-                    priority = _get_step_priority(pipeline_context, step)
+                        # Get the Celery priority for this step
+                        priority = _get_step_priority(pipeline_context, step)
 
-                    # Submit the Celery tasks
-                    step_results[step.key] = step_execution_fn(
-                        app,
-                        pipeline_context,
-                        step,
-                        queue,
-                        priority,
-                        active_execution.get_known_state(),
-                    )
+                        # Submit the Celery tasks
+                        step_results[step.key] = step_execution_fn(
+                            app,
+                            pipeline_context,
+                            step,
+                            queue,
+                            priority,
+                            active_execution.get_known_state(),
+                        )
 
-                except Exception:
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        "Encountered error during celery task submission.".format(),
-                        event_specific_data=EngineEventData.engine_error(
-                            serializable_error_info_from_exc_info(sys.exc_info()),
-                        ),
-                    )
-                    raise
-
-            time.sleep(TICK_SECONDS)
-
-        if step_errors:
-            raise DagsterSubprocessError(
-                "During celery execution errors occurred in workers:\n{error_list}".format(
-                    error_list="\n".join(
-                        [
-                            "[{step}]: {err}".format(step=key, err=err.to_string())
-                            for key, err in step_errors.items()
-                        ]
-                    )
-                ),
-                subprocess_error_infos=list(step_errors.values()),
-            )
+                    except Exception:
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            "Encountered error during celery task submission.".format(),
+                            event_specific_data=EngineEventData.engine_error(
+                                serializable_error_info_from_exc_info(sys.exc_info()),
+                            ),
+                        )
+                        raise
+
+                # wake as soon as new events are written, to find out when steps finish
+                step_event_stream.wait(TICK_SECONDS)
+
+            if step_errors:
+                raise DagsterSubprocessError(
+                    "During celery execution errors occurred in workers:\n{error_list}".format(
+                        error_list="\n".join(
+                            [
+                                "[{step}]: {err}".format(step=key, err=err.to_string())
+                                for key, err in step_errors.items()
+                            ]
+                        )
+                    ),
+                    subprocess_error_infos=list(step_errors.values()),
+                )
+    finally:
+        step_event_stream.end_watch()
 
 
 def _get_step_priority(context, step):
@@ -0,0 +1,80 @@
+import time
+
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.test_utils import create_run_for_test, instance_for_test
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster_celery.core_execution_loop import StepEventStream
+
+
+def _step_event(event_type, step_key, message, event_specific_data=None):
+    return DagsterEvent(
+        event_type_value=event_type.value,
+        pipeline_name="foo",
+        step_key=step_key,
+        message=message,
+        event_specific_data=event_specific_data,
+    )
+
+
+def _log_event(instance, run, event):
+    instance.handle_new_event(
+        EventLogEntry(
+            message=event.message,
+            user_message=event.message,
+            level="debug",
+            pipeline_name=run.pipeline_name,
+            run_id=run.run_id,
+            error_info=None,
+            timestamp=time.time(),
+            step_key=event.step_key,
+            dagster_event=event,
+        )
+    )
+
+
+def test_step_event_stream():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, pipeline_name="foo")
+        stream = StepEventStream(instance, run.run_id)
+
+        submitted_a = _step_event(DagsterEventType.ENGINE_EVENT, "a", "submitted")
+        _log_event(instance, run, submitted_a)
+        stream.ignore(submitted_a)
+
+        # engine events reported by workers are associated with their step by the log entry
+        worker_a = instance.report_engine_event(
+            "worker", run, cls=StepEventStream, step_key="a"
+        )
+        start_a = _step_event(DagsterEventType.STEP_START, "a", "start")
+        _log_event(instance, run, start_a)
+        _log_event(instance, run, _step_event(DagsterEventType.STEP_START, "b", "start"))
+
+        # only the events of the given steps are read, and not the ignored events
+        assert stream.read({"a"}) == [worker_a, start_a]
+        assert not stream.is_step_finished("a")
+
+        # the event log is only read again when forced, since it is not being watched
+        success_a = _step_event(
+            DagsterEventType.STEP_SUCCESS, "a", "success", StepSuccessData(duration_ms=1.0)
+        )
+        _log_event(instance, run, success_a)
+        assert stream.read({"a"}) == []
+        assert stream.read({"a"}, force=True) == [success_a]
+        assert stream.is_step_finished("a")
+
+        # events returned by the step's task that were already read are not reported again
+        unlogged_a = _step_event(DagsterEventType.ENGINE_EVENT, "a", "unlogged")
+        read_events, unread_events = stream.pop_step_events(
+            "a",
+            [
+                serialize_dagster_namedtuple(event)
+                for event in [worker_a, start_a, success_a, unlogged_a]
+            ],
+        )
+        assert read_events == [worker_a, start_a, success_a]
+        assert unread_events == [unlogged_a]
+
+        assert stream.pop_step_events("a", []) == ([], [])
+        assert not stream.is_step_finished("a")
@@ -197,18 +197,51 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
 
         except Exception as e:  # pylint: disable=broad-except
             return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Error when checking on step container health: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
+                self._step_failure_event(
+                    step_handler_context,
+                    step_key,
+                    f"Error when checking on step container health: {e}",
                 )
             ]
 
+        return self._check_container_health(step_handler_context, step_key, container)
+
+    def check_steps_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
+        client = self._get_client()
+
+        container_name_by_step_key = {
+            step_key: self._get_container_name(
+                step_handler_context.execute_step_args.pipeline_run_id, step_key
+            )
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute
+        }
+
+        # a single request for the containers of all of the steps, rather than one per step
+        try:
+            containers_by_name = {
+                container.name: container
+                for container in client.containers.list(
+                    all=True, filters={"name": list(container_name_by_step_key.values())}
+                )
+            }
+        except Exception:  # pylint: disable=broad-except
+            return super().check_steps_health(step_handler_context)
+
+        events = []
+        for step_key, container_name in container_name_by_step_key.items():
+            container = containers_by_name.get(container_name)
+            if not container:
+                # report the missing container in the same way as checking on the step alone
+                events.extend(self.check_step_health(step_handler_context.for_step(step_key)))
+            else:
+                events.extend(
+                    self._check_container_health(step_handler_context, step_key, container)
+                )
+        return events
+
+    def _check_container_health(
+        self, step_handler_context: StepHandlerContext, step_key: str, container
+    ) -> List[DagsterEvent]:
         if container.status == "running":
             return []
 
@@ -216,15 +249,10 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
             container_info = container.wait(timeout=0.1)
         except Exception as e:  # pylint: disable=broad-except
             return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
+                self._step_failure_event(
+                    step_handler_context,
+                    step_key,
+                    f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
                 )
             ]
 
@@ -233,18 +261,27 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
             return []
 
         return [
-            DagsterEvent(
-                event_type_value=DagsterEventType.STEP_FAILURE.value,
-                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                step_key=step_key,
-                message=f"Container status is {container.status}. Return code is {str(ret_code)}.",
-                event_specific_data=StepFailureData(
-                    error=None,
-                    user_failure_data=None,
-                ),
+            self._step_failure_event(
+                step_handler_context,
+                step_key,
+                f"Container status is {container.status}. Return code is {str(ret_code)}.",
             )
         ]
 
+    def _step_failure_event(
+        self, step_handler_context: StepHandlerContext, step_key: str, message: str
+    ) -> DagsterEvent:
+        return DagsterEvent(
+            event_type_value=DagsterEventType.STEP_FAILURE.value,
+            pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+            step_key=step_key,
+            message=message,
+            event_specific_data=StepFailureData(
+                error=None,
+                user_failure_data=None,
+            ),
+        )
+
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
 
         assert (
@@ -2,11 +2,17 @@
 # pylint: disable=unused-argument
 
 import os
+from unittest import mock
 
+from dagster import ModeDefinition, pipeline, solid
+from dagster.core.definitions.reconstructable import reconstructable
 from dagster.core.execution.api import execute_pipeline
-from dagster.core.test_utils import environ
+from dagster.core.executor.step_delegating.step_handler.base import StepHandlerContext
+from dagster.core.test_utils import create_run_for_test, environ, instance_for_test
+from dagster.grpc.types import ExecuteStepArgs
 from dagster.utils.merger import merge_dicts
 from dagster.utils.yaml_utils import merge_yamls
+from dagster_docker.docker_executor import DockerStepHandler, docker_executor
 from dagster_test.test_project import (
     find_local_test_image,
     get_buildkite_registry_config,
@@ -103,3 +109,69 @@ def test_docker_executor_check_step_health():
             assert not execute_pipeline(
                 recon_pipeline, run_config=run_config, instance=instance
             ).success
+
+
+@solid
+def foo():
+    return 1
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=[docker_executor])])
+def bar():
+    foo()
+
+
+def test_docker_step_handler_check_steps_health():
+    handler = DockerStepHandler()
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, pipeline_name="bar")
+
+        def _container(step_key, status, status_code=None):
+            container = mock.MagicMock()
+            container.name = handler._get_container_name(  # pylint: disable=protected-access
+                run.run_id, step_key
+            )
+            container.status = status
+            container.wait.return_value = {"StatusCode": status_code}
+            return container
+
+        client = mock.MagicMock()
+        client.containers.list.return_value = [
+            _container("running_solid", "running"),
+            _container("succeeded_solid", "exited", 0),
+            _container("failed_solid", "exited", 1),
+        ]
+        client.containers.get.side_effect = Exception("No such container")
+
+        with mock.patch.object(handler, "_get_client", return_value=client):
+            events = handler.check_steps_health(
+                StepHandlerContext(
+                    instance,
+                    ExecuteStepArgs(
+                        reconstructable(bar).get_python_origin(),
+                        run.run_id,
+                        ["running_solid", "succeeded_solid", "failed_solid", "missing_solid"],
+                    ),
+                    {
+                        "running_solid": {},
+                        "succeeded_solid": {},
+                        "failed_solid": {},
+                        "missing_solid": {},
+                    },
+                )
+            )
+
+        assert [(event.step_key, event.is_step_failure) for event in events] == [
+            ("failed_solid", True),
+            ("missing_solid", True),
+        ]
+        assert events[0].message == "Container status is exited. Return code is 1."
+        assert events[1].message == (
+            "Error when checking on step container health: No such container"
+        )
+
+        # the containers of all of the steps were listed with a single request, and only the
+        # container missing from the list was requested on its own
+        assert client.containers.list.call_count == 1
+        assert client.containers.get.call_count == 1
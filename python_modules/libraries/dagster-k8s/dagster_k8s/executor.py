@@ -24,6 +24,9 @@
 )
 from .utils import delete_job
 
+# Label of the Kubernetes Jobs launched for the steps of a run, so that they can be listed by run
+RUN_ID_LABEL = "dagster/run-id"
+
 
 @executor(
     name="k8s",
@@ -179,6 +182,7 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             pod_name=pod_name,
             component="step_worker",
             user_defined_k8s_config=user_defined_k8s_config,
+            labels={RUN_ID_LABEL: step_handler_context.execute_step_args.pipeline_run_id},
         )
 
         events.append(
@@ -214,20 +218,47 @@ def check_step_health(self, step_handler_context: StepHandlerContext):
 
         job = self._batch_api.read_namespaced_job(namespace=self._job_namespace, name=job_name)
         if job.status.failed:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+            return [self._step_failure_event(step_handler_context, step_key, job_name)]
         return []
 
+    def check_steps_health(self, step_handler_context: StepHandlerContext):
+        run_id = step_handler_context.execute_step_args.pipeline_run_id
+        job_name_by_step_key = {
+            step_key: "dagster-job-%s" % (get_k8s_job_name(run_id, step_key))
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute
+        }
+
+        # a single request for the step jobs of the run, rather than one per step
+        jobs_by_name = {
+            job.metadata.name: job
+            for job in self._batch_api.list_namespaced_job(
+                namespace=self._job_namespace,
+                label_selector=f"app.kubernetes.io/component=step_worker,{RUN_ID_LABEL}={run_id}",
+            ).items
+        }
+
+        events = []
+        for step_key, job_name in job_name_by_step_key.items():
+            job = jobs_by_name.get(job_name)
+            if not job:
+                # read the job directly, in case it was created after the jobs were listed
+                events.extend(self.check_step_health(step_handler_context.for_step(step_key)))
+            elif job.status.failed:
+                events.append(self._step_failure_event(step_handler_context, step_key, job_name))
+        return events
+
+    def _step_failure_event(self, step_handler_context, step_key, job_name):
+        return DagsterEvent(
+            event_type_value=DagsterEventType.STEP_FAILURE.value,
+            pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+            step_key=step_key,
+            message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
+            event_specific_data=StepFailureData(
+                error=None,
+                user_failure_data=None,
+            ),
+        )
+
     def terminate_step(self, step_handler_context: StepHandlerContext):
         assert (
             len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
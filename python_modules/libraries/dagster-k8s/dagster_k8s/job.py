@@ -437,6 +437,7 @@ def construct_dagster_k8s_job(
     pod_name=None,
     component=None,
     env_vars=None,
+    labels=None,
 ):
     """Constructs a Kubernetes Job object for a dagster-graphql invocation.
 
@@ -451,6 +452,7 @@ def construct_dagster_k8s_job(
         component (str, optional): The name of the component, used to provide the Job label
             app.kubernetes.io/component. Defaults to None.
         env_vars(Dict[str, str]): Additional environment variables to add to the K8s Container.
+        labels (Dict[str, str], optional): Additional labels for the Job and its Pod.
 
     Returns:
         kubernetes.client.V1Job: A Kubernetes Job object.
@@ -468,6 +470,7 @@ def construct_dagster_k8s_job(
     pod_name = check.opt_str_param(pod_name, "pod_name", default=job_name + "-pod")
     check.opt_str_param(component, "component")
     check.opt_dict_param(env_vars, "env_vars", key_type=str, value_type=str)
+    labels = check.opt_dict_param(labels, "labels", key_type=str, value_type=str)
 
     check.invariant(
         len(job_name) <= MAX_K8S_NAME_LEN,
@@ -492,6 +495,8 @@ def construct_dagster_k8s_job(
     if component:
         dagster_labels["app.kubernetes.io/component"] = component
 
+    dagster_labels.update(labels)
+
     env = [kubernetes.client.V1EnvVar(name="DAGSTER_HOME", value=job_config.dagster_home)]
     if job_config.postgres_password_secret:
         env.append(
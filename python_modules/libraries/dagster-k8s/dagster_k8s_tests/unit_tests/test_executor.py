@@ -11,7 +11,7 @@
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.grpc.types import ExecuteStepArgs
 from dagster_k8s.executor import K8sStepHandler, k8s_job_executor
-from dagster_k8s.job import DagsterK8sJobConfig, UserDefinedDagsterK8sConfig
+from dagster_k8s.job import DagsterK8sJobConfig, UserDefinedDagsterK8sConfig, get_k8s_job_name
 
 
 @solid
@@ -159,3 +159,63 @@ def test_step_handler_image_override(kubeconfig_file):
         method_name, _args, kwargs = mock_method_calls[0]
         assert method_name == "create_namespaced_job"
         assert kwargs["body"].spec.template.spec.containers[0].image == "new-image"
+
+        # the job and its pod are labeled with the run they belong to
+        assert kwargs["body"].metadata.labels["dagster/run-id"] == run.run_id
+        assert kwargs["body"].spec.template.metadata.labels["dagster/run-id"] == run.run_id
+
+
+def test_step_handler_check_steps_health(kubeconfig_file):
+
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        job_config=DagsterK8sJobConfig(instance_config_map="foobar", job_image="bizbuz"),
+        job_namespace="foo",
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(
+            instance,
+            pipeline_name="bar",
+        )
+
+        def _job(step_key, failed):
+            job = mock.MagicMock()
+            job.metadata.name = "dagster-job-%s" % get_k8s_job_name(run.run_id, step_key)
+            job.status.failed = failed
+            return job
+
+        mock_k8s_client_batch_api.list_namespaced_job.return_value.items = [
+            _job("healthy_solid", None),
+            _job("failed_solid", 1),
+        ]
+
+        events = handler.check_steps_health(
+            StepHandlerContext(
+                instance,
+                ExecuteStepArgs(
+                    reconstructable(bar).get_python_origin(),
+                    run.run_id,
+                    ["healthy_solid", "failed_solid"],
+                ),
+                {"healthy_solid": {}, "failed_solid": {}},
+            )
+        )
+
+        assert [(event.step_key, event.is_step_failure) for event in events] == [
+            ("failed_solid", True)
+        ]
+
+        # all of the steps were checked with a single list call
+        mock_method_calls = mock_k8s_client_batch_api.method_calls
+        assert [method_name for method_name, _args, _kwargs in mock_method_calls] == [
+            "list_namespaced_job"
+        ]
+        assert mock_method_calls[0][2]["namespace"] == "foo"
+        # only the jobs of the run are listed
+        assert mock_method_calls[0][2]["label_selector"] == (
+            f"app.kubernetes.io/component=step_worker,dagster/run-id={run.run_id}"
+        )
@@ -0,0 +1,22 @@
+"""add run priority column
+
+Revision ID: 39973a1ce839
+Revises: 67069fb5ec1d
+Create Date: 2021-09-22 11:27:40.531289
+
+"""
+from dagster.core.storage.migration.utils import add_run_priority_column
+
+# revision identifiers, used by Alembic.
+revision = "39973a1ce839"
+down_revision = "67069fb5ec1d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_priority_column()
+
+
+def downgrade():
+    pass
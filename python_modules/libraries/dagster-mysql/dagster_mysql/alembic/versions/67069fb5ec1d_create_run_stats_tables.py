@@ -0,0 +1,22 @@
+"""create run stats tables
+
+Revision ID: 67069fb5ec1d
+Revises: 29a8e9d74220
+Create Date: 2021-09-20 14:03:11.218345
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_tables
+
+# revision identifiers, used by Alembic.
+revision = "67069fb5ec1d"
+down_revision = "29a8e9d74220"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_tables()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""create asset runs table
+
+Revision ID: 8e2b7a5d9c16
+Revises: 39973a1ce839
+Create Date: 2021-09-24 10:12:48.630127
+
+"""
+from dagster.core.storage.migration.utils import create_asset_runs_table
+
+# revision identifiers, used by Alembic.
+revision = "8e2b7a5d9c16"
+down_revision = "39973a1ce839"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_runs_table()
+
+
+def downgrade():
+    pass
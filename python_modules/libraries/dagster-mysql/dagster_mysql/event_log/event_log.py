@@ -3,11 +3,15 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import (
     AssetKeyTable,
+    AssetRunsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlPollingEventWatcher,
 )
-from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.migration import (
+    ASSET_KEY_INDEX_COLS,
+    SECONDARY_INDEX_ASSET_RUNS,
+)
 from dagster.core.storage.sql import stamp_alembic_rev  # pylint: disable=unused-import
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade
 from dagster.serdes import ConfigurableClass, ConfigurableClassData, serialize_dagster_namedtuple
@@ -165,6 +169,21 @@ def store_asset(self, event):
                     )
                 )
 
+        self.store_asset_run(event)
+
+    def store_asset_run(self, event):
+        check.inst_param(event, "event", EventLogEntry)
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS):
+            return
+
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        with self.index_connection() as conn:
+            conn.execute(
+                db.dialects.mysql.insert(AssetRunsTable)
+                .values(run_id=event.run_id, asset_key=asset_key_str)
+                .on_duplicate_key_update(asset_key=asset_key_str)
+            )
+
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import sqlalchemy as db
 from dagster import check
 from dagster.core.storage.runs import DaemonHeartbeatsTable, RunStorageSqlMetadata, SqlRunStorage
@@ -103,6 +105,13 @@ def create_clean_storage(mysql_url):
     def connect(self, run_id=None):  # pylint: disable=arguments-differ, unused-argument
         return create_mysql_connection(self._engine, __file__, "run")
 
+    @contextmanager
+    def connect_for_transaction(self):
+        # The engine connects in autocommit mode, so switch the connection to the default MySQL
+        # isolation level for statements to be grouped in to transactions
+        with self.connect() as conn:
+            yield conn.execution_options(isolation_level="REPEATABLE READ")
+
     def upgrade(self):
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
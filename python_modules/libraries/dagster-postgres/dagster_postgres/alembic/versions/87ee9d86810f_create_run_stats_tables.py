@@ -0,0 +1,22 @@
+"""create run stats tables
+
+Revision ID: 87ee9d86810f
+Revises: f4b6a4885876
+Create Date: 2021-09-20 14:03:11.218345
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_tables
+
+# revision identifiers, used by Alembic.
+revision = "87ee9d86810f"
+down_revision = "f4b6a4885876"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_tables()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add run priority column
+
+Revision ID: cb1e5fea9b8a
+Revises: 87ee9d86810f
+Create Date: 2021-09-22 11:27:40.531289
+
+"""
+from dagster.core.storage.migration.utils import add_run_priority_column
+
+# revision identifiers, used by Alembic.
+revision = "cb1e5fea9b8a"
+down_revision = "87ee9d86810f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_priority_column()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""create asset runs table
+
+Revision ID: d4c6f2e81a37
+Revises: cb1e5fea9b8a
+Create Date: 2021-09-24 10:12:48.630127
+
+"""
+from dagster.core.storage.migration.utils import create_asset_runs_table
+
+# revision identifiers, used by Alembic.
+revision = "d4c6f2e81a37"
+down_revision = "cb1e5fea9b8a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_runs_table()
+
+
+def downgrade():
+    pass
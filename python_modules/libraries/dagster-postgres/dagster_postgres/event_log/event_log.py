@@ -8,12 +8,20 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import (
     AssetKeyTable,
+    AssetRunsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.migration import (
+    ASSET_KEY_INDEX_COLS,
+    SECONDARY_INDEX_ASSET_RUNS,
+)
 from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
+from dagster.core.storage.event_log.sql_event_log import (
+    chunk_events_for_insert,
+    get_latest_asset_events,
+)
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade, stamp_alembic_rev
 from dagster.serdes import (
     ConfigurableClass,
@@ -140,6 +148,7 @@ def store_event(self, event):
         """
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
+        stats_events = self.filter_stats_events([event])
         with self._connect() as conn:
             result = conn.execute(
                 insert_event_statement.returning(
@@ -152,10 +161,39 @@ def store_event(self, event):
                 """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
                 (res[0] + "_" + str(res[1]),),
             )
+            self.update_stats_for_events(conn, stats_events)
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             self.store_asset(event)
 
+    def store_events(self, events):
+        """Store a batch of events using multi-row insert statements, notifying watchers of each
+        inserted event.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        stats_events = self.filter_stats_events(events)
+        with self._connect() as conn:
+            for chunk in chunk_events_for_insert(events):
+                result = conn.execute(
+                    self.prepare_insert_events(chunk).returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                rows = result.fetchall()
+                result.close()
+                for res in rows:
+                    conn.execute(
+                        """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                        (res[0] + "_" + str(res[1]),),
+                    )
+            self.update_stats_for_events(conn, stats_events)
+
+        for event in get_latest_asset_events(events):
+            self.store_asset(event)
+
     def store_asset(self, event):
         check.inst_param(event, "event", EventLogEntry)
         if not event.is_dagster_event or not event.dagster_event.asset_key:
@@ -208,6 +246,23 @@ def store_asset(self, event):
                     )
                 )
 
+        self.store_asset_run(event)
+
+    def store_asset_run(self, event):
+        check.inst_param(event, "event", EventLogEntry)
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_RUNS):
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(
+                db.dialects.postgresql.insert(AssetRunsTable)
+                .values(
+                    run_id=event.run_id,
+                    asset_key=event.dagster_event.asset_key.to_string(),
+                )
+                .on_conflict_do_nothing()
+            )
+
     def _connect(self):
         return create_pg_connection(self._engine, __file__, "event log")
 
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import sqlalchemy as db
 from dagster import check
 from dagster.core.storage.runs import DaemonHeartbeatsTable, RunStorageSqlMetadata, SqlRunStorage
@@ -110,6 +112,13 @@ def connect(self):
             "run",
         )
 
+    @contextmanager
+    def connect_for_transaction(self):
+        # The engine connects in autocommit mode, so switch the connection to the default postgres
+        # isolation level for statements to be grouped in to transactions
+        with self.connect() as conn:
+            yield conn.execution_options(isolation_level="READ COMMITTED")
+
     def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)